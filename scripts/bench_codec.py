@@ -0,0 +1,126 @@
+"""Compare the binary Task/Result codec with pydantic JSON round trips.
+
+Payload sizes approximate what flows through the queue: a small skill
+invocation, a medium content-generation brief and a large retrieval context.
+Each row reports encode and decode cost per message and the encoded size.
+
+Usage:
+  python scripts/bench_codec.py [--iterations 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from datetime import UTC, datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from chimera.lib.codec import decode_result, decode_task, encode_result, encode_task
+from chimera.models.result import Result, ResultStatus
+from chimera.models.task import Task
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _payload(size: str) -> dict[str, Any]:
+    if size == "small":
+        return {"skill": "fetch_feed", "arguments": {"platform": "moltbook", "limit": 20}}
+    if size == "medium":
+        return {
+            "skill": "generate_post",
+            "brief": "Launch thread for the autumn collection. " * 20,
+            "tags": [f"tag_{i}" for i in range(20)],
+            "persona": {"tone": "playful", "audience": "gen-z", "max_chars": 280},
+        }
+    return {
+        "skill": "answer_with_context",
+        "documents": [
+            {"id": f"doc_{i}", "score": 0.5 + i / 100, "text": "Retrieved passage. " * 20}
+            for i in range(40)
+        ],
+    }
+
+
+def _models(size: str) -> tuple[Task, Result]:
+    now = datetime.now(UTC)
+    task = Task(
+        tenant_id="t_bench",
+        trace_id="tr_0123456789abcdef",
+        task_id="tk_0123456789abcdef",
+        session_id="ss_42",
+        kind="skill.invoke",
+        input=_payload(size),
+        priority=50,
+        max_attempts=3,
+        timeout_s=30,
+        created_at=now,
+        updated_at=now,
+    )
+    result = Result(
+        tenant_id=task.tenant_id,
+        trace_id=task.trace_id,
+        task_id=task.task_id,
+        status=ResultStatus.SUCCEEDED,
+        output={"echo": task.input, "tokens": 812},
+        produced_by="worker-3",
+        completed_at=now,
+    )
+    return task, result
+
+
+def _us(fn: Callable[[], object], iterations: int) -> float:
+    return min(timeit.repeat(fn, number=iterations, repeat=3)) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+    n = args.iterations
+
+    print(f"{'payload':<15}{'codec':<14}{'encode us':>10}{'decode us':>11}{'bytes':>8}")
+    for size in ("small", "medium", "large"):
+        task, result = _models(size)
+        for label, model, dump_json, load_json, encode, decode in (
+            (
+                "task",
+                task,
+                task.model_dump_json,
+                Task.model_validate_json,
+                encode_task,
+                decode_task,
+            ),
+            (
+                "result",
+                result,
+                result.model_dump_json,
+                Result.model_validate_json,
+                encode_result,
+                decode_result,
+            ),
+        ):
+            as_json = dump_json().encode()
+            as_binary = encode(model)  # type: ignore[arg-type]
+            # partial binds this iteration's values; timeit calls them after the loop moves on.
+            encode_model = partial(encode, model)  # type: ignore[arg-type]
+            rows = (
+                ("json", dump_json, partial(load_json, as_json), len(as_json)),
+                ("binary", encode_model, partial(decode, as_binary), len(as_binary)),
+                (
+                    "binary-trust",
+                    encode_model,
+                    partial(decode, as_binary, trusted=True),
+                    len(as_binary),
+                ),
+            )
+            for codec, enc, dec, size_bytes in rows:
+                print(
+                    f"{size + ' ' + label:<15}{codec:<14}"
+                    f"{_us(enc, n):>10.2f}{_us(dec, n):>11.2f}{size_bytes:>8}"
+                )
+
+
+if __name__ == "__main__":
+    main()
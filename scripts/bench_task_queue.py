@@ -0,0 +1,90 @@
+"""Measure task queue throughput with batched enqueue, dequeue and ack.
+
+`--backend memory` benchmarks InMemoryTaskQueue. `--backend redis` benchmarks
+RedisTaskQueue against `--url`, or against fakeredis when no URL is given
+(useful for a smoke run; absolute numbers only mean something on Redis).
+
+Usage:
+  python scripts/bench_task_queue.py [--backend memory|redis] [--url redis://localhost:6379/0]
+      [--tasks 50000] [--batch 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from datetime import UTC, datetime
+
+from redis.asyncio import Redis
+
+from chimera.lib.memory_queue import InMemoryTaskQueue
+from chimera.lib.redis_queue import RedisTaskQueue
+from chimera.models.task import Task
+
+TENANT_ID = "t_bench"
+
+
+async def _run(queue: InMemoryTaskQueue | RedisTaskQueue, total: int, batch: int) -> None:
+    now = datetime.now(UTC)
+    tasks = [
+        Task(
+            tenant_id=TENANT_ID,
+            trace_id="tr_bench",
+            task_id=f"tk_{i}",
+            kind="bench",
+            input={"i": i},
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(total)
+    ]
+
+    started = time.perf_counter()
+    for offset in range(0, total, batch):
+        await queue.enqueue_many(TENANT_ID, tasks[offset : offset + batch])
+    enqueued = time.perf_counter()
+
+    consumed = 0
+    while consumed < total:
+        delivered = await queue.dequeue(TENANT_ID, batch_size=batch, worker_id="bench")
+        await queue.ack_many(TENANT_ID, delivered, "bench")
+        consumed += len(delivered)
+    finished = time.perf_counter()
+
+    print(f"enqueue_many      {total / (enqueued - started):12,.0f} tasks/s")
+    print(f"dequeue + ack     {total / (finished - enqueued):12,.0f} tasks/s")
+
+
+async def _run_redis(client: Redis, total: int, batch: int) -> None:
+    queue = RedisTaskQueue(client, stream_prefix="chimera:bench", block_ms=None)
+    await client.delete(queue.stream_key(TENANT_ID))
+    try:
+        await _run(queue, total, batch)
+    finally:
+        await client.delete(queue.stream_key(TENANT_ID))
+        await client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", choices=["memory", "redis"], default="redis")
+    parser.add_argument("--url", default=None)
+    parser.add_argument("--tasks", type=int, default=50_000)
+    parser.add_argument("--batch", type=int, default=500)
+    args = parser.parse_args()
+
+    if args.backend == "memory":
+        asyncio.run(_run(InMemoryTaskQueue(block_ms=None), args.tasks, args.batch))
+        return
+    if args.url:
+        client: Redis = Redis.from_url(args.url)
+    else:
+        import fakeredis.aioredis
+
+        client = fakeredis.aioredis.FakeRedis()
+    asyncio.run(_run_redis(client, args.tasks, args.batch))
+
+
+if __name__ == "__main__":
+    main()
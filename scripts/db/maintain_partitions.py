@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Create upcoming partitions and expire old ones.
+
+Run at least daily (e.g. from cron) against the primary database. The
+database URL and pool settings come from ``CHIMERA_DB_*`` variables.
+
+Usage:
+    python scripts/db/maintain_partitions.py            # apply
+    python scripts/db/maintain_partitions.py --dry-run  # print the DDL only
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import UTC, datetime
+
+from chimera.db.engine import Database, DatabaseConfig
+from chimera.db.partitions import DEFAULT_POLICIES, PartitionManager, plan_maintenance
+
+
+async def _run(dry_run: bool) -> None:
+    database = Database.from_config(DatabaseConfig.from_env())
+    manager = PartitionManager(database.engine)
+    try:
+        if not dry_run:
+            for action in await manager.maintain():
+                print(f"{action.kind:<8}{action.name}")
+            return
+        now = datetime.now(UTC)
+        for policy in DEFAULT_POLICIES:
+            existing = await manager.partitions(policy.table)
+            for action in plan_maintenance(policy, existing, now):
+                print(";\n".join(action.statements()) + ";")
+    finally:
+        await database.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dry-run", action="store_true", help="Print DDL without running it.")
+    asyncio.run(_run(parser.parse_args().dry_run))
+
+
+if __name__ == "__main__":
+    main()
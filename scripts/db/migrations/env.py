@@ -1,3 +1,4 @@
+import re
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
@@ -8,6 +9,7 @@ from sqlmodel import SQLModel
 
 # Import your models here so Alembic can see them
 from chimera.db import schema
+from chimera.db.partitions import PARTITIONED_TABLES
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -22,6 +24,22 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = SQLModel.metadata
 
+_PARTITION = re.compile(r"_p\d{8}$")
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Hide partition plumbing from autogenerate.
+
+    Partitions are created at runtime by ``PartitionManager``, and foreign keys
+    to partitioned tables exist in the models for ORM joins only.
+    """
+    if type_ == "table":
+        return not (reflected and name and _PARTITION.search(name))
+    if type_ == "foreign_key_constraint":
+        return object.referred_table.name not in PARTITIONED_TABLES
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -44,6 +62,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -66,7 +85,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,178 @@
+"""Initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 03:42:46.378665
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+from sqlmodel.sql.sqltypes import AutoString
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "agent_profiles",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("tenant_id", sa.Uuid(), nullable=False),
+        sa.Column("name", AutoString(), nullable=False),
+        sa.Column("role", AutoString(), nullable=False),
+        sa.Column(
+            "tools_config",
+            sa.JSON().with_variant(postgresql.JSONB(astext_type=sa.Text()), "postgresql"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_agent_profiles_tenant_id"), "agent_profiles", ["tenant_id"], unique=False
+    )
+    op.create_table(
+        "budget_configs",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("tenant_id", sa.Uuid(), nullable=False),
+        sa.Column("daily_limit_usd", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("currency", AutoString(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_budget_configs_tenant_id"), "budget_configs", ["tenant_id"], unique=False
+    )
+    op.create_table(
+        "swarm_sessions",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("tenant_id", sa.Uuid(), nullable=False),
+        sa.Column("status", AutoString(), nullable=False),
+        sa.Column(
+            "context",
+            sa.JSON().with_variant(postgresql.JSONB(astext_type=sa.Text()), "postgresql"),
+            nullable=True,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_swarm_sessions_status"), "swarm_sessions", ["status"], unique=False)
+    op.create_index(
+        op.f("ix_swarm_sessions_tenant_id"), "swarm_sessions", ["tenant_id"], unique=False
+    )
+    op.create_table(
+        "tasks",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("session_id", sa.Uuid(), nullable=True),
+        sa.Column("agent_id", sa.Uuid(), nullable=True),
+        sa.Column("parent_task_id", sa.Uuid(), nullable=True),
+        sa.Column("type", AutoString(), nullable=False),
+        sa.Column("status", AutoString(), nullable=False),
+        sa.Column(
+            "input_payload",
+            sa.JSON().with_variant(postgresql.JSONB(astext_type=sa.Text()), "postgresql"),
+            nullable=True,
+        ),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("attempt_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["agent_id"],
+            ["agent_profiles.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["parent_task_id"],
+            ["tasks.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["session_id"],
+            ["swarm_sessions.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_tasks_status"), "tasks", ["status"], unique=False)
+    op.create_index(op.f("ix_tasks_type"), "tasks", ["type"], unique=False)
+    op.create_table(
+        "review_cards",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("task_id", sa.Uuid(), nullable=False),
+        sa.Column("trigger_reason", AutoString(), nullable=False),
+        sa.Column("status", AutoString(), nullable=False),
+        sa.Column("reviewer_id", sa.Uuid(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("resolved_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["task_id"],
+            ["tasks.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "task_results",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("task_id", sa.Uuid(), nullable=False),
+        sa.Column("status", AutoString(), nullable=False),
+        sa.Column(
+            "output_payload",
+            sa.JSON().with_variant(postgresql.JSONB(astext_type=sa.Text()), "postgresql"),
+            nullable=True,
+        ),
+        sa.Column("artifact_uri", AutoString(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["task_id"],
+            ["tasks.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "transactions",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("budget_id", sa.Uuid(), nullable=False),
+        sa.Column("task_id", sa.Uuid(), nullable=True),
+        sa.Column("amount_usd", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("asset_symbol", AutoString(), nullable=False),
+        sa.Column("status", AutoString(), nullable=False),
+        sa.Column(
+            "metadata",
+            sa.JSON().with_variant(postgresql.JSONB(astext_type=sa.Text()), "postgresql"),
+            nullable=True,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["budget_id"],
+            ["budget_configs.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["task_id"],
+            ["tasks.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_transactions_status"), "transactions", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_transactions_status"), table_name="transactions")
+    op.drop_table("transactions")
+    op.drop_table("task_results")
+    op.drop_table("review_cards")
+    op.drop_index(op.f("ix_tasks_type"), table_name="tasks")
+    op.drop_index(op.f("ix_tasks_status"), table_name="tasks")
+    op.drop_table("tasks")
+    op.drop_index(op.f("ix_swarm_sessions_tenant_id"), table_name="swarm_sessions")
+    op.drop_index(op.f("ix_swarm_sessions_status"), table_name="swarm_sessions")
+    op.drop_table("swarm_sessions")
+    op.drop_index(op.f("ix_budget_configs_tenant_id"), table_name="budget_configs")
+    op.drop_table("budget_configs")
+    op.drop_index(op.f("ix_agent_profiles_tenant_id"), table_name="agent_profiles")
+    op.drop_table("agent_profiles")
@@ -0,0 +1,69 @@
+"""Hot query indexes
+
+Composite indexes match the equality columns and ordering of the hot
+queries, so Postgres can walk the index in order instead of sorting.
+Partial indexes only cover rows that are still being worked on. On Postgres
+the indexes are built CONCURRENTLY so writers are not blocked on large tables.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 03:43:25.015625
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_ACTIVE_TASKS = sa.text("status IN ('QUEUED', 'RUNNING')")
+_OPEN_CARDS = sa.text("status = 'OPEN'")
+
+_INDEXES: list[tuple[str, str, list[str], sa.TextClause | None]] = [
+    (
+        "ix_swarm_sessions_tenant_status_created",
+        "swarm_sessions",
+        ["tenant_id", "status", "created_at"],
+        None,
+    ),
+    ("ix_tasks_session_status_created", "tasks", ["session_id", "status", "created_at"], None),
+    ("ix_tasks_active_created", "tasks", ["created_at"], _ACTIVE_TASKS),
+    ("ix_task_results_task_created", "task_results", ["task_id", "created_at"], None),
+    (
+        "ix_transactions_budget_status_created",
+        "transactions",
+        ["budget_id", "status", "created_at"],
+        None,
+    ),
+    ("ix_transactions_task_id", "transactions", ["task_id"], None),
+    ("ix_review_cards_open_created", "review_cards", ["created_at"], _OPEN_CARDS),
+    ("ix_review_cards_task_id", "review_cards", ["task_id"], None),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in _INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_where=where,
+                sqlite_where=where,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _where in reversed(_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,127 @@
+"""Partition tasks, task_results and transactions by created_at
+
+Each table is rebuilt as ``PARTITION BY RANGE (created_at)`` with monthly
+partitions covering the existing rows plus three months ahead; after that
+``PartitionManager.maintain`` owns partition creation and retention.
+
+Postgres requires the partition key in every unique constraint, so the
+primary keys become ``(id, created_at)``, and foreign keys can no longer
+point at ``tasks.id``. Those references (results, transactions, review
+cards, parent tasks) stay declared in the models for ORM joins but are not
+enforced by the database. Rows are copied into the new tables, so run this
+in a maintenance window on large databases. SQLite (tests) is left as is.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 04:05:00.000000
+
+"""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+from alembic import context, op
+
+from chimera.db.partitions import PartitionAction, next_period, period_start
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PREMAKE_MONTHS = 3
+
+# Foreign keys that point at tasks.id, which stops being unique on its own.
+_TASK_REFERENCES = (
+    ("tasks", "tasks_parent_task_id_fkey", "parent_task_id"),
+    ("task_results", "task_results_task_id_fkey", "task_id"),
+    ("transactions", "transactions_task_id_fkey", "task_id"),
+    ("review_cards", "review_cards_task_id_fkey", "task_id"),
+)
+
+# Foreign keys held by the partitioned tables, recreated on the new parents.
+_OUTGOING = {
+    "tasks": (
+        ("tasks_session_id_fkey", "session_id", "swarm_sessions"),
+        ("tasks_agent_id_fkey", "agent_id", "agent_profiles"),
+    ),
+    "task_results": (),
+    "transactions": (("transactions_budget_id_fkey", "budget_id", "budget_configs"),),
+}
+
+_ACTIVE_TASKS = sa.text("status IN ('QUEUED', 'RUNNING')")
+
+_INDEXES: dict[str, tuple[tuple[str, list[str], sa.TextClause | None], ...]] = {
+    "tasks": (
+        ("ix_tasks_status", ["status"], None),
+        ("ix_tasks_type", ["type"], None),
+        ("ix_tasks_session_status_created", ["session_id", "status", "created_at"], None),
+        ("ix_tasks_active_created", ["created_at"], _ACTIVE_TASKS),
+    ),
+    "task_results": (("ix_task_results_task_created", ["task_id", "created_at"], None),),
+    "transactions": (
+        ("ix_transactions_status", ["status"], None),
+        ("ix_transactions_budget_status_created", ["budget_id", "status", "created_at"], None),
+        ("ix_transactions_task_id", ["task_id"], None),
+    ),
+}
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    if context.is_offline_mode():
+        # Partition bounds depend on the oldest existing row.
+        raise RuntimeError("Revision 0003 needs a database connection; run it online.")
+    for table, constraint, _column in _TASK_REFERENCES:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {constraint}")
+    for table in _INDEXES:
+        _rebuild(table, partitioned=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in _INDEXES:
+        _rebuild(table, partitioned=False)
+    for table, constraint, column in _TASK_REFERENCES:
+        op.create_foreign_key(constraint, table, "tasks", [column], ["id"])
+
+
+def _rebuild(table: str, *, partitioned: bool) -> None:
+    old = f"{table}_old"
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    op.execute(f"ALTER TABLE {old} RENAME CONSTRAINT {table}_pkey TO {old}_pkey")
+    for name, *_ in _INDEXES[table]:
+        op.execute(f"ALTER INDEX IF EXISTS {name} RENAME TO {name}_old")
+
+    suffix = " PARTITION BY RANGE (created_at)" if partitioned else ""
+    op.execute(f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS){suffix}")
+    key = ["id", "created_at"] if partitioned else ["id"]
+    op.create_primary_key(f"{table}_pkey", table, key)
+    if partitioned:
+        _create_partitions(table, old)
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")  # noqa: S608
+    op.execute(f"DROP TABLE {old} CASCADE")
+
+    for name, column, referred in _OUTGOING[table]:
+        op.create_foreign_key(name, table, referred, [column], ["id"])
+    for name, columns, where in _INDEXES[table]:
+        op.create_index(name, table, columns, postgresql_where=where)
+
+
+def _create_partitions(table: str, source: str) -> None:
+    now = datetime.now(UTC)
+    query = sa.text(f"SELECT min(created_at) FROM {source}")  # noqa: S608
+    oldest = op.get_bind().execute(query).scalar()
+    start = period_start(min(oldest or now, now), "month")
+    last = period_start(now, "month")
+    for _ in range(PREMAKE_MONTHS):
+        last = next_period(last, "month")
+    while start <= last:
+        end = next_period(start, "month")
+        for statement in PartitionAction("create", table, start, end).statements():
+            op.execute(statement)
+        start = end
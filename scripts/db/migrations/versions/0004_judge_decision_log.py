@@ -0,0 +1,52 @@
+"""Judge decision log
+
+Append-only table written in batches by the decision log sink. It is keyed
+by the domain identifiers and has no foreign keys, so decisions outlive the
+task partitions they refer to.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 03:55:50.086804
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlmodel.sql.sqltypes import AutoString
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "judge_decisions",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("tenant_id", AutoString(), nullable=False),
+        sa.Column("trace_id", AutoString(), nullable=False),
+        sa.Column("task_id", AutoString(), nullable=False),
+        sa.Column("decision", AutoString(), nullable=False),
+        sa.Column("reason", AutoString(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_judge_decisions_task_id"), "judge_decisions", ["task_id"], unique=False
+    )
+    op.create_index(
+        "ix_judge_decisions_tenant_created",
+        "judge_decisions",
+        ["tenant_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_judge_decisions_tenant_created", table_name="judge_decisions")
+    op.drop_index(op.f("ix_judge_decisions_task_id"), table_name="judge_decisions")
+    op.drop_table("judge_decisions")
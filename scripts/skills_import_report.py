@@ -0,0 +1,43 @@
+"""Report per-skill import cost for worker cold starts.
+
+Registers every skill from `skills.json` and installed `chimera.skills` entry
+points lazily, imports them one by one, and prints the import time of each.
+
+Usage:
+  python scripts/skills_import_report.py [--budget-ms 250]
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from chimera.skills.registry import SkillRegistry
+from chimera.skills.samples import register_sample_skills
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--manifest", type=Path, default=REPO_ROOT / "skills.json")
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    registry = SkillRegistry()
+    register_sample_skills(registry, args.manifest)
+    report = registry.load_all()
+
+    total_ms = 0.0
+    for timing in report:
+        elapsed_ms = timing.seconds * 1000
+        total_ms += elapsed_ms
+        print(f"{timing.skill_name:<32} {elapsed_ms:8.2f} ms  {timing.target}")
+    print(f"{'total':<32} {total_ms:8.2f} ms")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        raise SystemExit(f"Skill import cost {total_ms:.2f} ms exceeds budget {args.budget_ms} ms")
+
+
+if __name__ == "__main__":
+    main()
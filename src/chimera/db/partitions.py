@@ -0,0 +1,296 @@
+"""Range partitions by ``created_at`` for the high-volume tables.
+
+On Postgres, ``tasks``, ``task_results`` and ``transactions`` are declared
+``PARTITION BY RANGE (created_at)`` (migration 0003). Each partition holds
+one day or one month and is named ``<table>_p<YYYYMMDD>`` after its lower
+bound. Vacuum and index maintenance then work on small partitions, and
+retention is a metadata-only ``DROP``/``DETACH`` instead of a bulk
+``DELETE`` that bloats the table.
+
+``PartitionManager.maintain`` keeps ``premake`` future partitions ready and
+expires partitions past their retention. Run it at least daily, e.g. with
+``scripts/db/maintain_partitions.py`` from cron. An insert whose
+``created_at`` has no partition fails, so ``premake`` is the safety margin
+for missed runs.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import text
+
+from chimera.lib.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = get_logger(__name__)
+
+PARTITIONED_TABLES: tuple[str, ...] = ("tasks", "task_results", "transactions")
+
+PartitionInterval = Literal["day", "month"]
+PartitionActionKind = Literal["create", "drop", "archive"]
+
+_IDENTIFIER = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+class PartitionPolicy(BaseModel):
+    """How one table is partitioned and expired.
+
+    Attributes:
+        table: Partitioned parent table.
+        interval: Span of one partition.
+        premake: Partitions kept ready beyond the current one.
+        retention_days: Expire partitions whose newest possible row is
+            older than this; ``None`` keeps them forever.
+        archive_schema: Detach expired partitions into this schema (cold
+            storage, e.g. for ``pg_dump`` to object storage) instead of
+            dropping them.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    table: str = Field(pattern=_IDENTIFIER.pattern)
+    interval: PartitionInterval = "month"
+    premake: int = Field(default=3, ge=1)
+    retention_days: int | None = Field(default=None, ge=1)
+    archive_schema: str | None = Field(default=None, pattern=_IDENTIFIER.pattern)
+
+
+DEFAULT_POLICIES: tuple[PartitionPolicy, ...] = (
+    PartitionPolicy(table="tasks", retention_days=90),
+    PartitionPolicy(table="task_results", retention_days=90),
+    # Financial records are never deleted outright.
+    PartitionPolicy(table="transactions", retention_days=400, archive_schema="archive"),
+)
+
+
+def period_start(moment: datetime, interval: PartitionInterval) -> datetime:
+    """Return the lower bound of the partition containing ``moment``.
+
+    Args:
+        moment: Timezone-aware timestamp.
+        interval: Partition span.
+
+    Returns:
+        Midnight UTC of the day, or of the first day of the month.
+
+    Raises:
+        ValueError: If ``moment`` is naive.
+    """
+    if moment.tzinfo is None:
+        raise ValueError("period_start needs a timezone-aware datetime")
+    day = moment.astimezone(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    return day if interval == "day" else day.replace(day=1)
+
+
+def next_period(start: datetime, interval: PartitionInterval) -> datetime:
+    """Return the lower bound of the partition after the one starting at ``start``.
+
+    Args:
+        start: Lower bound from ``period_start``.
+        interval: Partition span.
+
+    Returns:
+        The next lower bound.
+
+    Raises:
+        None.
+    """
+    if interval == "day":
+        return start + timedelta(days=1)
+    if start.month == 12:
+        return start.replace(year=start.year + 1, month=1)
+    return start.replace(month=start.month + 1)
+
+
+def partition_name(table: str, start: datetime) -> str:
+    """Name the partition of ``table`` starting at ``start``.
+
+    Args:
+        table: Parent table.
+        start: Partition lower bound.
+
+    Returns:
+        ``<table>_p<YYYYMMDD>``.
+
+    Raises:
+        None.
+    """
+    return f"{table}_p{start:%Y%m%d}"
+
+
+def parse_partition_name(table: str, name: str) -> datetime | None:
+    """Recover the lower bound from a partition name.
+
+    Args:
+        table: Parent table.
+        name: Child table name.
+
+    Returns:
+        The lower bound, or ``None`` if ``name`` was not made by ``partition_name``.
+
+    Raises:
+        None.
+    """
+    match = re.fullmatch(rf"{re.escape(table)}_p(\d{{8}})", name)
+    if match is None:
+        return None
+    try:
+        return datetime.strptime(match.group(1), "%Y%m%d").replace(tzinfo=UTC)
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionAction:
+    """One partition to create or expire."""
+
+    kind: PartitionActionKind
+    table: str
+    start: datetime
+    end: datetime
+    archive_schema: str | None = None
+
+    @property
+    def name(self) -> str:
+        """Partition table name."""
+        return partition_name(self.table, self.start)
+
+    def statements(self) -> tuple[str, ...]:
+        """Render the DDL for this action.
+
+        Args:
+            None.
+
+        Returns:
+            Statements to run in one transaction.
+
+        Raises:
+            None.
+        """
+        if self.kind == "create":
+            return (
+                f"CREATE TABLE IF NOT EXISTS {self.name} PARTITION OF {self.table} "
+                f"FOR VALUES FROM ('{self.start.isoformat()}') TO ('{self.end.isoformat()}')",
+            )
+        if self.kind == "drop":
+            return (f"DROP TABLE IF EXISTS {self.name}",)
+        return (
+            f"CREATE SCHEMA IF NOT EXISTS {self.archive_schema}",
+            f"ALTER TABLE {self.table} DETACH PARTITION {self.name}",
+            f"ALTER TABLE {self.name} SET SCHEMA {self.archive_schema}",
+        )
+
+
+def plan_maintenance(
+    policy: PartitionPolicy, existing: Collection[str], now: datetime
+) -> list[PartitionAction]:
+    """Work out which partitions to create and which to expire.
+
+    Args:
+        policy: Table policy.
+        existing: Names of the table's current partitions.
+        now: Current time.
+
+    Returns:
+        Create actions for missing current and future partitions, then
+        drop or archive actions for expired ones, oldest first.
+
+    Raises:
+        ValueError: If ``now`` is naive.
+    """
+    actions: list[PartitionAction] = []
+    start = period_start(now, policy.interval)
+    for _ in range(policy.premake + 1):
+        end = next_period(start, policy.interval)
+        if partition_name(policy.table, start) not in existing:
+            actions.append(PartitionAction("create", policy.table, start, end))
+        start = end
+
+    if policy.retention_days is None:
+        return actions
+    cutoff = now - timedelta(days=policy.retention_days)
+    kind: PartitionActionKind = "archive" if policy.archive_schema else "drop"
+    for lower in sorted(filter(None, (parse_partition_name(policy.table, n) for n in existing))):
+        upper = next_period(lower, policy.interval)
+        if upper <= cutoff:
+            actions.append(PartitionAction(kind, policy.table, lower, upper, policy.archive_schema))
+    return actions
+
+
+class PartitionManager:
+    """Creates upcoming partitions and applies retention on Postgres."""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        policies: Sequence[PartitionPolicy] = DEFAULT_POLICIES,
+        *,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self._engine = engine
+        self._policies = tuple(policies)
+        self._clock = clock
+
+    async def partitions(self, table: str) -> list[str]:
+        """List the partitions currently attached to ``table``.
+
+        Args:
+            table: Parent table.
+
+        Returns:
+            Partition names, sorted.
+
+        Raises:
+            sqlalchemy.exc.SQLAlchemyError: If the catalog query fails.
+        """
+        query = text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "WHERE parent.relname = :table ORDER BY child.relname"
+        )
+        async with self._engine.connect() as connection:
+            return list((await connection.execute(query, {"table": table})).scalars())
+
+    async def maintain(self) -> list[PartitionAction]:
+        """Create missing partitions and expire old ones for every policy.
+
+        Args:
+            None.
+
+        Returns:
+            The actions applied; empty on databases other than Postgres.
+
+        Raises:
+            sqlalchemy.exc.SQLAlchemyError: If a DDL statement fails. Actions
+                applied before the failure stay applied.
+        """
+        if self._engine.dialect.name != "postgresql":
+            logger.info("db.partitions_skipped", dialect=self._engine.dialect.name)
+            return []
+        now = self._clock()
+        applied: list[PartitionAction] = []
+        for policy in self._policies:
+            existing = await self.partitions(policy.table)
+            for action in plan_maintenance(policy, existing, now):
+                async with self._engine.begin() as connection:
+                    for statement in action.statements():
+                        await connection.execute(text(statement))
+                applied.append(action)
+                logger.info(
+                    "db.partition_" + action.kind,
+                    table=action.table,
+                    partition=action.name,
+                    start=action.start.isoformat(),
+                    end=action.end.isoformat(),
+                )
+        return applied
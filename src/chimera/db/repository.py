@@ -0,0 +1,297 @@
+"""Async data access for tasks, results, transactions and review cards.
+
+Writes go through bulk helpers that send one multi-row statement per batch
+instead of one round trip per row. Reads take an explicit ``load`` set of
+relationships, fetched with one extra ``SELECT ... WHERE id IN (...)`` per
+relationship regardless of how many rows were returned. Relationships that
+were not requested raise on access instead of silently querying per row.
+
+``tasks``, ``task_results`` and ``transactions`` are partitioned by
+``created_at`` on Postgres (see ``chimera.db.partitions``). Reads on them are
+bounded by ``since``, which defaults to the repository's ``lookback`` window,
+so the planner only touches recent partitions. Results and transactions are
+never older than their task, so the same bound applies when loading them as
+relationships. Tasks loaded as relationships (a task's ``parent``, a review
+card's ``task``) are bounded too; one created before ``since`` is left unset.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import selectinload, with_loader_criteria
+from sqlmodel import SQLModel, col
+
+from chimera.db.schema import ReviewCard, Task, TaskResult, Transaction
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Sequence
+    from uuid import UUID
+
+    from sqlalchemy.sql import Select
+
+    from chimera.db.engine import Database
+
+RowT = TypeVar("RowT", bound=SQLModel)
+
+TaskRelation = Literal["results", "reviews", "transactions", "session", "agent", "parent"]
+
+_TASK_RELATIONS: dict[TaskRelation, Any] = {
+    "results": Task.results,
+    "reviews": Task.reviews,
+    "transactions": Task.transactions,
+    "session": Task.session,
+    "agent": Task.agent,
+    "parent": Task.parent,
+}
+
+DEFAULT_LOOKBACK = timedelta(days=31)
+
+
+class Repository:
+    """Bulk writes and relationship-aware reads over one ``Database``."""
+
+    def __init__(
+        self,
+        database: Database,
+        *,
+        lookback: timedelta = DEFAULT_LOOKBACK,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self._db = database
+        self._lookback = lookback
+        self._clock = clock
+
+    async def add_tasks(self, rows: Sequence[Task]) -> int:
+        """Insert tasks in one batched statement.
+
+        Args:
+            rows: Tasks to insert.
+
+        Returns:
+            Number of rows inserted.
+
+        Raises:
+            sqlalchemy.exc.IntegrityError: If a row violates a constraint.
+        """
+        return await self._bulk_insert(Task, rows)
+
+    async def add_results(self, rows: Sequence[TaskResult]) -> int:
+        """Insert task results in one batched statement.
+
+        Args:
+            rows: Results to insert.
+
+        Returns:
+            Number of rows inserted.
+
+        Raises:
+            sqlalchemy.exc.IntegrityError: If a row violates a constraint.
+        """
+        return await self._bulk_insert(TaskResult, rows)
+
+    async def add_transactions(self, rows: Sequence[Transaction]) -> int:
+        """Insert transactions in one batched statement.
+
+        Args:
+            rows: Transactions to insert.
+
+        Returns:
+            Number of rows inserted.
+
+        Raises:
+            sqlalchemy.exc.IntegrityError: If a row violates a constraint.
+        """
+        return await self._bulk_insert(Transaction, rows)
+
+    async def add_review_cards(self, rows: Sequence[ReviewCard]) -> int:
+        """Insert review cards in one batched statement.
+
+        Args:
+            rows: Review cards to insert.
+
+        Returns:
+            Number of rows inserted.
+
+        Raises:
+            sqlalchemy.exc.IntegrityError: If a row violates a constraint.
+        """
+        return await self._bulk_insert(ReviewCard, rows)
+
+    async def get_tasks(
+        self,
+        task_ids: Collection[UUID],
+        *,
+        since: datetime | None = None,
+        load: Collection[TaskRelation] = (),
+    ) -> list[Task]:
+        """Fetch tasks by id.
+
+        Args:
+            task_ids: Ids to fetch; unknown ids are skipped.
+            since: Only consider tasks created at or after this time;
+                defaults to the lookback window.
+            load: Relationships to populate on the returned tasks.
+
+        Returns:
+            The tasks found, in no particular order.
+
+        Raises:
+            sqlalchemy.exc.SQLAlchemyError: If the query fails.
+        """
+        if not task_ids:
+            return []
+        bound = self._since(since)
+        query = select(Task).where(col(Task.id).in_(task_ids), col(Task.created_at) >= bound)
+        return await self._all(_with_task_relations(query, load, bound))
+
+    async def tasks_for_session(
+        self,
+        session_id: UUID,
+        *,
+        status: str | None = None,
+        limit: int = 100,
+        since: datetime | None = None,
+        load: Collection[TaskRelation] = (),
+    ) -> list[Task]:
+        """Fetch a swarm session's most recent tasks.
+
+        Args:
+            session_id: Swarm session id.
+            status: Only return tasks in this status.
+            limit: Maximum number of tasks.
+            since: Only consider tasks created at or after this time;
+                defaults to the lookback window.
+            load: Relationships to populate on the returned tasks.
+
+        Returns:
+            Tasks ordered newest first.
+
+        Raises:
+            sqlalchemy.exc.SQLAlchemyError: If the query fails.
+        """
+        bound = self._since(since)
+        query = select(Task).where(
+            col(Task.session_id) == session_id, col(Task.created_at) >= bound
+        )
+        if status is not None:
+            query = query.where(col(Task.status) == status)
+        query = query.order_by(col(Task.created_at).desc()).limit(limit)
+        return await self._all(_with_task_relations(query, load, bound))
+
+    async def results_for_tasks(
+        self, task_ids: Collection[UUID], *, since: datetime | None = None
+    ) -> dict[UUID, list[TaskResult]]:
+        """Fetch the results of many tasks in one query.
+
+        Args:
+            task_ids: Task ids.
+            since: Only consider results created at or after this time;
+                defaults to the lookback window.
+
+        Returns:
+            Results per task id, oldest first; tasks without results are absent.
+
+        Raises:
+            sqlalchemy.exc.SQLAlchemyError: If the query fails.
+        """
+        if not task_ids:
+            return {}
+        query = (
+            select(TaskResult)
+            .where(
+                col(TaskResult.task_id).in_(task_ids),
+                col(TaskResult.created_at) >= self._since(since),
+            )
+            .order_by(col(TaskResult.created_at))
+        )
+        grouped: dict[UUID, list[TaskResult]] = {}
+        for result in await self._all(query):
+            grouped.setdefault(result.task_id, []).append(result)
+        return grouped
+
+    async def open_review_cards(
+        self, *, limit: int = 100, since: datetime | None = None
+    ) -> list[ReviewCard]:
+        """Fetch the oldest open review cards with their tasks loaded.
+
+        Args:
+            limit: Maximum number of cards.
+            since: Only consider cards, and load tasks, created at or after
+                this time; defaults to the lookback window.
+
+        Returns:
+            Cards ordered oldest first, each with ``task`` populated.
+
+        Raises:
+            sqlalchemy.exc.SQLAlchemyError: If the query fails.
+        """
+        bound = self._since(since)
+        query = (
+            select(ReviewCard)
+            .where(col(ReviewCard.status) == "OPEN", col(ReviewCard.created_at) >= bound)
+            .order_by(col(ReviewCard.created_at))
+            .limit(limit)
+            .options(
+                selectinload(ReviewCard.task),  # type: ignore[arg-type]
+                with_loader_criteria(Task, col(Task.created_at) >= bound),
+            )
+        )
+        return await self._all(query)
+
+    async def transactions_for_budget(
+        self, budget_id: UUID, *, since: datetime | None = None
+    ) -> list[Transaction]:
+        """Fetch a budget's transactions.
+
+        Args:
+            budget_id: Budget config id.
+            since: Only return transactions created at or after this time;
+                defaults to the lookback window.
+
+        Returns:
+            Transactions ordered oldest first.
+
+        Raises:
+            sqlalchemy.exc.SQLAlchemyError: If the query fails.
+        """
+        query = select(Transaction).where(
+            col(Transaction.budget_id) == budget_id,
+            col(Transaction.created_at) >= self._since(since),
+        )
+        return await self._all(query.order_by(col(Transaction.created_at)))
+
+    async def _bulk_insert(self, model: type[RowT], rows: Sequence[RowT]) -> int:
+        if not rows:
+            return 0
+        # ORM bulk INSERT maps attribute names (e.g. metadata_json) to columns
+        # and is sent as multi-row VALUES batches.
+        values = [row.model_dump() for row in rows]
+        async with self._db.session() as session:
+            await session.execute(insert(model), values)
+        return len(values)
+
+    def _since(self, since: datetime | None) -> datetime:
+        return since if since is not None else self._clock() - self._lookback
+
+    async def _all(self, query: Select[Any]) -> list[Any]:
+        async with self._db.session() as session:
+            return list((await session.scalars(query)).all())
+
+
+def _with_task_relations(
+    query: Select[Any], load: Collection[TaskRelation], since: datetime
+) -> Select[Any]:
+    for name in load:
+        query = query.options(selectinload(_TASK_RELATIONS[name]))
+    if "parent" in load:
+        query = query.options(with_loader_criteria(Task, col(Task.created_at) >= since))
+    if "results" in load:
+        query = query.options(with_loader_criteria(TaskResult, col(TaskResult.created_at) >= since))
+    if "transactions" in load:
+        query = query.options(
+            with_loader_criteria(Transaction, col(Transaction.created_at) >= since)
+        )
+    return query
@@ -1,14 +1,36 @@
 from typing import Optional, List
-from datetime import datetime
+from datetime import UTC, datetime
 from decimal import Decimal
 from uuid import UUID, uuid4
-from sqlmodel import SQLModel, Field, Relationship, JSON
-from sqlalchemy import Column
+from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import JSON, Column, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 
+# JSONB on Postgres; plain JSON elsewhere so the schema also builds on SQLite for tests.
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+# Relationships must be loaded explicitly (see chimera.db.repository); an
+# attribute access that would emit a query per row raises instead.
+_NO_LAZY_LOAD = {"lazy": "raise_on_sql"}
+
+
+def _partial_index(name: str, *columns: str, where: str) -> Index:
+    # Partial indexes are honoured by Postgres and SQLite; other dialects get a full index.
+    return Index(name, *columns, postgresql_where=text(where), sqlite_where=text(where))
+
+
+def _utcnow() -> datetime:
+    # Timestamp columns are timezone-aware; naive values are rejected on insert.
+    return datetime.now(UTC)
+
+
 # -----------------------------------------------------------------------------
 # Identity & Orchestration
 # -----------------------------------------------------------------------------
+# On Postgres, tasks, task_results and transactions are range-partitioned by
+# created_at (see chimera.db.partitions), so their primary keys there are
+# (id, created_at) and foreign keys to tasks.id are not enforced.
 
 
 class SwarmSession(SQLModel, table=True):
@@ -17,16 +39,21 @@ class SwarmSession(SQLModel, table=True):
     """
 
     __tablename__ = "swarm_sessions"
+    __table_args__ = (
+        Index("ix_swarm_sessions_tenant_status_created", "tenant_id", "status", "created_at"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     tenant_id: UUID = Field(index=True, nullable=False)
     status: str = Field(index=True)  # e.g., "active", "completed"
-    context: dict = Field(default={}, sa_column=Column(JSONB))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    context: dict = Field(default={}, sa_column=Column(JSONType))
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
     # Relationships
-    tasks: List["Task"] = Relationship(back_populates="session")
+    tasks: List["Task"] = Relationship(
+        back_populates="session", sa_relationship_kwargs=_NO_LAZY_LOAD
+    )
 
 
 class AgentProfile(SQLModel, table=True):
@@ -40,10 +67,10 @@ class AgentProfile(SQLModel, table=True):
     tenant_id: UUID = Field(index=True, nullable=False)
     name: str
     role: str
-    tools_config: dict = Field(default={}, sa_column=Column(JSONB))
+    tools_config: dict = Field(default={}, sa_column=Column(JSONType))
 
     # Relationships
-    tasks: List["Task"] = Relationship(back_populates="agent")
+    tasks: List["Task"] = Relationship(back_populates="agent", sa_relationship_kwargs=_NO_LAZY_LOAD)
 
 
 class Task(SQLModel, table=True):
@@ -52,6 +79,14 @@ class Task(SQLModel, table=True):
     """
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Tasks of a session in a given state, newest first.
+        Index("ix_tasks_session_status_created", "session_id", "status", "created_at"),
+        # Work that is still queued or running, oldest first.
+        _partial_index(
+            "ix_tasks_active_created", "created_at", where="status IN ('QUEUED', 'RUNNING')"
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     session_id: Optional[UUID] = Field(default=None, foreign_key="swarm_sessions.id")
@@ -60,21 +95,33 @@ class Task(SQLModel, table=True):
 
     type: str = Field(index=True)
     status: str = Field(index=True, default="QUEUED")
-    input_payload: dict = Field(default={}, sa_column=Column(JSONB))
+    input_payload: dict = Field(default={}, sa_column=Column(JSONType))
     priority: int = Field(default=0)
     attempt_count: int = Field(default=0)
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
     # Relationships
-    session: Optional[SwarmSession] = Relationship(back_populates="tasks")
-    agent: Optional[AgentProfile] = Relationship(back_populates="tasks")
-    parent: Optional["Task"] = Relationship(sa_relationship_kwargs={"remote_side": "Task.id"})
-    results: List["TaskResult"] = Relationship(back_populates="task")
-    transactions: List["Transaction"] = Relationship(back_populates="task")
-    reviews: List["ReviewCard"] = Relationship(back_populates="task")
+    session: Optional[SwarmSession] = Relationship(
+        back_populates="tasks", sa_relationship_kwargs=_NO_LAZY_LOAD
+    )
+    agent: Optional[AgentProfile] = Relationship(
+        back_populates="tasks", sa_relationship_kwargs=_NO_LAZY_LOAD
+    )
+    parent: Optional["Task"] = Relationship(
+        sa_relationship_kwargs={"remote_side": "Task.id", **_NO_LAZY_LOAD}
+    )
+    results: List["TaskResult"] = Relationship(
+        back_populates="task", sa_relationship_kwargs=_NO_LAZY_LOAD
+    )
+    transactions: List["Transaction"] = Relationship(
+        back_populates="task", sa_relationship_kwargs=_NO_LAZY_LOAD
+    )
+    reviews: List["ReviewCard"] = Relationship(
+        back_populates="task", sa_relationship_kwargs=_NO_LAZY_LOAD
+    )
 
 
 class TaskResult(SQLModel, table=True):
@@ -83,16 +130,17 @@ class TaskResult(SQLModel, table=True):
     """
 
     __tablename__ = "task_results"
+    __table_args__ = (Index("ix_task_results_task_created", "task_id", "created_at"),)
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     task_id: UUID = Field(foreign_key="tasks.id")
     status: str
-    output_payload: dict = Field(default={}, sa_column=Column(JSONB))
+    output_payload: dict = Field(default={}, sa_column=Column(JSONType))
     artifact_uri: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
 
     # Relationships
-    task: Task = Relationship(back_populates="results")
+    task: Task = Relationship(back_populates="results", sa_relationship_kwargs=_NO_LAZY_LOAD)
 
 
 # -----------------------------------------------------------------------------
@@ -114,7 +162,9 @@ class BudgetConfig(SQLModel, table=True):
     is_active: bool = Field(default=True)
 
     # Relationships
-    transactions: List["Transaction"] = Relationship(back_populates="budget")
+    transactions: List["Transaction"] = Relationship(
+        back_populates="budget", sa_relationship_kwargs=_NO_LAZY_LOAD
+    )
 
 
 class Transaction(SQLModel, table=True):
@@ -123,6 +173,11 @@ class Transaction(SQLModel, table=True):
     """
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        # A budget's transactions in a given state over a time window (daily spend).
+        Index("ix_transactions_budget_status_created", "budget_id", "status", "created_at"),
+        Index("ix_transactions_task_id", "task_id"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     budget_id: UUID = Field(foreign_key="budget_configs.id")
@@ -132,13 +187,17 @@ class Transaction(SQLModel, table=True):
     asset_symbol: str
     status: str = Field(index=True)  # PENDING, EXECUTED, REJECTED
     metadata_json: dict = Field(
-        default={}, sa_column=Column(JSONB, name="metadata")
+        default={}, sa_column=Column(JSONType, name="metadata")
     )  # 'metadata' is reserved in SQLModel
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
 
     # Relationships
-    budget: BudgetConfig = Relationship(back_populates="transactions")
-    task: Optional[Task] = Relationship(back_populates="transactions")
+    budget: BudgetConfig = Relationship(
+        back_populates="transactions", sa_relationship_kwargs=_NO_LAZY_LOAD
+    )
+    task: Optional[Task] = Relationship(
+        back_populates="transactions", sa_relationship_kwargs=_NO_LAZY_LOAD
+    )
 
 
 # -----------------------------------------------------------------------------
@@ -152,14 +211,40 @@ class ReviewCard(SQLModel, table=True):
     """
 
     __tablename__ = "review_cards"
+    __table_args__ = (
+        # The review queue: open cards oldest first. Resolved cards are most
+        # of the table and are left out of the index.
+        _partial_index("ix_review_cards_open_created", "created_at", where="status = 'OPEN'"),
+        Index("ix_review_cards_task_id", "task_id"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     task_id: UUID = Field(foreign_key="tasks.id")
     trigger_reason: str
     status: str = Field(default="OPEN")  # OPEN, RESOLVED, REJECTED
     reviewer_id: Optional[UUID] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
     resolved_at: Optional[datetime] = None
 
     # Relationships
-    task: Task = Relationship(back_populates="reviews")
+    task: Task = Relationship(back_populates="reviews", sa_relationship_kwargs=_NO_LAZY_LOAD)
+
+
+class JudgeDecision(SQLModel, table=True):
+    """
+    Append-only record of a Judge decision, written in batches by
+    chimera.services.decision_log.
+    """
+
+    __tablename__ = "judge_decisions"
+    __table_args__ = (Index("ix_judge_decisions_tenant_created", "tenant_id", "created_at"),)
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    # Domain identifiers (e.g. "t_acme"), not foreign keys: decisions are kept
+    # after the tasks they refer to have been partitioned away.
+    tenant_id: str
+    trace_id: str
+    task_id: str = Field(index=True)
+    decision: str  # approve, deny, hitl
+    reason: str
+    created_at: datetime = Field(default_factory=_utcnow)
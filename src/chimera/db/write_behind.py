@@ -0,0 +1,686 @@
+"""Write-behind persistence of task status transitions and results.
+
+High-frequency task updates are buffered and flushed to Postgres in
+micro-batches (see ``specs/data-architecture.md``), so database write IOPS
+grow with the flush rate rather than with task throughput. Status updates
+for the same task coalesce in the buffer, so only the latest one is written.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Protocol
+from uuid import UUID, uuid4
+
+from sqlalchemy import DateTime, Table, Uuid, bindparam, func, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from chimera.db.partitions import PARTITIONED_TABLES
+from chimera.db.schema import Task as TaskRow
+from chimera.db.schema import TaskResult
+from chimera.lib.logging import get_logger
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from redis.asyncio import Redis
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlalchemy.sql.dml import Insert
+
+logger = get_logger(__name__)
+
+TASKS: Table = TaskRow.__table__  # type: ignore[attr-defined]
+TASK_RESULTS: Table = TaskResult.__table__  # type: ignore[attr-defined]
+
+
+@dataclass(frozen=True, slots=True)
+class TaskStatusUpdate:
+    """Latest known state of a task row.
+
+    ``None`` timestamps and attempt counts leave the stored value unchanged.
+    ``created_at`` identifies the row rather than updating it: with it, the
+    update on a partitioned Postgres ``tasks`` table touches only the row's
+    partition instead of probing every partition for the ID.
+    """
+
+    task_id: UUID
+    status: str
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+    attempt_count: int | None = None
+    created_at: datetime | None = None
+
+    def merged(self, newer: TaskStatusUpdate | None) -> TaskStatusUpdate:
+        """Combine with a later update, keeping fields the later one leaves unset.
+
+        Args:
+            newer: Later update for the same task, if any.
+
+        Returns:
+            The combined update.
+
+        Raises:
+            None.
+        """
+        if newer is None:
+            return self
+        return TaskStatusUpdate(
+            task_id=self.task_id,
+            status=newer.status,
+            started_at=newer.started_at or self.started_at,
+            completed_at=newer.completed_at or self.completed_at,
+            attempt_count=(
+                newer.attempt_count if newer.attempt_count is not None else self.attempt_count
+            ),
+            created_at=self.created_at or newer.created_at,
+        )
+
+
+@dataclass(slots=True)
+class WriteBatch:
+    """Buffered writes taken for one flush."""
+
+    statuses: dict[UUID, TaskStatusUpdate] = field(default_factory=dict)
+    results: list[dict[str, Any]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.statuses) + len(self.results)
+
+
+class WriteBuffer(Protocol):
+    """Storage for writes that have not been flushed yet."""
+
+    async def add_status(self, update: TaskStatusUpdate) -> int:
+        """Buffer a status update, replacing any older one for the task; return buffer size."""
+        ...
+
+    async def add_result(self, row: dict[str, Any]) -> int:
+        """Buffer a ``task_results`` row; return buffer size."""
+        ...
+
+    async def take(self) -> WriteBatch:
+        """Hand out buffered writes for flushing."""
+        ...
+
+    async def commit(self, batch: WriteBatch) -> None:
+        """Forget a batch once it is durable in the database."""
+        ...
+
+    async def restore(self, batch: WriteBatch) -> None:
+        """Return a batch whose flush failed so it is retried."""
+        ...
+
+
+class InMemoryWriteBuffer:
+    """Process-local buffer. Unflushed writes are lost if the process dies.
+
+    Args:
+        None.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    def __init__(self) -> None:
+        self._batch = WriteBatch()
+
+    async def add_status(self, update: TaskStatusUpdate) -> int:
+        """Buffer a status update, replacing any older one for the same task.
+
+        Args:
+            update: Latest task state.
+
+        Returns:
+            Number of buffered writes.
+
+        Raises:
+            None.
+        """
+        statuses = self._batch.statuses
+        previous = statuses.get(update.task_id)
+        statuses[update.task_id] = previous.merged(update) if previous else update
+        return len(self._batch)
+
+    async def add_result(self, row: dict[str, Any]) -> int:
+        """Buffer a ``task_results`` row.
+
+        Args:
+            row: Column values.
+
+        Returns:
+            Number of buffered writes.
+
+        Raises:
+            None.
+        """
+        self._batch.results.append(row)
+        return len(self._batch)
+
+    async def take(self) -> WriteBatch:
+        """Hand out everything buffered so far.
+
+        Returns:
+            The batch; the buffer starts empty again.
+
+        Raises:
+            None.
+        """
+        batch, self._batch = self._batch, WriteBatch()
+        return batch
+
+    async def commit(self, batch: WriteBatch) -> None:
+        """Nothing to do: taken writes are no longer held.
+
+        Args:
+            batch: Flushed batch.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        _ = batch
+
+    async def restore(self, batch: WriteBatch) -> None:
+        """Put a failed batch back, keeping newer status updates.
+
+        Args:
+            batch: Batch whose flush failed.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        statuses = self._batch.statuses
+        for task_id, older in batch.statuses.items():
+            statuses[task_id] = older.merged(statuses.get(task_id))
+        self._batch.results[:0] = batch.results
+
+
+class RedisWriteBuffer:
+    """Buffer kept in Redis so unflushed writes survive a process crash.
+
+    Status updates live in a hash with one field per task attribute, so each
+    ``HSET`` atomically merges into what is buffered; results live in a
+    list. Any number of processes may buffer into the same prefix, but only
+    one flushes at a time: ``take`` is a single Lua script that acquires a
+    flush lease for this buffer instance and renames both keys to
+    ``:flushing`` keys. Batches are therefore flushed one after another in
+    the order they were taken, and a status never goes back to an older one.
+
+    ``commit`` deletes the ``:flushing`` keys and the lease only while this
+    instance still holds the lease. If a flusher crashes, its lease expires
+    after ``flush_lease_ms`` and the next ``take`` replays the orphaned
+    batch. Replays are idempotent: updates rewrite the same values and
+    results are inserted with ``ON CONFLICT DO NOTHING``. ``flush_lease_ms``
+    must exceed the longest flush; a flush outliving its lease can be
+    overtaken by newer batches.
+
+    Args:
+        redis_client: Async Redis client.
+        key_prefix: Prefix for the buffer keys.
+        flush_lease_ms: How long a flusher may hold the flush lease.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        *,
+        key_prefix: str = "chimera:write_behind",
+        flush_lease_ms: int = 60_000,
+    ) -> None:
+        self._redis = redis_client
+        self._statuses = f"{key_prefix}:statuses"
+        self._results = f"{key_prefix}:results"
+        self._flushing = (f"{self._statuses}:flushing", f"{self._results}:flushing")
+        self._lease = f"{key_prefix}:flush_lease"
+        self._owner = uuid4().hex
+        self._flush_lease_ms = flush_lease_ms
+        self._take = redis_client.register_script(_TAKE)
+        self._commit = redis_client.register_script(_COMMIT)
+        self._release = redis_client.register_script(_RELEASE)
+
+    async def add_status(self, update: TaskStatusUpdate) -> int:
+        """Buffer a status update, replacing any older one for the same task.
+
+        Args:
+            update: Latest task state.
+
+        Returns:
+            Approximate number of buffered writes (status fields count individually).
+
+        Raises:
+            redis.RedisError: If Redis is unavailable.
+        """
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hset(self._statuses, mapping=_status_fields(update))  # type: ignore[arg-type]
+        pipe.hlen(self._statuses)
+        pipe.llen(self._results)
+        _, statuses, results = await pipe.execute()
+        return int(statuses) + int(results)
+
+    async def add_result(self, row: dict[str, Any]) -> int:
+        """Buffer a ``task_results`` row.
+
+        Args:
+            row: Column values.
+
+        Returns:
+            Number of buffered writes.
+
+        Raises:
+            redis.RedisError: If Redis is unavailable.
+        """
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.rpush(self._results, _row_to_json(TASK_RESULTS, row))
+        pipe.hlen(self._statuses)
+        pipe.llen(self._results)
+        _, statuses, results = await pipe.execute()
+        return int(statuses) + int(results)
+
+    async def take(self) -> WriteBatch:
+        """Take the flush lease, move buffered writes to ``:flushing`` and read them.
+
+        A batch left behind by a failed or crashed flush is returned as is,
+        before anything newer.
+
+        Returns:
+            The batch to flush; empty while another instance holds the lease.
+
+        Raises:
+            redis.RedisError: If Redis is unavailable.
+        """
+        statuses, results = await self._take(
+            keys=[self._statuses, self._results, *self._flushing, self._lease],
+            args=[self._owner, self._flush_lease_ms],
+        )
+        fields = dict(zip(statuses[::2], statuses[1::2], strict=True))
+        batch = WriteBatch(statuses=_parse_status_fields(fields))
+        batch.results = [_row_from_json(TASK_RESULTS, payload) for payload in results]
+        return batch
+
+    async def commit(self, batch: WriteBatch) -> None:
+        """Delete the ``:flushing`` keys and release the lease, if still held.
+
+        Args:
+            batch: Flushed batch.
+
+        Returns:
+            None.
+
+        Raises:
+            redis.RedisError: If Redis is unavailable.
+        """
+        _ = batch
+        if not await self._commit(keys=[*self._flushing, self._lease], args=[self._owner]):
+            # Another flusher has taken over and will replay the same batch.
+            logger.warning("write_behind.lease_lost", lease_ms=self._flush_lease_ms)
+
+    async def restore(self, batch: WriteBatch) -> None:
+        """Keep the ``:flushing`` keys and release the lease so any flusher retries them.
+
+        Args:
+            batch: Batch whose flush failed.
+
+        Returns:
+            None.
+
+        Raises:
+            redis.RedisError: If Redis is unavailable.
+        """
+        _ = batch
+        await self._release(keys=[self._lease], args=[self._owner])
+
+
+class WriteBehindPersister:
+    """Buffers task status transitions and results, flushing them in bulk.
+
+    A flush runs every ``flush_interval_s`` or as soon as ``max_batch``
+    writes are buffered. Each flush is one transaction with two executemany
+    statements: an ``UPDATE tasks`` for the coalesced status updates and an
+    ``INSERT ... ON CONFLICT (id) DO NOTHING`` into ``task_results``. A
+    failed flush is returned to the buffer and retried. ``close`` stops the
+    timer and flushes what is left; use ``RedisWriteBuffer`` when writes
+    must also survive a crash.
+
+    Args:
+        engine: Async SQLAlchemy engine.
+        buffer: Where writes wait; defaults to an in-memory buffer.
+        flush_interval_s: Maximum time between flushes.
+        max_batch: Buffered writes that trigger an early flush.
+
+    Returns:
+        None.
+
+    Raises:
+        ValueError: If ``flush_interval_s`` or ``max_batch`` is not positive.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        buffer: WriteBuffer | None = None,
+        *,
+        flush_interval_s: float = 5.0,
+        max_batch: int = 500,
+    ) -> None:
+        if flush_interval_s <= 0 or max_batch < 1:
+            raise ValueError("flush_interval_s and max_batch must be positive")
+        self._engine = engine
+        self._buffer = buffer or InMemoryWriteBuffer()
+        self._flush_interval_s = flush_interval_s
+        self._max_batch = max_batch
+        self._flush_lock = asyncio.Lock()
+        self._size_reached = asyncio.Event()
+        self._loop_task: asyncio.Task[None] | None = None
+        self._flushed = 0
+
+    async def __aenter__(self) -> WriteBehindPersister:
+        """Start the flush loop.
+
+        Returns:
+            The running persister.
+
+        Raises:
+            None.
+        """
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop the flush loop and flush remaining writes.
+
+        Raises:
+            Exception: If the final flush fails.
+        """
+        await self.close()
+
+    @property
+    def flushed(self) -> int:
+        """Number of writes flushed so far."""
+        return self._flushed
+
+    def start(self) -> None:
+        """Start the background flush loop. Starting twice is a no-op.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the flush loop and flush remaining writes.
+
+        Returns:
+            None.
+
+        Raises:
+            Exception: If the final flush fails; the writes stay buffered.
+        """
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._loop_task
+            self._loop_task = None
+        await self.flush()
+
+    async def record_status(self, update: TaskStatusUpdate) -> None:
+        """Buffer a task status transition.
+
+        Args:
+            update: Latest task state.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        if await self._buffer.add_status(update) >= self._max_batch:
+            self._size_reached.set()
+
+    async def record_result(self, result: TaskResult) -> None:
+        """Buffer a ``task_results`` row.
+
+        Args:
+            result: Row to insert.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        if await self._buffer.add_result(result.model_dump()) >= self._max_batch:
+            self._size_reached.set()
+
+    async def flush(self) -> int:
+        """Write everything buffered in one transaction.
+
+        Returns:
+            Number of writes flushed.
+
+        Raises:
+            Exception: Whatever the database raises; the batch is restored.
+        """
+        async with self._flush_lock:
+            batch = await self._buffer.take()
+            if not batch:
+                return 0
+            try:
+                async with self._engine.begin() as connection:
+                    by_id, by_key = _status_params(batch.statuses)
+                    if by_id:
+                        await connection.execute(_STATUS_UPDATE, by_id)
+                    if by_key:
+                        await connection.execute(_STATUS_UPDATE_BY_KEY, by_key)
+                    if batch.results:
+                        insert = insert_ignoring_conflicts(TASK_RESULTS, connection.dialect.name)
+                        await connection.execute(insert, batch.results)
+            except BaseException:
+                await self._buffer.restore(batch)
+                raise
+            await self._buffer.commit(batch)
+            self._flushed += len(batch)
+            return len(batch)
+
+    async def _run(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._size_reached.wait(), self._flush_interval_s)
+            self._size_reached.clear()
+            try:
+                await self.flush()
+            except Exception as exc:
+                logger.warning("write_behind.flush_failed", error=str(exc))
+
+
+def insert_ignoring_conflicts(table: Table, dialect_name: str) -> Insert:
+    """Build ``INSERT ... ON CONFLICT (id) DO NOTHING`` for the dialect.
+
+    Partitioned tables on Postgres are keyed by ``(id, created_at)``, so the
+    conflict target includes ``created_at`` there.
+
+    Args:
+        table: Target table with an ``id`` primary key.
+        dialect_name: SQLAlchemy dialect name of the connection.
+
+    Returns:
+        The insert statement, to execute with a list of rows.
+
+    Raises:
+        ValueError: If the dialect has no ``ON CONFLICT`` support.
+    """
+    if dialect_name == "postgresql":
+        key = ["id", "created_at"] if table.name in PARTITIONED_TABLES else ["id"]
+        return postgresql.insert(table).on_conflict_do_nothing(index_elements=key)
+    if dialect_name == "sqlite":
+        return sqlite.insert(table).on_conflict_do_nothing(index_elements=["id"])
+    raise ValueError(f"Unsupported dialect for bulk upserts: {dialect_name}")
+
+
+# KEYS: statuses, results, statuses:flushing, results:flushing, lease
+# ARGV: owner, lease ms
+_TAKE = """
+local holder = redis.call('GET', KEYS[5])
+if holder and holder ~= ARGV[1] then
+    return {{}, {}}
+end
+for i = 1, 2 do
+    if redis.call('EXISTS', KEYS[i + 2]) == 0 and redis.call('EXISTS', KEYS[i]) == 1 then
+        redis.call('RENAME', KEYS[i], KEYS[i + 2])
+    end
+end
+local statuses = redis.call('HGETALL', KEYS[3])
+local results = redis.call('LRANGE', KEYS[4], 0, -1)
+if #statuses == 0 and #results == 0 then
+    redis.call('DEL', KEYS[5])
+else
+    redis.call('SET', KEYS[5], ARGV[1], 'PX', ARGV[2])
+end
+return {statuses, results}
+"""
+
+# KEYS: statuses:flushing, results:flushing, lease; ARGV: owner
+_COMMIT = """
+if redis.call('GET', KEYS[3]) ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1], KEYS[2], KEYS[3])
+return 1
+"""
+
+# KEYS: lease; ARGV: owner
+_RELEASE = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+_STATUS_UPDATE = (
+    update(TASKS)
+    .where(TASKS.c.id == bindparam("b_id"))
+    .values(
+        status=bindparam("b_status"),
+        started_at=func.coalesce(bindparam("b_started_at"), TASKS.c.started_at),
+        completed_at=func.coalesce(bindparam("b_completed_at"), TASKS.c.completed_at),
+        attempt_count=func.coalesce(bindparam("b_attempt_count"), TASKS.c.attempt_count),
+    )
+)
+# Same update keyed by the full (id, created_at) primary key of the partitioned table.
+_STATUS_UPDATE_BY_KEY = _STATUS_UPDATE.where(TASKS.c.created_at == bindparam("b_created_at"))
+
+
+def _status_params(
+    statuses: dict[UUID, TaskStatusUpdate],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    by_id: list[dict[str, Any]] = []
+    by_key: list[dict[str, Any]] = []
+    for status in statuses.values():
+        params = {
+            "b_id": status.task_id,
+            "b_status": status.status,
+            "b_started_at": status.started_at,
+            "b_completed_at": status.completed_at,
+            "b_attempt_count": status.attempt_count,
+        }
+        if status.created_at is None:
+            by_id.append(params)
+        else:
+            params["b_created_at"] = status.created_at
+            by_key.append(params)
+    return by_id, by_key
+
+
+def _row_to_json(table: Table, row: dict[str, Any]) -> str:
+    return json.dumps(
+        {name: _jsonable(value) for name, value in row.items() if name in table.c},
+        separators=(",", ":"),
+    )
+
+
+def _row_from_json(table: Table, payload: bytes | str) -> dict[str, Any]:
+    row: dict[str, Any] = json.loads(payload)
+    for column in table.columns:
+        value = row.get(column.name)
+        if value is None:
+            continue
+        column_type = getattr(column.type, "impl", column.type)
+        if isinstance(column_type, Uuid):
+            row[column.name] = UUID(value)
+        elif isinstance(column_type, DateTime):
+            row[column.name] = datetime.fromisoformat(value)
+    return row
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _status_fields(update: TaskStatusUpdate) -> dict[str, str]:
+    prefix = f"{update.task_id}|"
+    fields = {f"{prefix}status": update.status}
+    if update.started_at is not None:
+        fields[f"{prefix}started_at"] = update.started_at.isoformat()
+    if update.completed_at is not None:
+        fields[f"{prefix}completed_at"] = update.completed_at.isoformat()
+    if update.attempt_count is not None:
+        fields[f"{prefix}attempt_count"] = str(update.attempt_count)
+    if update.created_at is not None:
+        fields[f"{prefix}created_at"] = update.created_at.isoformat()
+    return fields
+
+
+def _parse_status_fields(fields: dict[bytes, bytes]) -> dict[UUID, TaskStatusUpdate]:
+    grouped: dict[UUID, dict[str, str]] = {}
+    for raw_name, raw_value in fields.items():
+        raw_task_id, _, name = raw_name.decode().partition("|")
+        grouped.setdefault(UUID(raw_task_id), {})[name] = raw_value.decode()
+    updates: dict[UUID, TaskStatusUpdate] = {}
+    for task_id, values in grouped.items():
+        if "status" not in values:
+            continue
+        attempt_count = values.get("attempt_count")
+        updates[task_id] = TaskStatusUpdate(
+            task_id=task_id,
+            status=values["status"],
+            started_at=_parse_iso(values.get("started_at")),
+            completed_at=_parse_iso(values.get("completed_at")),
+            attempt_count=int(attempt_count) if attempt_count is not None else None,
+            created_at=_parse_iso(values.get("created_at")),
+        )
+    return updates
+
+
+def _parse_iso(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value is not None else None
@@ -0,0 +1,186 @@
+"""Compact, versioned binary encoding of ``Task`` and ``Result``.
+
+A payload is a msgpack array holding the codec version followed by the
+model's fields in a fixed order, so field names are not repeated in every
+message. Datetimes use the msgpack timestamp extension; naive datetimes are
+taken to be UTC, like the ``datetime.utcnow()`` values they usually come
+from, and decode as aware UTC datetimes. Decoders also accept
+the JSON produced by ``model_dump_json``, so readers can be upgraded before
+writers.
+
+``trusted=True`` builds models without running pydantic validation or
+model validators. Only use it for payloads written by our own services from
+already-validated models, e.g. tasks the Planner enqueued.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any, TypeVar
+
+import msgpack
+from pydantic import BaseModel
+
+from chimera.models.result import Result, ResultStatus
+from chimera.models.task import Task, TaskStatus
+
+CODEC_VERSION = 1
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+TASK_FIELDS: tuple[str, ...] = (
+    "tenant_id",
+    "trace_id",
+    "task_id",
+    "parent_task_id",
+    "session_id",
+    "kind",
+    "input",
+    "status",
+    "priority",
+    "attempt",
+    "max_attempts",
+    "timeout_s",
+    "created_at",
+    "updated_at",
+    "started_at",
+    "completed_at",
+)
+
+RESULT_FIELDS: tuple[str, ...] = (
+    "tenant_id",
+    "trace_id",
+    "task_id",
+    "status",
+    "output",
+    "error",
+    "produced_by",
+    "completed_at",
+)
+
+
+class CodecError(ValueError):
+    """Raised when a payload cannot be decoded."""
+
+
+def encode_task(task: Task) -> bytes:
+    """Encode a task.
+
+    Args:
+        task: Task to encode.
+
+    Returns:
+        The versioned binary payload.
+
+    Raises:
+        CodecError: If a field is not serializable.
+    """
+    return _pack([CODEC_VERSION, *(getattr(task, name) for name in TASK_FIELDS)])
+
+
+def decode_task(data: bytes, *, trusted: bool = False) -> Task:
+    """Decode a task from a binary or JSON payload.
+
+    Args:
+        data: Payload from ``encode_task`` or ``Task.model_dump_json``.
+        trusted: Skip validation for payloads produced by our own services.
+
+    Returns:
+        The decoded task.
+
+    Raises:
+        CodecError: If the payload is malformed or has an unknown version.
+        pydantic.ValidationError: If an untrusted payload fails validation.
+    """
+    if data[:1] == b"{":
+        return Task.model_validate_json(data)
+    fields = _unpack(data, TASK_FIELDS)
+    if not trusted:
+        return Task.model_validate(fields)
+    fields["status"] = TaskStatus(fields["status"])
+    return _construct(Task, fields)
+
+
+def encode_result(result: Result) -> bytes:
+    """Encode a result.
+
+    Args:
+        result: Result to encode.
+
+    Returns:
+        The versioned binary payload.
+
+    Raises:
+        CodecError: If a field is not serializable.
+    """
+    return _pack([CODEC_VERSION, *(getattr(result, name) for name in RESULT_FIELDS)])
+
+
+def decode_result(data: bytes, *, trusted: bool = False) -> Result:
+    """Decode a result from a binary or JSON payload.
+
+    Args:
+        data: Payload from ``encode_result`` or ``Result.model_dump_json``.
+        trusted: Skip validation for payloads produced by our own services.
+
+    Returns:
+        The decoded result.
+
+    Raises:
+        CodecError: If the payload is malformed or has an unknown version.
+        pydantic.ValidationError: If an untrusted payload fails validation.
+    """
+    if data[:1] == b"{":
+        return Result.model_validate_json(data)
+    fields = _unpack(data, RESULT_FIELDS)
+    if not trusted:
+        return Result.model_validate(fields)
+    fields["status"] = ResultStatus(fields["status"])
+    return _construct(Result, fields)
+
+
+def _pack(values: list[Any]) -> bytes:
+    try:
+        packed: bytes = msgpack.packb(values, datetime=True, default=_default)
+    except (TypeError, ValueError) as exc:
+        raise CodecError(f"Cannot encode payload: {exc}") from exc
+    return packed
+
+
+def _unpack(data: bytes, names: tuple[str, ...]) -> dict[str, Any]:
+    try:
+        values = msgpack.unpackb(data, timestamp=3, strict_map_key=False)
+    except Exception as exc:
+        raise CodecError(f"Malformed payload: {exc}") from exc
+    if not isinstance(values, list) or not values or values[0] != CODEC_VERSION:
+        version = values[0] if isinstance(values, list) and values else None
+        raise CodecError(f"Unsupported codec version {version!r}")
+    if len(values) != len(names) + 1:
+        raise CodecError(f"Expected {len(names)} fields, got {len(values) - 1}")
+    return dict(zip(names, values[1:], strict=False))
+
+
+def _construct(cls: type[ModelT], fields: dict[str, Any]) -> ModelT:  # noqa: UP047
+    # Equivalent to model_construct() for a complete field set, without its
+    # per-field default handling, which costs more than validating JSON.
+    instance = cls.__new__(cls)
+    object.__setattr__(instance, "__dict__", fields)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(fields))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    private = _PRIVATE_DEFAULTS.get(cls)
+    object.__setattr__(instance, "__pydantic_private__", dict(private) if private else None)
+    return instance
+
+
+def _default(value: Any) -> Any:
+    # StrEnum values are packed as plain strings; msgpack only calls this for unknown
+    # types, and for naive datetimes, which the timestamp extension cannot hold.
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    raise TypeError(f"unsupported type {type(value).__name__}")
+
+
+_PRIVATE_DEFAULTS: dict[type[BaseModel], dict[str, Any]] = {
+    model: {name: attr.get_default() for name, attr in model.__private_attributes__.items()}
+    for model in (Task, Result)
+}
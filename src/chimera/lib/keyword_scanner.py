@@ -0,0 +1,308 @@
+"""Multi-term keyword scanning over nested JSON payloads.
+
+``KeywordScanner`` compiles a whole blocklist into one regular expression
+whose alternatives are factored into a trie (``pass|password|passport``
+becomes ``pass(?:word|port)?``). The regex engine then follows a single
+path per input position instead of trying every term, so the scan cost
+grows with the text length and the longest term, not with the number of
+terms. The scan itself runs in C.
+
+``scan_output`` joins every string leaf of a payload with a separator no
+term can contain and scans the joined text once, then maps each match back
+to the leaf it came from. ``first_matches`` does the same for a whole
+batch of payloads: their leaves are collected once into ``StringLeaves``
+and scanned as one text, skipping the rest of a payload after its first hit.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import re
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+JsonPath = tuple[str | int, ...]
+
+# Joins string leaves for a single scan; no term may contain it.
+_LEAF_SEPARATOR = "\x00"
+
+
+@dataclass(frozen=True, slots=True)
+class KeywordMatch:
+    """One blocklisted term found in a payload.
+
+    ``start`` and ``end`` index into the string at ``path``.
+    """
+
+    term: str
+    path: JsonPath
+    start: int
+    end: int
+
+
+@dataclass(frozen=True, slots=True)
+class StringLeaves:
+    """The string leaves of one JSON-like payload, in document order.
+
+    Collected once per payload so that size checks and keyword scans can
+    share the same walk.
+    """
+
+    paths: tuple[JsonPath, ...]
+    values: tuple[str, ...]
+
+    @classmethod
+    def collect(cls, output: Mapping[str, Any]) -> StringLeaves:
+        """Walk a payload and collect its string leaves.
+
+        Args:
+            output: Payload such as ``Result.output``; nested dicts and lists
+                are walked, dict keys are not collected.
+
+        Returns:
+            The leaves with their paths.
+
+        Raises:
+            None.
+        """
+        paths: list[JsonPath] = []
+        values: list[str] = []
+        for path, leaf in _string_leaves(output, ()):
+            paths.append(path)
+            values.append(leaf)
+        return cls(tuple(paths), tuple(values))
+
+    @property
+    def total_chars(self) -> int:
+        """Combined length of all leaves."""
+        return sum(map(len, self.values))
+
+
+class KeywordScanner:
+    """Immutable matcher for a fixed set of terms.
+
+    Matching is case-insensitive. With ``whole_words`` a term only matches
+    when it is not directly preceded or followed by a letter, digit or
+    underscore, so ``SSN`` does not fire inside ``classname``.
+    """
+
+    def __init__(self, terms: Iterable[str], *, whole_words: bool = True) -> None:
+        normalized = {term.strip().casefold(): term.strip() for term in terms if term.strip()}
+        if any(_LEAF_SEPARATOR in term for term in normalized):
+            raise ValueError("Keyword terms must not contain NUL characters")
+        self._terms = dict(sorted(normalized.items()))
+        self._pattern = _compile(self._terms, whole_words) if self._terms else None
+
+    @property
+    def terms(self) -> tuple[str, ...]:
+        """The configured terms, as given."""
+        return tuple(self._terms.values())
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def search(self, text: str) -> KeywordMatch | None:
+        """Find the first match in a string.
+
+        Args:
+            text: Text to scan.
+
+        Returns:
+            The leftmost match, or ``None`` if the text is clean.
+
+        Raises:
+            None.
+        """
+        if self._pattern is None:
+            return None
+        found = self._pattern.search(text)
+        return self._match((), found) if found else None
+
+    def scan(self, text: str) -> list[KeywordMatch]:
+        """Find all non-overlapping matches in a string.
+
+        Args:
+            text: Text to scan.
+
+        Returns:
+            Matches in order of position.
+
+        Raises:
+            None.
+        """
+        if self._pattern is None:
+            return []
+        return [self._match((), found) for found in self._pattern.finditer(text)]
+
+    def scan_output(
+        self, output: Mapping[str, Any], *, first_only: bool = False
+    ) -> list[KeywordMatch]:
+        """Find matches in every string leaf of a JSON-like payload.
+
+        Args:
+            output: Payload such as ``Result.output``; nested dicts and lists
+                are walked, dict keys are not scanned.
+            first_only: Stop at the first match.
+
+        Returns:
+            Matches with the path of the leaf they were found in, in
+            document order.
+
+        Raises:
+            None.
+        """
+        if self._pattern is None:
+            return []
+        leaves = StringLeaves.collect(output)
+        if first_only:
+            first = self.first_matches([leaves])[0]
+            return [] if first is None else [first]
+        if not leaves.values:
+            return []
+        joined, offsets = _join(leaves.values)
+        matches: list[KeywordMatch] = []
+        for found in self._pattern.finditer(joined):
+            leaf_index = bisect.bisect_right(offsets, found.start()) - 1
+            matches.append(self._leaf_match(found, leaves.paths[leaf_index], offsets[leaf_index]))
+        return matches
+
+    def first_matches(self, documents: Sequence[StringLeaves]) -> list[KeywordMatch | None]:
+        """Find the first match in each of several payloads with one scan.
+
+        All leaves of all payloads are joined into one text. After a payload's
+        first hit the scan resumes at the start of the next payload, so a
+        flagged payload costs no more than the text up to its first hit.
+
+        Args:
+            documents: Leaves of each payload, from ``StringLeaves.collect``.
+
+        Returns:
+            The first match of each payload, or ``None`` for clean payloads,
+            in input order.
+
+        Raises:
+            None.
+        """
+        firsts: list[KeywordMatch | None] = [None] * len(documents)
+        if self._pattern is None:
+            return firsts
+        paths: list[JsonPath] = []
+        values: list[str] = []
+        owners: list[int] = []
+        for index, document in enumerate(documents):
+            paths.extend(document.paths)
+            values.extend(document.values)
+            owners.extend([index] * len(document.values))
+        if not values:
+            return firsts
+        joined, offsets = _join(values)
+        # Offset of the first leaf after each leaf's document, to resume from.
+        resume = [len(joined)] * len(values)
+        next_start = len(joined)
+        for leaf_index in range(len(values) - 1, -1, -1):
+            resume[leaf_index] = next_start
+            if leaf_index == 0 or owners[leaf_index - 1] != owners[leaf_index]:
+                next_start = offsets[leaf_index]
+
+        search = self._pattern.search
+        found = search(joined)
+        while found is not None:
+            leaf_index = bisect.bisect_right(offsets, found.start()) - 1
+            firsts[owners[leaf_index]] = self._leaf_match(
+                found, paths[leaf_index], offsets[leaf_index]
+            )
+            found = search(joined, resume[leaf_index])
+        return firsts
+
+    def _match(self, path: JsonPath, found: re.Match[str]) -> KeywordMatch:
+        return KeywordMatch(self._term(found), path, *found.span())
+
+    def _leaf_match(self, found: re.Match[str], path: JsonPath, base: int) -> KeywordMatch:
+        return KeywordMatch(self._term(found), path, found.start() - base, found.end() - base)
+
+    def _term(self, found: re.Match[str]) -> str:
+        # The regex's case folding can match text whose casefold() differs slightly.
+        text = found.group()
+        return self._terms.get(text.casefold(), text)
+
+
+def load_blocklist(path: Path) -> list[str]:
+    """Read blocklist terms from a file.
+
+    ``.json`` files hold a list of strings. Any other file holds one term per
+    line; blank lines and lines starting with ``#`` are ignored.
+
+    Args:
+        path: Blocklist file.
+
+    Returns:
+        The terms in file order.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If a JSON blocklist is not a list of strings.
+    """
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".json":
+        terms = json.loads(text)
+        if not isinstance(terms, list) or not all(isinstance(term, str) for term in terms):
+            raise ValueError(f"{path} must contain a JSON list of strings")
+        return terms
+    return [line.strip() for line in text.splitlines() if line.strip() and not line.startswith("#")]
+
+
+def _join(leaves: Sequence[str]) -> tuple[str, list[int]]:
+    if len(leaves) == 1:
+        return leaves[0], [0]
+    offsets: list[int] = []
+    position = 0
+    for leaf in leaves:
+        offsets.append(position)
+        position += len(leaf) + 1
+    return _LEAF_SEPARATOR.join(leaves), offsets
+
+
+def _string_leaves(value: Any, path: JsonPath) -> Iterator[tuple[JsonPath, str]]:
+    if isinstance(value, str):
+        yield path, value
+    elif isinstance(value, Mapping):
+        for key, item in value.items():
+            yield from _string_leaves(item, (*path, key))
+    elif isinstance(value, list | tuple):
+        for index, item in enumerate(value):
+            yield from _string_leaves(item, (*path, index))
+
+
+def _compile(terms: Mapping[str, str], whole_words: bool) -> re.Pattern[str]:
+    trie: dict[str, Any] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    body = _trie_pattern(trie)
+    if whole_words:
+        body = rf"(?<!\w)(?:{body})(?!\w)"
+    return re.compile(body, re.IGNORECASE)
+
+
+def _trie_pattern(node: dict[str, Any]) -> str:
+    terminal = "" in node
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in node.items() if char]
+    if not branches:
+        return ""
+    if len(branches) == 1:
+        alternation = branches[0]
+        grouped = alternation if len(alternation) == 1 else f"(?:{alternation})"
+    else:
+        # Branches start with distinct characters, so at most one can match.
+        alternation = grouped = f"(?:{'|'.join(branches)})"
+    if terminal:
+        # Greedy optional: try the longer terms first, fall back to the prefix.
+        return f"{grouped}?"
+    return alternation
@@ -0,0 +1,248 @@
+"""Micro-batching adapter for ``LLMPort``.
+
+Collects ``generate_result`` calls for a short window and sends them to the
+backend together, which amortizes per-request overhead for high-volume,
+short tasks such as classification. Identical prompts from the same tenant
+that are waiting at the same time share one backend call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from chimera.lib.logging import get_logger
+from chimera.lib.stats import percentile
+from chimera.ports.llm import BatchLLMPort, LLMPort
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from chimera.models.result import Result
+    from chimera.models.task import Task
+
+logger = get_logger(__name__)
+
+PromptKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class BatchingStats:
+    """Trade-off between the latency added by batching and the calls saved.
+
+    ``wait_*_ms`` is how long tasks sat in the window before being sent,
+    i.e. the latency the adapter adds. ``requests_per_call`` is how many
+    ``generate_result`` calls each backend request served.
+    """
+
+    requests: int
+    deduplicated: int
+    batches: int
+    backend_calls: int
+    mean_batch_size: float
+    requests_per_call: float
+    wait_p50_ms: float
+    wait_p95_ms: float
+    backend_p50_ms: float
+
+
+@dataclass(slots=True)
+class _Pending:
+    task: Task
+    key: PromptKey
+    future: asyncio.Future[Result]
+    queued_at: float
+
+
+def prompt_key(task: Task) -> PromptKey:
+    """Key under which identical prompts are de-duplicated.
+
+    Args:
+        task: Task to key.
+
+    Returns:
+        ``(tenant_id, kind, canonical input JSON)``; tenants never share results.
+
+    Raises:
+        TypeError: If the task input is not JSON serializable.
+    """
+    payload = json.dumps(task.input, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return (task.tenant_id, task.kind, payload)
+
+
+class BatchingLLM:
+    """``LLMPort`` decorator that micro-batches and de-duplicates calls.
+
+    A batch is sent when it reaches ``max_batch_size`` or ``max_wait_ms``
+    after its first task arrived, whichever comes first. Backends that
+    implement ``BatchLLMPort`` receive one ``generate_results`` call per
+    batch; other backends get concurrent ``generate_result`` calls, so only
+    de-duplication applies. A task whose prompt matches one already waiting
+    or in flight reuses that result, re-addressed to its own task and trace.
+
+    Args:
+        llm: Backend to wrap.
+        max_batch_size: Maximum tasks per backend request.
+        max_wait_ms: Maximum time a task waits for its batch to fill.
+        key: Function computing the de-duplication key of a task.
+        clock: Monotonic clock in seconds, injectable for tests.
+        stats_window: Number of recent samples kept for percentiles.
+
+    Returns:
+        None.
+
+    Raises:
+        ValueError: If ``max_batch_size`` is less than 1 or ``max_wait_ms`` is negative.
+    """
+
+    def __init__(
+        self,
+        llm: LLMPort,
+        *,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        key: Callable[[Task], PromptKey] = prompt_key,
+        clock: Callable[[], float] = time.monotonic,
+        stats_window: int = 1024,
+    ) -> None:
+        if max_batch_size < 1 or max_wait_ms < 0:
+            raise ValueError("max_batch_size must be at least 1 and max_wait_ms non-negative")
+        self._llm = llm
+        self._max_batch_size = max_batch_size
+        self._max_wait_s = max_wait_ms / 1000
+        self._key = key
+        self._clock = clock
+        self._batch: list[_Pending] = []
+        self._by_key: dict[PromptKey, asyncio.Future[Result]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._dispatches: set[asyncio.Task[None]] = set()
+        self._waits_ms: deque[float] = deque(maxlen=stats_window)
+        self._backend_ms: deque[float] = deque(maxlen=stats_window)
+        self._requests = 0
+        self._deduplicated = 0
+        self._batches = 0
+        self._dispatched = 0
+        self._backend_calls = 0
+
+    async def generate_result(self, task: Task) -> Result:
+        """Queue a task for the next batch and wait for its result.
+
+        Args:
+            task: The task to be processed.
+
+        Returns:
+            A Result addressed to ``task``.
+
+        Raises:
+            Exception: Whatever the backend raises for this task or its batch.
+        """
+        self._requests += 1
+        key = self._key(task)
+        shared = self._by_key.get(key)
+        if shared is not None:
+            self._deduplicated += 1
+            return _readdressed(await asyncio.shield(shared), task)
+
+        future: asyncio.Future[Result] = asyncio.get_running_loop().create_future()
+        self._by_key[key] = future
+        self._batch.append(_Pending(task, key, future, self._clock()))
+        if len(self._batch) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._max_wait_s, self._flush)
+        return _readdressed(await asyncio.shield(future), task)
+
+    async def flush(self) -> None:
+        """Send the current batch now and wait for every in-flight batch.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        self._flush()
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches, return_exceptions=True)
+
+    def stats(self) -> BatchingStats:
+        """Snapshot batching counters and latency percentiles.
+
+        Returns:
+            Current statistics.
+
+        Raises:
+            None.
+        """
+        waits = sorted(self._waits_ms)
+        backend = sorted(self._backend_ms)
+        return BatchingStats(
+            requests=self._requests,
+            deduplicated=self._deduplicated,
+            batches=self._batches,
+            backend_calls=self._backend_calls,
+            mean_batch_size=self._dispatched / self._batches if self._batches else 0.0,
+            requests_per_call=(
+                self._requests / self._backend_calls if self._backend_calls else 0.0
+            ),
+            wait_p50_ms=percentile(waits, 0.50),
+            wait_p95_ms=percentile(waits, 0.95),
+            backend_p50_ms=percentile(backend, 0.50),
+        )
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._batch:
+            return
+        batch, self._batch = self._batch, []
+        now = self._clock()
+        self._waits_ms.extend((now - pending.queued_at) * 1000 for pending in batch)
+        self._batches += 1
+        self._dispatched += len(batch)
+        dispatch = asyncio.create_task(self._dispatch(batch))
+        self._dispatches.add(dispatch)
+        dispatch.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list[_Pending]) -> None:
+        tasks = [pending.task for pending in batch]
+        started = self._clock()
+        outcomes: Sequence[Result | BaseException]
+        try:
+            if isinstance(self._llm, BatchLLMPort):
+                self._backend_calls += 1
+                outcomes = await self._llm.generate_results(tasks)
+                if len(outcomes) != len(tasks):
+                    raise RuntimeError(
+                        f"Batch backend returned {len(outcomes)} results for {len(tasks)} tasks"
+                    )
+            else:
+                self._backend_calls += len(tasks)
+                outcomes = await asyncio.gather(
+                    *(self._llm.generate_result(task) for task in tasks), return_exceptions=True
+                )
+        except Exception as exc:
+            logger.warning("llm_batching.batch_failed", size=len(batch), error=str(exc))
+            outcomes = [exc] * len(batch)
+        finally:
+            self._backend_ms.append((self._clock() - started) * 1000)
+
+        for pending, outcome in zip(batch, outcomes, strict=True):
+            del self._by_key[pending.key]
+            if isinstance(outcome, BaseException):
+                pending.future.set_exception(outcome)
+                # Mark the exception retrieved when every waiter was cancelled.
+                pending.future.exception()
+            else:
+                pending.future.set_result(outcome)
+
+
+def _readdressed(result: Result, task: Task) -> Result:
+    if result.task_id == task.task_id and result.trace_id == task.trace_id:
+        return result
+    return result.model_copy(update={"task_id": task.task_id, "trace_id": task.trace_id})
@@ -0,0 +1,347 @@
+"""Response cache for ``LLMPort``.
+
+Two tiers sit in front of the backend. The exact tier is keyed on a hash of
+the canonical ``(kind, input)``. The optional near-duplicate tier embeds the
+same canonical text and looks it up in a ``VectorIndexPort``. Either kind of
+hit saves a full LLM round trip.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Collection, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from chimera.models.result import Result, ResultStatus
+
+if TYPE_CHECKING:
+    from chimera.models.task import Task
+    from chimera.ports.llm import LLMPort
+    from chimera.ports.vector_index import VectorIndexPort
+
+Embedder = Callable[[str], Awaitable[Sequence[float]]]
+
+# Scope shared by all tenants for kinds declared tenant-independent.
+SHARED_SCOPE = "*"
+
+
+@dataclass(frozen=True, slots=True)
+class LLMCacheStats:
+    """Counters describing cache effectiveness."""
+
+    exact_hits: int
+    semantic_hits: int
+    misses: int
+    evictions: int
+    entries: int
+
+
+@dataclass(slots=True)
+class _Entry:
+    result: Result
+    expires_at: float
+    scope: str
+    kind: str
+    indexed: bool
+
+    @property
+    def partition(self) -> str:
+        return f"{self.scope}\x00{self.kind}"
+
+
+def prompt_text(task: Task) -> str:
+    """Canonical text of a task's prompt.
+
+    Args:
+        task: Task to describe.
+
+    Returns:
+        Compact JSON of ``kind`` and ``input`` with sorted keys.
+
+    Raises:
+        TypeError: If the task input is not JSON serializable.
+    """
+    return json.dumps(
+        {"kind": task.kind, "input": task.input},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+
+class InMemoryVectorIndex:
+    """``VectorIndexPort`` held in process memory.
+
+    Vectors are normalized on insert and searched by brute-force cosine
+    similarity. Partitions are bounded by the cache's ``max_entries``,
+    which keeps a linear scan cheaper than maintaining an ANN structure.
+    Use a Weaviate-backed index to share entries across processes.
+
+    Args:
+        None.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    def __init__(self) -> None:
+        self._partitions: dict[str, dict[str, tuple[float, ...]]] = {}
+
+    async def add(self, partition: str, key: str, vector: Sequence[float]) -> None:
+        """Insert or replace a vector under ``key``.
+
+        Args:
+            partition: Partition to write.
+            key: Identifier returned by ``search``.
+            vector: Embedding vector.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        normalized = _normalized(vector)
+        if normalized is not None:
+            self._partitions.setdefault(partition, {})[key] = normalized
+
+    async def remove(self, partition: str, key: str) -> None:
+        """Delete a vector. Unknown keys are ignored.
+
+        Args:
+            partition: Partition holding the vector.
+            key: Identifier to delete.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        vectors = self._partitions.get(partition)
+        if vectors is not None:
+            vectors.pop(key, None)
+            if not vectors:
+                del self._partitions[partition]
+
+    async def search(
+        self, partition: str, vector: Sequence[float], min_similarity: float
+    ) -> tuple[str, float] | None:
+        """Find the most similar vector in a partition.
+
+        Args:
+            partition: Partition to search.
+            vector: Query embedding.
+            min_similarity: Minimum cosine similarity for a match.
+
+        Returns:
+            ``(key, similarity)`` of the best match, or None.
+
+        Raises:
+            None.
+        """
+        query = _normalized(vector)
+        vectors = self._partitions.get(partition)
+        if query is None or not vectors:
+            return None
+        best: tuple[str, float] | None = None
+        for key, candidate in vectors.items():
+            similarity = math.fsum(a * b for a, b in zip(query, candidate, strict=False))
+            if similarity >= min_similarity and (best is None or similarity > best[1]):
+                best = (key, similarity)
+        return best
+
+
+class CachingLLM:
+    """``LLMPort`` decorator that serves repeated prompts from a cache.
+
+    Entries are scoped per tenant unless the task kind is listed in
+    ``shared_kinds``, in which case all tenants share them; only use that for
+    kinds whose output does not depend on tenant data. Only succeeded
+    results are stored. Entries expire after ``ttl_s`` and the least
+    recently used entry is evicted beyond ``max_entries``. Cached results
+    are re-addressed to the requesting task's tenant, trace and task IDs.
+
+    The near-duplicate tier is enabled by passing both ``embed`` and
+    ``index``. A task that misses the exact tier is embedded and matched
+    against previous prompts of the same scope and kind; a match with cosine
+    similarity of at least ``min_similarity`` is a hit.
+
+    Args:
+        llm: Backend to wrap.
+        ttl_s: Lifetime of an entry.
+        max_entries: Maximum number of cached results.
+        shared_kinds: Task kinds cached across tenants.
+        embed: Async function embedding prompt text.
+        index: Vector index for the near-duplicate tier.
+        min_similarity: Similarity threshold for near-duplicate hits.
+        clock: Monotonic clock in seconds, injectable for tests.
+
+    Returns:
+        None.
+
+    Raises:
+        ValueError: If a bound is invalid or only one of ``embed`` and ``index`` is set.
+    """
+
+    def __init__(
+        self,
+        llm: LLMPort,
+        *,
+        ttl_s: float = 300.0,
+        max_entries: int = 4096,
+        shared_kinds: Collection[str] = (),
+        embed: Embedder | None = None,
+        index: VectorIndexPort | None = None,
+        min_similarity: float = 0.95,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl_s <= 0 or max_entries < 1:
+            raise ValueError("ttl_s must be positive and max_entries at least 1")
+        if (embed is None) != (index is None):
+            raise ValueError("The near-duplicate tier needs both embed and index")
+        self._llm = llm
+        self._ttl_s = ttl_s
+        self._max_entries = max_entries
+        self._shared_kinds = frozenset(shared_kinds)
+        self._embed = embed
+        self._index = index
+        self._min_similarity = min_similarity
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._exact_hits = 0
+        self._semantic_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    async def generate_result(self, task: Task) -> Result:
+        """Return a cached result for the task's prompt, or call the backend.
+
+        Args:
+            task: The task to be processed.
+
+        Returns:
+            A Result addressed to ``task``.
+
+        Raises:
+            Exception: Whatever the backend or embedder raises.
+        """
+        text = prompt_text(task)
+        scope = SHARED_SCOPE if task.kind in self._shared_kinds else task.tenant_id
+        partition = f"{scope}\x00{task.kind}"
+        key = hashlib.sha256(f"{scope}\x00{text}".encode()).hexdigest()
+
+        entry = await self._live(key)
+        if entry is not None:
+            self._exact_hits += 1
+            return _for_task(entry.result, task)
+
+        vector: Sequence[float] | None = None
+        if self._embed is not None and self._index is not None:
+            vector = await self._embed(text)
+            match = await self._index.search(partition, vector, self._min_similarity)
+            if match is not None:
+                entry = await self._live(match[0])
+                if entry is not None:
+                    self._semantic_hits += 1
+                    return _for_task(entry.result, task)
+
+        self._misses += 1
+        result = await self._llm.generate_result(task)
+        if result.status is ResultStatus.SUCCEEDED:
+            await self._store(key, scope, task.kind, result, vector)
+        return result
+
+    async def invalidate(self, tenant_id: str | None = None, kind: str | None = None) -> int:
+        """Drop cached entries matching a tenant scope and/or task kind.
+
+        Args:
+            tenant_id: Only drop entries in this scope (``SHARED_SCOPE`` for shared kinds).
+            kind: Only drop entries of this task kind.
+
+        Returns:
+            Number of entries dropped.
+
+        Raises:
+            None.
+        """
+        keys = [
+            key
+            for key, entry in self._entries.items()
+            if (tenant_id is None or entry.scope == tenant_id)
+            and (kind is None or entry.kind == kind)
+        ]
+        for key in keys:
+            await self._drop(key)
+        return len(keys)
+
+    def stats(self) -> LLMCacheStats:
+        """Snapshot the cache counters.
+
+        Returns:
+            Current statistics.
+
+        Raises:
+            None.
+        """
+        return LLMCacheStats(
+            exact_hits=self._exact_hits,
+            semantic_hits=self._semantic_hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+        )
+
+    async def _live(self, key: str) -> _Entry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            await self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def _store(
+        self,
+        key: str,
+        scope: str,
+        kind: str,
+        result: Result,
+        vector: Sequence[float] | None,
+    ) -> None:
+        if key in self._entries:
+            await self._drop(key)
+        entry = _Entry(result, self._clock() + self._ttl_s, scope, kind, vector is not None)
+        self._entries[key] = entry
+        if vector is not None and self._index is not None:
+            await self._index.add(entry.partition, key, vector)
+        while len(self._entries) > self._max_entries:
+            await self._drop(next(iter(self._entries)))
+            self._evictions += 1
+
+    async def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        if entry.indexed and self._index is not None:
+            await self._index.remove(entry.partition, key)
+
+
+def _for_task(result: Result, task: Task) -> Result:
+    return result.model_copy(
+        update={"tenant_id": task.tenant_id, "trace_id": task.trace_id, "task_id": task.task_id}
+    )
+
+
+def _normalized(vector: Sequence[float]) -> tuple[float, ...] | None:
+    norm = math.sqrt(math.fsum(value * value for value in vector))
+    if norm == 0:
+        return None
+    return tuple(value / norm for value in vector)
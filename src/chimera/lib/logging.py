@@ -0,0 +1,22 @@
+"""Structured logging helpers shared by Chimera services."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import structlog
+
+
+def get_logger(name: str) -> Any:
+    """Return a structlog logger bound to a module name.
+
+    Args:
+        name: Logger name, usually ``__name__``.
+
+    Returns:
+        A structlog bound logger.
+
+    Raises:
+        None.
+    """
+    return structlog.get_logger(name)
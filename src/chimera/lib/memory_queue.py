@@ -0,0 +1,322 @@
+"""In-process asyncio adapter for ``TaskQueuePort``.
+
+Intended for single-node deployments, tests and benchmarks where running
+Redis is not worth it. Semantics mirror ``RedisTaskQueue``: tenant-scoped
+queues, explicit acknowledgement, and reclaiming of idle pending tasks, so
+either adapter can sit behind the same Planner/Worker code.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from chimera.models.task import Task
+    from chimera.models.types import TenantId
+
+
+@dataclass(slots=True)
+class _Delivery:
+    task: Task
+    worker_id: str
+    delivered_at: float
+
+
+@dataclass(slots=True)
+class _TenantQueue:
+    # Heap of (-priority, sequence, message_id): highest priority first, FIFO within a priority.
+    ready: list[tuple[int, int, str]] = field(default_factory=list)
+    tasks: dict[str, Task] = field(default_factory=dict)
+    pending: dict[str, _Delivery] = field(default_factory=dict)
+    available: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class InMemoryTaskQueue:
+    """Tenant-scoped priority task queue held in process memory.
+
+    Tasks are served by ``Task.priority`` (highest first), then in enqueue
+    order. Delivered tasks stay pending until acknowledged. Pending tasks can
+    be claimed by another worker with ``dequeue_pending`` once idle for long
+    enough, and, when ``visibility_timeout_ms`` is set, they are also made
+    visible to ``dequeue`` again after that timeout.
+
+    Enqueued ``Task`` objects are stored and handed to consumers as-is (no
+    serialization), so producers must not reuse or mutate a task after
+    enqueueing it. Nothing survives a process restart; use
+    ``RedisTaskQueue`` where durability matters.
+
+    Args:
+        block_ms: How long ``dequeue`` waits for new or expired tasks, or
+            ``None`` to return immediately.
+        visibility_timeout_ms: Time after which an unacknowledged task is
+            redelivered by ``dequeue``, or ``None`` to only reclaim it via
+            ``dequeue_pending``.
+        clock: Monotonic clock in seconds, injectable for tests.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    def __init__(
+        self,
+        *,
+        block_ms: int | None = 1000,
+        visibility_timeout_ms: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._block_ms = block_ms
+        self._visibility_timeout_ms = visibility_timeout_ms
+        self._clock = clock
+        self._tenants: dict[str, _TenantQueue] = {}
+        self._sequence = itertools.count(1)
+
+    async def enqueue(self, tenant_id: TenantId, task: Task) -> None:
+        """Add a task to the tenant's queue.
+
+        Args:
+            tenant_id: Target tenant.
+            task: Task to enqueue.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If the task belongs to another tenant.
+        """
+        await self.enqueue_many(tenant_id, [task])
+
+    async def enqueue_many(self, tenant_id: TenantId, tasks: Iterable[Task]) -> list[str]:
+        """Add several tasks to the tenant's queue.
+
+        Args:
+            tenant_id: Target tenant.
+            tasks: Tasks to enqueue, in order.
+
+        Returns:
+            Message IDs, in order.
+
+        Raises:
+            ValueError: If any task belongs to another tenant.
+        """
+        batch = list(tasks)
+        for task in batch:
+            if task.tenant_id != tenant_id:
+                raise ValueError(
+                    f"Task '{task.task_id}' belongs to tenant '{task.tenant_id}', not '{tenant_id}'"
+                )
+        queue = self._queue(tenant_id)
+        ids: list[str] = []
+        for task in batch:
+            sequence = next(self._sequence)
+            message_id = f"{sequence}-0"
+            queue.tasks[message_id] = task
+            heapq.heappush(queue.ready, (-task.priority, sequence, message_id))
+            ids.append(message_id)
+        if ids:
+            queue.available.set()
+        return ids
+
+    async def dequeue(
+        self, tenant_id: TenantId, batch_size: int = 1, worker_id: str = "default_worker"
+    ) -> Sequence[Task]:
+        """Take up to ``batch_size`` of the tenant's highest-priority tasks.
+
+        Args:
+            tenant_id: Target tenant.
+            batch_size: Maximum number of tasks to retrieve.
+            worker_id: Consumer taking the tasks.
+
+        Returns:
+            Tasks delivered to the worker, with ``_raw_id`` set for ``ack``.
+
+        Raises:
+            ValueError: If ``batch_size`` is less than 1.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        queue = self._queue(tenant_id)
+        tasks = self._take(queue, batch_size, worker_id)
+        if tasks or self._block_ms is None:
+            return tasks
+        deadline = self._clock() + self._block_ms / 1000
+        while not tasks:
+            now = self._clock()
+            remaining = deadline - now
+            if remaining <= 0:
+                break
+            # Enqueue sets the event, but an expiring visibility timeout does not,
+            # so wake up no later than the oldest pending delivery expires.
+            expiry = self._next_expiry(queue)
+            timeout = remaining if expiry is None else min(remaining, max(expiry - now, 0.0))
+            try:
+                await asyncio.wait_for(queue.available.wait(), timeout)
+            except TimeoutError:
+                if timeout >= remaining:
+                    break
+            tasks = self._take(queue, batch_size, worker_id)
+        return tasks
+
+    async def ack(self, tenant_id: TenantId, task: Task, worker_id: str) -> None:
+        """Acknowledge successful processing of a task.
+
+        Args:
+            tenant_id: Target tenant.
+            task: A task returned by ``dequeue`` or ``dequeue_pending``.
+            worker_id: Consumer that processed the task.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If the task was not delivered by a queue.
+        """
+        await self.ack_many(tenant_id, [task], worker_id)
+
+    async def ack_many(self, tenant_id: TenantId, tasks: Sequence[Task], worker_id: str) -> None:
+        """Acknowledge several tasks.
+
+        Unknown or already-acknowledged IDs are ignored, like ``XACK``. A task
+        made visible again by the visibility timeout but not yet redelivered
+        is acknowledged too, and will not be redelivered.
+
+        Args:
+            tenant_id: Target tenant.
+            tasks: Tasks returned by ``dequeue`` or ``dequeue_pending``.
+            worker_id: Consumer that processed the tasks.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If a task was not delivered by a queue.
+        """
+        _ = worker_id
+        queue = self._queue(tenant_id)
+        for task in tasks:
+            raw_id = task._raw_id
+            if raw_id is None:
+                raise ValueError(f"Task '{task.task_id}' was not delivered by a queue")
+            queue.pending.pop(raw_id, None)
+            # A requeued task's ready entry is skipped by _take once its task is gone.
+            queue.tasks.pop(raw_id, None)
+
+    async def dequeue_pending(
+        self,
+        tenant_id: TenantId,
+        worker_id: str,
+        idle_time_ms: int = 10000,
+        batch_size: int = 100,
+    ) -> Sequence[Task]:
+        """Claim unacknowledged tasks that have been idle for at least ``idle_time_ms``.
+
+        Args:
+            tenant_id: Target tenant.
+            worker_id: The claiming worker.
+            idle_time_ms: Minimum time since last delivery.
+            batch_size: Maximum number of tasks to claim.
+
+        Returns:
+            The claimed tasks, oldest message first.
+
+        Raises:
+            None.
+        """
+        queue = self._queue(tenant_id)
+        now = self._clock()
+        cutoff = now - idle_time_ms / 1000
+        claimed_ids: list[str] = []
+        for message_id, delivery in queue.pending.items():
+            if len(claimed_ids) == batch_size or delivery.delivered_at > cutoff:
+                break
+            claimed_ids.append(message_id)
+        claimed: list[Task] = []
+        for message_id in claimed_ids:
+            # Re-insert so pending stays ordered by delivery time.
+            delivery = queue.pending.pop(message_id)
+            delivery.worker_id = worker_id
+            delivery.delivered_at = now
+            queue.pending[message_id] = delivery
+            claimed.append(delivery.task)
+        return claimed
+
+    def depth(self, tenant_id: TenantId) -> int:
+        """Number of tasks waiting to be delivered for a tenant.
+
+        Args:
+            tenant_id: Target tenant.
+
+        Returns:
+            The number of ready tasks.
+
+        Raises:
+            None.
+        """
+        queue = self._tenants.get(tenant_id)
+        return len(queue.tasks) - len(queue.pending) if queue is not None else 0
+
+    def pending_count(self, tenant_id: TenantId) -> int:
+        """Number of delivered but unacknowledged tasks for a tenant.
+
+        Args:
+            tenant_id: Target tenant.
+
+        Returns:
+            The pending count.
+
+        Raises:
+            None.
+        """
+        queue = self._tenants.get(tenant_id)
+        return len(queue.pending) if queue is not None else 0
+
+    def _queue(self, tenant_id: str) -> _TenantQueue:
+        queue = self._tenants.get(tenant_id)
+        if queue is None:
+            queue = self._tenants[tenant_id] = _TenantQueue()
+        return queue
+
+    def _take(self, queue: _TenantQueue, batch_size: int, worker_id: str) -> list[Task]:
+        now = self._clock()
+        if self._visibility_timeout_ms is not None and queue.pending:
+            self._requeue_expired(queue, now, self._visibility_timeout_ms / 1000)
+        tasks: list[Task] = []
+        while queue.ready and len(tasks) < batch_size:
+            _, _, message_id = heapq.heappop(queue.ready)
+            task = queue.tasks.get(message_id)
+            if task is None:
+                continue
+            task._raw_id = message_id
+            queue.pending[message_id] = _Delivery(task, worker_id, now)
+            tasks.append(task)
+        if not queue.ready:
+            queue.available.clear()
+        return tasks
+
+    def _next_expiry(self, queue: _TenantQueue) -> float | None:
+        if self._visibility_timeout_ms is None or not queue.pending:
+            return None
+        oldest = next(iter(queue.pending.values()))
+        return oldest.delivered_at + self._visibility_timeout_ms / 1000
+
+    def _requeue_expired(self, queue: _TenantQueue, now: float, timeout: float) -> None:
+        # pending is kept ordered by delivery time, so expired entries form a prefix.
+        # Same comparison as _next_expiry, so a wake-up at the expiry always requeues.
+        expired: list[str] = []
+        for message_id, delivery in queue.pending.items():
+            if delivery.delivered_at + timeout > now:
+                break
+            expired.append(message_id)
+        for message_id in expired:
+            delivery = queue.pending.pop(message_id)
+            sequence = int(message_id.split("-", 1)[0])
+            heapq.heappush(queue.ready, (-delivery.task.priority, sequence, message_id))
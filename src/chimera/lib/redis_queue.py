@@ -0,0 +1,291 @@
+"""Redis Streams adapter for ``TaskQueuePort``.
+
+Each tenant gets its own stream (``<prefix>:<tenant_id>``) and consumer group,
+so one tenant's backlog never blocks another's reads. Batch operations are
+pipelined so throughput is bounded by Redis, not by per-task round trips.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from pydantic import ValidationError
+from redis.exceptions import ResponseError
+
+from chimera.lib.codec import decode_task, encode_task
+from chimera.lib.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from redis.asyncio import Redis
+
+    from chimera.models.task import Task
+    from chimera.models.types import TenantId
+
+logger = get_logger(__name__)
+
+_TASK_FIELD = b"task"
+
+
+class RedisTaskQueue:
+    """Tenant-scoped task queue backed by Redis Streams consumer groups.
+
+    Delivered tasks stay in the group's pending entries list until they are
+    acknowledged; ``dequeue_pending`` reclaims entries whose consumer went
+    idle (e.g. crashed) via ``XAUTOCLAIM``. Entries that cannot be decoded
+    are moved to ``<stream>:dead`` and acknowledged so they are not
+    redelivered forever.
+
+    Args:
+        redis_client: Async Redis client (``redis.asyncio`` or fakeredis).
+        stream_prefix: Prefix for per-tenant stream keys.
+        group: Consumer group name.
+        block_ms: How long ``dequeue`` blocks waiting for new tasks, or
+            ``None`` to return immediately.
+        max_len: Approximate stream length cap applied on ``XADD``, or
+            ``None`` for no trimming.
+        binary: Write tasks with the compact ``chimera.lib.codec`` format
+            instead of JSON. Either format is always readable.
+        trusted_decode: Skip pydantic validation when decoding binary
+            entries. Only enable when every producer is our own Planner.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        *,
+        stream_prefix: str = "chimera:tasks",
+        group: str = "chimera:workers",
+        block_ms: int | None = 1000,
+        max_len: int | None = None,
+        binary: bool = False,
+        trusted_decode: bool = False,
+    ) -> None:
+        self._redis = redis_client
+        self._stream_prefix = stream_prefix
+        self._group = group
+        self._block_ms = block_ms
+        self._max_len = max_len
+        self._binary = binary
+        self._trusted_decode = trusted_decode
+        self._groups_ready: set[str] = set()
+
+    def stream_key(self, tenant_id: TenantId) -> str:
+        """Return the stream key holding a tenant's tasks.
+
+        Args:
+            tenant_id: Target tenant.
+
+        Returns:
+            The Redis key.
+
+        Raises:
+            None.
+        """
+        return f"{self._stream_prefix}:{tenant_id}"
+
+    async def enqueue(self, tenant_id: TenantId, task: Task) -> None:
+        """Add a task to the tenant's stream.
+
+        Args:
+            tenant_id: Target tenant.
+            task: Task to enqueue.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If the task belongs to another tenant.
+        """
+        await self.enqueue_many(tenant_id, [task])
+
+    async def enqueue_many(self, tenant_id: TenantId, tasks: Iterable[Task]) -> list[str]:
+        """Add several tasks with one pipelined round trip.
+
+        Args:
+            tenant_id: Target tenant.
+            tasks: Tasks to enqueue, in order.
+
+        Returns:
+            The stream entry IDs, in order.
+
+        Raises:
+            ValueError: If any task belongs to another tenant.
+        """
+        payloads = [self._encode(tenant_id, task) for task in tasks]
+        if not payloads:
+            return []
+        key = self.stream_key(tenant_id)
+        await self._ensure_group(key)
+        pipe = self._redis.pipeline(transaction=False)
+        for payload in payloads:
+            pipe.xadd(key, {_TASK_FIELD: payload}, maxlen=self._max_len, approximate=True)
+        return [_text(entry_id) for entry_id in await pipe.execute()]
+
+    async def dequeue(
+        self, tenant_id: TenantId, batch_size: int = 1, worker_id: str = "default_worker"
+    ) -> Sequence[Task]:
+        """Read up to ``batch_size`` new tasks with one blocking ``XREADGROUP``.
+
+        Args:
+            tenant_id: Target tenant.
+            batch_size: Maximum number of tasks to retrieve.
+            worker_id: Consumer name within the group.
+
+        Returns:
+            Tasks delivered to the worker, with ``_raw_id`` set for ``ack``.
+
+        Raises:
+            ValueError: If ``batch_size`` is less than 1.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        key = self.stream_key(tenant_id)
+        await self._ensure_group(key)
+        try:
+            response = await self._read(key, batch_size, worker_id)
+        except ResponseError as exc:
+            if "NOGROUP" not in str(exc):
+                raise
+            # The stream was deleted behind our back; recreate the group once.
+            self._groups_ready.discard(key)
+            await self._ensure_group(key)
+            response = await self._read(key, batch_size, worker_id)
+        entries = [entry for _, stream_entries in response for entry in stream_entries]
+        return await self._decode_entries(key, entries)
+
+    async def ack(self, tenant_id: TenantId, task: Task, worker_id: str) -> None:
+        """Acknowledge successful processing of a task.
+
+        Args:
+            tenant_id: Target tenant.
+            task: A task returned by ``dequeue`` or ``dequeue_pending``.
+            worker_id: Consumer that processed the task.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If the task was not delivered by this queue.
+        """
+        await self.ack_many(tenant_id, [task], worker_id)
+
+    async def ack_many(self, tenant_id: TenantId, tasks: Sequence[Task], worker_id: str) -> None:
+        """Acknowledge several tasks with a single multi-ID ``XACK``.
+
+        Args:
+            tenant_id: Target tenant.
+            tasks: Tasks returned by ``dequeue`` or ``dequeue_pending``.
+            worker_id: Consumer that processed the tasks.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If a task was not delivered by this queue.
+        """
+        _ = worker_id
+        raw_ids: list[str] = []
+        for task in tasks:
+            raw_id = task._raw_id
+            if raw_id is None:
+                raise ValueError(f"Task '{task.task_id}' was not delivered by a Redis queue")
+            raw_ids.append(raw_id)
+        if raw_ids:
+            await self._redis.xack(self.stream_key(tenant_id), self._group, *raw_ids)
+
+    async def dequeue_pending(
+        self,
+        tenant_id: TenantId,
+        worker_id: str,
+        idle_time_ms: int = 10000,
+        batch_size: int = 100,
+    ) -> Sequence[Task]:
+        """Claim tasks that another consumer left unacknowledged, via ``XAUTOCLAIM``.
+
+        Args:
+            tenant_id: Target tenant.
+            worker_id: The claiming consumer.
+            idle_time_ms: Minimum time since last delivery.
+            batch_size: Maximum number of entries to claim.
+
+        Returns:
+            The claimed tasks.
+
+        Raises:
+            None.
+        """
+        key = self.stream_key(tenant_id)
+        await self._ensure_group(key)
+        response = await self._redis.xautoclaim(
+            key,
+            self._group,
+            worker_id,
+            min_idle_time=idle_time_ms,
+            start_id="0-0",
+            count=batch_size,
+        )
+        return await self._decode_entries(key, response[1])
+
+    async def _read(self, key: str, batch_size: int, worker_id: str) -> Any:
+        return await self._redis.xreadgroup(
+            self._group, worker_id, {key: ">"}, count=batch_size, block=self._block_ms
+        )
+
+    async def _ensure_group(self, key: str) -> None:
+        if key in self._groups_ready:
+            return
+        try:
+            await self._redis.xgroup_create(key, self._group, id="0", mkstream=True)
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+        self._groups_ready.add(key)
+
+    async def _decode_entries(
+        self, key: str, entries: Sequence[tuple[bytes | str, dict[Any, Any]]]
+    ) -> list[Task]:
+        tasks: list[Task] = []
+        poison: list[tuple[str, dict[Any, Any]]] = []
+        for raw_id, fields in entries:
+            entry_id = _text(raw_id)
+            payload = fields.get(_TASK_FIELD, fields.get(_TASK_FIELD.decode()))
+            try:
+                if payload is None:
+                    raise ValueError("entry has no task field")
+                if isinstance(payload, str):
+                    payload = payload.encode()
+                task = decode_task(payload, trusted=self._trusted_decode)
+            except (ValidationError, ValueError) as exc:
+                logger.warning(
+                    "redis_queue.poison_entry", stream=key, entry_id=entry_id, error=str(exc)
+                )
+                poison.append((entry_id, fields))
+                continue
+            task._raw_id = entry_id
+            tasks.append(task)
+        if poison:
+            pipe = self._redis.pipeline(transaction=False)
+            for entry_id, fields in poison:
+                pipe.xadd(f"{key}:dead", {**fields, b"source_id": entry_id})
+            pipe.xack(key, self._group, *(entry_id for entry_id, _ in poison))
+            await pipe.execute()
+        return tasks
+
+    def _encode(self, tenant_id: TenantId, task: Task) -> bytes:
+        if task.tenant_id != tenant_id:
+            raise ValueError(
+                f"Task '{task.task_id}' belongs to tenant '{task.tenant_id}', not '{tenant_id}'"
+            )
+        return encode_task(task) if self._binary else task.model_dump_json().encode()
+
+
+def _text(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
@@ -0,0 +1,26 @@
+"""Small statistics helpers shared by services that report latency stats."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted samples.
+
+    Args:
+        ordered: Samples in ascending order.
+        fraction: Percentile as a fraction, e.g. ``0.95``.
+
+    Returns:
+        The sample at that rank, or 0.0 when there are no samples.
+
+    Raises:
+        None.
+    """
+    if not ordered:
+        return 0.0
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
@@ -47,4 +47,9 @@ class Result(BaseModel):
     @model_validator(mode="after")
     def validate_error_presence(self) -> "Result":
         """Ensure error is present for failures and absent for success."""
-        raise NotImplementedError("Result.validate_error_presence is not implemented")
+        if self.status is ResultStatus.SUCCEEDED:
+            if self.error is not None:
+                raise ValueError("A succeeded result must not carry an error")
+        elif self.error is None:
+            raise ValueError(f"A result with status '{self.status}' requires error details")
+        return self
@@ -12,6 +12,7 @@ class ReviewReason(StrEnum):
 
     LOW_CONFIDENCE = "low_confidence"
     SENSITIVE_KEYWORD = "sensitive_keyword"
+    OUTPUT_TOO_LARGE = "output_too_large"
 
 
 class ReviewStatus(StrEnum):
@@ -23,7 +23,18 @@ class TaskStatus(StrEnum):
     @property
     def is_terminal(self) -> bool:
         """Return True if the status is terminal."""
-        raise NotImplementedError("TaskStatus.is_terminal is not implemented")
+        return self in _TERMINAL_STATUSES
+
+
+_TERMINAL_STATUSES = frozenset(
+    {
+        TaskStatus.SUCCEEDED,
+        TaskStatus.FAILED,
+        TaskStatus.CANCELLED,
+        TaskStatus.BLOCKED,
+        TaskStatus.TIMED_OUT,
+    }
+)
 
 
 class Task(BaseModel):
@@ -75,9 +86,19 @@ class Task(BaseModel):
     @model_validator(mode="after")
     def validate_terminal_status_completeness(self) -> "Task":
         """Ensure terminal status has completed_at set."""
-        raise NotImplementedError("Task.validate_terminal_status_completeness is not implemented")
+        if self.status.is_terminal and self.completed_at is None:
+            raise ValueError(f"Task in terminal status '{self.status}' requires completed_at")
+        return self
 
     @model_validator(mode="after")
     def validate_timestamp_ordering(self) -> "Task":
         """Verify timestamp sequence integrity."""
-        raise NotImplementedError("Task.validate_timestamp_ordering is not implemented")
+        if self.updated_at < self.created_at:
+            raise ValueError("updated_at must not precede created_at")
+        if self.started_at is not None and self.started_at < self.created_at:
+            raise ValueError("started_at must not precede created_at")
+        if self.completed_at is not None and self.completed_at < (
+            self.started_at or self.created_at
+        ):
+            raise ValueError("completed_at must not precede started_at or created_at")
+        return self
@@ -2,35 +2,76 @@
 
 from __future__ import annotations
 
-from chimera.skills.models import SkillContext
+from typing import TYPE_CHECKING
+
 from chimera.skills.registry import SkillRegistry
-from chimera.skills.samples import register_sample_skills
-from chimera.skills.workflow import SkillWorkflowRunner, WorkflowDefinition, WorkflowRunResult
+from chimera.skills.samples import SKILLS_MANIFEST, register_sample_skills
+from chimera.skills.workflow import (
+    SkillWorkflowRunner,
+    WorkflowDefinition,
+    WorkflowExecutionMode,
+    WorkflowPlan,
+    WorkflowRunResult,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+    from pathlib import Path
+
+    from chimera.skills.models import SkillContext
 
 
 class SkillsWorkflowPipeline:
     """High-level pipeline that executes skill workflows.
 
     Args:
-        None.
+        registry: Optional registry to populate with the built-in skills.
+        mode: Step scheduling mode for the underlying runner.
+        max_concurrency: Maximum number of steps in flight in parallel mode.
+        manifest: Skills manifest to register the built-in skills from.
 
     Returns:
         None.
 
     Raises:
-        None.
+        ValueError: If max_concurrency is less than 1.
     """
 
-    def __init__(self, registry: SkillRegistry | None = None) -> None:
+    def __init__(
+        self,
+        registry: SkillRegistry | None = None,
+        mode: WorkflowExecutionMode = WorkflowExecutionMode.SEQUENTIAL,
+        max_concurrency: int = 8,
+        manifest: Path = SKILLS_MANIFEST,
+    ) -> None:
         self._registry = registry or SkillRegistry()
-        register_sample_skills(self._registry)
-        self._runner = SkillWorkflowRunner(self._registry)
+        register_sample_skills(self._registry, manifest)
+        self._runner = SkillWorkflowRunner(
+            self._registry, mode=mode, max_concurrency=max_concurrency
+        )
+
+    def compile(self, definition: WorkflowDefinition) -> WorkflowPlan:
+        """Compile a workflow definition once for repeated runs.
+
+        Args:
+            definition: Workflow definition to compile.
+
+        Returns:
+            An immutable execution plan.
+
+        Raises:
+            KeyError: If a step references an unregistered skill.
+            pydantic.ValidationError: If a static step payload fails input validation.
+        """
+        return self._runner.compile(definition)
 
-    async def run(self, definition: WorkflowDefinition, context: SkillContext) -> WorkflowRunResult:
+    async def run(
+        self, definition: WorkflowDefinition | WorkflowPlan, context: SkillContext
+    ) -> WorkflowRunResult:
         """Run the workflow definition using the registered skills.
 
         Args:
-            definition: Workflow definition to execute.
+            definition: Workflow definition or compiled plan to execute.
             context: Execution context.
 
         Returns:
@@ -40,3 +81,32 @@ class SkillsWorkflowPipeline:
             pydantic.ValidationError: If a step payload fails input validation.
         """
         return await self._runner.run(definition, context)
+
+    def run_many(
+        self,
+        definition: WorkflowDefinition | WorkflowPlan,
+        contexts: Iterable[SkillContext],
+        max_concurrency: int = 64,
+        per_tenant_concurrency: int = 8,
+    ) -> AsyncIterator[tuple[SkillContext, WorkflowRunResult]]:
+        """Run the workflow for many contexts, streaming results as they complete.
+
+        Args:
+            definition: Workflow definition or compiled plan to execute.
+            contexts: Execution contexts, one run each.
+            max_concurrency: Maximum number of runs in flight overall.
+            per_tenant_concurrency: Maximum number of runs in flight per tenant.
+
+        Returns:
+            An async iterator of ``(context, result)`` pairs in completion order.
+
+        Raises:
+            ValueError: If a concurrency limit is less than 1.
+            pydantic.ValidationError: If a step payload fails input validation.
+        """
+        return self._runner.run_many(
+            definition,
+            contexts,
+            max_concurrency=max_concurrency,
+            per_tenant_concurrency=per_tenant_concurrency,
+        )
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import Protocol, runtime_checkable
 
 from chimera.models.result import Result
@@ -21,3 +22,19 @@ class LLMPort(Protocol):
             A validated Result model.
         """
         ...
+
+
+@runtime_checkable
+class BatchLLMPort(LLMPort, Protocol):
+    """LLM backend that can also process several tasks in one request."""
+
+    async def generate_results(self, tasks: Sequence[Task]) -> Sequence[Result]:
+        """Process tasks in a single backend request.
+
+        Args:
+            tasks: Tasks to process.
+
+        Returns:
+            One Result per task, in task order.
+        """
+        ...
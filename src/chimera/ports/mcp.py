@@ -1,18 +1,22 @@
+import asyncio
 from abc import abstractmethod
-from typing import Any, List
+from collections.abc import Sequence
 from contextlib import AbstractAsyncContextManager
+from typing import Any
+
 from chimera.models.mcp import ToolDefinition, ToolResult
 
+
 class MCPClientPort(AbstractAsyncContextManager["MCPClientPort"]):
     """Port defining the interface for a Model Context Protocol client."""
 
     @abstractmethod
-    async def list_tools(self) -> List[ToolDefinition]:
+    async def list_tools(self) -> list[ToolDefinition]:
         """List all available tools from the connected MCP server.
 
         Returns:
-            List[ToolDefinition]: The list of tools discovered.
-        
+            list[ToolDefinition]: The list of tools discovered.
+
         Raises:
             RuntimeError: If the client is not connected or discovery fails.
         """
@@ -28,9 +32,31 @@ class MCPClientPort(AbstractAsyncContextManager["MCPClientPort"]):
 
         Returns:
             ToolResult: The outcome of the tool execution.
-            
+
         Raises:
             ValueError: If the tool name is unknown.
             RuntimeError: If execution fails at the transport level.
         """
         pass
+
+    async def call_tool_batch(
+        self, name: str, arguments: Sequence[dict[str, Any]]
+    ) -> list[ToolResult]:
+        """Call one tool with several argument sets.
+
+        The default issues the calls concurrently through ``call_tool``.
+        Clients override this to send the calls together; ``MCPClient``
+        pipelines them in a single write to the server.
+
+        Args:
+            name: The name of the tool to execute.
+            arguments: One parameter set per call.
+
+        Returns:
+            list[ToolResult]: One outcome per argument set, in order.
+
+        Raises:
+            ValueError: If the tool name is unknown.
+            RuntimeError: If execution fails at the transport level.
+        """
+        return list(await asyncio.gather(*(self.call_tool(name, args) for args in arguments)))
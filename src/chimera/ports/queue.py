@@ -1,4 +1,4 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from typing import Protocol, runtime_checkable
 
 from chimera.models.task import Task
@@ -16,6 +16,18 @@ class TaskQueuePort(Protocol):
         """Add a task to the queue for a specific tenant."""
         ...
 
+    async def enqueue_many(self, tenant_id: TenantId, tasks: Iterable[Task]) -> Sequence[str]:
+        """Add several tasks for a tenant in one batch.
+
+        Args:
+            tenant_id: Target tenant.
+            tasks: Tasks to enqueue, in order.
+
+        Returns:
+            Queue-assigned message IDs, in order.
+        """
+        ...
+
     async def dequeue(
         self, tenant_id: TenantId, batch_size: int = 1, worker_id: str = "default_worker"
     ) -> Sequence[Task]:
@@ -35,6 +47,16 @@ class TaskQueuePort(Protocol):
         """Acknowledge successful processing of a task."""
         ...
 
+    async def ack_many(self, tenant_id: TenantId, tasks: Sequence[Task], worker_id: str) -> None:
+        """Acknowledge several tasks in one batch.
+
+        Args:
+            tenant_id: Target tenant.
+            tasks: Tasks delivered by ``dequeue`` or ``dequeue_pending``.
+            worker_id: Consumer that processed the tasks.
+        """
+        ...
+
     async def dequeue_pending(
         self, tenant_id: TenantId, worker_id: str, idle_time_ms: int = 10000
     ) -> Sequence[Task]:
@@ -0,0 +1,45 @@
+from collections.abc import Sequence
+from typing import Protocol, runtime_checkable
+
+
+@runtime_checkable
+class VectorIndexPort(Protocol):
+    """Port for nearest-neighbour lookup over embedding vectors.
+
+    Vectors are grouped into partitions (e.g. one per tenant and task kind);
+    searches never cross partitions.
+    """
+
+    async def add(self, partition: str, key: str, vector: Sequence[float]) -> None:
+        """Insert or replace a vector under ``key``.
+
+        Args:
+            partition: Partition to write.
+            key: Identifier returned by ``search``.
+            vector: Embedding vector.
+        """
+        ...
+
+    async def remove(self, partition: str, key: str) -> None:
+        """Delete a vector. Unknown keys are ignored.
+
+        Args:
+            partition: Partition holding the vector.
+            key: Identifier to delete.
+        """
+        ...
+
+    async def search(
+        self, partition: str, vector: Sequence[float], min_similarity: float
+    ) -> tuple[str, float] | None:
+        """Find the most similar vector in a partition.
+
+        Args:
+            partition: Partition to search.
+            vector: Query embedding.
+            min_similarity: Minimum cosine similarity for a match.
+
+        Returns:
+            ``(key, similarity)`` of the best match, or None.
+        """
+        ...
@@ -0,0 +1,730 @@
+"""Per-tenant daily spend ledger with reserve/commit/release semantics.
+
+A transfer first ``reserve``s its amount. The reservation succeeds only if
+committed spend plus outstanding reservations plus the amount stays within
+the limit, and the check and the increment happen as one atomic step, so
+concurrent agents of one tenant can never overshoot the budget together.
+The transfer then ``commit``s the reservation once it executed, or
+``release``s it if it failed. Every operation touches one tenant-day
+account, so budget checks cost O(1) instead of a ``SUM`` over
+``transactions``.
+
+Amounts are tracked as integer cents, so the ledger never accumulates
+floating-point error. Reservations expire after ``hold_ttl_s``, so a hold
+left behind by a crashed agent stops counting against the budget.
+
+``RedisBudgetLedger`` keeps the accounts in Redis and runs each operation
+as a Lua script; ``InMemoryBudgetLedger`` keeps them in process, sharded by
+tenant behind per-shard locks. ``BudgetReconciler`` periodically corrects
+committed spend from executed rows in ``transactions``, e.g. for transfers
+recorded without going through the ledger.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, time, timedelta
+from decimal import ROUND_CEILING, Decimal
+from typing import TYPE_CHECKING, Any, Protocol
+from uuid import uuid4
+
+from sqlalchemy import func, select
+from sqlmodel import col
+
+from chimera.db.schema import BudgetConfig, Transaction
+from chimera.lib.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from redis.asyncio import Redis
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = get_logger(__name__)
+
+_CENT = Decimal("0.01")
+
+
+class BudgetExceededError(RuntimeError):
+    """A reservation would take a tenant over its daily limit."""
+
+
+@dataclass(frozen=True, slots=True)
+class Reservation:
+    """Funds held for one pending transfer."""
+
+    reservation_id: str
+    tenant_id: str
+    day: date
+    amount_usd: Decimal
+    expires_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class BudgetUsage:
+    """A tenant's spend for one day."""
+
+    committed_usd: Decimal
+    reserved_usd: Decimal
+
+    @property
+    def total_usd(self) -> Decimal:
+        """Committed spend plus outstanding reservations."""
+        return self.committed_usd + self.reserved_usd
+
+
+class BudgetLedger(Protocol):
+    """Atomic per-tenant daily spend accounts."""
+
+    async def reserve(self, tenant_id: str, amount_usd: Decimal, limit_usd: Decimal) -> Reservation:
+        """Hold funds if they fit within the limit, else raise ``BudgetExceededError``."""
+        ...
+
+    async def commit(self, reservation: Reservation) -> bool:
+        """Turn a hold into spend; return False if the hold had already expired."""
+        ...
+
+    async def release(self, reservation: Reservation) -> bool:
+        """Drop a hold; return False if it had already expired."""
+        ...
+
+    async def usage(self, tenant_id: str, day: date | None = None) -> BudgetUsage:
+        """Current spend of a tenant; ``day`` defaults to today (UTC)."""
+        ...
+
+    async def reconcile(
+        self, tenant_id: str, day: date, *, expected_usd: Decimal, actual_usd: Decimal
+    ) -> bool:
+        """Set committed spend to ``actual_usd`` if it still equals ``expected_usd``."""
+        ...
+
+
+@dataclass(slots=True)
+class _Account:
+    committed: int = 0
+    reserved: int = 0
+    # reservation_id -> (cents, expiry as epoch milliseconds)
+    holds: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+    def purge(self, now_ms: int) -> None:
+        expired = [key for key, (_, expiry) in self.holds.items() if expiry <= now_ms]
+        for key in expired:
+            self.reserved -= self.holds.pop(key)[0]
+
+
+@dataclass(slots=True)
+class _Shard:
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    accounts: dict[tuple[str, date], _Account] = field(default_factory=dict)
+    swept_day: date | None = None
+
+    def sweep(self, today: date) -> None:
+        # Runs once per day per shard: drop accounts from before yesterday,
+        # which no reservation can still be charged to.
+        if self.swept_day == today:
+            return
+        cutoff = today - timedelta(days=1)
+        for key in [key for key in self.accounts if key[1] < cutoff]:
+            del self.accounts[key]
+        self.swept_day = today
+
+
+class InMemoryBudgetLedger:
+    """Process-local ledger, sharded by tenant.
+
+    Each shard has its own lock, so tenants on different shards never
+    contend, and operations are safe across threads as well as tasks.
+    Accounts are lost if the process dies; reconcile on startup. Accounts
+    older than yesterday are dropped, so ``usage`` of such a day reads zero.
+
+    Args:
+        shards: Number of lock shards.
+        hold_ttl_s: Lifetime of a reservation.
+        clock: Source of the current time; defaults to UTC now.
+
+    Returns:
+        None.
+
+    Raises:
+        ValueError: If ``shards`` or ``hold_ttl_s`` is not positive.
+    """
+
+    def __init__(
+        self,
+        *,
+        shards: int = 16,
+        hold_ttl_s: float = 300.0,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        if shards < 1 or hold_ttl_s <= 0:
+            raise ValueError("shards and hold_ttl_s must be positive")
+        self._shards = [_Shard() for _ in range(shards)]
+        self._hold_ttl = timedelta(seconds=hold_ttl_s)
+        self._clock = clock or _utcnow
+
+    async def reserve(self, tenant_id: str, amount_usd: Decimal, limit_usd: Decimal) -> Reservation:
+        """Hold funds if they fit within today's limit.
+
+        Args:
+            tenant_id: Tenant spending the funds.
+            amount_usd: Amount to hold; rounded up to whole cents.
+            limit_usd: The tenant's daily limit.
+
+        Returns:
+            The reservation, to be committed or released.
+
+        Raises:
+            ValueError: If ``amount_usd`` is not positive.
+            BudgetExceededError: If the amount does not fit.
+        """
+        cents = _amount_cents(amount_usd)
+        now = self._clock()
+        reservation = _new_reservation(tenant_id, now, cents, self._hold_ttl)
+        shard = self._shard(tenant_id)
+        with shard.lock:
+            shard.sweep(reservation.day)
+            account = shard.accounts.setdefault((tenant_id, reservation.day), _Account())
+            account.purge(_epoch_ms(now))
+            if account.committed + account.reserved + cents > _cents(limit_usd):
+                raise _exceeded(tenant_id, amount_usd, account.committed + account.reserved)
+            account.reserved += cents
+            account.holds[reservation.reservation_id] = (cents, _epoch_ms(reservation.expires_at))
+        return reservation
+
+    async def commit(self, reservation: Reservation) -> bool:
+        """Turn a hold into committed spend.
+
+        The amount is committed even if the hold expired, since the
+        transfer did execute.
+
+        Args:
+            reservation: Hold returned by ``reserve``.
+
+        Returns:
+            False if the hold had already expired.
+
+        Raises:
+            None.
+        """
+        return self._settle(reservation, commit=True)
+
+    async def release(self, reservation: Reservation) -> bool:
+        """Drop a hold without spending it.
+
+        Args:
+            reservation: Hold returned by ``reserve``.
+
+        Returns:
+            False if the hold had already expired.
+
+        Raises:
+            None.
+        """
+        return self._settle(reservation, commit=False)
+
+    async def usage(self, tenant_id: str, day: date | None = None) -> BudgetUsage:
+        """Current spend of a tenant.
+
+        Args:
+            tenant_id: Target tenant.
+            day: UTC day; defaults to today.
+
+        Returns:
+            Committed and reserved amounts.
+
+        Raises:
+            None.
+        """
+        now = self._clock()
+        today = _utc_day(now)
+        shard = self._shard(tenant_id)
+        with shard.lock:
+            shard.sweep(today)
+            account = shard.accounts.get((tenant_id, day or today))
+            if account is None:
+                return BudgetUsage(Decimal("0.00"), Decimal("0.00"))
+            account.purge(_epoch_ms(now))
+            return BudgetUsage(_usd(account.committed), _usd(account.reserved))
+
+    async def reconcile(
+        self, tenant_id: str, day: date, *, expected_usd: Decimal, actual_usd: Decimal
+    ) -> bool:
+        """Set committed spend if nothing was committed since it was read.
+
+        Args:
+            tenant_id: Target tenant.
+            day: UTC day.
+            expected_usd: Committed spend read before computing ``actual_usd``.
+            actual_usd: Committed spend according to the source of truth.
+
+        Returns:
+            True if the account was updated.
+
+        Raises:
+            None.
+        """
+        shard = self._shard(tenant_id)
+        with shard.lock:
+            account = shard.accounts.setdefault((tenant_id, day), _Account())
+            if account.committed != _cents(expected_usd):
+                return False
+            account.committed = _cents(actual_usd)
+            return True
+
+    def _settle(self, reservation: Reservation, *, commit: bool) -> bool:
+        shard = self._shard(reservation.tenant_id)
+        with shard.lock:
+            key = (reservation.tenant_id, reservation.day)
+            account = shard.accounts.setdefault(key, _Account())
+            hold = account.holds.pop(reservation.reservation_id, None)
+            if hold is not None:
+                account.reserved -= hold[0]
+            if commit:
+                account.committed += _cents(reservation.amount_usd)
+            return hold is not None
+
+    def _shard(self, tenant_id: str) -> _Shard:
+        return self._shards[hash(tenant_id) % len(self._shards)]
+
+
+# Shared by the scripts below: drop expired holds and return their cents to
+# the budget. KEYS: account hash, holds hash, expiry zset.
+_PURGE = """
+local function purge(now_ms)
+    local expired = redis.call('ZRANGEBYSCORE', KEYS[3], '-inf', now_ms)
+    for _, id in ipairs(expired) do
+        local cents = redis.call('HGET', KEYS[2], id)
+        if cents then
+            redis.call('HINCRBY', KEYS[1], 'reserved', -tonumber(cents))
+            redis.call('HDEL', KEYS[2], id)
+        end
+    end
+    if #expired > 0 then
+        redis.call('ZREMRANGEBYSCORE', KEYS[3], '-inf', now_ms)
+    end
+end
+local function expire_all(ttl_s)
+    for i = 1, 3 do
+        redis.call('EXPIRE', KEYS[i], ttl_s)
+    end
+end
+"""
+
+# ARGV: reservation id, cents, limit cents, now ms, expiry ms, key ttl s
+_RESERVE = (
+    _PURGE
+    + """
+purge(ARGV[4])
+local committed = tonumber(redis.call('HGET', KEYS[1], 'committed') or '0')
+local reserved = tonumber(redis.call('HGET', KEYS[1], 'reserved') or '0')
+local cents = tonumber(ARGV[2])
+if committed + reserved + cents > tonumber(ARGV[3]) then
+    return {0, committed + reserved}
+end
+redis.call('HINCRBY', KEYS[1], 'reserved', cents)
+redis.call('HSET', KEYS[2], ARGV[1], cents)
+redis.call('ZADD', KEYS[3], ARGV[5], ARGV[1])
+expire_all(ARGV[6])
+return {1, committed + reserved + cents}
+"""
+)
+
+# ARGV: reservation id, cents to commit (0 to release), key ttl s
+_SETTLE = (
+    _PURGE
+    + """
+local held = redis.call('HGET', KEYS[2], ARGV[1])
+if held then
+    redis.call('HDEL', KEYS[2], ARGV[1])
+    redis.call('ZREM', KEYS[3], ARGV[1])
+    redis.call('HINCRBY', KEYS[1], 'reserved', -tonumber(held))
+end
+if tonumber(ARGV[2]) > 0 then
+    redis.call('HINCRBY', KEYS[1], 'committed', ARGV[2])
+    expire_all(ARGV[3])
+end
+if held then
+    return 1
+end
+return 0
+"""
+)
+
+# ARGV: now ms
+_USAGE = (
+    _PURGE
+    + """
+purge(ARGV[1])
+return {
+    redis.call('HGET', KEYS[1], 'committed') or '0',
+    redis.call('HGET', KEYS[1], 'reserved') or '0',
+}
+"""
+)
+
+# ARGV: expected cents, actual cents, key ttl s
+_RECONCILE = (
+    _PURGE
+    + """
+local committed = tonumber(redis.call('HGET', KEYS[1], 'committed') or '0')
+if committed ~= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'committed', ARGV[2])
+expire_all(ARGV[3])
+return 1
+"""
+)
+
+
+class RedisBudgetLedger:
+    """Ledger shared by all processes through Redis.
+
+    Each tenant-day account is a hash (``committed`` and ``reserved`` cents)
+    plus a hash and a sorted set of holds, all under one hash tag so they
+    live on the same cluster slot. Every operation is a single Lua script,
+    so Redis runs it atomically without locks or retries. Keys expire
+    ``key_ttl_s`` after their last write.
+
+    Args:
+        redis_client: Async Redis client.
+        key_prefix: Prefix of all ledger keys.
+        hold_ttl_s: Lifetime of a reservation.
+        key_ttl_s: Lifetime of an account after its last write.
+        clock: Source of the current time; defaults to UTC now.
+
+    Returns:
+        None.
+
+    Raises:
+        ValueError: If ``hold_ttl_s`` or ``key_ttl_s`` is not positive.
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        *,
+        key_prefix: str = "chimera:spend",
+        hold_ttl_s: float = 300.0,
+        key_ttl_s: int = 3 * 24 * 3600,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        if hold_ttl_s <= 0 or key_ttl_s <= 0:
+            raise ValueError("hold_ttl_s and key_ttl_s must be positive")
+        self._redis = redis_client
+        self._prefix = key_prefix
+        self._hold_ttl = timedelta(seconds=hold_ttl_s)
+        self._key_ttl_s = key_ttl_s
+        self._clock = clock or _utcnow
+        self._reserve = redis_client.register_script(_RESERVE)
+        self._settle = redis_client.register_script(_SETTLE)
+        self._usage = redis_client.register_script(_USAGE)
+        self._reconcile = redis_client.register_script(_RECONCILE)
+
+    def keys(self, tenant_id: str, day: date) -> list[str]:
+        """Redis keys of a tenant-day account.
+
+        Args:
+            tenant_id: Target tenant.
+            day: UTC day.
+
+        Returns:
+            The account hash, holds hash and hold expiry sorted set keys.
+
+        Raises:
+            None.
+        """
+        base = f"{self._prefix}:{{{tenant_id}:{day.isoformat()}}}"
+        return [base, f"{base}:holds", f"{base}:expiry"]
+
+    async def reserve(self, tenant_id: str, amount_usd: Decimal, limit_usd: Decimal) -> Reservation:
+        """Hold funds if they fit within today's limit.
+
+        Args:
+            tenant_id: Tenant spending the funds.
+            amount_usd: Amount to hold; rounded up to whole cents.
+            limit_usd: The tenant's daily limit.
+
+        Returns:
+            The reservation, to be committed or released.
+
+        Raises:
+            ValueError: If ``amount_usd`` is not positive.
+            BudgetExceededError: If the amount does not fit.
+            redis.RedisError: If Redis is unavailable.
+        """
+        cents = _amount_cents(amount_usd)
+        now = self._clock()
+        reservation = _new_reservation(tenant_id, now, cents, self._hold_ttl)
+        accepted, spend = await self._reserve(
+            keys=self.keys(tenant_id, reservation.day),
+            args=[
+                reservation.reservation_id,
+                cents,
+                _cents(limit_usd),
+                _epoch_ms(now),
+                _epoch_ms(reservation.expires_at),
+                self._key_ttl_s,
+            ],
+        )
+        if not accepted:
+            raise _exceeded(tenant_id, amount_usd, int(spend))
+        return reservation
+
+    async def commit(self, reservation: Reservation) -> bool:
+        """Turn a hold into committed spend.
+
+        The amount is committed even if the hold expired, since the
+        transfer did execute.
+
+        Args:
+            reservation: Hold returned by ``reserve``.
+
+        Returns:
+            False if the hold had already expired.
+
+        Raises:
+            redis.RedisError: If Redis is unavailable.
+        """
+        return await self._settle_hold(reservation, _cents(reservation.amount_usd))
+
+    async def release(self, reservation: Reservation) -> bool:
+        """Drop a hold without spending it.
+
+        Args:
+            reservation: Hold returned by ``reserve``.
+
+        Returns:
+            False if the hold had already expired.
+
+        Raises:
+            redis.RedisError: If Redis is unavailable.
+        """
+        return await self._settle_hold(reservation, 0)
+
+    async def usage(self, tenant_id: str, day: date | None = None) -> BudgetUsage:
+        """Current spend of a tenant.
+
+        Args:
+            tenant_id: Target tenant.
+            day: UTC day; defaults to today.
+
+        Returns:
+            Committed and reserved amounts.
+
+        Raises:
+            redis.RedisError: If Redis is unavailable.
+        """
+        now = self._clock()
+        committed, reserved = await self._usage(
+            keys=self.keys(tenant_id, day or _utc_day(now)), args=[_epoch_ms(now)]
+        )
+        return BudgetUsage(_usd(int(committed)), _usd(int(reserved)))
+
+    async def reconcile(
+        self, tenant_id: str, day: date, *, expected_usd: Decimal, actual_usd: Decimal
+    ) -> bool:
+        """Set committed spend if nothing was committed since it was read.
+
+        Args:
+            tenant_id: Target tenant.
+            day: UTC day.
+            expected_usd: Committed spend read before computing ``actual_usd``.
+            actual_usd: Committed spend according to the source of truth.
+
+        Returns:
+            True if the account was updated.
+
+        Raises:
+            redis.RedisError: If Redis is unavailable.
+        """
+        updated = await self._reconcile(
+            keys=self.keys(tenant_id, day),
+            args=[_cents(expected_usd), _cents(actual_usd), self._key_ttl_s],
+        )
+        return bool(updated)
+
+    async def _settle_hold(self, reservation: Reservation, commit_cents: int) -> bool:
+        found = await self._settle(
+            keys=self.keys(reservation.tenant_id, reservation.day),
+            args=[reservation.reservation_id, commit_cents, self._key_ttl_s],
+        )
+        return bool(found)
+
+
+class BudgetReconciler:
+    """Periodically corrects ledger spend from executed transactions.
+
+    Each run sums today's ``EXECUTED`` transactions per tenant (the
+    ``tenant_id`` of their budget, as a string) and overwrites the ledger's
+    committed spend with it. The overwrite is a compare-and-set against the
+    value read before the query, so a commit that lands while the query runs
+    makes that tenant wait for the next run instead of being lost. Tenants
+    with a budget but no executed transactions that day are reset to zero.
+
+    Args:
+        ledger: Ledger to correct.
+        engine: Async SQLAlchemy engine.
+        interval_s: Time between runs of the background loop.
+        clock: Source of the current time; defaults to UTC now.
+
+    Returns:
+        None.
+
+    Raises:
+        ValueError: If ``interval_s`` is not positive.
+    """
+
+    def __init__(
+        self,
+        ledger: BudgetLedger,
+        engine: AsyncEngine,
+        *,
+        interval_s: float = 300.0,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        if interval_s <= 0:
+            raise ValueError("interval_s must be positive")
+        self._ledger = ledger
+        self._engine = engine
+        self._interval_s = interval_s
+        self._clock = clock or _utcnow
+        self._loop_task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the background loop. Starting twice is a no-op.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the background loop.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._loop_task
+            self._loop_task = None
+
+    async def reconcile(self, day: date | None = None) -> dict[str, Decimal]:
+        """Correct every budget tenant's committed spend for a day.
+
+        Args:
+            day: UTC day; defaults to today.
+
+        Returns:
+            Ledger drift (database minus ledger) of each tenant that was
+            corrected; tenants without drift or skipped by the
+            compare-and-set are not listed.
+
+        Raises:
+            Exception: Whatever the database or the ledger raises.
+        """
+        day = day or _utc_day(self._clock())
+        # Read the ledger first so the compare-and-set detects commits made
+        # while the transactions are being summed.
+        expected = {
+            tenant_id: (await self._ledger.usage(tenant_id, day)).committed_usd
+            for tenant_id in await self._budget_tenants()
+        }
+        actual = await self._executed_spend(day)
+
+        drift: dict[str, Decimal] = {}
+        for tenant_id, before in expected.items():
+            spend = actual.get(tenant_id, Decimal("0.00"))
+            if spend == before:
+                continue
+            if await self._ledger.reconcile(tenant_id, day, expected_usd=before, actual_usd=spend):
+                drift[tenant_id] = spend - before
+                logger.warning(
+                    "budget_ledger.reconciled", tenant_id=tenant_id, drift_usd=str(spend - before)
+                )
+        return drift
+
+    async def _budget_tenants(self) -> Sequence[str]:
+        query = select(col(BudgetConfig.tenant_id)).distinct()
+        async with self._engine.connect() as connection:
+            rows = await connection.execute(query)
+            return [str(tenant_id) for (tenant_id,) in rows]
+
+    async def _executed_spend(self, day: date) -> dict[str, Decimal]:
+        start = datetime.combine(day, time(), tzinfo=UTC)
+        query: Any = (
+            select(col(BudgetConfig.tenant_id), func.sum(col(Transaction.amount_usd)))
+            .join(Transaction, col(Transaction.budget_id) == col(BudgetConfig.id))
+            .where(
+                col(Transaction.status) == "EXECUTED",
+                col(Transaction.created_at) >= start,
+                col(Transaction.created_at) < start + timedelta(days=1),
+            )
+            .group_by(col(BudgetConfig.tenant_id))
+        )
+        async with self._engine.connect() as connection:
+            rows = await connection.execute(query)
+            return {str(tenant_id): Decimal(total).quantize(_CENT) for tenant_id, total in rows}
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.reconcile()
+            except Exception as exc:
+                logger.warning("budget_ledger.reconcile_failed", error=str(exc))
+            await asyncio.sleep(self._interval_s)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+def _utc_day(moment: datetime) -> date:
+    return moment.astimezone(UTC).date()
+
+
+def _epoch_ms(moment: datetime) -> int:
+    return int(moment.timestamp() * 1000)
+
+
+def _cents(amount_usd: Decimal) -> int:
+    return int((amount_usd * 100).to_integral_value(rounding=ROUND_CEILING))
+
+
+def _amount_cents(amount_usd: Decimal) -> int:
+    if amount_usd <= 0:
+        raise ValueError("amount_usd must be positive")
+    return _cents(amount_usd)
+
+
+def _usd(cents: int) -> Decimal:
+    return (Decimal(cents) / 100).quantize(_CENT)
+
+
+def _new_reservation(tenant_id: str, now: datetime, cents: int, ttl: timedelta) -> Reservation:
+    return Reservation(
+        reservation_id=uuid4().hex,
+        tenant_id=tenant_id,
+        day=_utc_day(now),
+        amount_usd=_usd(cents),
+        expires_at=now + ttl,
+    )
+
+
+def _exceeded(tenant_id: str, amount_usd: Decimal, spend_cents: int) -> BudgetExceededError:
+    return BudgetExceededError(
+        f"Budget Exceeded: tenant {tenant_id} has spent or reserved "
+        f"{_usd(spend_cents)} USD today; {amount_usd} USD does not fit"
+    )
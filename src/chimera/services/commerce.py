@@ -1,18 +1,49 @@
 from decimal import Decimal
 from typing import Any
+from chimera.lib.logging import get_logger
 from chimera.models.commerce import TransactionRecord
 from chimera.ports.commerce import CommercePort
+from chimera.ports.mcp import MCPClientPort
+from chimera.services.budget_ledger import BudgetExceededError
+from chimera.services.judge_policy import CFOJudge
+
+logger = get_logger(__name__)
+
+TRANSFER_TOOL = "transfer_asset"
 
 class CommerceManager(CommercePort):
     """Manages financial operations with budget enforcement."""
 
-    def __init__(self, cdp_key_name: str, cdp_private_key: str):
+    def __init__(
+        self,
+        cdp_key_name: str,
+        cdp_private_key: str,
+        *,
+        cfo_judge: CFOJudge | None = None,
+        mcp_client: MCPClientPort | None = None,
+    ):
         """
         Initialize with Coinbase credentials.
-        
+
         justification: Credentials are required for AgentKit integration.
+
+        Args:
+            cdp_key_name: Coinbase Developer Platform API key name.
+            cdp_private_key: Coinbase Developer Platform API private key.
+            cfo_judge: Budget enforcement; its ledger tracks daily spend.
+            mcp_client: Client for the AgentKit MCP server. Without one the
+                manager runs dry: budgets are enforced and transfers are
+                logged, but nothing is sent.
+
+        Raises:
+            ValueError: If either credential is empty.
         """
-        raise NotImplementedError("CommerceManager.__init__ is not implemented")
+        if not cdp_key_name or not cdp_private_key:
+            raise ValueError("Missing credentials: CDP_API_KEY_NAME and CDP_API_KEY_PRIVATE_KEY")
+        self._cdp_key_name = cdp_key_name
+        self._cdp_private_key = cdp_private_key
+        self._cfo_judge = cfo_judge or CFOJudge()
+        self._mcp_client = mcp_client
 
     async def transfer_asset(
         self, 
@@ -23,10 +54,74 @@ class CommerceManager(CommercePort):
         destination: str,
         trace_id: str
     ) -> TransactionRecord:
-        raise NotImplementedError("CommerceManager.transfer_asset is not implemented")
+        """Transfer an amount within the tenant's daily budget.
+
+        The amount is held on the CFO judge's ledger before the transfer
+        tool is called, committed once it executed and released if it
+        failed. A cancelled call keeps its hold until the hold expires,
+        since the transfer may already have gone through.
+
+        Args:
+            agent_id: Agent requesting the transfer.
+            tenant_id: Tenant whose budget pays for it.
+            amount: Amount in USD.
+            asset: Asset symbol.
+            destination: Destination address.
+            trace_id: Trace of the request.
+
+        Returns:
+            The executed transaction.
+
+        Raises:
+            BudgetExceededError: If the amount does not fit in today's budget.
+            RuntimeError: If the transfer tool reports an error.
+        """
+        # Fail fast without taking a hold; reserve is the race-free check.
+        current_spend = await self.get_current_spend(tenant_id)
+        if not self._cfo_judge.validate_transaction(amount, current_spend):
+            raise BudgetExceededError(
+                f"Budget Exceeded: tenant {tenant_id} has spent {current_spend} USD today; "
+                f"{amount} USD does not fit"
+            )
+        reservation = await self._cfo_judge.reserve(tenant_id, amount)
+        try:
+            response = await self._call_mcp_tool(
+                TRANSFER_TOOL,
+                {"amount": str(amount), "asset_id": asset, "destination": destination},
+            )
+        except Exception:
+            await self._cfo_judge.ledger.release(reservation)
+            raise
+        await self._cfo_judge.ledger.commit(reservation)
+        return TransactionRecord(
+            trace_id=trace_id,
+            agent_id=agent_id,
+            tool_name=TRANSFER_TOOL,
+            amount_asset=amount,
+            asset_symbol=asset,
+            amount_usd=amount,
+            status="EXECUTED",
+            mcp_response=response,
+        )
 
     async def get_balance(self, wallet_id: str, asset: str) -> Decimal:
         raise NotImplementedError("CommerceManager.get_balance is not implemented")
 
     async def get_current_spend(self, tenant_id: str) -> Decimal:
-        raise NotImplementedError("CommerceManager.get_current_spend is not implemented")
+        """Today's spend from the budget ledger, including pending reservations.
+
+        This is a single ledger read, not a ``SUM`` over ``transactions``.
+        """
+        usage = await self._cfo_judge.ledger.usage(tenant_id)
+        return usage.total_usd
+
+    async def _call_mcp_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        if self._mcp_client is None:
+            logger.info("commerce.dry_run", tool=name, arguments=arguments)
+            return {"dry_run": True}
+        result = await self._mcp_client.call_tool(name, arguments)
+        if result.is_error:
+            raise RuntimeError(f"MCP tool {name} failed: {result.content}")
+        if isinstance(result.content, dict):
+            return result.content
+        return {"content": result.content}
@@ -0,0 +1,365 @@
+"""Asynchronous, batched durable log of Judge decisions.
+
+``DecisionLog.record`` puts a decision into a bounded in-memory queue and
+returns without doing I/O, so logging stays off the critical path of each
+result. A background task writes the queue to a ``DecisionSink`` in batches
+every ``flush_interval_s`` or as soon as ``max_batch`` decisions are waiting.
+
+When the queue is full, ``overflow="block"`` makes ``record`` wait for the
+next flush (backpressure on the judge) and ``overflow="drop"`` discards the
+decision and counts it in ``dropped``. ``close`` stops the background task
+and writes everything still queued; the owner of the log must await it (or
+use the log as an async context manager) before the process exits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, Protocol
+from uuid import uuid4
+
+from sqlalchemy import Table, insert
+
+from chimera.db.schema import JudgeDecision
+from chimera.lib.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import datetime
+    from pathlib import Path
+    from types import TracebackType
+
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from chimera.models.types import TaskId, TenantId, TraceId
+    from chimera.ports.judge import Decision
+
+logger = get_logger(__name__)
+
+JUDGE_DECISIONS: Table = JudgeDecision.__table__  # type: ignore[attr-defined]
+
+OverflowPolicy = Literal["block", "drop"]
+
+# Dropped decisions are logged on the first drop and then once per this many.
+_DROP_LOG_EVERY = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class DecisionRecord:
+    """One Judge decision, as written to the decision log."""
+
+    tenant_id: TenantId
+    trace_id: TraceId
+    task_id: TaskId
+    decision: Decision
+    reason: str
+    decided_at: datetime
+
+    def as_dict(self) -> dict[str, Any]:
+        """Plain JSON-compatible fields.
+
+        Returns:
+            Field values, with the decision as its string value and the
+            timestamp in ISO 8601.
+
+        Raises:
+            None.
+        """
+        return {
+            "tenant_id": self.tenant_id,
+            "trace_id": self.trace_id,
+            "task_id": self.task_id,
+            "decision": self.decision.value,
+            "reason": self.reason,
+            "decided_at": self.decided_at.isoformat(),
+        }
+
+
+class DecisionSink(Protocol):
+    """Durable destination for batches of decisions."""
+
+    async def write(self, records: Sequence[DecisionRecord]) -> None:
+        """Persist a batch; raise if any record was not persisted."""
+        ...
+
+
+class DatabaseDecisionSink:
+    """Writes each batch to ``judge_decisions`` with one executemany insert.
+
+    Args:
+        engine: Async SQLAlchemy engine.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+
+    async def write(self, records: Sequence[DecisionRecord]) -> None:
+        """Insert a batch in one transaction.
+
+        Args:
+            records: Decisions to insert.
+
+        Returns:
+            None.
+
+        Raises:
+            Exception: Whatever the database raises.
+        """
+        rows = [
+            {
+                "id": uuid4(),
+                "tenant_id": record.tenant_id,
+                "trace_id": record.trace_id,
+                "task_id": record.task_id,
+                "decision": record.decision.value,
+                "reason": record.reason,
+                "created_at": record.decided_at,
+            }
+            for record in records
+        ]
+        async with self._engine.begin() as connection:
+            await connection.execute(insert(JUDGE_DECISIONS), rows)
+
+
+class JsonlDecisionSink:
+    """Appends each batch to a local JSON Lines file with a single write.
+
+    The file is opened in append mode for every batch, so it can be rotated
+    externally between flushes. File I/O runs in a worker thread.
+
+    Args:
+        path: Log file; created if missing.
+        fsync: Force each batch to disk before the flush completes.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    def __init__(self, path: Path, *, fsync: bool = False) -> None:
+        self._path = path
+        self._fsync = fsync
+
+    async def write(self, records: Sequence[DecisionRecord]) -> None:
+        """Append a batch, one JSON object per line.
+
+        Args:
+            records: Decisions to append.
+
+        Returns:
+            None.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        text = "".join(json.dumps(record.as_dict()) + "\n" for record in records)
+        await asyncio.to_thread(self._append, text)
+
+    def _append(self, text: str) -> None:
+        with self._path.open("a", encoding="utf-8") as handle:
+            handle.write(text)
+            if self._fsync:
+                handle.flush()
+                os.fsync(handle.fileno())
+
+
+class DecisionLog:
+    """Bounded buffer of decisions, flushed to a sink in the background.
+
+    A failed flush keeps its batch and retries it first on the next flush,
+    so decisions are written in the order they were recorded. While the
+    sink is failing the queue fills up and the overflow policy applies.
+
+    Args:
+        sink: Where batches are written.
+        capacity: Maximum number of queued decisions.
+        max_batch: Queued decisions that trigger an early flush, and the
+            largest batch handed to the sink.
+        flush_interval_s: Maximum time between flushes.
+        overflow: What ``record`` does when the queue is full.
+
+    Returns:
+        None.
+
+    Raises:
+        ValueError: If ``capacity``, ``max_batch`` or ``flush_interval_s`` is
+            not positive.
+    """
+
+    def __init__(
+        self,
+        sink: DecisionSink,
+        *,
+        capacity: int = 10_000,
+        max_batch: int = 500,
+        flush_interval_s: float = 1.0,
+        overflow: OverflowPolicy = "block",
+    ) -> None:
+        if capacity < 1 or max_batch < 1 or flush_interval_s <= 0:
+            raise ValueError("capacity, max_batch and flush_interval_s must be positive")
+        self._sink = sink
+        self._max_batch = max_batch
+        self._flush_interval_s = flush_interval_s
+        self._overflow = overflow
+        self._queue: asyncio.Queue[DecisionRecord] = asyncio.Queue(maxsize=capacity)
+        self._retry: list[DecisionRecord] = []
+        self._flush_lock = asyncio.Lock()
+        self._size_reached = asyncio.Event()
+        self._loop_task: asyncio.Task[None] | None = None
+        self._closed = False
+        self._written = 0
+        self._dropped = 0
+
+    async def __aenter__(self) -> DecisionLog:
+        """Start the flush loop.
+
+        Returns:
+            The running log.
+
+        Raises:
+            None.
+        """
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop the flush loop and write remaining decisions.
+
+        Raises:
+            Exception: If the final flush fails.
+        """
+        await self.close()
+
+    @property
+    def written(self) -> int:
+        """Number of decisions written to the sink so far."""
+        return self._written
+
+    @property
+    def dropped(self) -> int:
+        """Number of decisions discarded because the queue was full."""
+        return self._dropped
+
+    @property
+    def pending(self) -> int:
+        """Number of decisions recorded but not yet written."""
+        return self._queue.qsize() + len(self._retry)
+
+    def start(self) -> None:
+        """Start the background flush loop. Starting twice is a no-op.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop accepting decisions, stop the flush loop and write what is left.
+
+        A flush already running in the background is awaited, not cancelled.
+
+        Returns:
+            None.
+
+        Raises:
+            Exception: If the final flush fails; the decisions stay queued
+                and ``flush`` can be called again.
+        """
+        self._closed = True
+        if self._loop_task is not None:
+            # Wake the loop and let a flush in progress finish: cancelling it
+            # would not stop a sink write already running in a thread, and
+            # the batch would then be written twice.
+            self._size_reached.set()
+            await self._loop_task
+            self._loop_task = None
+        while self.pending:
+            await self.flush()
+            # Let callers blocked on a full queue enqueue before checking again.
+            await asyncio.sleep(0)
+
+    async def record(self, record: DecisionRecord) -> bool:
+        """Queue a decision for writing.
+
+        Args:
+            record: The decision.
+
+        Returns:
+            True if the decision was queued, False if it was dropped.
+
+        Raises:
+            RuntimeError: If the log is closed.
+        """
+        if self._closed:
+            raise RuntimeError("DecisionLog is closed")
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            if self._overflow == "drop":
+                self._dropped += 1
+                if self._dropped % _DROP_LOG_EVERY == 1:
+                    logger.warning("decision_log.dropped", dropped=self._dropped)
+                return False
+            self._size_reached.set()
+            await self._queue.put(record)
+        if self._queue.qsize() >= self._max_batch:
+            self._size_reached.set()
+        return True
+
+    async def flush(self) -> int:
+        """Write the decisions queued when the flush starts, in batches.
+
+        Returns:
+            Number of decisions written.
+
+        Raises:
+            Exception: Whatever the sink raises; the failed batch is kept
+                and retried first by the next flush.
+        """
+        async with self._flush_lock:
+            remaining = self._queue.qsize()
+            written = 0
+            while True:
+                if not self._retry:
+                    take = min(self._max_batch, remaining)
+                    self._retry = [self._queue.get_nowait() for _ in range(take)]
+                    remaining -= take
+                if not self._retry:
+                    return written
+                await self._sink.write(self._retry)
+                written += len(self._retry)
+                self._written += len(self._retry)
+                self._retry = []
+
+    async def _run(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._size_reached.wait(), self._flush_interval_s)
+            self._size_reached.clear()
+            if self._closed:
+                return
+            try:
+                await self.flush()
+            except Exception as exc:
+                logger.warning("decision_log.flush_failed", error=str(exc))
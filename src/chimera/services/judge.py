@@ -1,24 +1,129 @@
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+
 from chimera.lib.logging import get_logger
 from chimera.models.result import Result
-from chimera.models.types import TenantId
+from chimera.models.types import TaskId, TenantId, TraceId
 from chimera.ports.judge import Decision, JudgePort
-from chimera.services.judge_policy import DefaultJudgePolicy, JudgePolicy
+from chimera.services.decision_log import DecisionLog, DecisionRecord
+from chimera.services.judge_policy import DefaultJudgePolicy, JudgePolicy, RulePolicy
 
 logger = get_logger(__name__)
 
 
 class JudgeService(JudgePort):
-    """Service for evaluating results against security gates."""
+    """Service for evaluating results against security gates.
+
+    With ``policy_path`` the rules come from a JSON or YAML policy file (see
+    ``chimera.services.judge_policy``) and can be changed without a deploy:
+    ``reload_policy`` compiles the file again and swaps the new policy in
+    with a single assignment.
+
+    With ``decision_log`` decisions are queued to that log and written in
+    the background instead of being logged inline; the caller owns the log
+    and must close it on shutdown.
+    """
+
+    def __init__(
+        self,
+        policy: JudgePolicy | None = None,
+        *,
+        policy_path: Path | None = None,
+        decision_log: DecisionLog | None = None,
+    ):
+        if policy is not None and policy_path is not None:
+            raise ValueError("Pass either policy or policy_path, not both")
+        self._decision_log = decision_log
+        self._policy_path = policy_path
+        self._policy_mtime: float | None = None
+        self._policy: JudgePolicy = policy or DefaultJudgePolicy()
+        if policy_path is not None:
+            self.reload_policy()
+
+    @property
+    def policy(self) -> JudgePolicy:
+        """The policy currently in use."""
+        return self._policy
+
+    def reload_policy(self) -> None:
+        """Compile ``policy_path`` again and start using it.
+
+        Raises:
+            ValueError: If no policy path is configured.
+            OSError: If the policy file cannot be read.
+            pydantic.ValidationError: If the policy file is invalid; the
+                current policy stays in use.
+        """
+        if self._policy_path is None:
+            raise ValueError("No policy_path configured")
+        mtime = self._policy_path.stat().st_mtime
+        policy = RulePolicy.from_file(self._policy_path)
+        self._policy = policy
+        self._policy_mtime = mtime
+        logger.info("judge.policy_reloaded", rules=len(policy.document.rules))
 
-    def __init__(self, policy: JudgePolicy | None = None):
-        self._policy = policy or DefaultJudgePolicy()
+    def reload_if_changed(self) -> bool:
+        """Reload ``policy_path`` if the file changed since the last load.
+
+        Returns:
+            True if the policy was reloaded.
+
+        Raises:
+            OSError: If the policy file cannot be read.
+            pydantic.ValidationError: If the policy file is invalid.
+        """
+        if self._policy_path is None:
+            return False
+        if self._policy_path.stat().st_mtime == self._policy_mtime:
+            return False
+        self.reload_policy()
+        return True
 
     async def evaluate_result(self, tenant_id: TenantId, result: Result) -> Decision:
         """Evaluate a result and log the decision."""
-        raise NotImplementedError("JudgeService.evaluate_result is not implemented")
+        decision, reason = self._policy.evaluate(result)
+        await self.log_decision(tenant_id, result.trace_id, result.task_id, decision, reason)
+        return decision
+
+    async def evaluate_many(self, tenant_id: TenantId, results: Sequence[Result]) -> list[Decision]:
+        """Evaluate a batch of results and log each decision.
+
+        Args:
+            tenant_id: Target tenant.
+            results: Results to evaluate.
+
+        Returns:
+            One decision per result, in input order.
+
+        Raises:
+            None.
+        """
+        evaluate = self._policy.evaluate
+        outcomes = [evaluate(result) for result in results]
+        for result, (decision, reason) in zip(results, outcomes, strict=True):
+            await self.log_decision(tenant_id, result.trace_id, result.task_id, decision, reason)
+        return [decision for decision, _ in outcomes]
 
     async def log_decision(
-        self, tenant_id: TenantId, trace_id: str, task_id: str, decision: Decision, reason: str
+        self,
+        tenant_id: TenantId,
+        trace_id: TraceId,
+        task_id: TaskId,
+        decision: Decision,
+        reason: str,
     ) -> None:
         """Structured logging of judge decisions."""
-        raise NotImplementedError("JudgeService.log_decision is not implemented")
+        if self._decision_log is not None:
+            await self._decision_log.record(
+                DecisionRecord(tenant_id, trace_id, task_id, decision, reason, datetime.now(UTC))
+            )
+            return
+        logger.info(
+            "judge_decision",
+            tenant_id=tenant_id,
+            trace_id=trace_id,
+            task_id=task_id,
+            decision=decision,
+            reason=reason,
+        )
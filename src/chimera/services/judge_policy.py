@@ -1,8 +1,65 @@
+"""Judge policies, including declarative rule policies loaded from files.
+
+A rule policy is an ordered list of rules. Each rule holds a decision and
+a list of conditions that must all hold; the first matching rule decides
+and its ``id`` becomes the reason. Results matching no rule get the default
+decision. For example, in YAML::
+
+    default_decision: approve
+    rules:
+      - id: deny-destructive-action
+        decision: deny
+        when:
+          - {field: output.action, op: in, value: [delete_all_files, drop_database]}
+      - id: hitl-low-confidence
+        decision: hitl
+        when:
+          - {field: output.confidence, op: lt, value: 0.7}
+
+``field`` names a ``Result`` attribute, optionally followed by a dotted path
+into it (``output.posts.0.body``); numeric segments index lists. Every
+operator except ``missing`` is false when the path does not resolve, and an
+operator applied to a value of the wrong type (``lt`` on a string) is false.
+
+``RulePolicy`` compiles the rules once: each condition becomes a closure
+with its path pre-split and its operand pre-built (sets for ``in``, compiled
+patterns for ``matches``), so evaluating a result only runs those closures
+in order and never re-reads the rule definitions.
+"""
+
+from __future__ import annotations
+
+import operator
+import re
+from collections.abc import Callable, Mapping
 from decimal import Decimal
-from typing import Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Literal, Protocol, runtime_checkable
+
+import yaml
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from chimera.models.result import Result
 from chimera.ports.judge import Decision
+from chimera.services.budget_ledger import BudgetLedger, InMemoryBudgetLedger, Reservation
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+ConditionOp = Literal[
+    "eq", "ne", "in", "not_in", "lt", "le", "gt", "ge", "contains", "matches", "exists", "missing"
+]
+Predicate = Callable[[Result], bool]
+
+_MISSING = object()
+
+_COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+}
 
 
 @runtime_checkable
@@ -21,28 +78,289 @@ class JudgePolicy(Protocol):
         ...
 
 
-class DefaultJudgePolicy:
-    """A simple policy for the MVP."""
+class PolicyCondition(BaseModel):
+    """One test on a field of a result.
+
+    Attributes:
+        field: ``Result`` attribute, optionally followed by a dotted path.
+        op: Operator applied to the field value.
+        value: Operand; a list for ``in``/``not_in``, a regular expression
+            for ``matches``, unused for ``exists``/``missing``.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    field: str
+    op: ConditionOp = "eq"
+    value: Any = None
+
+    @field_validator("field")
+    @classmethod
+    def _known_field(cls, field: str) -> str:
+        if field.split(".", 1)[0] not in Result.model_fields:
+            raise ValueError(f"Unknown result field in '{field}'")
+        return field
+
+    @model_validator(mode="after")
+    def _operand_matches_op(self) -> PolicyCondition:
+        if self.op in ("in", "not_in") and not isinstance(self.value, list):
+            raise ValueError(f"Operator '{self.op}' needs a list value")
+        if self.op == "matches":
+            if not isinstance(self.value, str):
+                raise ValueError("Operator 'matches' needs a regular expression string")
+            re.compile(self.value)
+        return self
+
+
+class PolicyRule(BaseModel):
+    """A decision taken when all of its conditions hold.
+
+    Attributes:
+        id: Stable identifier, reported as the decision reason.
+        decision: Decision returned when the rule matches.
+        when: Conditions that must all hold; an empty list always matches.
+        description: Free-form note for policy authors.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    id: str = Field(min_length=1)
+    decision: Decision
+    when: list[PolicyCondition] = Field(default_factory=list)
+    description: str = ""
+
+
+class PolicyDocument(BaseModel):
+    """A rule policy as written in a JSON or YAML file.
+
+    Attributes:
+        default_decision: Decision for results that match no rule.
+        default_reason: Reason reported with the default decision.
+        rules: Rules, evaluated in order.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    default_decision: Decision = Decision.APPROVE
+    default_reason: str = "default"
+    rules: list[PolicyRule] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def _unique_rule_ids(self) -> PolicyDocument:
+        seen: set[str] = set()
+        for rule in self.rules:
+            if rule.id in seen:
+                raise ValueError(f"Duplicate rule id '{rule.id}'")
+            seen.add(rule.id)
+        return self
+
+    @classmethod
+    def from_file(cls, path: Path) -> PolicyDocument:
+        """Load and validate a policy file.
+
+        Args:
+            path: ``.yaml``/``.yml`` or JSON policy file.
+
+        Returns:
+            The parsed policy.
+
+        Raises:
+            OSError: If the file cannot be read.
+            yaml.YAMLError: If a YAML file is malformed.
+            pydantic.ValidationError: If the file does not match the model.
+        """
+        text = path.read_text(encoding="utf-8")
+        if path.suffix in (".yaml", ".yml"):
+            return cls.model_validate(yaml.safe_load(text))
+        return cls.model_validate_json(text)
+
+
+class RulePolicy:
+    """Policy that evaluates a ``PolicyDocument`` compiled into predicates.
+
+    Instances are immutable; to change rules, build a new policy.
+    """
+
+    def __init__(self, document: PolicyDocument):
+        self._document = document
+        self._program: tuple[tuple[str, Decision, tuple[Predicate, ...]], ...] = tuple(
+            (rule.id, rule.decision, tuple(_compile_condition(c) for c in rule.when))
+            for rule in document.rules
+        )
+        self._default = (document.default_decision, document.default_reason)
+
+    @classmethod
+    def from_file(cls, path: Path) -> RulePolicy:
+        """Load and compile a policy file.
+
+        Args:
+            path: ``.yaml``/``.yml`` or JSON policy file.
+
+        Returns:
+            The compiled policy.
+
+        Raises:
+            OSError: If the file cannot be read.
+            yaml.YAMLError: If a YAML file is malformed.
+            pydantic.ValidationError: If the file does not match the model.
+        """
+        return cls(PolicyDocument.from_file(path))
+
+    @property
+    def document(self) -> PolicyDocument:
+        """The rules this policy was compiled from."""
+        return self._document
 
     def evaluate(self, result: Result) -> tuple[Decision, str]:
-        raise NotImplementedError("DefaultJudgePolicy.evaluate is not implemented")
+        """Evaluate a result against the rules in order.
+
+        Args:
+            result: The result to evaluate.
+
+        Returns:
+            The decision of the first matching rule and its ID, or the
+            default decision and reason.
+
+        Raises:
+            None.
+        """
+        for rule_id, decision, predicates in self._program:
+            for predicate in predicates:
+                if not predicate(result):
+                    break
+            else:
+                return decision, rule_id
+        return self._default
+
+
+DEFAULT_POLICY = PolicyDocument(
+    default_reason="default-approve",
+    rules=[
+        PolicyRule(
+            id="deny-destructive-action",
+            decision=Decision.DENY,
+            when=[
+                PolicyCondition(
+                    field="output.action", op="in", value=["delete_all_files", "drop_database"]
+                )
+            ],
+        ),
+        PolicyRule(
+            id="hitl-low-confidence",
+            decision=Decision.HITL,
+            when=[PolicyCondition(field="output.confidence", op="lt", value=0.7)],
+        ),
+    ],
+)
+
+
+class DefaultJudgePolicy(RulePolicy):
+    """The built-in rules, used when no policy file is configured."""
+
+    def __init__(self) -> None:
+        super().__init__(DEFAULT_POLICY)
 
 
 class CFOJudge:
-    """Policy for financial budget enforcement."""
+    """Policy for financial budget enforcement.
 
-    def __init__(self, daily_limit: Decimal = Decimal("100.00")):
+    ``validate_transaction`` checks an amount against a spend figure the
+    caller already has. ``reserve`` is the race-free path: it checks and
+    holds the amount in one atomic ledger operation, so concurrent agents
+    of one tenant cannot overshoot the limit together.
+    """
+
+    def __init__(
+        self, daily_limit: Decimal = Decimal("100.00"), ledger: BudgetLedger | None = None
+    ):
         self.daily_limit = daily_limit
+        self.ledger: BudgetLedger = ledger or InMemoryBudgetLedger()
 
     def validate_transaction(self, amount_usd: Decimal, current_spend: Decimal) -> bool:
         """
         Validate if a transaction fits within the daily budget.
-        
+
         Args:
             amount_usd: The amount of the transaction in USD.
             current_spend: The total amount spent today in USD.
-            
+
         Returns:
             bool: True if approved, False otherwise.
         """
-        raise NotImplementedError("CFOJudge.validate_transaction is not implemented")
+        return current_spend + amount_usd <= self.daily_limit
+
+    async def reserve(self, tenant_id: str, amount_usd: Decimal) -> Reservation:
+        """Hold an amount against the tenant's daily budget.
+
+        Commit the reservation on the ledger once the transfer executed, or
+        release it if the transfer failed.
+
+        Args:
+            tenant_id: Tenant spending the funds.
+            amount_usd: The amount of the transaction in USD.
+
+        Returns:
+            The reservation.
+
+        Raises:
+            BudgetExceededError: If the amount does not fit in today's budget.
+        """
+        return await self.ledger.reserve(tenant_id, amount_usd, self.daily_limit)
+
+
+def _compile_condition(condition: PolicyCondition) -> Predicate:
+    get = _compile_path(condition.field)
+    op, operand = condition.op, condition.value
+    if op == "exists":
+        return lambda result: get(result) is not _MISSING
+    if op == "missing":
+        return lambda result: get(result) is _MISSING
+
+    test: Callable[[Any], bool]
+    if op in ("in", "not_in"):
+        try:
+            members: frozenset[Any] | tuple[Any, ...] = frozenset(operand)
+        except TypeError:
+            members = tuple(operand)
+        test = members.__contains__ if op == "in" else lambda value: value not in members
+    elif op == "contains":
+        test = lambda value: operand in value  # noqa: E731
+    elif op == "matches":
+        search = re.compile(operand).search
+        test = lambda value: isinstance(value, str) and search(value) is not None  # noqa: E731
+    else:
+        compare = _COMPARISONS[op]
+        test = lambda value: compare(value, operand)  # noqa: E731
+
+    def predicate(result: Result) -> bool:
+        value = get(result)
+        if value is _MISSING:
+            return False
+        try:
+            return bool(test(value))
+        except TypeError:
+            return False
+
+    return predicate
+
+
+def _compile_path(field: str) -> Callable[[Result], Any]:
+    root, *segments = field.split(".")
+    if not segments:
+        return operator.attrgetter(root)
+    steps = tuple((segment, int(segment) if segment.isdigit() else None) for segment in segments)
+
+    def get(result: Result) -> Any:
+        value = getattr(result, root)
+        for key, index in steps:
+            if isinstance(value, Mapping):
+                value = value.get(key, _MISSING)
+            elif index is not None and isinstance(value, list) and index < len(value):
+                value = value[index]
+            else:
+                return _MISSING
+            if value is _MISSING:
+                return value
+        return value
+
+    return get
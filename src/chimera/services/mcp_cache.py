@@ -0,0 +1,448 @@
+"""Tenant-scoped result cache for read-only MCP tools."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from chimera.ports.mcp import MCPClientPort
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
+    from pathlib import Path
+    from types import TracebackType
+
+    from chimera.models.mcp import ToolDefinition, ToolResult
+
+# Tools with side effects. These are never cached, whatever mcp.json says.
+NEVER_CACHE_TOOLS = frozenset({"transfer_asset", "post_content", "reply_to_post", "remember_fact"})
+
+CacheKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class ToolCachePolicy:
+    """Cache policy for one tool, declared under ``tools[*].cache`` in ``mcp.json``."""
+
+    ttl_s: float
+
+
+@dataclass(frozen=True, slots=True)
+class ToolCacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
+@dataclass(slots=True)
+class _Entry:
+    result: ToolResult
+    expires_at: float
+    size_bytes: int
+
+
+def load_cache_policies(path: Path) -> dict[str, ToolCachePolicy]:
+    """Read per-tool cache policies from an ``mcp.json`` file.
+
+    Args:
+        path: Path to ``mcp.json``.
+
+    Returns:
+        Policies keyed by tool name, for cacheable tools only.
+
+    Raises:
+        ValueError: If a side-effecting tool is marked cacheable.
+    """
+    config = json.loads(path.read_text(encoding="utf-8"))
+    policies: dict[str, ToolCachePolicy] = {}
+    for server in config.get("servers", {}).values():
+        for tool in server.get("tools", []):
+            cache = tool.get("cache", {})
+            if cache.get("cacheable"):
+                policies[tool["name"]] = ToolCachePolicy(ttl_s=cache["ttl_ms"] / 1000)
+    return _checked(policies)
+
+
+def load_cache_invalidations(path: Path) -> dict[str, frozenset[str]]:
+    """Read which cached tools each mutating tool invalidates from an ``mcp.json`` file.
+
+    Args:
+        path: Path to ``mcp.json``.
+
+    Returns:
+        Invalidated tool names keyed by mutating tool name, for tools that declare any.
+
+    Raises:
+        None.
+    """
+    config = json.loads(path.read_text(encoding="utf-8"))
+    invalidations: dict[str, frozenset[str]] = {}
+    for server in config.get("servers", {}).values():
+        for tool in server.get("tools", []):
+            invalidates = tool.get("cache", {}).get("invalidates")
+            if invalidates:
+                invalidations[tool["name"]] = frozenset(invalidates)
+    return invalidations
+
+
+def canonical_arguments(arguments: Mapping[str, Any]) -> str:
+    """Serialize tool arguments so equal payloads produce equal cache keys.
+
+    Args:
+        arguments: Tool arguments.
+
+    Returns:
+        Compact JSON with sorted keys.
+
+    Raises:
+        TypeError: If the arguments are not JSON serializable.
+    """
+    return json.dumps(arguments, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+class ToolResultCache:
+    """LRU, size-bounded cache of MCP tool results.
+
+    Entries are keyed on ``(tenant_id, tool_name, canonical arguments)`` and
+    expire after the tool's TTL. Only tools with a policy are cached, error
+    results are never stored, and concurrent identical calls share a single
+    upstream request. Cached results are shared between callers and must be
+    treated as read-only. Calls whose arguments are not JSON serializable
+    bypass the cache.
+
+    Args:
+        policies: Cache policies keyed by tool name.
+        invalidations: Cached tools to drop, per tenant, after a successful
+            call to each mutating tool.
+        max_entries: Maximum number of cached results.
+        max_bytes: Maximum total size of cached results, measured as JSON.
+        clock: Monotonic clock, injectable for tests.
+
+    Returns:
+        None.
+
+    Raises:
+        ValueError: If a bound is less than 1 or a side-effecting tool has a policy.
+    """
+
+    def __init__(
+        self,
+        policies: Mapping[str, ToolCachePolicy],
+        invalidations: Mapping[str, Iterable[str]] | None = None,
+        *,
+        max_entries: int = 1024,
+        max_bytes: int = 8 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be at least 1")
+        self._policies = _checked(dict(policies))
+        self._invalidations = {
+            tool_name: frozenset(targets) for tool_name, targets in (invalidations or {}).items()
+        }
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._in_flight: dict[CacheKey, asyncio.Task[ToolResult]] = {}
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+
+    @classmethod
+    def from_config(cls, path: Path, **kwargs: Any) -> ToolResultCache:
+        """Build a cache from the tool entries and ``defaults.tool_cache`` in ``mcp.json``.
+
+        Args:
+            path: Path to ``mcp.json``.
+            **kwargs: Overrides forwarded to the constructor.
+
+        Returns:
+            An empty cache.
+
+        Raises:
+            ValueError: If a side-effecting tool is marked cacheable.
+        """
+        config = json.loads(path.read_text(encoding="utf-8"))
+        bounds = config.get("defaults", {}).get("tool_cache", {})
+        return cls(
+            load_cache_policies(path), load_cache_invalidations(path), **{**bounds, **kwargs}
+        )
+
+    def is_cacheable(self, tool_name: str) -> bool:
+        """Whether results of a tool may be cached.
+
+        Args:
+            tool_name: Tool name.
+
+        Returns:
+            True when the tool has a cache policy.
+
+        Raises:
+            None.
+        """
+        return tool_name in self._policies
+
+    def invalidated_by(self, tool_name: str) -> frozenset[str]:
+        """Cached tools whose results a successful call to ``tool_name`` makes stale.
+
+        Args:
+            tool_name: Tool name.
+
+        Returns:
+            The invalidated tool names, empty for read-only tools.
+
+        Raises:
+            None.
+        """
+        return self._invalidations.get(tool_name, frozenset())
+
+    async def get_or_call(
+        self,
+        tenant_id: str,
+        tool_name: str,
+        arguments: Mapping[str, Any],
+        call: Callable[[], Awaitable[ToolResult]],
+    ) -> ToolResult:
+        """Return a cached result or run ``call`` once for all concurrent callers.
+
+        Args:
+            tenant_id: Tenant boundary for the entry.
+            tool_name: Tool name.
+            arguments: Tool arguments.
+            call: Performs the upstream tool call.
+
+        Returns:
+            The tool result.
+
+        Raises:
+            Exception: Whatever ``call`` raises; failures are not cached.
+        """
+        policy = self._policies.get(tool_name)
+        if policy is None:
+            return await call()
+
+        try:
+            key = (tenant_id, tool_name, canonical_arguments(arguments))
+        except (TypeError, ValueError):
+            return await call()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.result
+            self._drop(key)
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            self._coalesced += 1
+        else:
+            self._misses += 1
+            # The call runs in its own task, so cancelling any one caller
+            # (including the first) only detaches that caller; the others
+            # still get the shared result.
+            pending = asyncio.create_task(self._call_and_store(key, call, policy))
+            self._in_flight[key] = pending
+            pending.add_done_callback(partial(self._finish_call, key))
+        return await asyncio.shield(pending)
+
+    def invalidate(self, tenant_id: str | None = None, tool_name: str | None = None) -> int:
+        """Drop cached entries matching a tenant and/or tool.
+
+        Matching calls still in flight are detached: their callers get the
+        result, but it is not stored and later callers start a fresh call.
+
+        Args:
+            tenant_id: Only drop this tenant's entries, if set.
+            tool_name: Only drop this tool's entries, if set.
+
+        Returns:
+            Number of entries dropped.
+
+        Raises:
+            None.
+        """
+        keys = [key for key in self._entries if _matches(key, tenant_id, tool_name)]
+        for key in keys:
+            self._drop(key)
+        for key in [key for key in self._in_flight if _matches(key, tenant_id, tool_name)]:
+            del self._in_flight[key]
+        return len(keys)
+
+    def stats(self) -> ToolCacheStats:
+        """Snapshot the cache counters.
+
+        Returns:
+            Current statistics.
+
+        Raises:
+            None.
+        """
+        return ToolCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            coalesced=self._coalesced,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            size_bytes=self._size_bytes,
+        )
+
+    async def _call_and_store(
+        self, key: CacheKey, call: Callable[[], Awaitable[ToolResult]], policy: ToolCachePolicy
+    ) -> ToolResult:
+        result = await call()
+        # Skip the store if an invalidation detached this call while it ran.
+        if not result.is_error and self._in_flight.get(key) is asyncio.current_task():
+            self._store(key, result, policy)
+        return result
+
+    def _finish_call(self, key: CacheKey, task: asyncio.Task[ToolResult]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved when every caller had already left.
+            task.exception()
+
+    def _store(self, key: CacheKey, result: ToolResult, policy: ToolCachePolicy) -> None:
+        try:
+            size = len(json.dumps(result.content, separators=(",", ":"), default=str))
+        except (TypeError, ValueError):
+            return
+        if size > self._max_bytes:
+            return
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = _Entry(result, self._clock() + policy.ttl_s, size)
+        self._size_bytes += size
+        while len(self._entries) > self._max_entries or self._size_bytes > self._max_bytes:
+            self._drop(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _drop(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._size_bytes -= entry.size_bytes
+
+
+class CachedMCPClient(MCPClientPort):
+    """Tenant-bound view of an MCP client that reads through a result cache.
+
+    Args:
+        client: Upstream client.
+        cache: Shared result cache.
+        tenant_id: Tenant whose entries this view reads and writes.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    def __init__(self, client: MCPClientPort, cache: ToolResultCache, tenant_id: str) -> None:
+        self._client = client
+        self._cache = cache
+        self._tenant_id = tenant_id
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Leave the upstream client open; its owner manages its lifecycle.
+
+        Raises:
+            None.
+        """
+
+    async def list_tools(self) -> list[ToolDefinition]:
+        """List tools from the upstream client.
+
+        Returns:
+            The upstream tools.
+
+        Raises:
+            RuntimeError: If discovery fails.
+        """
+        return await self._client.list_tools()
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> ToolResult:
+        """Call a tool, serving cacheable tools from the cache.
+
+        A successful call to a mutating tool drops this tenant's cached
+        results for the tools it invalidates.
+
+        Args:
+            name: Tool name.
+            arguments: Tool arguments.
+
+        Returns:
+            The tool result.
+
+        Raises:
+            ValueError: If the tool name is unknown.
+            RuntimeError: If execution fails at the transport level.
+        """
+        if self._cache.is_cacheable(name):
+            return await self._cache.get_or_call(
+                self._tenant_id, name, arguments, lambda: self._client.call_tool(name, arguments)
+            )
+        result = await self._client.call_tool(name, arguments)
+        if not result.is_error:
+            self._invalidate_after(name)
+        return result
+
+    async def call_tool_batch(
+        self, name: str, arguments: Sequence[dict[str, Any]]
+    ) -> list[ToolResult]:
+        """Call one tool with several argument sets.
+
+        Cacheable tools are served call by call from the cache, which shares
+        one upstream request between identical argument sets. Other tools are
+        sent upstream as one batch.
+
+        Args:
+            name: Tool name.
+            arguments: One parameter set per call.
+
+        Returns:
+            One result per argument set, in order.
+
+        Raises:
+            ValueError: If the tool name is unknown.
+            RuntimeError: If execution fails at the transport level.
+        """
+        if self._cache.is_cacheable(name):
+            return await super().call_tool_batch(name, arguments)
+        results = await self._client.call_tool_batch(name, arguments)
+        if any(not result.is_error for result in results):
+            self._invalidate_after(name)
+        return results
+
+    def _invalidate_after(self, name: str) -> None:
+        for tool_name in self._cache.invalidated_by(name):
+            self._cache.invalidate(self._tenant_id, tool_name)
+
+
+def _checked(policies: dict[str, ToolCachePolicy]) -> dict[str, ToolCachePolicy]:
+    unsafe = sorted(NEVER_CACHE_TOOLS & policies.keys())
+    if unsafe:
+        raise ValueError(f"Side-effecting tools cannot be cached: {', '.join(unsafe)}")
+    return policies
+
+
+def _matches(key: CacheKey, tenant_id: str | None, tool_name: str | None) -> bool:
+    return (tenant_id is None or key[0] == tenant_id) and (tool_name is None or key[1] == tool_name)
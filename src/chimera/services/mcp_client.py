@@ -1,58 +1,456 @@
-from typing import Any, List, Optional, Type
-from types import TracebackType
-from chimera.ports.mcp import MCPClientPort
+"""Stdio MCP client with JSON-RPC request multiplexing."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import json
+import os
+from typing import TYPE_CHECKING, Any
+
 from chimera.models.mcp import ToolDefinition, ToolResult
+from chimera.ports.mcp import MCPClientPort
+from chimera.services.mcp_validation import (
+    ArgumentValidator,
+    SchemaErrorPolicy,
+    compile_argument_validators,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from pathlib import Path
+    from types import TracebackType
+
+PROTOCOL_VERSION = "2024-11-05"
+CLIENT_INFO = {"name": "chimera", "version": "0.1.0"}
+# Tool results can carry large documents; asyncio's 64 KiB line default is too small.
+_STREAM_LIMIT = 16 * 1024 * 1024
+
+
+class MCPConnectionError(ConnectionError, RuntimeError):
+    """Raised when the MCP server process is unavailable or exits mid-call."""
+
+
+class MCPRequestError(RuntimeError):
+    """Raised when the MCP server answers a request with a JSON-RPC error.
+
+    Attributes:
+        code: JSON-RPC error code.
+    """
+
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
 
 class MCPClient(MCPClientPort):
     """Implementation of MCP Client using stdio transport.
-    
-    This client manages the lifecycle of a connection to an MCP server
-    running as a local process.
+
+    One client owns one server subprocess. Requests are tagged with JSON-RPC
+    IDs and a single reader task routes each response back to its waiter, so
+    any number of ``call_tool`` coroutines can share the session concurrently.
+
+    The ``list_tools`` response is cached for the life of the session (until
+    the server sends ``notifications/tools/list_changed``). Tool input schemas
+    are compiled once into validators, so malformed ``call_tool`` arguments
+    are rejected locally without a round trip. Schemas come from
+    ``tool_schemas`` when given (e.g. from ``mcp.json``), otherwise from the
+    server's own tool listing.
+
+    Args:
+        command: The executable to run.
+        args: Arguments for the executable.
+        cwd: Working directory for the server process.
+        env: Extra environment variables for the server process.
+        request_timeout_s: Per-request timeout in seconds.
+        connect_timeout_s: Timeout for process start and handshake in seconds.
+        tool_schemas: Input schemas keyed by tool name, used instead of the
+            server listing for argument validation.
+        validate_arguments: Whether to check arguments locally before calling.
+        on_schema_error: ``"skip"`` leaves a tool whose input schema is invalid
+            for the server to validate; ``"raise"`` fails with
+            ``jsonschema.SchemaError`` when the validators are compiled.
+
+    Returns:
+        None.
+
+    Raises:
+        jsonschema.SchemaError: If a pinned schema is invalid and
+            ``on_schema_error`` is ``"raise"``.
     """
 
-    def __init__(self, command: str, args: List[str]):
-        """Initialize the client.
-        
-        Args:
-            command: The executable to run.
-            args: Arguments for the executable.
-        """
+    def __init__(
+        self,
+        command: str,
+        args: list[str],
+        *,
+        cwd: Path | None = None,
+        env: dict[str, str] | None = None,
+        request_timeout_s: float = 30.0,
+        connect_timeout_s: float = 10.0,
+        tool_schemas: Mapping[str, Mapping[str, Any]] | None = None,
+        validate_arguments: bool = True,
+        on_schema_error: SchemaErrorPolicy = "skip",
+    ) -> None:
         self.command = command
         self.args = args
+        self.cwd = cwd
+        self.env = env
+        self.request_timeout_s = request_timeout_s
+        self.connect_timeout_s = connect_timeout_s
+        self._process: asyncio.subprocess.Process | None = None
+        self._reader: asyncio.Task[None] | None = None
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._ids = itertools.count(1)
+        self._write_lock = asyncio.Lock()
+        self._tools: list[ToolDefinition] | None = None
+        self._tools_lock = asyncio.Lock()
+        self._validate_arguments = validate_arguments
+        self._on_schema_error = on_schema_error
+        self._pinned_schemas = tool_schemas is not None
+        self._known_tools: set[str] = set(tool_schemas or ())
+        self._validators: dict[str, ArgumentValidator] | None = (
+            compile_argument_validators(tool_schemas, on_schema_error=on_schema_error)
+            if tool_schemas is not None
+            else None
+        )
 
-    async def __aenter__(self) -> "MCPClient":
+    async def __aenter__(self) -> MCPClient:
         """Start the stdio process and perform handshake.
-        
+
+        Returns:
+            The connected client.
+
         Raises:
-            NotImplementedError: Always, during TDD phase.
+            MCPConnectionError: If the process cannot start or the handshake fails.
         """
-        raise NotImplementedError("MCPClient.__aenter__ is not implemented")
+        await self.start()
+        return self
 
     async def __aexit__(
         self,
-        exc_type: Optional[Type[BaseException]],
-        exc_val: Optional[BaseException],
-        exc_tb: Optional[TracebackType],
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
     ) -> None:
         """Terminate the stdio process and cleanup resources.
-        
+
+        Raises:
+            None.
+        """
+        await self.close()
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the server process and reader task are still running."""
+        return (
+            self._process is not None
+            and self._process.returncode is None
+            and self._reader is not None
+            and not self._reader.done()
+        )
+
+    async def start(self) -> None:
+        """Spawn the server process and complete the MCP handshake.
+
+        Returns:
+            None.
+
+        Raises:
+            MCPConnectionError: If the process cannot start or the handshake fails.
+        """
+        env = {**os.environ, **self.env} if self.env else None
+        try:
+            self._process = await asyncio.create_subprocess_exec(
+                self.command,
+                *self.args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                cwd=self.cwd,
+                env=env,
+                limit=_STREAM_LIMIT,
+            )
+        except OSError as exc:
+            raise MCPConnectionError(f"Cannot start MCP server '{self.command}': {exc}") from exc
+        self._reader = asyncio.create_task(self._read_loop())
+        try:
+            await self._request(
+                "initialize",
+                {
+                    "protocolVersion": PROTOCOL_VERSION,
+                    "capabilities": {},
+                    "clientInfo": CLIENT_INFO,
+                },
+                timeout_s=self.connect_timeout_s,
+            )
+            await self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        except (MCPRequestError, TimeoutError) as exc:
+            await self.close()
+            raise MCPConnectionError(f"MCP handshake with '{self.command}' failed: {exc}") from exc
+        except MCPConnectionError:
+            await self.close()
+            raise
+
+    async def close(self) -> None:
+        """Stop the reader, terminate the process and fail pending requests.
+
+        Returns:
+            None.
+
         Raises:
-            NotImplementedError: Always, during TDD phase.
+            None.
         """
-        raise NotImplementedError("MCPClient.__aexit__ is not implemented")
+        if self._reader is not None:
+            self._reader.cancel()
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+        process, self._process = self._process, None
+        if process is not None:
+            if process.stdin is not None:
+                process.stdin.close()
+            if process.returncode is None:
+                process.terminate()
+                try:
+                    await asyncio.wait_for(process.wait(), timeout=self.connect_timeout_s)
+                except TimeoutError:
+                    process.kill()
+                    await process.wait()
+        self._fail_pending(MCPConnectionError("MCP client closed"))
+
+    async def ping(self) -> None:
+        """Round-trip a JSON-RPC ping to check the session is responsive.
+
+        Returns:
+            None.
+
+        Raises:
+            MCPConnectionError: If the server is gone.
+            TimeoutError: If the server does not answer in time.
+        """
+        await self._request("ping", {}, timeout_s=self.connect_timeout_s)
+
+    async def list_tools(self) -> list[ToolDefinition]:
+        """Discover tools from the MCP server, cached for the session.
+
+        Returns:
+            The tools advertised by the server.
 
-    async def list_tools(self) -> List[ToolDefinition]:
-        """Discovery tools from the MCP server.
-        
         Raises:
-            NotImplementedError: Always, during TDD phase.
+            MCPConnectionError: If the server is gone.
+            MCPRequestError: If the server rejects the request.
         """
-        raise NotImplementedError("MCPClient.list_tools is not implemented")
+        if self._tools is None:
+            async with self._tools_lock:
+                if self._tools is None:
+                    self._tools = await self._fetch_tools()
+        return list(self._tools)
+
+    async def _fetch_tools(self) -> list[ToolDefinition]:
+        tools: list[ToolDefinition] = []
+        cursor: str | None = None
+        while True:
+            result = await self._request("tools/list", {"cursor": cursor} if cursor else {})
+            tools.extend(
+                ToolDefinition(
+                    name=tool["name"],
+                    description=tool.get("description", ""),
+                    input_schema=tool.get("inputSchema", {}),
+                )
+                for tool in result.get("tools", [])
+            )
+            cursor = result.get("nextCursor")
+            if not cursor:
+                return tools
 
     async def call_tool(self, name: str, arguments: dict[str, Any]) -> ToolResult:
         """Call a tool on the MCP server.
-        
+
+        Structured content is returned as-is when the server provides it;
+        otherwise the raw content blocks are returned.
+
+        Args:
+            name: Tool name.
+            arguments: Tool arguments.
+
+        Returns:
+            The tool result.
+
         Raises:
-            NotImplementedError: Always, during TDD phase.
+            MCPConnectionError: If the server is gone.
+            ToolArgumentError: If the arguments do not match the tool's input schema.
+            ValueError: If the server does not list the tool.
+            MCPRequestError: If the server rejects the request.
+            jsonschema.SchemaError: If a listed schema is invalid and
+                ``on_schema_error`` is ``"raise"``.
         """
-        raise NotImplementedError("MCPClient.call_tool is not implemented")
+        if self._validate_arguments:
+            validator = await self._validator(name)
+            if validator is not None:
+                validator(arguments)
+        result = await self._request("tools/call", {"name": name, "arguments": arguments})
+        return _tool_result(result)
+
+    async def call_tool_batch(
+        self, name: str, arguments: Sequence[dict[str, Any]]
+    ) -> list[ToolResult]:
+        """Call one tool with several argument sets, pipelined in a single write.
+
+        Every argument set is validated first; then all requests are framed
+        and written to the server with one write and one drain, instead of one
+        per call. The server still answers each request on its own.
+
+        Args:
+            name: Tool name.
+            arguments: One parameter set per call.
+
+        Returns:
+            One result per argument set, in order.
+
+        Raises:
+            MCPConnectionError: If the server is gone.
+            ToolArgumentError: If any argument set does not match the tool's input schema.
+            ValueError: If the server does not list the tool.
+            MCPRequestError: If the server rejects any of the requests.
+            jsonschema.SchemaError: If a listed schema is invalid and
+                ``on_schema_error`` is ``"raise"``.
+        """
+        if not arguments:
+            return []
+        if self._validate_arguments:
+            validator = await self._validator(name)
+            if validator is not None:
+                for args in arguments:
+                    validator(args)
+        results = await self._request_many(
+            "tools/call", [{"name": name, "arguments": args} for args in arguments]
+        )
+        return [_tool_result(result) for result in results]
+
+    async def _validator(self, name: str) -> ArgumentValidator | None:
+        if self._validators is None:
+            tools = await self.list_tools()
+            self._validators = compile_argument_validators(
+                {tool.name: tool.input_schema for tool in tools},
+                on_schema_error=self._on_schema_error,
+            )
+            self._known_tools = {tool.name for tool in tools}
+        validator = self._validators.get(name)
+        if validator is None and not self._pinned_schemas and name not in self._known_tools:
+            raise ValueError(f"Unknown MCP tool '{name}'")
+        return validator
+
+    async def _request(
+        self, method: str, params: dict[str, Any], *, timeout_s: float | None = None
+    ) -> dict[str, Any]:
+        (result,) = await self._request_many(method, [params], timeout_s=timeout_s)
+        return result
+
+    async def _request_many(
+        self,
+        method: str,
+        params: Sequence[dict[str, Any]],
+        *,
+        timeout_s: float | None = None,
+    ) -> list[dict[str, Any]]:
+        if not self.is_alive:
+            raise MCPConnectionError(f"MCP server '{self.command}' is not running")
+        loop = asyncio.get_running_loop()
+        futures: dict[int, asyncio.Future[dict[str, Any]]] = {
+            next(self._ids): loop.create_future() for _ in params
+        }
+        self._pending.update(futures)
+        try:
+            await self._send_many(
+                [
+                    {"jsonrpc": "2.0", "id": request_id, "method": method, "params": request}
+                    for request_id, request in zip(futures, params, strict=True)
+                ]
+            )
+            # return_exceptions so no failed sibling is left with an unretrieved exception.
+            outcomes = await asyncio.wait_for(
+                asyncio.gather(*futures.values(), return_exceptions=True),
+                timeout_s or self.request_timeout_s,
+            )
+        finally:
+            for request_id in futures:
+                self._pending.pop(request_id, None)
+        results: list[dict[str, Any]] = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+            results.append(outcome)
+        return results
+
+    async def _send(self, message: dict[str, Any]) -> None:
+        await self._send_many([message])
+
+    async def _send_many(self, messages: Sequence[dict[str, Any]]) -> None:
+        process = self._process
+        if process is None or process.stdin is None:
+            raise MCPConnectionError(f"MCP server '{self.command}' is not running")
+        data = b"".join(
+            json.dumps(message, separators=(",", ":")).encode() + b"\n" for message in messages
+        )
+        async with self._write_lock:
+            try:
+                process.stdin.write(data)
+                await process.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError) as exc:
+                raise MCPConnectionError(f"MCP server '{self.command}' exited") from exc
+
+    async def _read_loop(self) -> None:
+        if self._process is None or self._process.stdout is None:
+            return
+        stdout = self._process.stdout
+        try:
+            while line := await stdout.readline():
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if "method" in message:
+                    await self._handle_server_message(message)
+                    continue
+                future = self._pending.get(message.get("id"))
+                if future is None or future.done():
+                    continue
+                error = message.get("error")
+                if error is not None:
+                    future.set_exception(
+                        MCPRequestError(int(error.get("code", 0)), str(error.get("message", "")))
+                    )
+                else:
+                    future.set_result(message.get("result") or {})
+        finally:
+            self._fail_pending(MCPConnectionError(f"MCP server '{self.command}' exited"))
+
+    async def _handle_server_message(self, message: dict[str, Any]) -> None:
+        # Notifications need no answer; server-initiated requests are answered minimally.
+        if "id" not in message:
+            if message["method"] == "notifications/tools/list_changed":
+                self._tools = None
+                if not self._pinned_schemas:
+                    self._validators = None
+            return
+        if message["method"] == "ping":
+            reply: dict[str, Any] = {"jsonrpc": "2.0", "id": message["id"], "result": {}}
+        else:
+            reply = {
+                "jsonrpc": "2.0",
+                "id": message["id"],
+                "error": {"code": -32601, "message": f"Method not found: {message['method']}"},
+            }
+        with contextlib.suppress(MCPConnectionError):
+            await self._send(reply)
+
+    def _fail_pending(self, error: Exception) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+
+def _tool_result(result: dict[str, Any]) -> ToolResult:
+    content = result.get("structuredContent", result.get("content"))
+    return ToolResult(content=content, is_error=bool(result.get("isError", False)))
@@ -0,0 +1,409 @@
+"""Long-lived pool of warm MCP sessions keyed by server name."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import json
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from chimera.ports.mcp import MCPClientPort
+from chimera.services.mcp_cache import CachedMCPClient, ToolResultCache
+from chimera.services.mcp_client import MCPClient, MCPConnectionError
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from pathlib import Path
+    from types import TracebackType
+
+    from chimera.models.mcp import ToolDefinition, ToolResult
+
+
+@dataclass(frozen=True, slots=True)
+class MCPServerConfig:
+    """Connection details for one stdio MCP server from ``mcp.json``."""
+
+    name: str
+    command: str
+    args: tuple[str, ...] = ()
+    cwd: Path | None = None
+    tools: tuple[str, ...] = ()
+    request_timeout_s: float = 30.0
+    connect_timeout_s: float = 10.0
+    env: Mapping[str, str] = field(default_factory=dict)
+    input_schemas: Mapping[str, Mapping[str, Any]] | None = None
+
+
+def load_server_configs(path: Path) -> dict[str, MCPServerConfig]:
+    """Read stdio server definitions from an ``mcp.json`` file.
+
+    Relative working directories are resolved against the config file's
+    directory. Servers using other transports are skipped.
+
+    Args:
+        path: Path to ``mcp.json``.
+
+    Returns:
+        Server configs keyed by server name.
+
+    Raises:
+        None.
+    """
+    config = json.loads(path.read_text(encoding="utf-8"))
+    defaults = config.get("defaults", {})
+    servers: dict[str, MCPServerConfig] = {}
+    for name, server in config.get("servers", {}).items():
+        if server.get("transport") != "stdio":
+            continue
+        stdio = server["stdio"]
+        cwd = stdio.get("cwd")
+        servers[name] = MCPServerConfig(
+            name=name,
+            command=stdio["command"],
+            args=tuple(stdio.get("args", [])),
+            cwd=(path.parent / cwd).resolve() if cwd else None,
+            tools=tuple(tool["name"] for tool in server.get("tools", [])),
+            request_timeout_s=defaults.get("request_timeout_ms", 30000) / 1000,
+            connect_timeout_s=defaults.get("connect_timeout_ms", 10000) / 1000,
+            input_schemas={tool["name"]: tool["input_schema"] for tool in server.get("tools", [])},
+        )
+    return servers
+
+
+class MCPClientPool(MCPClientPort):
+    """Pool of warm, multiplexed MCP sessions.
+
+    Each server gets ``sessions_per_server`` long-lived :class:`MCPClient`
+    sessions, started on first use and shared round-robin by every caller.
+    Tool calls are routed to their server by tool name. A session whose
+    process has died is restarted on the next borrow, and a background health
+    check pings idle sessions so crashes are repaired before traffic hits them.
+
+    When a :class:`ToolResultCache` is attached, :meth:`for_tenant` returns a
+    tenant-bound view that serves read-only tools from the cache.
+
+    Calls that were in flight when a server crashed fail with
+    :class:`MCPConnectionError` and are not retried, because tools such as
+    ``transfer_asset`` are not idempotent.
+
+    Args:
+        servers: Server configs keyed by server name.
+        sessions_per_server: Number of sessions kept per server.
+        health_check_interval_s: Seconds between background health checks, or
+            ``None`` to disable them.
+        cache: Optional result cache for read-only tools.
+
+    Returns:
+        None.
+
+    Raises:
+        ValueError: If ``sessions_per_server`` is less than 1 or a tool is
+            declared by two servers.
+    """
+
+    def __init__(
+        self,
+        servers: Mapping[str, MCPServerConfig],
+        *,
+        sessions_per_server: int = 1,
+        health_check_interval_s: float | None = 30.0,
+        cache: ToolResultCache | None = None,
+    ) -> None:
+        if sessions_per_server < 1:
+            raise ValueError("sessions_per_server must be at least 1")
+        self._servers = dict(servers)
+        self._tool_servers: dict[str, str] = {}
+        for server in self._servers.values():
+            for tool in server.tools:
+                if tool in self._tool_servers:
+                    raise ValueError(
+                        f"Tool '{tool}' is declared by both '{self._tool_servers[tool]}'"
+                        f" and '{server.name}'"
+                    )
+                self._tool_servers[tool] = server.name
+        self._sessions: dict[str, list[MCPClient | None]] = {
+            name: [None] * sessions_per_server for name in self._servers
+        }
+        self._locks: dict[str, list[asyncio.Lock]] = {
+            name: [asyncio.Lock() for _ in range(sessions_per_server)] for name in self._servers
+        }
+        self._cursor = {name: itertools.cycle(range(sessions_per_server)) for name in self._servers}
+        self._health_check_interval_s = health_check_interval_s
+        self._health_task: asyncio.Task[None] | None = None
+        self.cache = cache
+
+    @classmethod
+    def from_config(cls, path: Path, **kwargs: Any) -> MCPClientPool:
+        """Build a pool, and its tool-result cache, from an ``mcp.json`` file.
+
+        Args:
+            path: Path to ``mcp.json``.
+            **kwargs: Forwarded to the constructor. Pass ``cache=None`` to
+                disable result caching.
+
+        Returns:
+            A pool with no sessions started yet.
+
+        Raises:
+            ValueError: If the config declares a tool twice or marks a
+                side-effecting tool cacheable.
+        """
+        kwargs.setdefault("cache", ToolResultCache.from_config(path))
+        return cls(load_server_configs(path), **kwargs)
+
+    async def __aenter__(self) -> MCPClientPool:
+        """Start background health checks.
+
+        Returns:
+            The pool.
+
+        Raises:
+            None.
+        """
+        if self._health_check_interval_s is not None and self._health_task is None:
+            self._health_task = asyncio.create_task(
+                self._health_loop(self._health_check_interval_s)
+            )
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop health checks and close every session.
+
+        Raises:
+            None.
+        """
+        await self.close()
+
+    def server_for(self, tool_name: str) -> str:
+        """Resolve the server that declares a tool.
+
+        Args:
+            tool_name: Tool name.
+
+        Returns:
+            The server name.
+
+        Raises:
+            ValueError: If no server declares the tool.
+        """
+        try:
+            return self._tool_servers[tool_name]
+        except KeyError:
+            raise ValueError(f"Unknown MCP tool '{tool_name}'") from None
+
+    def for_tenant(self, tenant_id: str) -> MCPClientPort:
+        """Return a client view for one tenant, reading through the result cache.
+
+        Args:
+            tenant_id: Tenant making the calls.
+
+        Returns:
+            A cached view when a cache is attached, otherwise the pool itself.
+
+        Raises:
+            None.
+        """
+        if self.cache is None:
+            return self
+        return CachedMCPClient(self, self.cache, tenant_id)
+
+    async def session(self, server: str) -> MCPClient:
+        """Borrow a live session for a server, starting or restarting it if needed.
+
+        Sessions are shared, not checked out: callers may issue requests on
+        the returned client concurrently.
+
+        Args:
+            server: Server name.
+
+        Returns:
+            A connected client.
+
+        Raises:
+            KeyError: If the server is not configured.
+            MCPConnectionError: If the server cannot be started.
+        """
+        if server not in self._servers:
+            raise KeyError(f"MCP server '{server}' is not configured")
+        slot = next(self._cursor[server])
+        client = self._sessions[server][slot]
+        if client is not None and client.is_alive:
+            return client
+        async with self._locks[server][slot]:
+            client = self._sessions[server][slot]
+            if client is not None and client.is_alive:
+                return client
+            if client is not None:
+                await client.close()
+            self._sessions[server][slot] = None
+            client = self._connect(self._servers[server])
+            await client.start()
+            self._sessions[server][slot] = client
+            return client
+
+    async def list_tools(self) -> list[ToolDefinition]:
+        """List the tools of every configured server.
+
+        Returns:
+            Tools from all servers.
+
+        Raises:
+            MCPConnectionError: If a server cannot be started.
+        """
+        clients = [await self.session(server) for server in self._servers]
+        listed = await asyncio.gather(*(client.list_tools() for client in clients))
+        return [tool for tools in listed for tool in tools]
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> ToolResult:
+        """Call a tool on the server that declares it.
+
+        Args:
+            name: Tool name.
+            arguments: Tool arguments.
+
+        Returns:
+            The tool result.
+
+        Raises:
+            ValueError: If no server declares the tool.
+            MCPConnectionError: If the server is unavailable or crashes mid-call.
+        """
+        client = await self.session(self.server_for(name))
+        return await client.call_tool(name, arguments)
+
+    async def call_tool_batch(
+        self, name: str, arguments: Sequence[dict[str, Any]]
+    ) -> list[ToolResult]:
+        """Call one tool with several argument sets on a single session.
+
+        The whole batch goes to one session, which pipelines the requests in
+        a single write, rather than being spread call by call across sessions.
+
+        Args:
+            name: Tool name.
+            arguments: One parameter set per call.
+
+        Returns:
+            One result per argument set, in order.
+
+        Raises:
+            ValueError: If no server declares the tool.
+            MCPConnectionError: If the server is unavailable or crashes mid-call.
+        """
+        client = await self.session(self.server_for(name))
+        return await client.call_tool_batch(name, arguments)
+
+    async def check_health(self) -> dict[str, bool]:
+        """Ping every started session and restart the ones that fail.
+
+        Args:
+            None.
+
+        Returns:
+            Whether each started server was healthy before any restart.
+
+        Raises:
+            None.
+        """
+        report: dict[str, bool] = {}
+        for server, sessions in self._sessions.items():
+            for slot, client in enumerate(sessions):
+                if client is None:
+                    continue
+                healthy = client.is_alive
+                if healthy:
+                    try:
+                        await client.ping()
+                    except (MCPConnectionError, TimeoutError):
+                        healthy = False
+                report[server] = report.get(server, True) and healthy
+                if not healthy:
+                    await self._restart(server, slot, client)
+        return report
+
+    async def close(self) -> None:
+        """Stop health checks and close every session.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        if self._health_task is not None:
+            self._health_task.cancel()
+            await asyncio.gather(self._health_task, return_exceptions=True)
+            self._health_task = None
+        for sessions in self._sessions.values():
+            for slot, client in enumerate(sessions):
+                sessions[slot] = None
+                if client is not None:
+                    await client.close()
+
+    def _connect(self, config: MCPServerConfig) -> MCPClient:
+        return MCPClient(
+            config.command,
+            list(config.args),
+            cwd=config.cwd,
+            env=dict(config.env) or None,
+            request_timeout_s=config.request_timeout_s,
+            connect_timeout_s=config.connect_timeout_s,
+            tool_schemas=config.input_schemas,
+        )
+
+    async def _restart(self, server: str, slot: int, stale: MCPClient) -> None:
+        async with self._locks[server][slot]:
+            if self._sessions[server][slot] is not stale:
+                return
+            await stale.close()
+            self._sessions[server][slot] = None
+            client = self._connect(self._servers[server])
+            try:
+                await client.start()
+            except MCPConnectionError:
+                return
+            self._sessions[server][slot] = client
+
+    async def _health_loop(self, interval_s: float) -> None:
+        while True:
+            await asyncio.sleep(interval_s)
+            with contextlib.suppress(Exception):
+                await self.check_health()
+
+
+_default_pool: MCPClientPool | None = None
+
+
+def set_default_pool(pool: MCPClientPool | None) -> None:
+    """Install the process-wide pool used by skills without an injected client.
+
+    Args:
+        pool: The pool, or ``None`` to clear it.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+    global _default_pool
+    _default_pool = pool
+
+
+def get_default_pool() -> MCPClientPool | None:
+    """Return the process-wide MCP pool, if one is installed.
+
+    Returns:
+        The pool or ``None``.
+
+    Raises:
+        None.
+    """
+    return _default_pool
@@ -0,0 +1,90 @@
+"""Local validation of MCP tool arguments against declared input schemas."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from typing import Any, Literal
+
+from jsonschema.exceptions import SchemaError
+from jsonschema.validators import Draft202012Validator, validator_for
+
+ArgumentValidator = Callable[[Mapping[str, Any]], None]
+
+SchemaErrorPolicy = Literal["raise", "skip"]
+
+
+class ToolArgumentError(ValueError):
+    """Raised when tool arguments do not match the tool's input schema.
+
+    Attributes:
+        tool_name: Tool whose arguments were rejected.
+        errors: One message per schema violation.
+    """
+
+    def __init__(self, tool_name: str, errors: list[str]) -> None:
+        super().__init__(f"Invalid arguments for MCP tool '{tool_name}': {'; '.join(errors)}")
+        self.tool_name = tool_name
+        self.errors = errors
+
+
+def compile_argument_validator(tool_name: str, schema: Mapping[str, Any]) -> ArgumentValidator:
+    """Compile an input schema once into a reusable validator callable.
+
+    The schema is checked and its validator class resolved up front, so each
+    call only walks the arguments. Valid arguments take the ``is_valid`` fast
+    path; errors are collected only when validation fails.
+
+    Args:
+        tool_name: Tool name, used in error messages.
+        schema: JSON schema for the tool's arguments.
+
+    Returns:
+        A callable that raises ``ToolArgumentError`` for invalid arguments.
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid.
+    """
+    resolved = dict(schema)
+    validator_cls = validator_for(resolved, default=Draft202012Validator)
+    validator_cls.check_schema(resolved)
+    validator = validator_cls(resolved)
+
+    def validate(arguments: Mapping[str, Any]) -> None:
+        if validator.is_valid(arguments):
+            return
+        errors = [
+            f"{'/'.join(str(part) for part in error.absolute_path) or '<root>'}: {error.message}"
+            for error in validator.iter_errors(arguments)
+        ]
+        raise ToolArgumentError(tool_name, errors)
+
+    return validate
+
+
+def compile_argument_validators(
+    schemas: Mapping[str, Mapping[str, Any]],
+    *,
+    on_schema_error: SchemaErrorPolicy = "raise",
+) -> dict[str, ArgumentValidator]:
+    """Compile validators for several tools.
+
+    Args:
+        schemas: Input schemas keyed by tool name.
+        on_schema_error: ``"raise"`` to fail on an invalid schema, or
+            ``"skip"`` to leave that tool without a validator.
+
+    Returns:
+        Validators keyed by tool name.
+
+    Raises:
+        jsonschema.SchemaError: If a schema is invalid and
+            ``on_schema_error`` is ``"raise"``.
+    """
+    validators: dict[str, ArgumentValidator] = {}
+    for name, schema in schemas.items():
+        try:
+            validators[name] = compile_argument_validator(name, schema)
+        except SchemaError:
+            if on_schema_error == "raise":
+                raise
+    return validators
@@ -1,27 +1,258 @@
-from typing import Any
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
 
+from chimera.lib.keyword_scanner import (
+    KeywordMatch,
+    KeywordScanner,
+    StringLeaves,
+    load_blocklist,
+)
+from chimera.lib.logging import get_logger
 from chimera.models.result import Result
+from chimera.models.review import ReviewReason
+
+logger = get_logger(__name__)
+
+DEFAULT_KEYWORDS = ("password", "secret key", "delete all", "override security", "PII", "SSN")
+
+SafetyCheck = Literal["confidence", "size", "keywords"]
+
+# Cheapest first: a field lookup, then a length sum, then the regex scan.
+SAFETY_CHECKS: tuple[SafetyCheck, ...] = ("confidence", "size", "keywords")
+
+
+@dataclass(frozen=True, slots=True)
+class SafetyVerdict:
+    """Outcome of the safety gate for one result.
+
+    ``reason`` and ``details`` are set when the result failed and map onto
+    the fields of the ``ReviewCard`` it should be routed to.
+    """
+
+    passed: bool
+    reason: ReviewReason | None = None
+    details: str = ""
+    match: KeywordMatch | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class SafetyCheckStats:
+    """Cumulative counters for one check of the safety gate.
+
+    ``checked`` counts results that reached the check, so a check late in
+    the pipeline sees fewer results than the ones before it.
+    """
+
+    checked: int
+    failed: int
+    elapsed_ns: int
+
+
+@dataclass(slots=True)
+class _Counter:
+    checked: int = 0
+    failed: int = 0
+    elapsed_ns: int = 0
+
+
+_PASSED = SafetyVerdict(passed=True)
 
 
 class SafetyService:
-    """Service for automated safety gating of agent results."""
+    """Service for automated safety gating of agent results.
+
+    Results go through ``SAFETY_CHECKS`` in order and stop at the first check
+    they fail. ``check_results`` runs each check over a whole batch before
+    the next one, so the keyword scan is a single pass over the outputs that
+    survived the cheaper checks.
+
+    Outputs may carry a ``confidence`` score in ``[0, 1]``; results without
+    one skip the confidence check. ``max_output_chars`` bounds the combined
+    length of the string values in an output; ``None`` disables the limit.
 
-    def __init__(self, confidence_threshold: float = 0.7):
+    The keyword blocklist is compiled once into a ``KeywordScanner``.
+    ``reload_keywords`` builds a replacement scanner and swaps it in with a
+    single assignment, so a check running concurrently sees either the old
+    or the new blocklist, never a partial one.
+    """
+
+    def __init__(
+        self,
+        confidence_threshold: float = 0.7,
+        *,
+        keywords: tuple[str, ...] | list[str] = DEFAULT_KEYWORDS,
+        blocklist_path: Path | None = None,
+        max_output_chars: int | None = 100_000,
+    ):
         self._confidence_threshold = confidence_threshold
-        self._keywords = ["password", "secret key", "delete all", "override security", "PII", "SSN"]
+        self._max_output_chars = max_output_chars
+        self._counters = {check: _Counter() for check in SAFETY_CHECKS}
+        self._blocklist_path = blocklist_path
+        self._blocklist_mtime: float | None = None
+        self._scanner = KeywordScanner(keywords)
+        if blocklist_path is not None:
+            self.reload_keywords()
+
+    @property
+    def scanner(self) -> KeywordScanner:
+        """The keyword scanner currently in use."""
+        return self._scanner
+
+    def reload_keywords(self, keywords: list[str] | None = None) -> int:
+        """Replace the blocklist.
+
+        Args:
+            keywords: New terms; when omitted they are read from ``blocklist_path``.
+
+        Returns:
+            Number of terms in the new blocklist.
+
+        Raises:
+            ValueError: If no terms are given and no blocklist path is configured,
+                or the blocklist file is malformed.
+            OSError: If the blocklist file cannot be read.
+        """
+        if keywords is None:
+            if self._blocklist_path is None:
+                raise ValueError("No keywords given and no blocklist_path configured")
+            mtime = self._blocklist_path.stat().st_mtime
+            keywords = load_blocklist(self._blocklist_path)
+            self._blocklist_mtime = mtime
+        scanner = KeywordScanner(keywords)
+        self._scanner = scanner
+        logger.info("safety.keywords_reloaded", terms=len(scanner))
+        return len(scanner)
+
+    def reload_if_changed(self) -> bool:
+        """Reload ``blocklist_path`` if the file changed since the last load.
+
+        Call this periodically, e.g. from a maintenance loop.
+
+        Returns:
+            True if the blocklist was reloaded.
+
+        Raises:
+            OSError: If the blocklist file cannot be read.
+            ValueError: If the blocklist file is malformed.
+        """
+        if self._blocklist_path is None:
+            return False
+        if self._blocklist_path.stat().st_mtime == self._blocklist_mtime:
+            return False
+        self.reload_keywords()
+        return True
+
+    def find_keywords(self, output: dict[str, Any]) -> list[KeywordMatch]:
+        """Locate every blocklisted term in a result payload.
+
+        Args:
+            output: Result payload; all nested string values are scanned.
+
+        Returns:
+            Matches with the path and character span of each hit.
+        """
+        return self._scanner.scan_output(output)
+
+    def stats(self) -> dict[SafetyCheck, SafetyCheckStats]:
+        """Snapshot the per-check counters.
+
+        Returns:
+            Counters keyed by check, in pipeline order.
+
+        Raises:
+            None.
+        """
+        return {
+            check: SafetyCheckStats(counter.checked, counter.failed, counter.elapsed_ns)
+            for check, counter in self._counters.items()
+        }
+
+    def check_results(self, results: Sequence[Result]) -> list[SafetyVerdict]:
+        """Run the safety gate over a batch, e.g. the output of ``Worker.process_batch``.
+
+        Args:
+            results: Results to check.
+
+        Returns:
+            One verdict per result, in input order.
+
+        Raises:
+            None.
+        """
+        verdicts: list[SafetyVerdict | None] = [None] * len(results)
+
+        counter = self._counters["confidence"]
+        started = time.perf_counter_ns()
+        for index, result in enumerate(results):
+            confidence = result.output.get("confidence")
+            if isinstance(confidence, int | float) and not self._check_confidence(confidence):
+                verdicts[index] = SafetyVerdict(
+                    passed=False,
+                    reason=ReviewReason.LOW_CONFIDENCE,
+                    details=f"Confidence {confidence:.2f} is below {self._confidence_threshold}",
+                )
+                counter.failed += 1
+        counter.checked += len(results)
+        counter.elapsed_ns += time.perf_counter_ns() - started
+
+        pending = [index for index, verdict in enumerate(verdicts) if verdict is None]
+        counter = self._counters["size"]
+        started = time.perf_counter_ns()
+        leaves: list[StringLeaves] = []
+        scannable: list[int] = []
+        for index in pending:
+            collected = StringLeaves.collect(results[index].output)
+            size = collected.total_chars
+            if self._max_output_chars is not None and size > self._max_output_chars:
+                verdicts[index] = SafetyVerdict(
+                    passed=False,
+                    reason=ReviewReason.OUTPUT_TOO_LARGE,
+                    details=f"Output has {size} characters, limit is {self._max_output_chars}",
+                )
+                counter.failed += 1
+            else:
+                leaves.append(collected)
+                scannable.append(index)
+        counter.checked += len(pending)
+        counter.elapsed_ns += time.perf_counter_ns() - started
+
+        counter = self._counters["keywords"]
+        started = time.perf_counter_ns()
+        for index, match in zip(scannable, self._scanner.first_matches(leaves), strict=True):
+            if match is not None:
+                verdicts[index] = SafetyVerdict(
+                    passed=False,
+                    reason=ReviewReason.SENSITIVE_KEYWORD,
+                    details=f"Found keyword '{match.term}'",
+                    match=match,
+                )
+                counter.failed += 1
+        counter.checked += len(scannable)
+        counter.elapsed_ns += time.perf_counter_ns() - started
+
+        return [_PASSED if verdict is None else verdict for verdict in verdicts]
 
     def _check_confidence(self, confidence: float) -> bool:
         """Internal: Check if confidence meets the threshold."""
-        raise NotImplementedError("SafetyService._check_confidence is not implemented")
+        return confidence >= self._confidence_threshold
 
     def _check_keywords(self, content: str) -> bool:
-        """Internal: Scan content for sensitive keywords."""
-        raise NotImplementedError("SafetyService._check_keywords is not implemented")
+        """Internal: Scan content for sensitive keywords.
+
+        Returns:
+            True if the content contains no blocklisted term.
+        """
+        return self._scanner.search(content) is None
 
     def check_result(self, result: Result) -> bool:
         """Check if a result passes automated safety filters.
 
+        Prefer ``check_results`` for batches; it scans them in one pass.
+
         Returns:
             True if safe, False if it needs review.
         """
-        raise NotImplementedError("SafetyService.check_result is not implemented")
+        return self.check_results([result])[0].passed
@@ -0,0 +1,420 @@
+"""Fair multi-tenant dispatch in front of ``Worker``.
+
+``FairScheduler`` serves tenants with deficit round-robin: each round, every
+tenant with work is credited ``quantum * weight`` tasks and may dequeue up to
+that credit, bounded by its concurrency cap and the shared in-flight budget.
+A busy tenant therefore cannot starve the others, and each tenant's wait is
+bounded by one round rather than by the size of other tenants' backlogs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from chimera.lib.logging import get_logger
+from chimera.lib.stats import percentile
+from chimera.models.types import TenantId
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+    from pathlib import Path
+
+    from chimera.models.task import Task
+    from chimera.ports.queue import TaskQueuePort
+    from chimera.services.worker import Worker
+
+logger = get_logger(__name__)
+
+
+class TenantSchedulingPolicy(BaseModel):
+    """Share of the worker pool granted to one tenant.
+
+    Attributes:
+        weight: Relative share; a tenant with weight 2 is served twice as
+            many tasks per round as a tenant with weight 1.
+        max_concurrency: Maximum number of the tenant's tasks in flight.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    weight: float = Field(default=1.0, gt=0)
+    max_concurrency: int = Field(default=4, ge=1)
+
+
+class SchedulerConfig(BaseModel):
+    """Scheduler settings, usually loaded from ``scheduler.json``.
+
+    Attributes:
+        quantum: Tasks credited to a weight-1 tenant per round.
+        max_in_flight: Size of the shared worker pool, in tasks.
+        max_batch_size: Maximum tasks taken from one tenant per dequeue.
+        idle_backoff_ms: Initial delay before re-polling a tenant whose
+            queue was empty.
+        max_idle_backoff_ms: Upper bound for the doubling idle delay.
+        default_policy: Policy for tenants without an explicit entry.
+        tenants: Per-tenant policies.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    quantum: int = Field(default=4, ge=1)
+    max_in_flight: int = Field(default=16, ge=1)
+    max_batch_size: int = Field(default=8, ge=1)
+    idle_backoff_ms: int = Field(default=50, ge=1)
+    max_idle_backoff_ms: int = Field(default=2000, ge=1)
+    default_policy: TenantSchedulingPolicy = Field(default_factory=TenantSchedulingPolicy)
+    tenants: dict[TenantId, TenantSchedulingPolicy] = Field(default_factory=dict)
+
+    @classmethod
+    def from_file(cls, path: Path) -> SchedulerConfig:
+        """Load and validate a scheduler config file.
+
+        Args:
+            path: Path to a JSON config such as ``scheduler.json``.
+
+        Returns:
+            The parsed config.
+
+        Raises:
+            pydantic.ValidationError: If the file does not match the model.
+        """
+        return cls.model_validate_json(path.read_text(encoding="utf-8"))
+
+    def policy_for(self, tenant_id: TenantId) -> TenantSchedulingPolicy:
+        """Return the policy that applies to a tenant.
+
+        Args:
+            tenant_id: Target tenant.
+
+        Returns:
+            The tenant's policy, or the default policy.
+
+        Raises:
+            None.
+        """
+        return self.tenants.get(tenant_id, self.default_policy)
+
+
+@runtime_checkable
+class SupportsDepth(Protocol):
+    """Queue adapter that can report a tenant's backlog without I/O."""
+
+    def depth(self, tenant_id: TenantId) -> int:
+        """Number of tasks waiting to be delivered for a tenant."""
+        ...
+
+
+@dataclass(frozen=True, slots=True)
+class TenantSchedulerStats:
+    """Per-tenant scheduling metrics.
+
+    Wait times measure how long dispatched tasks sat in the queue, from
+    ``Task.created_at`` to dequeue, over a sliding window of recent tasks.
+    """
+
+    depth: int | None
+    in_flight: int
+    dispatched: int
+    failed_batches: int
+    wait_p50_ms: float
+    wait_p95_ms: float
+    wait_max_ms: float
+
+
+@dataclass(slots=True)
+class _TenantState:
+    policy: TenantSchedulingPolicy
+    waits_ms: deque[float]
+    deficit: float = 0.0
+    in_flight: int = 0
+    dispatched: int = 0
+    failed_batches: int = 0
+    idle_until: float = 0.0
+    backoff_s: float = 0.0
+
+
+class FairScheduler:
+    """Deficit round-robin dispatcher feeding a shared worker pool.
+
+    The scheduler dequeues on behalf of tenants and hands each batch to
+    ``Worker.process_tasks``, which passes the results to the worker's
+    result sink. Tenants whose queue is empty are skipped with
+    a doubling back-off (reset by ``notify``) so idle tenants cost almost no
+    polling, and queues that implement ``SupportsDepth`` are not polled at
+    all while empty. Deficits are capped at one round's credit, so a tenant
+    that was throttled cannot burst past the others afterwards.
+
+    Dequeues are issued in turn from the scheduler loop, so the queue must be
+    configured with ``block_ms=None``; a blocking dequeue on an idle tenant
+    would stall every other tenant.
+
+    Args:
+        queue: Tenant-scoped task queue, configured not to block.
+        worker: Worker that processes dispatched batches.
+        config: Scheduling settings.
+        tenants: Tenants to serve in addition to those in ``config.tenants``.
+        clock: Monotonic clock in seconds, injectable for tests.
+        wait_window: Number of recent task waits kept per tenant.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    def __init__(
+        self,
+        queue: TaskQueuePort,
+        worker: Worker,
+        config: SchedulerConfig | None = None,
+        *,
+        tenants: Iterable[TenantId] = (),
+        clock: Callable[[], float] = time.monotonic,
+        wait_window: int = 1024,
+    ) -> None:
+        self._queue = queue
+        self._worker = worker
+        self._config = config or SchedulerConfig()
+        self._clock = clock
+        self._wait_window = wait_window
+        self._tenants: dict[str, _TenantState] = {}
+        self._order: deque[str] = deque()
+        self._in_flight = 0
+        self._batches: set[asyncio.Task[None]] = set()
+        self._wake = asyncio.Event()
+        self._stopping = False
+        for tenant_id in (*self._config.tenants, *tenants):
+            self.add_tenant(tenant_id)
+
+    def add_tenant(self, tenant_id: TenantId) -> None:
+        """Start serving a tenant. Adding a known tenant is a no-op.
+
+        Args:
+            tenant_id: Tenant to serve.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        if tenant_id in self._tenants:
+            return
+        self._tenants[tenant_id] = _TenantState(
+            policy=self._config.policy_for(tenant_id),
+            waits_ms=deque(maxlen=self._wait_window),
+        )
+        self._order.append(tenant_id)
+        self._wake.set()
+
+    def remove_tenant(self, tenant_id: TenantId) -> None:
+        """Stop dispatching a tenant's tasks. In-flight batches still complete.
+
+        Args:
+            tenant_id: Tenant to drop.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        if self._tenants.pop(tenant_id, None) is not None:
+            self._order.remove(tenant_id)
+
+    def notify(self, tenant_id: TenantId) -> None:
+        """Signal that a tenant has new work, cancelling its idle back-off.
+
+        Unknown tenants are added.
+
+        Args:
+            tenant_id: Tenant that received tasks.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        state = self._tenants.get(tenant_id)
+        if state is None:
+            self.add_tenant(tenant_id)
+            return
+        state.idle_until = 0.0
+        state.backoff_s = 0.0
+        self._wake.set()
+
+    async def dispatch_round(self) -> int:
+        """Run one deficit round-robin pass over the tenants.
+
+        Returns:
+            Number of tasks dispatched.
+
+        Raises:
+            Exception: Whatever the queue raises on ``dequeue``.
+        """
+        config = self._config
+        dispatched = 0
+        for _ in range(len(self._order)):
+            free = config.max_in_flight - self._in_flight
+            if free <= 0:
+                # Resume from this tenant next round so the pool is not
+                # always handed to whoever sits first in the order.
+                break
+            tenant_id = self._order[0]
+            self._order.rotate(-1)
+            state = self._tenants[tenant_id]
+            cap = state.policy.max_concurrency - state.in_flight
+            if cap <= 0 or state.idle_until > self._clock():
+                continue
+            if isinstance(self._queue, SupportsDepth) and self._queue.depth(tenant_id) == 0:
+                self._back_off(state)
+                continue
+
+            credit = config.quantum * state.policy.weight
+            state.deficit = min(state.deficit + credit, max(credit, 1.0))
+            want = min(int(state.deficit), cap, free, config.max_batch_size)
+            if want < 1:
+                continue
+            tasks = await self._queue.dequeue(
+                tenant_id, batch_size=want, worker_id=self._worker.worker_id
+            )
+            if len(tasks) < want:
+                # Queue drained: DRR forfeits unused credit.
+                state.deficit = 0.0
+                self._back_off(state)
+            else:
+                state.deficit -= len(tasks)
+                state.backoff_s = 0.0
+            if tasks:
+                self._launch(tenant_id, state, tasks)
+                dispatched += len(tasks)
+        return dispatched
+
+    async def run(self) -> None:
+        """Dispatch until ``stop`` is called, then wait for in-flight batches.
+
+        Returns:
+            None.
+
+        Raises:
+            Exception: Whatever the queue raises on ``dequeue``.
+        """
+        self._stopping = False
+        while not self._stopping:
+            self._wake.clear()
+            if await self.dispatch_round():
+                continue
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self._next_poll_delay())
+        await self.drain()
+
+    def stop(self) -> None:
+        """Ask ``run`` to stop dispatching and drain.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        self._stopping = True
+        self._wake.set()
+
+    async def drain(self) -> None:
+        """Wait for every in-flight batch to finish.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+    def stats(self) -> dict[str, TenantSchedulerStats]:
+        """Snapshot per-tenant queue depth, load and wait-time metrics.
+
+        ``depth`` is ``None`` when the queue does not implement
+        ``SupportsDepth``.
+
+        Returns:
+            Metrics keyed by tenant ID.
+
+        Raises:
+            None.
+        """
+        snapshot: dict[str, TenantSchedulerStats] = {}
+        for tenant_id, state in self._tenants.items():
+            waits = sorted(state.waits_ms)
+            snapshot[tenant_id] = TenantSchedulerStats(
+                depth=(
+                    self._queue.depth(tenant_id) if isinstance(self._queue, SupportsDepth) else None
+                ),
+                in_flight=state.in_flight,
+                dispatched=state.dispatched,
+                failed_batches=state.failed_batches,
+                wait_p50_ms=percentile(waits, 0.50),
+                wait_p95_ms=percentile(waits, 0.95),
+                wait_max_ms=waits[-1] if waits else 0.0,
+            )
+        return snapshot
+
+    def _launch(self, tenant_id: str, state: _TenantState, tasks: Sequence[Task]) -> None:
+        now = datetime.now(UTC)
+        for task in tasks:
+            created_at = task.created_at
+            if created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=UTC)
+            state.waits_ms.append(max((now - created_at).total_seconds() * 1000, 0.0))
+        size = len(tasks)
+        state.in_flight += size
+        state.dispatched += size
+        self._in_flight += size
+        batch = asyncio.create_task(self._process(tenant_id, state, tasks))
+        self._batches.add(batch)
+        batch.add_done_callback(self._batches.discard)
+
+    async def _process(self, tenant_id: str, state: _TenantState, tasks: Sequence[Task]) -> None:
+        # Results go to the worker's result sink; failed tasks stay pending in
+        # the queue and are retried via dequeue_pending.
+        try:
+            outcome = await self._worker.process_tasks(tenant_id, tasks)
+            if outcome.failures:
+                state.failed_batches += 1
+        except Exception as exc:
+            state.failed_batches += 1
+            logger.warning("scheduler.batch_failed", tenant_id=tenant_id, error=str(exc))
+        finally:
+            state.in_flight -= len(tasks)
+            self._in_flight -= len(tasks)
+            self._wake.set()
+
+    def _back_off(self, state: _TenantState) -> None:
+        initial = self._config.idle_backoff_ms / 1000
+        state.backoff_s = min(
+            max(state.backoff_s * 2, initial), self._config.max_idle_backoff_ms / 1000
+        )
+        state.idle_until = self._clock() + state.backoff_s
+
+    def _next_poll_delay(self) -> float | None:
+        # Sleep until the earliest idle tenant is due; completions and notify() wake us sooner.
+        now = self._clock()
+        delays = [
+            state.idle_until - now
+            for state in self._tenants.values()
+            if state.in_flight < state.policy.max_concurrency
+        ]
+        if not delays or self._in_flight >= self._config.max_in_flight:
+            return None
+        return max(min(delays), 0.0)
@@ -1,7 +1,11 @@
+import asyncio
 from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Protocol
 
 from chimera.lib.logging import get_logger
 from chimera.models.result import Result
+from chimera.models.task import Task
 from chimera.models.types import TenantId
 from chimera.ports.llm import LLMPort
 from chimera.ports.queue import TaskQueuePort
@@ -9,16 +13,51 @@ from chimera.ports.queue import TaskQueuePort
 logger = get_logger(__name__)
 
 
+class ResultSink(Protocol):
+    """Destination for produced results, such as the Judge or a persister."""
+
+    async def write(self, tenant_id: TenantId, results: Sequence[Result]) -> None:
+        """Take ownership of a batch of results; raise if they were not accepted."""
+        ...
+
+
+@dataclass(frozen=True, slots=True)
+class BatchOutcome:
+    """What became of a batch of tasks.
+
+    Succeeded tasks were handed to the result sink and acknowledged; failed
+    tasks were left unacknowledged for ``dequeue_pending`` to retry.
+    """
+
+    results: list[Result] = field(default_factory=list)
+    failures: list[tuple[Task, BaseException]] = field(default_factory=list)
+
+
 class Worker:
     """Service for consuming and processing tasks.
 
-    Uses an LLM backend to execute tasks and returns results.
+    Uses an LLM backend to execute tasks and returns results. With
+    ``result_sink`` every batch of results is handed to the sink before its
+    tasks are acknowledged, so a result is never acked without an owner.
     """
 
-    def __init__(self, queue: TaskQueuePort, llm: LLMPort, worker_id: str):
+    def __init__(
+        self,
+        queue: TaskQueuePort,
+        llm: LLMPort,
+        worker_id: str,
+        *,
+        result_sink: ResultSink | None = None,
+    ):
         self._queue = queue
         self._llm = llm
         self._worker_id = worker_id
+        self._result_sink = result_sink
+
+    @property
+    def worker_id(self) -> str:
+        """Consumer name used for dequeue and ack."""
+        return self._worker_id
 
     async def process_batch(self, tenant_id: TenantId, batch_size: int = 1) -> Sequence[Result]:
         """Consume a batch of tasks and process them.
@@ -28,9 +67,60 @@ class Worker:
             batch_size: Number of tasks to process.
 
         Returns:
-            A sequence of produced Results.
+            Results of the tasks that succeeded.
+
+        Raises:
+            Exception: The first failure if every task in the batch failed.
+        """
+        tasks = await self._queue.dequeue(
+            tenant_id, batch_size=batch_size, worker_id=self._worker_id
+        )
+        outcome = await self.process_tasks(tenant_id, tasks)
+        if outcome.failures and not outcome.results:
+            raise outcome.failures[0][1]
+        return outcome.results
+
+    async def process_tasks(self, tenant_id: TenantId, tasks: Sequence[Task]) -> BatchOutcome:
+        """Process already-dequeued tasks concurrently.
+
+        Results are handed to the result sink, then the succeeded tasks are
+        acknowledged with one ``ack_many``. Failed tasks are left
+        unacknowledged so they can be reclaimed and retried via
+        ``dequeue_pending``; a failed task does not fail its siblings.
+
+        Args:
+            tenant_id: Tenant the tasks were dequeued for.
+            tasks: Tasks delivered to this worker.
+
+        Returns:
+            Results of the succeeded tasks, in task order, and the failures.
+
+        Raises:
+            Exception: Whatever the result sink or ``ack_many`` raises; no
+                task is acknowledged if the sink fails.
         """
-        raise NotImplementedError("Worker.process_batch is not implemented")
+        outcomes = await asyncio.gather(
+            *(self._llm.generate_result(task) for task in tasks), return_exceptions=True
+        )
+        succeeded: list[Task] = []
+        outcome = BatchOutcome()
+        for task, result in zip(tasks, outcomes, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "worker.task_failed",
+                    tenant_id=tenant_id,
+                    task_id=task.task_id,
+                    error=str(result),
+                )
+                outcome.failures.append((task, result))
+                continue
+            succeeded.append(task)
+            outcome.results.append(result)
+        if succeeded:
+            if self._result_sink is not None:
+                await self._result_sink.write(tenant_id, outcome.results)
+            await self._queue.ack_many(tenant_id, succeeded, self._worker_id)
+        return outcome
 
     async def perceive(self, tenant_id: TenantId) -> None:
         """Augment worker state using MCP tools for external data.
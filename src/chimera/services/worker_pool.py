@@ -0,0 +1,337 @@
+"""Concurrent task consumption with a bounded number of in-flight LLM calls.
+
+LLM calls are I/O-bound, so one process can keep dozens of them in flight.
+``WorkerPool`` runs several asyncio consumers that dequeue only as many
+tasks as there are free LLM slots, which is the pool's back-pressure: when
+every slot is busy, nothing more is taken off the queue and the backlog stays
+visible to other processes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import multiprocessing
+import signal
+from typing import TYPE_CHECKING
+
+from chimera.lib.logging import get_logger
+from chimera.services.worker import ResultSink, Worker
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from types import TracebackType
+
+    from chimera.models.task import Task
+    from chimera.models.types import TenantId
+    from chimera.ports.llm import LLMPort
+    from chimera.ports.queue import TaskQueuePort
+
+logger = get_logger(__name__)
+
+
+class _Capacity:
+    """Counting limiter that can hand out several slots at once.
+
+    After ``close`` every waiting and future ``reserve`` returns 0 at once.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._free = limit
+        self._closed = False
+        self._available = asyncio.Event()
+        self._available.set()
+
+    @property
+    def free(self) -> int:
+        return self._free
+
+    async def reserve(self, wanted: int) -> int:
+        while self._free == 0 and not self._closed:
+            self._available.clear()
+            await self._available.wait()
+        if self._closed:
+            return 0
+        granted = min(wanted, self._free)
+        self._free -= granted
+        return granted
+
+    def release(self, count: int = 1) -> None:
+        if count:
+            self._free += count
+            self._available.set()
+
+    def close(self) -> None:
+        self._closed = True
+        self._available.set()
+
+
+class WorkerPool:
+    """Runs ``consumers`` dequeue loops sharing one in-flight LLM budget.
+
+    Each consumer reserves free slots, dequeues at most that many tasks from
+    the next tenant in turn, and starts one ``Worker.process_tasks`` call per
+    task; a slot is released as soon as its task finishes. At most
+    ``max_in_flight`` ``generate_result`` calls therefore run at once,
+    whatever the number of consumers or the batch size.
+
+    On shutdown, consumers stop dequeuing and in-flight tasks get up to
+    ``drain_timeout_s`` to finish and be acknowledged. Tasks still running
+    after that are cancelled without an ack, so they remain pending and can
+    be reclaimed with ``dequeue_pending``.
+
+    Args:
+        queue: Tenant-scoped task queue.
+        llm: Backend shared by every consumer.
+        tenants: Tenants to consume from.
+        worker_id: Prefix for consumer names (``<worker_id>-<n>``).
+        consumers: Number of concurrent dequeue loops.
+        max_in_flight: Global bound on concurrent LLM calls.
+        batch_size: Maximum tasks per dequeue.
+        idle_sleep_s: Pause after an empty dequeue, for non-blocking queues.
+        drain_timeout_s: Time allowed for in-flight tasks on shutdown.
+        result_sink: Receives every produced result before its task is
+            acknowledged.
+
+    Returns:
+        None.
+
+    Raises:
+        ValueError: If a count is less than 1 or no tenant is given.
+    """
+
+    def __init__(
+        self,
+        queue: TaskQueuePort,
+        llm: LLMPort,
+        tenants: Sequence[TenantId],
+        *,
+        worker_id: str = "worker",
+        consumers: int = 8,
+        max_in_flight: int = 64,
+        batch_size: int = 8,
+        idle_sleep_s: float = 0.05,
+        drain_timeout_s: float = 30.0,
+        result_sink: ResultSink | None = None,
+    ) -> None:
+        if consumers < 1 or max_in_flight < 1 or batch_size < 1:
+            raise ValueError("consumers, max_in_flight and batch_size must be at least 1")
+        if not tenants:
+            raise ValueError("WorkerPool needs at least one tenant")
+        self._queue = queue
+        self._tenants = list(tenants)
+        self._workers = [
+            Worker(queue, llm, f"{worker_id}-{n}", result_sink=result_sink)
+            for n in range(consumers)
+        ]
+        self._max_in_flight = max_in_flight
+        self._batch_size = batch_size
+        self._idle_sleep_s = idle_sleep_s
+        self._drain_timeout_s = drain_timeout_s
+        self._capacity: _Capacity | None = None
+        self._consumers: list[asyncio.Task[None]] = []
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._stopping = False
+
+    async def __aenter__(self) -> WorkerPool:
+        """Start the consumers.
+
+        Returns:
+            The running pool.
+
+        Raises:
+            None.
+        """
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop the consumers and drain in-flight tasks.
+
+        Raises:
+            None.
+        """
+        await self.drain()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of tasks currently being processed."""
+        return len(self._in_flight)
+
+    @property
+    def saturated(self) -> bool:
+        """Whether every LLM slot is busy, so consumers are not dequeuing."""
+        return self._capacity is not None and self._capacity.free == 0
+
+    async def start(self) -> None:
+        """Launch the consumer loops. Starting a running pool is a no-op.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        if self._consumers:
+            return
+        self._stopping = False
+        self._capacity = _Capacity(self._max_in_flight)
+        self._consumers = [
+            asyncio.create_task(self._consume(worker, offset))
+            for offset, worker in enumerate(self._workers)
+        ]
+
+    def stop(self) -> None:
+        """Stop dequeuing new tasks. In-flight tasks keep running.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        self._stopping = True
+        if self._capacity is not None:
+            self._capacity.close()
+
+    async def drain(self) -> int:
+        """Stop, then wait up to ``drain_timeout_s`` for in-flight tasks.
+
+        Consumers still inside a dequeue when the timeout expires are
+        cancelled too; whatever they had been delivered stays pending.
+
+        Returns:
+            Number of tasks cancelled unacknowledged, left for reclaim.
+
+        Raises:
+            None.
+        """
+        self.stop()
+        deadline = asyncio.get_running_loop().time() + self._drain_timeout_s
+        consumers, self._consumers = self._consumers, []
+        if consumers:
+            _, stuck = await asyncio.wait(consumers, timeout=self._drain_timeout_s)
+            for consumer in stuck:
+                consumer.cancel()
+            await asyncio.gather(*consumers, return_exceptions=True)
+        if not self._in_flight:
+            return 0
+        remaining = max(0.0, deadline - asyncio.get_running_loop().time())
+        _, pending = await asyncio.wait(set(self._in_flight), timeout=remaining)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning("worker_pool.drain_abandoned", tasks=len(pending))
+        return len(pending)
+
+    async def serve(self) -> None:
+        """Run until SIGINT or SIGTERM, then drain.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+        loop = asyncio.get_running_loop()
+        stopped = asyncio.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stopped.set)
+        await self.start()
+        try:
+            await stopped.wait()
+        finally:
+            await self.drain()
+
+    async def _consume(self, worker: Worker, offset: int) -> None:
+        capacity = self._capacity
+        if capacity is None:
+            return
+        turn = offset
+        while not self._stopping:
+            granted = await capacity.reserve(self._batch_size)
+            if self._stopping:
+                capacity.release(granted)
+                return
+            tenant_id = self._tenants[turn % len(self._tenants)]
+            turn += 1
+            try:
+                tasks = await self._queue.dequeue(
+                    tenant_id, batch_size=granted, worker_id=worker.worker_id
+                )
+            except Exception as exc:
+                capacity.release(granted)
+                logger.warning("worker_pool.dequeue_failed", tenant_id=tenant_id, error=str(exc))
+                await asyncio.sleep(self._idle_sleep_s)
+                continue
+            capacity.release(granted - len(tasks))
+            for task in tasks:
+                handle = asyncio.create_task(self._process(worker, tenant_id, task, capacity))
+                self._in_flight.add(handle)
+                handle.add_done_callback(self._in_flight.discard)
+            if not tasks:
+                await asyncio.sleep(self._idle_sleep_s)
+
+    async def _process(
+        self, worker: Worker, tenant_id: TenantId, task: Task, capacity: _Capacity
+    ) -> None:
+        # Results go to the result sink; a failed task is left unacknowledged
+        # and dequeue_pending retries it.
+        try:
+            await worker.process_tasks(tenant_id, [task])
+        except Exception as exc:
+            logger.warning(
+                "worker_pool.task_failed", tenant_id=tenant_id, task_id=task.task_id, error=str(exc)
+            )
+        finally:
+            capacity.release()
+
+
+def run_worker_processes(factory: Callable[[], WorkerPool], processes: int) -> None:
+    """Run ``processes`` worker pools in separate processes until they exit.
+
+    Each child builds its own pool (and queue/LLM clients) from ``factory``
+    and serves until it receives SIGINT or SIGTERM, so terminating the
+    parent's process group drains every pool.
+
+    Args:
+        factory: Picklable zero-argument callable building a pool.
+        processes: Number of child processes.
+
+    Returns:
+        None.
+
+    Raises:
+        ValueError: If ``processes`` is less than 1.
+    """
+    if processes < 1:
+        raise ValueError("processes must be at least 1")
+    context = multiprocessing.get_context("spawn")
+    children = [
+        context.Process(target=_serve_in_process, args=(factory,), name=f"worker-pool-{n}")
+        for n in range(processes)
+    ]
+    for child in children:
+        child.start()
+    try:
+        for child in children:
+            child.join()
+    except KeyboardInterrupt:
+        for child in children:
+            with contextlib.suppress(ProcessLookupError):
+                child.terminate()
+        for child in children:
+            child.join()
+
+
+def _serve_in_process(factory: Callable[[], WorkerPool]) -> None:
+    async def main() -> None:
+        await factory().serve()
+
+    asyncio.run(main())
@@ -1,11 +1,22 @@
 """Skill framework for Project Chimera."""
 
 from chimera.skills.base import Skill
+from chimera.skills.bindings import BindingError
 from chimera.skills.models import SkillContext, SkillRunRecord, SkillRunStatus
 from chimera.skills.registry import SkillRegistry
-from chimera.skills.workflow import SkillWorkflowRunner, WorkflowDefinition, WorkflowRunResult, WorkflowStep
+from chimera.skills.workflow import (
+    CompiledStep,
+    SkillWorkflowRunner,
+    WorkflowDefinition,
+    WorkflowExecutionMode,
+    WorkflowPlan,
+    WorkflowRunResult,
+    WorkflowStep,
+)
 
 __all__ = [
+    "BindingError",
+    "CompiledStep",
     "Skill",
     "SkillContext",
     "SkillRegistry",
@@ -13,6 +24,8 @@ __all__ = [
     "SkillRunStatus",
     "SkillWorkflowRunner",
     "WorkflowDefinition",
+    "WorkflowExecutionMode",
+    "WorkflowPlan",
     "WorkflowRunResult",
     "WorkflowStep",
 ]
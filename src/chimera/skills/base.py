@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import ClassVar, Generic, TypeVar
+from typing import TYPE_CHECKING, ClassVar, Generic, TypeVar
 
 from pydantic import BaseModel
 
-from chimera.skills.models import SkillContext
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from chimera.skills.models import SkillContext
 
 InputT = TypeVar("InputT", bound=BaseModel)
 OutputT = TypeVar("OutputT", bound=BaseModel)
@@ -20,6 +24,11 @@ class Skill(Generic[InputT, OutputT], ABC):
     Each skill validates input/output using Pydantic models and executes within a
     shared execution context.
 
+    Skills that keep no per-run state may set ``stateless = True`` so compiled
+    workflow plans can share a single instance across runs. Skills with a
+    native ``run_batch`` set ``supports_batch = True`` so the parallel workflow
+    runner coalesces sibling steps into a single batched call.
+
     Args:
         None.
 
@@ -34,6 +43,8 @@ class Skill(Generic[InputT, OutputT], ABC):
     description: ClassVar[str]
     input_model: ClassVar[type[InputT]]
     output_model: ClassVar[type[OutputT]]
+    stateless: ClassVar[bool] = False
+    supports_batch: ClassVar[bool] = False
 
     @abstractmethod
     async def run(self, payload: InputT, context: SkillContext) -> OutputT:
@@ -47,3 +58,22 @@ class Skill(Generic[InputT, OutputT], ABC):
             The validated output model.
         """
         raise NotImplementedError
+
+    async def run_batch(self, payloads: Sequence[InputT], context: SkillContext) -> list[OutputT]:
+        """Run the skill for many payloads sharing one execution context.
+
+        The default implementation runs ``run`` concurrently for every payload.
+        Skills that can process a batch in one pass, or coalesce it into one
+        upstream call, should override it and set ``supports_batch``.
+
+        Args:
+            payloads: Validated input data.
+            context: Execution context for MCP access and tracing.
+
+        Returns:
+            The output models, in payload order.
+
+        Raises:
+            Exception: The first exception raised by any payload.
+        """
+        return list(await asyncio.gather(*(self.run(payload, context) for payload in payloads)))
@@ -0,0 +1,96 @@
+"""Step-to-step data bindings for skill workflows.
+
+A binding is a string of the form ``${steps.<step_id>}`` or
+``${steps.<step_id>.<path>}``. Bindings are resolved against the live output
+models of earlier steps, so values flow between skills without a
+``model_dump``/``model_validate`` round trip.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping, Sequence
+
+from pydantic import BaseModel
+
+BINDING_PATTERN = re.compile(r"\$\{steps\.([A-Za-z0-9_\-]+)((?:\.[A-Za-z0-9_\-]+)*)\}")
+
+
+class BindingError(ValueError):
+    """Raised when a binding expression cannot be resolved."""
+
+
+def find_references(value: object) -> set[str]:
+    """Collect the step IDs referenced by bindings inside a value.
+
+    Args:
+        value: A step input (string, list or dict, possibly nested).
+
+    Returns:
+        The set of referenced step IDs.
+
+    Raises:
+        None.
+    """
+    if isinstance(value, str):
+        return {match.group(1) for match in BINDING_PATTERN.finditer(value)}
+    if isinstance(value, Mapping):
+        return set().union(*(find_references(item) for item in value.values()))
+    if isinstance(value, list):
+        return set().union(*(find_references(item) for item in value))
+    return set()
+
+
+def resolve_bindings(value: object, outputs: Mapping[str, BaseModel]) -> object:
+    """Replace binding expressions with values from earlier step outputs.
+
+    A string that is exactly one binding resolves to the referenced object
+    itself (a model, list, number, ...). Bindings embedded in a longer string
+    are interpolated with ``str()``.
+
+    Args:
+        value: A step input (string, list or dict, possibly nested).
+        outputs: Output models keyed by step ID.
+
+    Returns:
+        The value with every binding resolved.
+
+    Raises:
+        BindingError: If a referenced step or path does not exist.
+    """
+    if isinstance(value, str):
+        match = BINDING_PATTERN.fullmatch(value)
+        if match is not None:
+            return _lookup(match, outputs)
+        if "${" not in value:
+            return value
+        return BINDING_PATTERN.sub(lambda found: str(_lookup(found, outputs)), value)
+    if isinstance(value, Mapping):
+        return {key: resolve_bindings(item, outputs) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve_bindings(item, outputs) for item in value]
+    return value
+
+
+def _lookup(match: re.Match[str], outputs: Mapping[str, BaseModel]) -> object:
+    step_id, path = match.group(1), match.group(2)
+    if step_id not in outputs:
+        raise BindingError(f"Binding '{match.group(0)}' references step '{step_id}' with no output")
+    current: object = outputs[step_id]
+    for part in path.split(".")[1:]:
+        current = _walk(current, part, match.group(0))
+    return current
+
+
+def _walk(current: object, part: str, expression: str) -> object:
+    if isinstance(current, BaseModel):
+        if part in type(current).model_fields:
+            return getattr(current, part)
+    elif isinstance(current, Mapping):
+        if part in current:
+            return current[part]
+    elif isinstance(current, Sequence) and not isinstance(current, str) and part.isdigit():
+        index = int(part)
+        if index < len(current):
+            return current[index]
+    raise BindingError(f"Binding '{expression}' has no attribute '{part}'")
@@ -50,8 +50,10 @@ class SkillRunRecord(BaseModel):
 
     Attributes:
         skill_name: Skill identifier.
+        step_id: Workflow step identifier, if the step declared one.
         status: Outcome status.
-        output: Output payload captured as a dict.
+        output: Output payload captured as a dict. The live output model
+            stays with the runner; see ``WorkflowRunResult.output_of``.
         error: Optional error message for failures.
         completed_at: Completion timestamp.
 
@@ -68,7 +70,33 @@ class SkillRunRecord(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     skill_name: str
+    step_id: str | None = None
     status: SkillRunStatus
     output: dict[str, object]
     error: str | None = None
     completed_at: datetime
+
+
+class SkillImportTiming(BaseModel):
+    """Import cost of a lazily loaded skill.
+
+    Attributes:
+        skill_name: Skill identifier.
+        target: Import target in ``module:ClassName`` form.
+        seconds: Wall-clock time spent importing the target.
+
+    Args:
+        None.
+
+    Returns:
+        None.
+
+    Raises:
+        None.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    skill_name: str
+    target: str
+    seconds: float
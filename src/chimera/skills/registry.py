@@ -2,20 +2,35 @@
 
 from __future__ import annotations
 
-from typing import TypeVar
+import importlib
+import json
+import time
+from importlib.metadata import entry_points
+from typing import TYPE_CHECKING, TypeVar
 
 from pydantic import BaseModel
 
 from chimera.skills.base import Skill
+from chimera.skills.models import SkillImportTiming
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 InputT = TypeVar("InputT", bound=BaseModel)
 OutputT = TypeVar("OutputT", bound=BaseModel)
 SkillType = type[Skill[BaseModel, BaseModel]]
 
+ENTRY_POINT_GROUP = "chimera.skills"
+
 
 class SkillRegistry:
     """In-memory registry of available skills.
 
+    Skills can be registered eagerly as classes, or lazily as ``module:Class``
+    targets (from ``skills.json`` or package entry points). A lazy skill's
+    module is imported on first ``get``/``create`` and its import cost is
+    recorded for ``import_report``.
+
     Args:
         None.
 
@@ -28,6 +43,8 @@ class SkillRegistry:
 
     def __init__(self) -> None:
         self._skills: dict[str, SkillType] = {}
+        self._lazy: dict[str, str] = {}
+        self._import_timings: dict[str, SkillImportTiming] = {}
 
     def register(self, skill_cls: type[Skill[InputT, OutputT]]) -> type[Skill[InputT, OutputT]]:
         """Register a skill class by name.
@@ -42,13 +59,73 @@ class SkillRegistry:
             ValueError: If a skill with the same name already exists.
         """
         name = skill_cls.name
-        if name in self._skills:
-            raise ValueError(f"Skill '{name}' is already registered")
+        self._ensure_unique(name)
         self._skills[name] = skill_cls
         return skill_cls
 
+    def register_lazy(self, name: str, target: str) -> None:
+        """Register a skill by import target without importing it.
+
+        Args:
+            name: Skill name.
+            target: Import target in entry-point form, ``package.module:ClassName``.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If the name is taken or the target is malformed.
+        """
+        module, _, attr = target.partition(":")
+        if not module or not attr:
+            raise ValueError(f"Skill target '{target}' must look like 'module:ClassName'")
+        self._ensure_unique(name)
+        self._lazy[name] = target
+
+    def load_manifest(self, path: Path) -> list[str]:
+        """Lazily register every skill declared in a ``skills.json`` manifest.
+
+        Entries without a ``implementation.python`` block are skipped.
+
+        Args:
+            path: Path to the manifest.
+
+        Returns:
+            Names of the registered skills.
+
+        Raises:
+            ValueError: If a skill name is already registered.
+        """
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        names: list[str] = []
+        for entry in manifest.get("skills", []):
+            python = entry.get("implementation", {}).get("python")
+            if python is None:
+                continue
+            self.register_lazy(entry["name"], f"{python['module']}:{python['class']}")
+            names.append(entry["name"])
+        return names
+
+    def load_entry_points(self, group: str = ENTRY_POINT_GROUP) -> list[str]:
+        """Lazily register skills advertised by installed packages.
+
+        Args:
+            group: Entry point group to scan.
+
+        Returns:
+            Names of the registered skills.
+
+        Raises:
+            ValueError: If a skill name is already registered.
+        """
+        names: list[str] = []
+        for entry_point in entry_points(group=group):
+            self.register_lazy(entry_point.name, entry_point.value)
+            names.append(entry_point.name)
+        return names
+
     def get(self, name: str) -> SkillType:
-        """Fetch a skill class by name.
+        """Fetch a skill class by name, importing it on first use.
 
         Args:
             name: Skill name.
@@ -58,10 +135,17 @@ class SkillRegistry:
 
         Raises:
             KeyError: If the skill does not exist.
+            TypeError: If a lazy target does not resolve to a matching Skill subclass.
         """
-        if name not in self._skills:
+        skill_cls = self._skills.get(name)
+        if skill_cls is not None:
+            return skill_cls
+        if name not in self._lazy:
             raise KeyError(f"Skill '{name}' is not registered")
-        return self._skills[name]
+        skill_cls = self._import(name, self._lazy[name])
+        self._skills[name] = skill_cls
+        del self._lazy[name]
+        return skill_cls
 
     def create(self, name: str) -> Skill[BaseModel, BaseModel]:
         """Instantiate a skill by name.
@@ -79,7 +163,7 @@ class SkillRegistry:
         return skill_cls()
 
     def list_names(self) -> list[str]:
-        """List registered skill names.
+        """List registered skill names, including ones not imported yet.
 
         Returns:
             Sorted list of skill names.
@@ -87,4 +171,49 @@ class SkillRegistry:
         Raises:
             None.
         """
-        return sorted(self._skills.keys())
+        return sorted(self._skills.keys() | self._lazy.keys())
+
+    def load_all(self) -> list[SkillImportTiming]:
+        """Import every lazily registered skill.
+
+        Useful at build or deploy time to measure the full import cost.
+
+        Returns:
+            The import report after loading.
+
+        Raises:
+            KeyError: If a skill cannot be resolved.
+        """
+        for name in list(self._lazy):
+            self.get(name)
+        return self.import_report()
+
+    def import_report(self) -> list[SkillImportTiming]:
+        """Report the import cost of lazily loaded skills, most expensive first.
+
+        Returns:
+            One timing per skill imported so far.
+
+        Raises:
+            None.
+        """
+        return sorted(self._import_timings.values(), key=lambda timing: -timing.seconds)
+
+    def _ensure_unique(self, name: str) -> None:
+        if name in self._skills or name in self._lazy:
+            raise ValueError(f"Skill '{name}' is already registered")
+
+    def _import(self, name: str, target: str) -> SkillType:
+        module_name, _, attr = target.partition(":")
+        started = time.perf_counter()
+        module = importlib.import_module(module_name)
+        skill_cls = getattr(module, attr)
+        seconds = time.perf_counter() - started
+        if not (isinstance(skill_cls, type) and issubclass(skill_cls, Skill)):
+            raise TypeError(f"Skill target '{target}' is not a Skill subclass")
+        if skill_cls.name != name:
+            raise TypeError(f"Skill target '{target}' is named '{skill_cls.name}', not '{name}'")
+        self._import_timings[name] = SkillImportTiming(
+            skill_name=name, target=target, seconds=seconds
+        )
+        return skill_cls
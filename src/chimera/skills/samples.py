@@ -6,28 +6,47 @@ This module keeps helper functions that register built-ins and build example wor
 
 from __future__ import annotations
 
-from chimera.models.types import TenantId, TraceId
+from importlib import resources
+from pathlib import Path
+from typing import TYPE_CHECKING
+
 from chimera.skills.models import SkillContext
-from chimera.skills.registry import SkillRegistry
-from chimera.skills.skills import EchoSkill, McpToolSkill, NormalizeHandleSkill
 from chimera.skills.workflow import WorkflowDefinition, WorkflowStep
 
+if TYPE_CHECKING:
+    from chimera.models.types import TenantId, TraceId
+    from chimera.skills.registry import SkillRegistry
+
+
+def _default_manifest() -> Path:
+    # Wheels carry the manifest as package data; source checkouts keep it at the repo root.
+    packaged = resources.files("chimera.skills") / "skills.json"
+    if packaged.is_file():
+        return Path(str(packaged))
+    return Path(__file__).resolve().parents[3] / "skills.json"
+
+
+SKILLS_MANIFEST = _default_manifest()
+
+
+def register_sample_skills(registry: SkillRegistry, manifest: Path = SKILLS_MANIFEST) -> None:
+    """Register the skills declared in the manifest and by installed plugins.
 
-def register_sample_skills(registry: SkillRegistry) -> None:
-    """Register built-in sample skills.
+    Skills are registered lazily; each module is imported on first use.
 
     Args:
         registry: Registry to update.
+        manifest: ``skills.json`` manifest listing the built-in skills.
 
     Returns:
         None.
 
     Raises:
+        OSError: If the manifest cannot be read.
         ValueError: If a skill is registered more than once.
     """
-    registry.register(EchoSkill)
-    registry.register(NormalizeHandleSkill)
-    registry.register(McpToolSkill)
+    registry.load_manifest(manifest)
+    registry.load_entry_points()
 
 
 def build_sample_workflow(
@@ -1,16 +1,35 @@
 """Built-in skills.
 
 Each skill is defined in its own module to keep contracts and dependencies
-explicit and easy to discover.
+explicit and easy to discover. Modules are imported lazily on attribute access
+so that importing this package does not pay for every skill up front.
 """
 
-from chimera.skills.skills.echo import EchoInput, EchoOutput, EchoSkill
-from chimera.skills.skills.mcp_tool import McpToolInput, McpToolOutput, McpToolSkill
-from chimera.skills.skills.normalize_handle import (
-    NormalizeHandleInput,
-    NormalizeHandleOutput,
-    NormalizeHandleSkill,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from chimera.skills.skills.echo import EchoInput, EchoOutput, EchoSkill
+    from chimera.skills.skills.mcp_tool import McpToolInput, McpToolOutput, McpToolSkill
+    from chimera.skills.skills.normalize_handle import (
+        NormalizeHandleInput,
+        NormalizeHandleOutput,
+        NormalizeHandleSkill,
+    )
+
+_EXPORTS: dict[str, str] = {
+    "EchoInput": "chimera.skills.skills.echo",
+    "EchoOutput": "chimera.skills.skills.echo",
+    "EchoSkill": "chimera.skills.skills.echo",
+    "NormalizeHandleInput": "chimera.skills.skills.normalize_handle",
+    "NormalizeHandleOutput": "chimera.skills.skills.normalize_handle",
+    "NormalizeHandleSkill": "chimera.skills.skills.normalize_handle",
+    "McpToolInput": "chimera.skills.skills.mcp_tool",
+    "McpToolOutput": "chimera.skills.skills.mcp_tool",
+    "McpToolSkill": "chimera.skills.skills.mcp_tool",
+}
 
 __all__ = [
     "EchoInput",
@@ -23,3 +42,10 @@ __all__ = [
     "McpToolOutput",
     "McpToolSkill",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
@@ -5,10 +5,14 @@ Deterministic, side-effect free skill used as a checkpoint and runtime smoke tes
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from pydantic import BaseModel, Field
 
 from chimera.skills.base import Skill
-from chimera.skills.models import SkillContext
+
+if TYPE_CHECKING:
+    from chimera.skills.models import SkillContext
 
 
 class EchoInput(BaseModel):
@@ -30,6 +34,7 @@ class EchoSkill(Skill[EchoInput, EchoOutput]):
     description = "Echo back a provided message."
     input_model = EchoInput
     output_model = EchoOutput
+    stateless = True
 
     async def run(self, payload: EchoInput, context: SkillContext) -> EchoOutput:
         _ = context
@@ -5,10 +5,20 @@ Provides a consistent skill surface for invoking arbitrary MCP tools.
 
 from __future__ import annotations
 
+import asyncio
+from typing import TYPE_CHECKING
+
 from pydantic import BaseModel, Field
 
+from chimera.services.mcp_pool import get_default_pool
 from chimera.skills.base import Skill
-from chimera.skills.models import SkillContext
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from chimera.models.mcp import ToolResult
+    from chimera.ports.mcp import MCPClientPort
+    from chimera.skills.models import SkillContext
 
 
 class McpToolInput(BaseModel):
@@ -27,16 +37,55 @@ class McpToolOutput(BaseModel):
 
 
 class McpToolSkill(Skill[McpToolInput, McpToolOutput]):
-    """Invoke an MCP tool through the active MCP client."""
+    """Invoke an MCP tool through the active MCP client.
+
+    A client injected through ``SkillContext`` wins; otherwise the call borrows
+    a warm session from the process-wide MCP pool, reading read-only tools
+    through the pool's tenant-scoped result cache.
+    """
 
     name = "mcp_tool"
     description = "Invoke an MCP tool using the active MCP client."
     input_model = McpToolInput
     output_model = McpToolOutput
+    stateless = True
+    supports_batch = True
 
     async def run(self, payload: McpToolInput, context: SkillContext) -> McpToolOutput:
-        if context.mcp_client is None:
-            raise RuntimeError("MCP client is required for mcp_tool skill")
+        result = await _client(context).call_tool(payload.tool_name, payload.arguments)
+        return _to_output(result)
+
+    async def run_batch(
+        self, payloads: Sequence[McpToolInput], context: SkillContext
+    ) -> list[McpToolOutput]:
+        client = _client(context)
+
+        # Group calls to the same tool so the client can pipeline them together.
+        by_tool: dict[str, list[int]] = {}
+        for index, payload in enumerate(payloads):
+            by_tool.setdefault(payload.tool_name, []).append(index)
+
+        async def call(tool_name: str, indexes: list[int]) -> list[ToolResult]:
+            return await client.call_tool_batch(
+                tool_name, [payloads[index].arguments for index in indexes]
+            )
+
+        batches = await asyncio.gather(*(call(name, idx) for name, idx in by_tool.items()))
+        outputs: list[McpToolOutput | None] = [None] * len(payloads)
+        for indexes, results in zip(by_tool.values(), batches, strict=True):
+            for index, result in zip(indexes, results, strict=True):
+                outputs[index] = _to_output(result)
+        return [output for output in outputs if output is not None]
+
+
+def _client(context: SkillContext) -> MCPClientPort:
+    if context.mcp_client is not None:
+        return context.mcp_client
+    pool = get_default_pool()
+    if pool is None:
+        raise RuntimeError("MCP client is required for mcp_tool skill")
+    return pool.for_tenant(context.tenant_id)
+
 
-        result = await context.mcp_client.call_tool(payload.tool_name, payload.arguments)
-        return McpToolOutput(response={"content": result.content, "is_error": result.is_error})
+def _to_output(result: ToolResult) -> McpToolOutput:
+    return McpToolOutput(response={"content": result.content, "is_error": result.is_error})
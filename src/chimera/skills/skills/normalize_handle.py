@@ -5,10 +5,16 @@ Canonicalizes social handles into an '@handle' string.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from pydantic import BaseModel, Field
 
 from chimera.skills.base import Skill
-from chimera.skills.models import SkillContext
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from chimera.skills.models import SkillContext
 
 
 class NormalizeHandleInput(BaseModel):
@@ -30,12 +36,23 @@ class NormalizeHandleSkill(Skill[NormalizeHandleInput, NormalizeHandleOutput]):
     description = "Normalize a social handle into a canonical format."
     input_model = NormalizeHandleInput
     output_model = NormalizeHandleOutput
+    stateless = True
+    supports_batch = True
 
     async def run(
         self, payload: NormalizeHandleInput, context: SkillContext
     ) -> NormalizeHandleOutput:
         _ = context
-        normalized = payload.handle.strip()
-        if not normalized.startswith("@"):  # simple canonicalization
-            normalized = f"@{normalized}"
-        return NormalizeHandleOutput(handle=normalized)
+        return NormalizeHandleOutput(handle=_normalize(payload.handle))
+
+    async def run_batch(
+        self, payloads: Sequence[NormalizeHandleInput], context: SkillContext
+    ) -> list[NormalizeHandleOutput]:
+        _ = context
+        return [NormalizeHandleOutput(handle=_normalize(payload.handle)) for payload in payloads]
+
+
+def _normalize(handle: str) -> str:
+    normalized = handle.strip()
+    # simple canonicalization
+    return normalized if normalized.startswith("@") else f"@{normalized}"
@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass
 from datetime import datetime
+from enum import StrEnum
+from typing import TYPE_CHECKING
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
 
+from chimera.skills.bindings import BINDING_PATTERN, find_references, resolve_bindings
 from chimera.skills.models import SkillContext, SkillRunRecord, SkillRunStatus
-from chimera.skills.registry import SkillRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
+    from chimera.skills.base import Skill
+    from chimera.skills.registry import SkillRegistry, SkillType
 
 
 class WorkflowStep(BaseModel):
@@ -15,7 +26,11 @@ class WorkflowStep(BaseModel):
 
     Attributes:
         skill_name: Skill identifier.
-        input: Raw input payload for the skill.
+        input: Raw input payload for the skill. Values may contain bindings such as
+            ``${steps.normalize.handle}``; the whole input may also be a single binding
+            that hands an earlier step's output model straight to this skill.
+        step_id: Optional identifier other steps can depend on.
+        depends_on: Step IDs of earlier steps that must succeed first.
 
     Args:
         None.
@@ -30,7 +45,22 @@ class WorkflowStep(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     skill_name: str
-    input: dict[str, object] = Field(default_factory=dict)
+    input: dict[str, object] | str = Field(default_factory=dict)
+    step_id: str | None = None
+    depends_on: list[str] = Field(default_factory=list)
+
+    @field_validator("input")
+    @classmethod
+    def validate_input_binding(cls, value: dict[str, object] | str) -> dict[str, object] | str:
+        """Ensure a string input is a single binding expression."""
+        if isinstance(value, str) and BINDING_PATTERN.fullmatch(value) is None:
+            raise ValueError("A string step input must be a single '${steps.<id>...}' binding")
+        return value
+
+    @property
+    def dependencies(self) -> set[str]:
+        """Step IDs this step waits for: explicit dependencies plus bound steps."""
+        return set(self.depends_on) | find_references(self.input)
 
 
 class WorkflowDefinition(BaseModel):
@@ -55,6 +85,23 @@ class WorkflowDefinition(BaseModel):
     workflow_id: str
     steps: list[WorkflowStep]
 
+    @model_validator(mode="after")
+    def validate_dependencies(self) -> WorkflowDefinition:
+        """Ensure step IDs are unique and dependencies point at earlier steps."""
+        seen: set[str] = set()
+        for step in self.steps:
+            for dependency in sorted(step.dependencies):
+                if dependency not in seen:
+                    raise ValueError(
+                        f"Step '{step.step_id or step.skill_name}' depends on unknown or later "
+                        f"step '{dependency}'"
+                    )
+            if step.step_id is not None:
+                if step.step_id in seen:
+                    raise ValueError(f"Duplicate step_id '{step.step_id}'")
+                seen.add(step.step_id)
+        return self
+
 
 class WorkflowRunResult(BaseModel):
     """Captured outputs for a workflow execution.
@@ -74,59 +121,394 @@ class WorkflowRunResult(BaseModel):
     workflow_id: str
     steps: list[SkillRunRecord]
 
+    _outputs: dict[str, BaseModel] = PrivateAttr(default_factory=dict)
+
+    def output_of(self, step_id: str) -> BaseModel:
+        """Return the live output model of a succeeded step.
+
+        Args:
+            step_id: Step identifier.
+
+        Returns:
+            The validated output model produced by the step.
+
+        Raises:
+            KeyError: If the step has no recorded output.
+        """
+        if step_id not in self._outputs:
+            raise KeyError(f"Step '{step_id}' has no output")
+        return self._outputs[step_id]
+
+
+class WorkflowExecutionMode(StrEnum):
+    """How the runner schedules workflow steps."""
+
+    SEQUENTIAL = "sequential"
+    PARALLEL = "parallel"
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledStep:
+    """A workflow step with its skill resolved and its input validator bound.
+
+    Attributes:
+        step: The source step definition.
+        skill_cls: Resolved skill class.
+        instance: Shared skill instance for stateless skills, otherwise None.
+        input_model: Input validation model of the skill.
+        payload: Input validated at compile time for steps without bindings.
+        dependencies: Sorted IDs of the steps this step waits for.
+    """
+
+    step: WorkflowStep
+    skill_cls: SkillType
+    instance: Skill[BaseModel, BaseModel] | None
+    input_model: type[BaseModel]
+    payload: BaseModel | None
+    dependencies: tuple[str, ...]
+
+    def skill(self) -> Skill[BaseModel, BaseModel]:
+        """Return the shared instance or a fresh one for stateful skills."""
+        return self.instance if self.instance is not None else self.skill_cls()
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowPlan:
+    """Immutable execution plan produced by ``SkillWorkflowRunner.compile``.
+
+    A plan is safe to share across concurrent runs: static payloads and
+    stateless skill instances are reused and must be treated as read-only.
+
+    Attributes:
+        workflow_id: Workflow identifier.
+        steps: Compiled steps in definition order.
+        groups: Step indexes scheduled together in parallel mode. Sibling steps of a
+            ``supports_batch`` skill with identical dependencies share one group and
+            run as a single ``run_batch`` call; every other step is its own group.
+    """
+
+    workflow_id: str
+    steps: tuple[CompiledStep, ...]
+    groups: tuple[tuple[int, ...], ...]
+
 
 class SkillWorkflowRunner:
     """Executes workflow definitions using the skill registry.
 
+    In sequential mode steps run one after another in definition order. In
+    parallel mode steps form a DAG through ``depends_on`` and every step whose
+    dependencies have succeeded runs concurrently, bounded by ``max_concurrency``.
+    Sibling steps of a ``supports_batch`` skill run as one ``run_batch`` call that
+    occupies a single concurrency slot.
+
     Args:
-        None.
+        registry: Registry used to resolve skills.
+        mode: Step scheduling mode.
+        max_concurrency: Maximum number of steps in flight in parallel mode.
 
     Returns:
         None.
 
     Raises:
-        None.
+        ValueError: If max_concurrency is less than 1.
     """
 
-    def __init__(self, registry: SkillRegistry) -> None:
+    def __init__(
+        self,
+        registry: SkillRegistry,
+        mode: WorkflowExecutionMode = WorkflowExecutionMode.SEQUENTIAL,
+        max_concurrency: int = 8,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
         self._registry = registry
+        self._mode = mode
+        self._max_concurrency = max_concurrency
+
+    def compile(self, definition: WorkflowDefinition) -> WorkflowPlan:
+        """Compile a workflow definition into a reusable execution plan.
+
+        Skill names are resolved up front, stateless skills are instantiated
+        once, and inputs without bindings are validated once.
+
+        Args:
+            definition: Workflow definition to compile.
+
+        Returns:
+            An immutable WorkflowPlan.
 
-    async def run(self, definition: WorkflowDefinition, context: SkillContext) -> WorkflowRunResult:
-        """Run the workflow sequentially.
+        Raises:
+            KeyError: If a step references an unregistered skill.
+            pydantic.ValidationError: If a static step payload fails input validation.
+        """
+        compiled: list[CompiledStep] = []
+        instances: dict[str, Skill[BaseModel, BaseModel]] = {}
+        groups: dict[tuple[str, tuple[str, ...]] | int, list[int]] = {}
+        for index, step in enumerate(definition.steps):
+            skill_cls = self._registry.get(step.skill_name)
+            if skill_cls.stateless and step.skill_name not in instances:
+                instances[step.skill_name] = skill_cls()
+            payload = None
+            if not find_references(step.input):
+                payload = skill_cls.input_model.model_validate(step.input)
+            compiled.append(
+                CompiledStep(
+                    step=step,
+                    skill_cls=skill_cls,
+                    instance=instances.get(step.skill_name),
+                    input_model=skill_cls.input_model,
+                    payload=payload,
+                    dependencies=tuple(sorted(step.dependencies)),
+                )
+            )
+            key = (
+                (step.skill_name, compiled[-1].dependencies) if skill_cls.supports_batch else index
+            )
+            groups.setdefault(key, []).append(index)
+        return WorkflowPlan(
+            workflow_id=definition.workflow_id,
+            steps=tuple(compiled),
+            groups=tuple(tuple(group) for group in groups.values()),
+        )
+
+    async def run(
+        self, definition: WorkflowDefinition | WorkflowPlan, context: SkillContext
+    ) -> WorkflowRunResult:
+        """Run a workflow using the configured execution mode.
 
         Args:
-            definition: Workflow definition to execute.
+            definition: Workflow definition, or a plan from ``compile`` to skip compilation.
             context: Skill execution context.
 
         Returns:
-            WorkflowRunResult containing outputs of each step.
+            WorkflowRunResult containing outputs of each executed step, in definition order.
+
+        Raises:
+            KeyError: If a step references an unregistered skill.
+            pydantic.ValidationError: If a step payload fails input validation.
+            BindingError: If a step input binding cannot be resolved.
+        """
+        plan = definition if isinstance(definition, WorkflowPlan) else self.compile(definition)
+        outputs: dict[str, BaseModel] = {}
+        if self._mode is WorkflowExecutionMode.PARALLEL:
+            results = await self._run_parallel(plan, context, outputs)
+        else:
+            results = await self._run_sequential(plan, context, outputs)
+        run_result = WorkflowRunResult(workflow_id=plan.workflow_id, steps=results)
+        run_result._outputs = outputs
+        return run_result
+
+    async def run_many(
+        self,
+        definition: WorkflowDefinition | WorkflowPlan,
+        contexts: Iterable[SkillContext],
+        max_concurrency: int = 64,
+        per_tenant_concurrency: int = 8,
+    ) -> AsyncIterator[tuple[SkillContext, WorkflowRunResult]]:
+        """Run one workflow for many contexts, streaming results as they complete.
+
+        The definition is compiled once and the plan is shared by every run.
+        Contexts are consumed lazily; contexts whose tenant is at its cap wait
+        in a bounded backlog while other tenants keep the global slots busy.
+
+        Args:
+            definition: Workflow definition or compiled plan to execute.
+            contexts: Execution contexts, one run each.
+            max_concurrency: Maximum number of runs in flight overall.
+            per_tenant_concurrency: Maximum number of runs in flight per tenant.
+
+        Yields:
+            ``(context, result)`` pairs in completion order.
 
         Raises:
+            ValueError: If a concurrency limit is less than 1.
             pydantic.ValidationError: If a step payload fails input validation.
+            BindingError: If a step input binding cannot be resolved.
         """
+        if max_concurrency < 1 or per_tenant_concurrency < 1:
+            raise ValueError("Concurrency limits must be at least 1")
+        plan = definition if isinstance(definition, WorkflowPlan) else self.compile(definition)
+        source = iter(contexts)
+        exhausted = False
+        backlog: defaultdict[str, deque[SkillContext]] = defaultdict(deque)
+        backlog_size = 0
+        max_backlog = max_concurrency * 4
+        active: Counter[str] = Counter()
+        in_flight: dict[asyncio.Task[WorkflowRunResult], SkillContext] = {}
+
+        def next_from_backlog() -> SkillContext | None:
+            for tenant_id, waiting in backlog.items():
+                if active[tenant_id] < per_tenant_concurrency:
+                    context = waiting.popleft()
+                    if not waiting:
+                        del backlog[tenant_id]
+                    return context
+            return None
+
+        try:
+            while True:
+                while len(in_flight) < max_concurrency:
+                    context = next_from_backlog()
+                    if context is not None:
+                        backlog_size -= 1
+                    else:
+                        if exhausted or backlog_size >= max_backlog:
+                            break
+                        context = next(source, None)
+                        if context is None:
+                            exhausted = True
+                            break
+                        if active[context.tenant_id] >= per_tenant_concurrency:
+                            backlog[context.tenant_id].append(context)
+                            backlog_size += 1
+                            continue
+                    active[context.tenant_id] += 1
+                    in_flight[asyncio.create_task(self.run(plan, context))] = context
+
+                # Backlogged tenants always have a run in flight, so this only ends the loop
+                # once the source and the backlog are both drained.
+                if not in_flight:
+                    return
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    context = in_flight.pop(task)
+                    active[context.tenant_id] -= 1
+                    if not active[context.tenant_id]:
+                        del active[context.tenant_id]
+                    yield context, task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    async def _run_sequential(
+        self,
+        plan: WorkflowPlan,
+        context: SkillContext,
+        outputs: dict[str, BaseModel],
+    ) -> list[SkillRunRecord]:
         results: list[SkillRunRecord] = []
-        for step in definition.steps:
-            skill = self._registry.create(step.skill_name)
-            payload = skill.input_model.model_validate(step.input)
-            try:
-                output = await skill.run(payload, context)
-                results.append(
-                    SkillRunRecord(
-                        skill_name=step.skill_name,
-                        status=SkillRunStatus.SUCCEEDED,
-                        output=output.model_dump(),
-                        completed_at=datetime.utcnow(),
-                    )
-                )
-            except Exception as exc:  # pragma: no cover - defensive capture
-                results.append(
-                    SkillRunRecord(
-                        skill_name=step.skill_name,
-                        status=SkillRunStatus.FAILED,
-                        output={},
-                        error=str(exc),
-                        completed_at=datetime.utcnow(),
-                    )
-                )
+        for compiled in plan.steps:
+            record = await self._run_step(compiled, context, outputs)
+            results.append(record)
+            if record.status is SkillRunStatus.FAILED:
                 break
-        return WorkflowRunResult(workflow_id=definition.workflow_id, steps=results)
+        return results
+
+    async def _run_parallel(
+        self,
+        plan: WorkflowPlan,
+        context: SkillContext,
+        outputs: dict[str, BaseModel],
+    ) -> list[SkillRunRecord]:
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        halted = asyncio.Event()
+        by_id: dict[str, tuple[asyncio.Task[list[SkillRunRecord] | None], int]] = {}
+        records: list[SkillRunRecord | None] = [None] * len(plan.steps)
+        tasks: list[asyncio.Task[list[SkillRunRecord] | None]] = []
+
+        async def run_group(
+            members: list[CompiledStep],
+            dependencies: list[tuple[asyncio.Task[list[SkillRunRecord] | None], int]],
+        ) -> list[SkillRunRecord] | None:
+            for dependency, position in dependencies:
+                upstream = await dependency
+                if upstream is None or upstream[position].status is SkillRunStatus.FAILED:
+                    return None
+            async with semaphore:
+                # A failure elsewhere halts the workflow: nothing new is started.
+                if halted.is_set():
+                    return None
+                if len(members) == 1:
+                    group_records = [await self._run_step(members[0], context, outputs)]
+                else:
+                    group_records = await self._run_batch(members, context, outputs)
+            if any(record.status is SkillRunStatus.FAILED for record in group_records):
+                halted.set()
+            return group_records
+
+        for group in plan.groups:
+            members = [plan.steps[index] for index in group]
+            # Group members share their dependencies, which always live in earlier groups.
+            dependencies = [by_id[step_id] for step_id in members[0].dependencies]
+            task = asyncio.create_task(run_group(members, dependencies))
+            tasks.append(task)
+            for position, member in enumerate(members):
+                if member.step.step_id is not None:
+                    by_id[member.step.step_id] = (task, position)
+
+        try:
+            group_results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        for group, group_records in zip(plan.groups, group_results, strict=True):
+            for index, record in zip(group, group_records or [], strict=False):
+                records[index] = record
+        return [record for record in records if record is not None]
+
+    async def _run_step(
+        self, compiled: CompiledStep, context: SkillContext, outputs: dict[str, BaseModel]
+    ) -> SkillRunRecord:
+        skill = compiled.skill()
+        payload = compiled.payload
+        if payload is None:
+            payload = self._bind_input(compiled, outputs)
+        try:
+            output = await skill.run(payload, context)
+        except Exception as exc:  # pragma: no cover - defensive capture
+            return self._record(compiled, outputs, error=exc)
+        return self._record(compiled, outputs, output=output)
+
+    async def _run_batch(
+        self, members: list[CompiledStep], context: SkillContext, outputs: dict[str, BaseModel]
+    ) -> list[SkillRunRecord]:
+        skill = members[0].skill()
+        payloads = [
+            member.payload if member.payload is not None else self._bind_input(member, outputs)
+            for member in members
+        ]
+        try:
+            batch_outputs = await skill.run_batch(payloads, context)
+        except Exception as exc:
+            return [self._record(member, outputs, error=exc) for member in members]
+        return [
+            self._record(member, outputs, output=output)
+            for member, output in zip(members, batch_outputs, strict=True)
+        ]
+
+    @staticmethod
+    def _record(
+        compiled: CompiledStep,
+        outputs: dict[str, BaseModel],
+        output: BaseModel | None = None,
+        error: Exception | None = None,
+    ) -> SkillRunRecord:
+        step = compiled.step
+        if output is None:
+            return SkillRunRecord(
+                skill_name=step.skill_name,
+                step_id=step.step_id,
+                status=SkillRunStatus.FAILED,
+                output={},
+                error=str(error),
+                completed_at=datetime.utcnow(),
+            )
+        if step.step_id is not None:
+            outputs[step.step_id] = output
+        return SkillRunRecord(
+            skill_name=step.skill_name,
+            step_id=step.step_id,
+            status=SkillRunStatus.SUCCEEDED,
+            output=output.model_dump(),
+            completed_at=datetime.utcnow(),
+        )
+
+    @staticmethod
+    def _bind_input(compiled: CompiledStep, outputs: dict[str, BaseModel]) -> BaseModel:
+        input_model = compiled.input_model
+        bound = resolve_bindings(compiled.step.input, outputs)
+        # Already-validated models are handed over as-is; no dump/validate round trip.
+        if isinstance(bound, input_model):
+            return bound
+        return input_model.model_validate(bound, from_attributes=isinstance(bound, BaseModel))
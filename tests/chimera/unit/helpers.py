@@ -0,0 +1,34 @@
+"""Test doubles and builders shared by the unit tests."""
+
+from datetime import UTC, datetime
+from typing import Any, Generic, TypeVar
+
+from chimera.models.task import Task
+
+T = TypeVar("T")
+
+
+class Clock(Generic[T]):  # noqa: UP046
+    """Clock that only moves when a test assigns ``now``."""
+
+    def __init__(self, now: T) -> None:
+        self.now = now
+
+    def __call__(self) -> T:
+        return self.now
+
+
+def make_task(task_id: str = "tk_1", **overrides: Any) -> Task:
+    """Build a valid task for the ``t_acme`` tenant; keyword arguments override fields."""
+    now = datetime.now(UTC)
+    fields: dict[str, Any] = {
+        "tenant_id": "t_acme",
+        "trace_id": "tr_1",
+        "task_id": task_id,
+        "kind": "test",
+        "input": {},
+        "created_at": now,
+        "updated_at": now,
+    }
+    fields.update(overrides)
+    return Task.model_validate(fields)
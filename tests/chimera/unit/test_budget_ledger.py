@@ -0,0 +1,222 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+import fakeredis.aioredis
+import pytest
+from sqlmodel import SQLModel
+
+from chimera.db.engine import Database, DatabaseConfig
+from chimera.db.repository import Repository
+from chimera.db.schema import BudgetConfig, Transaction
+from chimera.models.mcp import ToolResult
+from chimera.services.budget_ledger import (
+    BudgetExceededError,
+    BudgetLedger,
+    BudgetReconciler,
+    InMemoryBudgetLedger,
+    RedisBudgetLedger,
+)
+from chimera.services.commerce import CommerceManager
+from chimera.services.judge_policy import CFOJudge
+from tests.chimera.unit.helpers import Clock
+
+NOW = datetime(2026, 11, 20, 15, 30, tzinfo=UTC)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def ledger_and_clock(request: pytest.FixtureRequest) -> tuple[BudgetLedger, Clock[datetime]]:
+    clock = Clock(NOW)
+    if request.param == "memory":
+        return InMemoryBudgetLedger(hold_ttl_s=60, clock=clock), clock
+    return RedisBudgetLedger(fakeredis.aioredis.FakeRedis(), hold_ttl_s=60, clock=clock), clock
+
+
+@pytest.fixture
+async def database(tmp_path: Path) -> AsyncGenerator[Database, None]:
+    database = Database.from_config(
+        DatabaseConfig(url=f"sqlite+aiosqlite:///{tmp_path / 'chimera.db'}")
+    )
+    async with database.engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+    yield database
+    await database.dispose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reservations_never_exceed_the_limit(
+    ledger_and_clock: tuple[BudgetLedger, Clock[datetime]],
+) -> None:
+    ledger, _ = ledger_and_clock
+
+    outcomes = await asyncio.gather(
+        *(ledger.reserve("t_acme", Decimal("0.75"), Decimal("30.00")) for _ in range(100)),
+        return_exceptions=True,
+    )
+
+    accepted = [o for o in outcomes if not isinstance(o, BaseException)]
+    assert len(accepted) == 40
+    assert all(isinstance(o, BudgetExceededError) for o in outcomes if o not in accepted)
+    assert (await ledger.usage("t_acme")).reserved_usd == Decimal("30.00")
+    assert (await ledger.usage("t_other")).total_usd == Decimal("0.00")
+
+
+@pytest.mark.asyncio
+async def test_commit_release_and_expiry(
+    ledger_and_clock: tuple[BudgetLedger, Clock[datetime]],
+) -> None:
+    ledger, clock = ledger_and_clock
+    limit = Decimal("100.00")
+    spent = await ledger.reserve("t_acme", Decimal("40.00"), limit)
+    failed = await ledger.reserve("t_acme", Decimal("30.00"), limit)
+    abandoned = await ledger.reserve("t_acme", Decimal("30.00"), limit)
+
+    with pytest.raises(BudgetExceededError, match="Budget Exceeded"):
+        await ledger.reserve("t_acme", Decimal("0.01"), limit)
+    assert await ledger.commit(spent) is True
+    assert await ledger.release(failed) is True
+    assert await ledger.usage("t_acme") == await ledger.usage("t_acme", NOW.date())
+    assert (await ledger.usage("t_acme")).committed_usd == Decimal("40.00")
+
+    clock.now += timedelta(seconds=61)
+    usage = await ledger.usage("t_acme")
+    assert (usage.committed_usd, usage.reserved_usd) == (Decimal("40.00"), Decimal("0.00"))
+    # The hold expired, but an executed transfer still counts as spend.
+    assert await ledger.commit(abandoned) is False
+    assert (await ledger.usage("t_acme")).committed_usd == Decimal("70.00")
+
+    clock.now += timedelta(days=1)
+    assert (await ledger.usage("t_acme")).total_usd == Decimal("0.00")
+
+
+@pytest.mark.asyncio
+async def test_reconciler_overwrites_drift_from_executed_transactions(
+    database: Database,
+) -> None:
+    clock = Clock(NOW)
+    ledger = InMemoryBudgetLedger(clock=clock)
+    budget = BudgetConfig(tenant_id=uuid4(), daily_limit_usd=Decimal("100.00"))
+    tenant = str(budget.tenant_id)
+
+    def transaction(amount: str, status: str, created_at: datetime) -> Transaction:
+        return Transaction(
+            budget_id=budget.id,
+            amount_usd=Decimal(amount),
+            asset_symbol="USDC",
+            status=status,
+            created_at=created_at,
+        )
+
+    async with database.session() as session:
+        session.add(budget)
+    await Repository(database).add_transactions(
+        [
+            transaction("12.50", "EXECUTED", NOW - timedelta(hours=1)),
+            transaction("7.25", "EXECUTED", NOW),
+            transaction("50.00", "REJECTED", NOW),
+            transaction("99.00", "EXECUTED", NOW - timedelta(days=1)),
+        ]
+    )
+    await ledger.commit(await ledger.reserve(tenant, Decimal("5.00"), Decimal("100.00")))
+    reconciler = BudgetReconciler(ledger, database.engine, clock=clock)
+
+    assert await reconciler.reconcile() == {tenant: Decimal("14.75")}
+    assert (await ledger.usage(tenant)).committed_usd == Decimal("19.75")
+    assert await reconciler.reconcile() == {}
+    stale = await ledger.reconcile(
+        tenant, NOW.date(), expected_usd=Decimal("1.00"), actual_usd=Decimal("0.00")
+    )
+    assert stale is False
+
+
+@pytest.mark.asyncio
+async def test_reconciler_resets_tenants_without_executed_transactions(
+    database: Database,
+) -> None:
+    clock = Clock(NOW)
+    ledger = InMemoryBudgetLedger(clock=clock)
+    budget = BudgetConfig(tenant_id=uuid4(), daily_limit_usd=Decimal("100.00"))
+    tenant = str(budget.tenant_id)
+    async with database.session() as session:
+        session.add(budget)
+    await ledger.commit(await ledger.reserve(tenant, Decimal("3.00"), Decimal("100.00")))
+
+    drift = await BudgetReconciler(ledger, database.engine, clock=clock).reconcile()
+
+    assert drift == {tenant: Decimal("-3.00")}
+    assert (await ledger.usage(tenant)).committed_usd == Decimal("0.00")
+
+
+@pytest.mark.asyncio
+async def test_in_memory_ledger_drops_accounts_older_than_yesterday() -> None:
+    clock = Clock(NOW)
+    ledger = InMemoryBudgetLedger(shards=1, clock=clock)
+    limit = Decimal("100.00")
+    await ledger.commit(await ledger.reserve("t_acme", Decimal("5.00"), limit))
+
+    clock.now = NOW + timedelta(days=1)
+    await ledger.reserve("t_acme", Decimal("1.00"), limit)
+    assert (await ledger.usage("t_acme", NOW.date())).committed_usd == Decimal("5.00")
+
+    clock.now = NOW + timedelta(days=2)
+    await ledger.reserve("t_other", Decimal("1.00"), limit)
+    assert (await ledger.usage("t_acme", NOW.date())).committed_usd == Decimal("0.00")
+    assert len(ledger._shards[0].accounts) == 2
+
+
+@pytest.mark.asyncio
+async def test_cfo_judge_and_commerce_manager_share_the_ledger() -> None:
+    judge = CFOJudge(daily_limit=Decimal("100.00"))
+    manager = CommerceManager("key", "secret", cfo_judge=judge)
+
+    reservation = await judge.reserve("t_acme", Decimal("60.00"))
+    assert await manager.get_current_spend("t_acme") == Decimal("60.00")
+    with pytest.raises(BudgetExceededError, match="Budget Exceeded"):
+        await judge.reserve("t_acme", Decimal("50.00"))
+
+    await judge.ledger.release(reservation)
+    assert await manager.get_current_spend("t_acme") == Decimal("0.00")
+    assert judge.validate_transaction(Decimal("40.00"), Decimal("60.00")) is True
+    with pytest.raises(ValueError, match="Missing credentials"):
+        CommerceManager("", "")
+
+
+class TransferClient:
+    def __init__(self, *, fail: bool) -> None:
+        self.fail = fail
+        self.calls: list[tuple[str, dict[str, object]]] = []
+
+    async def call_tool(self, name: str, arguments: dict[str, object]) -> ToolResult:
+        self.calls.append((name, arguments))
+        if self.fail:
+            raise ConnectionError("agentkit unavailable")
+        return ToolResult(content={"tx_hash": "0xabc"})
+
+
+@pytest.mark.asyncio
+async def test_transfer_asset_commits_on_success_and_releases_on_failure() -> None:
+    judge = CFOJudge(daily_limit=Decimal("100.00"))
+    client = TransferClient(fail=True)
+    manager = CommerceManager("key", "secret", cfo_judge=judge, mcp_client=client)  # type: ignore[arg-type]
+    transfer = {"agent_id": "a_1", "asset": "USDC", "destination": "0x1", "trace_id": "tr_1"}
+
+    with pytest.raises(ConnectionError):
+        await manager.transfer_asset(tenant_id="t_acme", amount=Decimal("60.00"), **transfer)
+    assert await manager.get_current_spend("t_acme") == Decimal("0.00")
+
+    client.fail = False
+    record = await manager.transfer_asset(tenant_id="t_acme", amount=Decimal("60.00"), **transfer)
+    usage = await judge.ledger.usage("t_acme")
+
+    assert (record.status, record.mcp_response) == ("EXECUTED", {"tx_hash": "0xabc"})
+    assert (usage.committed_usd, usage.reserved_usd) == (Decimal("60.00"), Decimal("0.00"))
+    assert client.calls[-1] == (
+        "transfer_asset",
+        {"amount": "60.00", "asset_id": "USDC", "destination": "0x1"},
+    )
+    with pytest.raises(BudgetExceededError):
+        await manager.transfer_asset(tenant_id="t_acme", amount=Decimal("50.00"), **transfer)
+    assert len(client.calls) == 2
@@ -0,0 +1,109 @@
+from datetime import UTC, datetime
+
+import fakeredis.aioredis
+import msgpack
+import pytest
+from pydantic import ValidationError
+
+from chimera.lib.codec import (
+    CodecError,
+    decode_result,
+    decode_task,
+    encode_result,
+    encode_task,
+)
+from chimera.lib.redis_queue import RedisTaskQueue
+from chimera.models.result import Result, ResultStatus
+from chimera.models.task import Task, TaskStatus
+from tests.chimera.unit.helpers import make_task
+
+
+def _task(task_id: str = "tk_1", **overrides: object) -> Task:
+    fields: dict[str, object] = {
+        "session_id": "ss_1",
+        "kind": "skill.invoke",
+        "input": {"skill": "fetch_feed", "arguments": {"limit": 20, "tags": ["a", None]}},
+        "priority": 40,
+        "timeout_s": 30,
+    }
+    fields.update(overrides)
+    return make_task(task_id, **fields)
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_task_and_result_round_trip(trusted: bool) -> None:
+    task = _task()
+    result = Result(
+        tenant_id="t_acme",
+        trace_id="tr_1",
+        task_id="tk_1",
+        status=ResultStatus.FAILED,
+        output={},
+        error={"reason": "timeout"},
+        produced_by="w1",
+        completed_at=datetime.now(UTC),
+    )
+
+    decoded_task = decode_task(encode_task(task), trusted=trusted)
+    decoded_result = decode_result(encode_result(result), trusted=trusted)
+
+    assert decoded_task == task
+    assert decoded_task.status is TaskStatus.QUEUED
+    assert decoded_task.model_dump_json() == task.model_dump_json()
+    assert decoded_result == result
+    assert decoded_result.status is ResultStatus.FAILED
+    decoded_task._raw_id = "1-0"
+    assert decoded_task._raw_id == "1-0"
+
+
+def test_json_payloads_still_decode_and_binary_is_smaller() -> None:
+    task = _task()
+    as_json = task.model_dump_json().encode()
+
+    assert decode_task(as_json) == task
+    assert len(encode_task(task)) < len(as_json) / 2
+
+
+def test_invalid_payloads_are_rejected() -> None:
+    with pytest.raises(CodecError, match="version 99"):
+        decode_task(msgpack.packb([99, "t_acme"]))
+    with pytest.raises(CodecError, match="Expected 16 fields"):
+        decode_task(msgpack.packb([1, "t_acme"]))
+    with pytest.raises(CodecError, match="Malformed"):
+        decode_task(b"\xc1")
+
+    tampered = msgpack.unpackb(encode_task(_task()), timestamp=3)
+    tampered[1] = "acme"
+    with pytest.raises(ValidationError):
+        decode_task(msgpack.packb(tampered, datetime=True))
+
+
+def test_naive_datetimes_are_encoded_as_utc() -> None:
+    naive = datetime(2026, 1, 1, 12, 30)
+    task = _task(created_at=naive, updated_at=naive)
+
+    decoded = decode_task(encode_task(task))
+
+    assert decoded.created_at == naive.replace(tzinfo=UTC)
+    assert decoded.updated_at.tzinfo is not None
+
+
+@pytest.mark.asyncio
+async def test_redis_queue_reads_binary_and_json_entries() -> None:
+    client = fakeredis.aioredis.FakeRedis()
+    json_queue = RedisTaskQueue(client, block_ms=None)
+    binary_queue = RedisTaskQueue(client, block_ms=None, binary=True, trusted_decode=True)
+
+    await json_queue.enqueue("t_acme", _task("tk_json"))
+    await binary_queue.enqueue("t_acme", _task("tk_bin"))
+    tasks = await binary_queue.dequeue("t_acme", batch_size=10, worker_id="w1")
+    await binary_queue.ack_many("t_acme", tasks, "w1")
+
+    assert [task.task_id for task in tasks] == ["tk_json", "tk_bin"]
+    assert await client.xpending(binary_queue.stream_key("t_acme"), "chimera:workers") == {
+        "pending": 0,
+        "min": None,
+        "max": None,
+        "consumers": [],
+    }
+    await client.aclose()
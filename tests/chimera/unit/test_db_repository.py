@@ -0,0 +1,125 @@
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import SQLModel
+
+from chimera.db.engine import Database, DatabaseConfig, create_engine
+from chimera.db.repository import Repository
+from chimera.db.schema import BudgetConfig, ReviewCard, Task, TaskResult, Transaction
+
+
+@pytest.fixture
+async def database(tmp_path: Path) -> AsyncGenerator[Database, None]:
+    database = Database.from_config(
+        DatabaseConfig(url=f"sqlite+aiosqlite:///{tmp_path / 'chimera.db'}", pool_size=2)
+    )
+    async with database.engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+    yield database
+    await database.dispose()
+
+
+def _count_selects(database: Database) -> list[str]:
+    statements: list[str] = []
+
+    def record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(database.engine.sync_engine, "before_cursor_execute", record)
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_bulk_loads_and_reads_related_rows_without_n_plus_one(database: Database) -> None:
+    repo = Repository(database)
+    budget = BudgetConfig(tenant_id=Task().id, daily_limit_usd=Decimal("10.00"))
+    async with database.session() as session:
+        session.add(budget)
+    tasks = [Task(type="post", status="SUCCEEDED") for _ in range(20)]
+
+    assert await repo.add_tasks(tasks) == 20
+    assert (
+        await repo.add_results([TaskResult(task_id=t.id, status="SUCCEEDED") for t in tasks]) == 20
+    )
+    await repo.add_review_cards([ReviewCard(task_id=tasks[0].id, trigger_reason="nsfw")])
+    await repo.add_transactions(
+        [
+            Transaction(
+                budget_id=budget.id,
+                task_id=tasks[0].id,
+                amount_usd=Decimal("1.50"),
+                asset_symbol="USDC",
+                status="EXECUTED",
+                metadata_json={"tx": "0xabc"},
+            )
+        ]
+    )
+
+    selects = _count_selects(database)
+    loaded = await repo.get_tasks([t.id for t in tasks], load=("results", "reviews"))
+
+    assert len(selects) == 3
+    assert sum(len(task.results) for task in loaded) == 20
+    assert sum(len(task.reviews) for task in loaded) == 1
+    (transaction,) = await repo.transactions_for_budget(budget.id)
+    assert transaction.metadata_json == {"tx": "0xabc"}
+    (card,) = await repo.open_review_cards()
+    assert card.task.id == tasks[0].id
+
+
+@pytest.mark.asyncio
+async def test_related_tasks_are_bounded_by_since(database: Database) -> None:
+    repo = Repository(database)
+    now = datetime.now(UTC)
+    old = Task(type="plan", created_at=now - timedelta(days=60))
+    child = Task(type="post", parent_task_id=old.id)
+    await repo.add_tasks([old, child])
+    await repo.add_review_cards([ReviewCard(task_id=old.id, trigger_reason="nsfw")])
+
+    selects = _count_selects(database)
+    (loaded,) = await repo.get_tasks([child.id], load=("parent",))
+    (card,) = await repo.open_review_cards()
+
+    assert loaded.parent is None
+    assert card.task is None
+    assert all(
+        "tasks.created_at >=" in statement for statement in selects if "FROM tasks" in statement
+    )
+    (widened,) = await repo.get_tasks([child.id], since=now - timedelta(days=90), load=("parent",))
+    assert widened.parent is not None
+    assert widened.parent.id == old.id
+
+
+@pytest.mark.asyncio
+async def test_unrequested_relationships_raise_instead_of_querying(database: Database) -> None:
+    repo = Repository(database)
+    task = Task(type="post")
+    await repo.add_tasks([task])
+    await repo.add_results([TaskResult(task_id=task.id, status="FAILED")])
+
+    async with database.session() as session:
+        loaded = await session.get(Task, task.id)
+        assert loaded is not None
+        with pytest.raises(InvalidRequestError, match="lazy='raise_on_sql'"):
+            _ = loaded.results
+    assert [r.status for r in (await repo.results_for_tasks([task.id]))[task.id]] == ["FAILED"]
+
+
+def test_postgres_engine_uses_pool_and_timeout_settings() -> None:
+    config = DatabaseConfig.from_env(
+        {"CHIMERA_DB_POOL_SIZE": "3", "CHIMERA_DB_PREPARED_STATEMENT_CACHE_SIZE": "0"}
+    )
+    engine = create_engine(config)
+
+    assert engine.dialect.driver == "asyncpg"
+    assert engine.pool.size() == 3  # type: ignore[attr-defined]
+    assert config.prepared_statement_cache_size == 0
+    with pytest.raises(ValueError, match="Unsupported database driver"):
+        create_engine(DatabaseConfig(url="postgresql+psycopg2://localhost/chimera"))
@@ -0,0 +1,158 @@
+import asyncio
+import json
+from collections.abc import AsyncGenerator, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select
+from sqlmodel import SQLModel
+
+from chimera.db.engine import Database, DatabaseConfig
+from chimera.db.schema import JudgeDecision
+from chimera.models.result import Result, ResultStatus
+from chimera.ports.judge import Decision
+from chimera.services.decision_log import (
+    DatabaseDecisionSink,
+    DecisionLog,
+    DecisionRecord,
+    JsonlDecisionSink,
+)
+from chimera.services.judge import JudgeService
+
+
+class RecordingSink:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+        self.failures = 0
+
+    async def write(self, records: Sequence[DecisionRecord]) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("sink unavailable")
+        self.batches.append([record.task_id for record in records])
+
+
+class SlowSink(RecordingSink):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writing = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def write(self, records: Sequence[DecisionRecord]) -> None:
+        # Shielded like a write running in a thread: cancelling the caller
+        # does not stop it.
+        self.writing.set()
+        await asyncio.shield(self._write_when_released(records))
+
+    async def _write_when_released(self, records: Sequence[DecisionRecord]) -> None:
+        await self.release.wait()
+        await super().write(records)
+
+
+def _record(task_id: str) -> DecisionRecord:
+    return DecisionRecord(
+        "t_acme", "tr_1", task_id, Decision.APPROVE, "default-approve", datetime.now(UTC)
+    )
+
+
+@pytest.fixture
+async def database(tmp_path: Path) -> AsyncGenerator[Database, None]:
+    database = Database.from_config(
+        DatabaseConfig(url=f"sqlite+aiosqlite:///{tmp_path / 'chimera.db'}")
+    )
+    async with database.engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+    yield database
+    await database.dispose()
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_everything_in_batches_and_in_order() -> None:
+    sink = RecordingSink()
+    sink.failures = 1
+    log = DecisionLog(sink, max_batch=2, flush_interval_s=60)
+
+    for task_id in ("tk_1", "tk_2", "tk_3"):
+        assert await log.record(_record(task_id)) is True
+    with pytest.raises(ConnectionError):
+        await log.flush()
+    await log.record(_record("tk_4"))
+    await log.close()
+
+    assert sink.batches == [["tk_1", "tk_2"], ["tk_3", "tk_4"]]
+    assert (log.written, log.pending) == (4, 0)
+    with pytest.raises(RuntimeError, match="closed"):
+        await log.record(_record("tk_5"))
+
+
+@pytest.mark.asyncio
+async def test_close_during_a_background_write_does_not_write_the_batch_twice() -> None:
+    sink = SlowSink()
+    log = DecisionLog(sink, max_batch=2, flush_interval_s=60)
+    log.start()
+    await log.record(_record("tk_1"))
+    await log.record(_record("tk_2"))
+    await asyncio.wait_for(sink.writing.wait(), timeout=1)
+
+    closing = asyncio.create_task(log.close())
+    await asyncio.sleep(0.01)
+    assert not closing.done()
+    sink.release.set()
+    await asyncio.wait_for(closing, timeout=1)
+
+    assert sink.batches == [["tk_1", "tk_2"]]
+    assert (log.written, log.pending) == (2, 0)
+
+
+@pytest.mark.asyncio
+async def test_overflow_drops_with_a_counter_or_blocks_until_flushed() -> None:
+    dropping = DecisionLog(RecordingSink(), capacity=2, overflow="drop")
+    results = [await dropping.record(_record(f"tk_{n}")) for n in range(5)]
+
+    assert results == [True, True, False, False, False]
+    assert dropping.dropped == 3
+
+    sink = RecordingSink()
+    async with DecisionLog(sink, capacity=2, max_batch=10, flush_interval_s=60) as blocking:
+        for n in range(5):
+            await asyncio.wait_for(blocking.record(_record(f"tk_{n}")), timeout=1)
+
+    assert [task for batch in sink.batches for task in batch] == [f"tk_{n}" for n in range(5)]
+    assert blocking.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_sinks_write_to_jsonl_and_the_database(tmp_path: Path, database: Database) -> None:
+    path = tmp_path / "decisions.jsonl"
+    jsonl = JsonlDecisionSink(path, fsync=True)
+    await jsonl.write([_record("tk_1")])
+    await jsonl.write([_record("tk_2")])
+    await DatabaseDecisionSink(database.engine).write([_record("tk_1"), _record("tk_2")])
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    async with database.session() as session:
+        rows = (await session.execute(select(JudgeDecision.task_id))).scalars().all()
+
+    assert [line["task_id"] for line in lines] == ["tk_1", "tk_2"]
+    assert lines[0]["decision"] == "approve"
+    assert sorted(rows) == ["tk_1", "tk_2"]
+
+
+@pytest.mark.asyncio
+async def test_judge_service_queues_decisions_instead_of_logging_inline() -> None:
+    sink = RecordingSink()
+    result = Result(
+        tenant_id="t_acme",
+        trace_id="tr_1",
+        task_id="tk_9",
+        status=ResultStatus.SUCCEEDED,
+        output={"action": "delete_all_files"},
+        completed_at=datetime.now(UTC),
+    )
+    async with DecisionLog(sink, flush_interval_s=60) as log:
+        judge = JudgeService(decision_log=log)
+        assert await judge.evaluate_result("t_acme", result) == Decision.DENY
+        assert (log.pending, sink.batches) == (1, [])
+
+    assert sink.batches == [["tk_9"]]
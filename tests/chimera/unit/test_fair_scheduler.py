@@ -0,0 +1,134 @@
+import asyncio
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from chimera.lib.memory_queue import InMemoryTaskQueue
+from chimera.models.result import Result, ResultStatus
+from chimera.models.task import Task
+from chimera.services.scheduler import FairScheduler, SchedulerConfig, TenantSchedulingPolicy
+from chimera.services.worker import Worker
+from tests.chimera.unit.helpers import make_task
+
+
+class RecordingLLM:
+    def __init__(self) -> None:
+        self.order: list[str] = []
+        self.running: Counter[str] = Counter()
+        self.peak: Counter[str] = Counter()
+
+    async def generate_result(self, task: Task) -> Result:
+        self.running[task.tenant_id] += 1
+        self.peak[task.tenant_id] = max(self.peak[task.tenant_id], self.running[task.tenant_id])
+        await asyncio.sleep(0)
+        self.running[task.tenant_id] -= 1
+        self.order.append(task.tenant_id)
+        return Result(
+            tenant_id=task.tenant_id,
+            trace_id=task.trace_id,
+            task_id=task.task_id,
+            status=ResultStatus.SUCCEEDED,
+            output={},
+            completed_at=datetime.now(UTC),
+        )
+
+
+def _tasks(tenant_id: str, count: int, age_s: float = 0.0) -> list[Task]:
+    created = datetime.now(UTC) - timedelta(seconds=age_s)
+    return [
+        make_task(f"{tenant_id}_{i}", tenant_id=tenant_id, created_at=created, updated_at=created)
+        for i in range(count)
+    ]
+
+
+async def _run_until_drained(scheduler: FairScheduler, queue: InMemoryTaskQueue) -> None:
+    runner = asyncio.create_task(scheduler.run())
+    for _ in range(1000):
+        await asyncio.sleep(0.001)
+        if all(queue.depth(t) == 0 and queue.pending_count(t) == 0 for t in scheduler.stats()):
+            break
+    scheduler.stop()
+    await runner
+
+
+@pytest.mark.asyncio
+async def test_busy_tenant_does_not_starve_small_tenant() -> None:
+    queue = InMemoryTaskQueue(block_ms=None)
+    llm = RecordingLLM()
+    await queue.enqueue_many("t_busy", _tasks("t_busy", 200))
+    await queue.enqueue_many("t_small", _tasks("t_small", 8))
+    config = SchedulerConfig(quantum=4, max_in_flight=4)
+    scheduler = FairScheduler(
+        queue, Worker(queue, llm, "w1"), config, tenants=["t_busy", "t_small"]
+    )
+
+    await _run_until_drained(scheduler, queue)
+
+    assert len(llm.order) == 208
+    # Equal weights alternate rounds, so the small tenant finishes within the first few rounds.
+    last_small = max(i for i, tenant in enumerate(llm.order) if tenant == "t_small")
+    assert last_small < 24
+
+
+@pytest.mark.asyncio
+async def test_weights_set_dispatch_ratio_and_caps_bound_concurrency() -> None:
+    queue = InMemoryTaskQueue(block_ms=None)
+    llm = RecordingLLM()
+    await queue.enqueue_many("t_gold", _tasks("t_gold", 300))
+    await queue.enqueue_many("t_free", _tasks("t_free", 300))
+    config = SchedulerConfig(
+        quantum=2,
+        max_in_flight=64,
+        tenants={
+            "t_gold": TenantSchedulingPolicy(weight=3, max_concurrency=6),
+            "t_free": TenantSchedulingPolicy(weight=1, max_concurrency=2),
+        },
+    )
+    scheduler = FairScheduler(queue, Worker(queue, llm, "w1"), config)
+
+    for _ in range(20):
+        await scheduler.dispatch_round()
+        await asyncio.sleep(0)
+    await scheduler.drain()
+
+    stats = scheduler.stats()
+    assert stats["t_gold"].dispatched == 3 * stats["t_free"].dispatched
+    assert llm.peak["t_free"] <= 2
+    assert llm.peak["t_gold"] <= 6
+
+
+@pytest.mark.asyncio
+async def test_idle_tenant_backs_off_until_notified() -> None:
+    now = [0.0]
+    queue = InMemoryTaskQueue(block_ms=None)
+    llm = RecordingLLM()
+    scheduler = FairScheduler(
+        queue, Worker(queue, llm, "w1"), tenants=["t_idle"], clock=lambda: now[0]
+    )
+
+    assert await scheduler.dispatch_round() == 0
+    await queue.enqueue_many("t_idle", _tasks("t_idle", 2, age_s=0.5))
+    assert await scheduler.dispatch_round() == 0
+
+    scheduler.notify("t_idle")
+    assert await scheduler.dispatch_round() == 2
+    await scheduler.drain()
+
+    stats = scheduler.stats()["t_idle"]
+    assert stats.depth == 0
+    assert stats.in_flight == 0
+    assert stats.wait_p95_ms >= 500
+
+
+def test_config_loads_from_file(tmp_path: Path) -> None:
+    path = tmp_path / "scheduler.json"
+    path.write_text('{"max_in_flight": 8, "tenants": {"t_acme": {"weight": 2}}}')
+
+    config = SchedulerConfig.from_file(path)
+
+    assert config.policy_for("t_acme").weight == 2
+    assert config.policy_for("t_other") == config.default_policy
+    repo_config = Path(__file__).parents[3] / "scheduler.json"
+    assert SchedulerConfig.from_file(repo_config).max_in_flight == 16
@@ -0,0 +1,119 @@
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from chimera.models.result import Result, ResultStatus
+from chimera.ports.judge import Decision
+from chimera.services.judge import JudgeService
+from chimera.services.judge_policy import DefaultJudgePolicy, PolicyDocument, RulePolicy
+
+POLICY_YAML = """
+default_decision: approve
+default_reason: no-rule-matched
+rules:
+  - id: deny-failed-payments
+    decision: deny
+    when:
+      - {field: status, op: ne, value: succeeded}
+      - {field: error.code, op: in, value: [payment_declined, insufficient_funds]}
+  - id: hitl-unreviewed-link
+    decision: hitl
+    when:
+      - {field: output.posts.0.body, op: matches, value: "https?://"}
+      - {field: output.reviewed, op: missing}
+  - id: hitl-large-spend
+    decision: hitl
+    when:
+      - {field: output.spend_usd, op: ge, value: 50}
+"""
+
+
+def _result(output: dict[str, Any], error: dict[str, Any] | None = None) -> Result:
+    return Result(
+        tenant_id="t_acme",
+        trace_id="tr_1",
+        task_id="tk_1",
+        status=ResultStatus.SUCCEEDED if error is None else ResultStatus.FAILED,
+        output=output,
+        error=error,
+        completed_at=datetime.now(UTC),
+    )
+
+
+def test_rules_match_in_order_and_report_their_id(tmp_path: Path) -> None:
+    path = tmp_path / "judge_policy.yaml"
+    path.write_text(POLICY_YAML, encoding="utf-8")
+    policy = RulePolicy.from_file(path)
+
+    assert policy.evaluate(_result({}, error={"code": "payment_declined"})) == (
+        Decision.DENY,
+        "deny-failed-payments",
+    )
+    assert policy.evaluate(_result({}, error={"code": "timeout"})) == (
+        Decision.APPROVE,
+        "no-rule-matched",
+    )
+    link = {"posts": [{"body": "see https://example.com"}]}
+    assert policy.evaluate(_result(link)) == (Decision.HITL, "hitl-unreviewed-link")
+    assert policy.evaluate(_result({**link, "reviewed": True}))[1] == "no-rule-matched"
+    assert policy.evaluate(_result({"posts": []}))[1] == "no-rule-matched"
+    # Wrong operand types never match instead of raising.
+    assert policy.evaluate(_result({"spend_usd": "lots"}))[1] == "no-rule-matched"
+    assert policy.evaluate(_result({"spend_usd": 75}))[1] == "hitl-large-spend"
+
+
+def test_invalid_policies_are_rejected_at_load_time() -> None:
+    rule = {"id": "r1", "decision": "deny", "when": [{"field": "output.x"}]}
+
+    with pytest.raises(ValidationError, match="Unknown result field"):
+        PolicyDocument.model_validate({"rules": [{**rule, "when": [{"field": "confidence"}]}]})
+    with pytest.raises(ValidationError, match="needs a list"):
+        PolicyDocument.model_validate(
+            {"rules": [{**rule, "when": [{"field": "status", "op": "in", "value": "x"}]}]}
+        )
+    with pytest.raises(ValidationError, match="Duplicate rule id"):
+        PolicyDocument.model_validate({"rules": [rule, rule]})
+
+
+@pytest.mark.asyncio
+async def test_evaluate_many_logs_each_decision_with_its_rule() -> None:
+    judge = JudgeService()
+    results = [
+        _result({"action": "delete_all_files"}),
+        _result({"confidence": 0.4}),
+        _result({"confidence": 0.9}),
+    ]
+
+    with patch("chimera.services.judge.logger") as mock_logger:
+        decisions = await judge.evaluate_many("t_acme", results)
+
+    assert isinstance(judge.policy, DefaultJudgePolicy)
+    assert decisions == [Decision.DENY, Decision.HITL, Decision.APPROVE]
+    assert [call.kwargs["reason"] for call in mock_logger.info.call_args_list] == [
+        "deny-destructive-action",
+        "hitl-low-confidence",
+        "default-approve",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_judge_service_reloads_the_policy_file(tmp_path: Path) -> None:
+    path = tmp_path / "judge_policy.json"
+    path.write_text('{"rules": []}', encoding="utf-8")
+    judge = JudgeService(policy_path=path)
+    result = _result({"action": "delete_all_files"})
+
+    assert await judge.evaluate_result("t_acme", result) == Decision.APPROVE
+    assert judge.reload_if_changed() is False
+
+    path.write_text(
+        '{"rules": [{"id": "deny-all", "decision": "deny"}]}',
+        encoding="utf-8",
+    )
+    judge.reload_policy()
+
+    assert await judge.evaluate_result("t_acme", result) == Decision.DENY
@@ -0,0 +1,75 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from chimera.lib.keyword_scanner import KeywordMatch, KeywordScanner, load_blocklist
+from chimera.services.safety import SafetyService
+
+
+def test_scanner_prefers_longest_term_and_respects_word_boundaries() -> None:
+    scanner = KeywordScanner(["pass", "password", "Passport", "SSN", "delete all"])
+
+    matches = scanner.scan("PASSWORD, passports, pass. classname has no SSN-like DELETE ALL")
+
+    assert [(m.term, m.start, m.end) for m in matches] == [
+        ("password", 0, 8),
+        ("pass", 21, 25),
+        ("SSN", 44, 47),
+        ("delete all", 53, 63),
+    ]
+    assert scanner.search("nothing to see") is None
+    assert KeywordScanner([]).scan("password") == []
+
+
+def test_scan_output_reports_the_leaf_path_and_span_of_each_hit() -> None:
+    scanner = KeywordScanner(["secret key", "SSN"])
+    output = {
+        "title": "Weekly update",
+        "posts": [{"body": "rotate the secret key"}, 42, {"body": "ok"}],
+        "meta": {"note": "SSN redacted", "secret key": None},
+    }
+
+    matches = scanner.scan_output(output)
+
+    assert matches == [
+        KeywordMatch("secret key", ("posts", 0, "body"), 11, 21),
+        KeywordMatch("SSN", ("meta", "note"), 0, 3),
+    ]
+    assert scanner.scan_output(output, first_only=True) == matches[:1]
+    assert scanner.scan_output({"count": 3}) == []
+
+
+def test_load_blocklist_reads_text_and_json(tmp_path: Path) -> None:
+    text_file = tmp_path / "blocklist.txt"
+    text_file.write_text("# security\npassword\n\n  api key \n", encoding="utf-8")
+    json_file = tmp_path / "blocklist.json"
+    json_file.write_text(json.dumps(["PII", "SSN"]), encoding="utf-8")
+    bad_file = tmp_path / "bad.json"
+    bad_file.write_text(json.dumps({"terms": ["x"]}), encoding="utf-8")
+
+    assert load_blocklist(text_file) == ["password", "api key"]
+    assert load_blocklist(json_file) == ["PII", "SSN"]
+    with pytest.raises(ValueError, match="JSON list of strings"):
+        load_blocklist(bad_file)
+
+
+def test_safety_service_hot_reloads_its_blocklist(tmp_path: Path) -> None:
+    blocklist = tmp_path / "blocklist.txt"
+    blocklist.write_text("password\n", encoding="utf-8")
+    service = SafetyService(blocklist_path=blocklist)
+    before = service.scanner
+
+    assert service._check_keywords("my password") is False
+    assert service._check_keywords("wire transfer") is True
+    assert service.reload_if_changed() is False
+
+    blocklist.write_text("wire transfer\n", encoding="utf-8")
+    stat = blocklist.stat()
+    os.utime(blocklist, (stat.st_atime, stat.st_mtime + 5))
+
+    assert service.reload_if_changed() is True
+    assert service.scanner is not before
+    assert service._check_keywords("my password") is True
+    assert [m.path for m in service.find_keywords({"a": ["wire transfer"]})] == [("a", 0)]
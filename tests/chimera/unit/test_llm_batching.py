@@ -0,0 +1,115 @@
+import asyncio
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+import pytest
+
+from chimera.lib.llm_batching import BatchingLLM
+from chimera.models.result import Result, ResultStatus
+from chimera.models.task import Task
+from tests.chimera.unit.helpers import make_task
+
+
+def _task(task_id: str, text: str, tenant_id: str = "t_acme") -> Task:
+    return make_task(
+        task_id,
+        tenant_id=tenant_id,
+        trace_id=f"tr_{task_id}",
+        kind="classify",
+        input={"text": text},
+    )
+
+
+def _result(task: Task) -> Result:
+    return Result(
+        tenant_id=task.tenant_id,
+        trace_id=task.trace_id,
+        task_id=task.task_id,
+        status=ResultStatus.SUCCEEDED,
+        output={"label": task.input["text"].upper()},
+        completed_at=datetime.now(UTC),
+    )
+
+
+class BatchBackend:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    async def generate_result(self, task: Task) -> Result:
+        raise AssertionError("batch backends should receive generate_results")
+
+    async def generate_results(self, tasks: Sequence[Task]) -> Sequence[Result]:
+        self.batches.append([task.task_id for task in tasks])
+        if any(task.input["text"] == "boom" for task in tasks):
+            raise RuntimeError("backend unavailable")
+        return [_result(task) for task in tasks]
+
+
+class SingleBackend:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate_result(self, task: Task) -> Result:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return _result(task)
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_as_one_request() -> None:
+    backend = BatchBackend()
+    llm = BatchingLLM(backend, max_batch_size=4, max_wait_ms=1000)
+
+    results = await asyncio.gather(
+        *(llm.generate_result(_task(f"tk_{i}", f"t{i}")) for i in range(4))
+    )
+
+    assert backend.batches == [["tk_0", "tk_1", "tk_2", "tk_3"]]
+    assert [result.output["label"] for result in results] == ["T0", "T1", "T2", "T3"]
+    stats = llm.stats()
+    assert stats.batches == 1
+    assert stats.requests_per_call == 4.0
+
+
+@pytest.mark.asyncio
+async def test_window_flushes_partial_batch_and_dedupes_identical_prompts() -> None:
+    backend = BatchBackend()
+    llm = BatchingLLM(backend, max_batch_size=16, max_wait_ms=1)
+
+    first, duplicate, other_tenant = await asyncio.gather(
+        llm.generate_result(_task("tk_1", "spam")),
+        llm.generate_result(_task("tk_2", "spam")),
+        llm.generate_result(_task("tk_3", "spam", tenant_id="t_other")),
+    )
+
+    assert backend.batches == [["tk_1", "tk_3"]]
+    assert (duplicate.task_id, duplicate.trace_id) == ("tk_2", "tr_tk_2")
+    assert duplicate.output == first.output
+    assert other_tenant.tenant_id == "t_other"
+    stats = llm.stats()
+    assert stats.deduplicated == 1
+    assert stats.wait_p95_ms > 0
+
+
+@pytest.mark.asyncio
+async def test_single_task_backend_only_gets_deduplication() -> None:
+    backend = SingleBackend()
+    llm = BatchingLLM(backend, max_batch_size=8, max_wait_ms=1)
+
+    await asyncio.gather(*(llm.generate_result(_task(f"tk_{i}", f"t{i % 2}")) for i in range(6)))
+
+    assert backend.calls == 2
+    assert llm.stats().backend_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_caller() -> None:
+    llm = BatchingLLM(BatchBackend(), max_batch_size=2, max_wait_ms=1000)
+
+    outcomes = await asyncio.gather(
+        llm.generate_result(_task("tk_1", "boom")),
+        llm.generate_result(_task("tk_2", "fine")),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
@@ -0,0 +1,109 @@
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from chimera.lib.llm_cache import CachingLLM, InMemoryVectorIndex
+from chimera.models.result import Result, ResultStatus
+from chimera.models.task import Task
+from tests.chimera.unit.helpers import Clock, make_task
+
+
+class CountingLLM:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate_result(self, task: Task) -> Result:
+        self.calls += 1
+        failed = task.input.get("fail", False)
+        return Result(
+            tenant_id=task.tenant_id,
+            trace_id=task.trace_id,
+            task_id=task.task_id,
+            status=ResultStatus.FAILED if failed else ResultStatus.SUCCEEDED,
+            output={"n": self.calls},
+            error={"reason": "boom"} if failed else None,
+            completed_at=datetime.now(UTC),
+        )
+
+
+def _task(task_id: str, tenant_id: str = "t_acme", kind: str = "classify", **payload: Any) -> Task:
+    return make_task(
+        task_id, tenant_id=tenant_id, trace_id=f"tr_{task_id}", kind=kind, input=payload
+    )
+
+
+@pytest.mark.asyncio
+async def test_exact_hits_are_tenant_scoped_and_readdressed() -> None:
+    backend = CountingLLM()
+    llm = CachingLLM(backend, shared_kinds={"translate"})
+
+    first = await llm.generate_result(_task("tk_1", text="hi", lang="fr"))
+    again = await llm.generate_result(_task("tk_2", lang="fr", text="hi"))
+    other_tenant = await llm.generate_result(
+        _task("tk_3", tenant_id="t_other", text="hi", lang="fr")
+    )
+    await llm.generate_result(_task("tk_4", kind="translate", text="hi"))
+    shared = await llm.generate_result(
+        _task("tk_5", tenant_id="t_other", kind="translate", text="hi")
+    )
+
+    assert backend.calls == 3
+    assert again.output == first.output
+    assert (again.task_id, again.trace_id) == ("tk_2", "tr_tk_2")
+    assert other_tenant.output != first.output
+    assert shared.tenant_id == "t_other"
+    stats = llm.stats()
+    assert (stats.exact_hits, stats.misses) == (2, 3)
+
+
+@pytest.mark.asyncio
+async def test_ttl_size_bound_and_failures() -> None:
+    clock = Clock(0.0)
+    backend = CountingLLM()
+    llm = CachingLLM(backend, ttl_s=10, max_entries=2, clock=clock)
+
+    await llm.generate_result(_task("tk_1", q=1))
+    await llm.generate_result(_task("tk_2", q=2))
+    await llm.generate_result(_task("tk_3", q=3))
+    await llm.generate_result(_task("tk_4", fail=True))
+    await llm.generate_result(_task("tk_5", fail=True))
+    assert llm.stats().evictions == 1
+    assert backend.calls == 5
+
+    await llm.generate_result(_task("tk_6", q=3))
+    assert backend.calls == 5
+    clock.now = 11
+    await llm.generate_result(_task("tk_7", q=3))
+    assert backend.calls == 6
+
+
+@pytest.mark.asyncio
+async def test_near_duplicate_tier_matches_similar_prompts_of_same_kind() -> None:
+    backend = CountingLLM()
+
+    async def embed(text: str) -> Sequence[float]:
+        return [1.0, 0.01] if "refund" in text else [0.0, 1.0]
+
+    index = InMemoryVectorIndex()
+    llm = CachingLLM(backend, embed=embed, index=index, min_similarity=0.99)
+
+    await llm.generate_result(_task("tk_1", text="refund please"))
+    similar = await llm.generate_result(_task("tk_2", text="refund, please!"))
+    unrelated = await llm.generate_result(_task("tk_3", text="hello"))
+    other_kind = await llm.generate_result(_task("tk_4", kind="summarize", text="refund pls"))
+
+    assert backend.calls == 3
+    assert similar.task_id == "tk_2"
+    assert unrelated.output["n"] == 2
+    assert other_kind.output["n"] == 3
+    assert llm.stats().semantic_hits == 1
+
+    assert await llm.invalidate(tenant_id="t_acme", kind="classify") == 2
+    assert await index.search("t_acme\x00classify", [1.0, 0.0], 0.5) is None
+
+
+def test_near_duplicate_tier_needs_embedder_and_index() -> None:
+    with pytest.raises(ValueError, match="both embed and index"):
+        CachingLLM(CountingLLM(), index=InMemoryVectorIndex())
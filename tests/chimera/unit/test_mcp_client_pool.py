@@ -0,0 +1,172 @@
+import asyncio
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from chimera.services.mcp_client import MCPClient, MCPConnectionError
+from chimera.services.mcp_pool import MCPClientPool, MCPServerConfig, set_default_pool
+from chimera.services.mcp_validation import ToolArgumentError
+from chimera.skills.models import SkillContext
+from chimera.skills.skills.mcp_tool import McpToolInput, McpToolSkill
+
+FAKE_SERVER = textwrap.dedent(
+    """
+    import collections, json, os, sys, threading, time
+
+    lock = threading.Lock()
+    seen = collections.Counter()
+    TOOLS = [
+        {
+            "name": "echo",
+            "inputSchema": {"type": "object", "properties": {"tag": {"type": "string"}}},
+        },
+        {"name": "crash", "inputSchema": {"type": "object"}},
+        {"name": "stats", "inputSchema": {"type": "object"}},
+    ]
+
+    def send(message):
+        with lock:
+            sys.stdout.write(json.dumps(message) + "\\n")
+            sys.stdout.flush()
+
+    def handle(message):
+        method, params = message["method"], message.get("params", {})
+        seen[method] += 1
+        if method == "initialize":
+            result = {"protocolVersion": params["protocolVersion"], "capabilities": {}}
+        elif method == "tools/list":
+            result = {"tools": TOOLS}
+        elif method == "tools/call":
+            args = params["arguments"]
+            if params["name"] == "crash":
+                os._exit(1)
+            if params["name"] == "stats":
+                args = dict(seen)
+            time.sleep(args.get("delay", 0))
+            result = {"structuredContent": {"pid": os.getpid(), **args}, "content": []}
+        else:
+            result = {}
+        send({"jsonrpc": "2.0", "id": message["id"], "result": result})
+
+    for line in sys.stdin:
+        message = json.loads(line)
+        if "id" in message:
+            threading.Thread(target=handle, args=(message,), daemon=True).start()
+    """
+)
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> MCPServerConfig:
+    script = tmp_path / "server.py"
+    script.write_text(FAKE_SERVER, encoding="utf-8")
+    return MCPServerConfig(
+        name="fake",
+        command=sys.executable,
+        args=(str(script),),
+        tools=("echo", "crash"),
+        request_timeout_s=5.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_client_multiplexes_concurrent_calls(server: MCPServerConfig) -> None:
+    """Spec: specs/001-mcp-client/spec.md (FR-002)."""
+    async with MCPClient(server.command, list(server.args)) as client:
+        tools = await client.list_tools()
+        slow = asyncio.create_task(client.call_tool("echo", {"delay": 0.3, "tag": "slow"}))
+        fast = await client.call_tool("echo", {"tag": "fast"})
+
+        assert not slow.done()
+        assert fast.content["tag"] == "fast"
+        assert (await slow).content["tag"] == "slow"
+        assert [tool.name for tool in tools] == ["echo", "crash", "stats"]
+
+
+@pytest.mark.asyncio
+async def test_client_caches_tools_and_rejects_bad_arguments_locally(
+    server: MCPServerConfig,
+) -> None:
+    async with MCPClient(server.command, list(server.args)) as client:
+        await client.list_tools()
+        await client.list_tools()
+        with pytest.raises(ToolArgumentError, match="tag"):
+            await client.call_tool("echo", {"tag": 42})
+        with pytest.raises(ValueError, match="missing_tool"):
+            await client.call_tool("missing_tool", {})
+
+        stats = (await client.call_tool("stats", {})).content
+
+    assert stats["tools/list"] == 1
+    assert stats["tools/call"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_warm_session_and_restarts_after_crash(
+    server: MCPServerConfig,
+) -> None:
+    """Spec: specs/001-mcp-client/spec.md (AC-004)."""
+    async with MCPClientPool({"fake": server}, health_check_interval_s=None) as pool:
+        first = await pool.call_tool("echo", {})
+        second = await pool.call_tool("echo", {})
+        assert first.content["pid"] == second.content["pid"]
+
+        with pytest.raises(MCPConnectionError):
+            await pool.call_tool("crash", {})
+
+        restarted = await pool.call_tool("echo", {})
+        assert restarted.content["pid"] != first.content["pid"]
+
+
+@pytest.mark.asyncio
+async def test_pool_sends_a_batch_to_one_session_in_order(server: MCPServerConfig) -> None:
+    async with MCPClientPool(
+        {"fake": server}, sessions_per_server=2, health_check_interval_s=None
+    ) as pool:
+        results = await pool.call_tool_batch(
+            "echo", [{"tag": "a", "delay": 0.2}, {"tag": "b"}, {"tag": "c"}]
+        )
+        with pytest.raises(ToolArgumentError):
+            await pool.call_tool_batch("echo", [{"tag": "ok"}, {"tag": 42}])
+
+    assert [result.content["tag"] for result in results] == ["a", "b", "c"]
+    assert len({result.content["pid"] for result in results}) == 1
+
+
+@pytest.mark.asyncio
+async def test_health_check_restarts_dead_session(server: MCPServerConfig) -> None:
+    async with MCPClientPool({"fake": server}, health_check_interval_s=None) as pool:
+        client = await pool.session("fake")
+        assert await pool.check_health() == {"fake": True}
+
+        with pytest.raises(MCPConnectionError):
+            await client.call_tool("crash", {})
+
+        assert await pool.check_health() == {"fake": False}
+        assert (await pool.session("fake")) is not client
+
+
+@pytest.mark.asyncio
+async def test_mcp_tool_skill_borrows_from_default_pool(server: MCPServerConfig) -> None:
+    pool = MCPClientPool({"fake": server}, health_check_interval_s=None)
+    set_default_pool(pool)
+    try:
+        output = await McpToolSkill().run(
+            McpToolInput(tool_name="echo", arguments={"msg": "hi"}),
+            SkillContext(tenant_id="t_acme", trace_id="tr_1"),
+        )
+    finally:
+        set_default_pool(None)
+        await pool.close()
+
+    assert output.response["content"]["msg"] == "hi"
+
+
+def test_pool_routes_tools_from_mcp_config() -> None:
+    pool = MCPClientPool.from_config(Path(__file__).parents[3] / "mcp.json")
+
+    assert pool.server_for("transfer_asset") == "chimera-commerce"
+    with pytest.raises(ValueError):
+        pool.server_for("missing_tool")
@@ -0,0 +1,205 @@
+import asyncio
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from chimera.models.mcp import ToolDefinition, ToolResult
+from chimera.ports.mcp import MCPClientPort
+from chimera.services.mcp_cache import (
+    CachedMCPClient,
+    ToolCachePolicy,
+    ToolResultCache,
+    load_cache_invalidations,
+    load_cache_policies,
+)
+from tests.chimera.unit.helpers import Clock
+
+
+class CountingClient(MCPClientPort):
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def list_tools(self) -> list[ToolDefinition]:
+        return []
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> ToolResult:
+        self.calls.append((name, arguments))
+        await asyncio.sleep(0.01)
+        return ToolResult(content={"n": len(self.calls)})
+
+
+@pytest.fixture
+def upstream() -> CountingClient:
+    return CountingClient()
+
+
+def _cache(clock: Clock[float] | None = None, **kwargs: Any) -> ToolResultCache:
+    return ToolResultCache(
+        {"fetch_feed": ToolCachePolicy(ttl_s=10.0)},
+        {"post_content": ["fetch_feed"]},
+        clock=clock or Clock(0.0),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_keys_on_tenant_and_canonical_arguments(upstream: CountingClient) -> None:
+    cache = _cache()
+    acme = CachedMCPClient(upstream, cache, "t_acme")
+    other = CachedMCPClient(upstream, cache, "t_other")
+
+    first = await acme.call_tool("fetch_feed", {"platform": "x", "limit": 5})
+    second = await acme.call_tool("fetch_feed", {"limit": 5, "platform": "x"})
+    await other.call_tool("fetch_feed", {"platform": "x", "limit": 5})
+
+    assert first is second
+    assert len(upstream.calls) == 2
+    assert cache.stats().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_upstream_request(
+    upstream: CountingClient,
+) -> None:
+    cache = _cache()
+    client = CachedMCPClient(upstream, cache, "t_acme")
+
+    results = await asyncio.gather(*(client.call_tool("fetch_feed", {}) for _ in range(5)))
+
+    assert len(upstream.calls) == 1
+    assert all(result is results[0] for result in results)
+    assert cache.stats().coalesced == 4
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_first_caller_does_not_fail_the_others(
+    upstream: CountingClient,
+) -> None:
+    cache = _cache()
+    client = CachedMCPClient(upstream, cache, "t_acme")
+
+    first = asyncio.create_task(client.call_tool("fetch_feed", {}))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(client.call_tool("fetch_feed", {}))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    result = await second
+
+    assert first.cancelled()
+    assert result.content == {"n": 1}
+    assert len(upstream.calls) == 1
+    assert await client.call_tool("fetch_feed", {}) is result
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_and_evict_lru(upstream: CountingClient) -> None:
+    clock = Clock(0.0)
+    cache = _cache(clock, max_entries=2)
+    client = CachedMCPClient(upstream, cache, "t_acme")
+
+    for page in (1, 2, 1, 3):
+        await client.call_tool("fetch_feed", {"page": page})
+    await client.call_tool("fetch_feed", {"page": 1})
+    assert len(upstream.calls) == 3
+    assert cache.stats().evictions == 1
+
+    clock.now = 11.0
+    await client.call_tool("fetch_feed", {"page": 1})
+    assert len(upstream.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_tools_without_policy_always_call_upstream(upstream: CountingClient) -> None:
+    client = CachedMCPClient(upstream, _cache(), "t_acme")
+
+    await client.call_tool("transfer_asset", {"amount": 1})
+    await client.call_tool("transfer_asset", {"amount": 1})
+
+    assert len(upstream.calls) == 2
+
+
+def test_mutating_tools_can_never_be_cached() -> None:
+    with pytest.raises(ValueError):
+        ToolResultCache({"post_content": ToolCachePolicy(ttl_s=1.0)})
+
+
+def test_policies_are_loaded_from_mcp_config() -> None:
+    policies = load_cache_policies(Path(__file__).parents[3] / "mcp.json")
+
+    assert policies["recall_context"].ttl_s == 30.0
+    assert "transfer_asset" not in policies
+    assert "post_content" not in policies
+
+
+@pytest.mark.asyncio
+async def test_successful_mutation_invalidates_the_tenants_reads(upstream: CountingClient) -> None:
+    cache = _cache()
+    acme = CachedMCPClient(upstream, cache, "t_acme")
+    other = CachedMCPClient(upstream, cache, "t_other")
+    await acme.call_tool("fetch_feed", {})
+    await other.call_tool("fetch_feed", {})
+
+    await acme.call_tool("post_content", {"text": "hi"})
+    await acme.call_tool("fetch_feed", {})
+    await other.call_tool("fetch_feed", {})
+
+    assert [name for name, _ in upstream.calls] == [
+        "fetch_feed",
+        "fetch_feed",
+        "post_content",
+        "fetch_feed",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_read_in_flight_during_invalidation_is_not_stored(upstream: CountingClient) -> None:
+    cache = _cache()
+    client = CachedMCPClient(upstream, cache, "t_acme")
+
+    read = asyncio.create_task(client.call_tool("fetch_feed", {}))
+    await asyncio.sleep(0)
+    cache.invalidate("t_acme", "fetch_feed")
+    await read
+    await client.call_tool("fetch_feed", {})
+
+    assert len(upstream.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_unserializable_arguments_bypass_the_cache(upstream: CountingClient) -> None:
+    client = CachedMCPClient(upstream, _cache(), "t_acme")
+
+    await client.call_tool("fetch_feed", {"limit": Decimal("5")})
+    await client.call_tool("fetch_feed", {"limit": Decimal("5")})
+
+    assert len(upstream.calls) == 2
+
+
+def test_invalidations_are_loaded_from_mcp_config() -> None:
+    path = Path(__file__).parents[3] / "mcp.json"
+    invalidations = load_cache_invalidations(path)
+
+    assert invalidations["remember_fact"] >= {"recall_context"}
+    assert invalidations["transfer_asset"] == {"get_wallet_balance"}
+    assert "get_transaction_status" not in load_cache_policies(path)
+
+
+@pytest.mark.asyncio
+async def test_batches_read_through_the_cache_and_mutations_invalidate(
+    upstream: CountingClient,
+) -> None:
+    cache = _cache()
+    client = CachedMCPClient(upstream, cache, "t_acme")
+
+    await client.call_tool_batch("fetch_feed", [{"page": 1}, {"page": 1}, {"page": 2}])
+    await client.call_tool_batch("post_content", [{"text": "a"}, {"text": "b"}])
+    await client.call_tool("fetch_feed", {"page": 1})
+
+    assert [name for name, _ in upstream.calls].count("fetch_feed") == 3
+    assert cache.stats().coalesced == 1
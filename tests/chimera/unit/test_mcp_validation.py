@@ -0,0 +1,52 @@
+import json
+from pathlib import Path
+
+import pytest
+from jsonschema.exceptions import SchemaError
+
+from chimera.services.mcp_client import MCPClient
+from chimera.services.mcp_validation import (
+    ToolArgumentError,
+    compile_argument_validator,
+    compile_argument_validators,
+)
+
+
+def _config_schemas() -> dict[str, dict[str, object]]:
+    config = json.loads((Path(__file__).parents[3] / "mcp.json").read_text(encoding="utf-8"))
+    return {
+        tool["name"]: tool["input_schema"]
+        for server in config["servers"].values()
+        for tool in server["tools"]
+    }
+
+
+def test_every_configured_input_schema_compiles() -> None:
+    validators = compile_argument_validators(_config_schemas())
+
+    validators["remember_fact"]({"content": "likes jazz", "tags": ["music"]})
+    with pytest.raises(ToolArgumentError) as excinfo:
+        validators["remember_fact"]({"content": "", "extra": True})
+
+    assert excinfo.value.tool_name == "remember_fact"
+    assert len(excinfo.value.errors) == 2
+
+
+def test_validator_reports_the_failing_path() -> None:
+    validate = compile_argument_validator(
+        "fetch_feed",
+        {"type": "object", "properties": {"limit": {"type": "integer", "maximum": 50}}},
+    )
+
+    with pytest.raises(ToolArgumentError, match="limit: 99 is greater than the maximum of 50"):
+        validate({"limit": 99})
+
+
+def test_invalid_schema_raises_or_is_skipped_by_policy() -> None:
+    schemas = {"broken": {"type": "nonsense"}, "ok": {"type": "object"}}
+
+    with pytest.raises(SchemaError):
+        compile_argument_validators(schemas)
+    assert list(compile_argument_validators(schemas, on_schema_error="skip")) == ["ok"]
+    with pytest.raises(SchemaError):
+        MCPClient("true", [], tool_schemas=schemas, on_schema_error="raise")
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from chimera.lib.memory_queue import InMemoryTaskQueue
+from tests.chimera.unit.helpers import Clock, make_task
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_first_then_fifo() -> None:
+    queue = InMemoryTaskQueue(block_ms=None)
+    await queue.enqueue_many(
+        "t_acme",
+        [
+            make_task("low"),
+            make_task("high_1", priority=90),
+            make_task("mid", priority=50),
+            make_task("high_2", priority=90),
+        ],
+    )
+
+    tasks = await queue.dequeue("t_acme", batch_size=4, worker_id="w1")
+
+    assert [task.task_id for task in tasks] == ["high_1", "high_2", "mid", "low"]
+    assert queue.depth("t_acme") == 0
+    assert queue.pending_count("t_acme") == 4
+
+
+@pytest.mark.asyncio
+async def test_visibility_timeout_redelivers_unacked_task() -> None:
+    clock = Clock(0.0)
+    queue = InMemoryTaskQueue(block_ms=None, visibility_timeout_ms=500, clock=clock)
+    await queue.enqueue("t_acme", make_task("tk_1"))
+    (delivered,) = await queue.dequeue("t_acme", worker_id="w1")
+
+    assert await queue.dequeue("t_acme", worker_id="w2") == []
+    clock.now = 0.5
+    (redelivered,) = await queue.dequeue("t_acme", worker_id="w2")
+    await queue.ack("t_acme", redelivered, "w2")
+
+    assert redelivered._raw_id == delivered._raw_id
+    assert queue.pending_count("t_acme") == 0
+
+
+@pytest.mark.asyncio
+async def test_late_ack_of_a_requeued_task_prevents_redelivery() -> None:
+    clock = Clock(0.0)
+    queue = InMemoryTaskQueue(block_ms=None, visibility_timeout_ms=500, clock=clock)
+    await queue.enqueue("t_acme", make_task("slow"))
+    (slow,) = await queue.dequeue("t_acme", worker_id="w1")
+    await queue.enqueue("t_acme", make_task("urgent", priority=90))
+
+    clock.now = 0.5
+    (urgent,) = await queue.dequeue("t_acme", worker_id="w2")
+    assert (urgent.task_id, queue.depth("t_acme")) == ("urgent", 1)
+    await queue.ack("t_acme", slow, "w1")
+
+    assert queue.depth("t_acme") == 0
+    assert await queue.dequeue("t_acme", worker_id="w2") == []
+
+
+@pytest.mark.asyncio
+async def test_blocking_dequeue_wakes_on_enqueue() -> None:
+    queue = InMemoryTaskQueue(block_ms=1000)
+
+    waiter = asyncio.create_task(queue.dequeue("t_acme", worker_id="w1"))
+    await asyncio.sleep(0)
+    await queue.enqueue("t_acme", make_task("tk_1"))
+
+    tasks = await asyncio.wait_for(waiter, timeout=0.5)
+    assert [task.task_id for task in tasks] == ["tk_1"]
+
+
+@pytest.mark.asyncio
+async def test_blocking_dequeue_wakes_when_visibility_timeout_expires() -> None:
+    queue = InMemoryTaskQueue(block_ms=1000, visibility_timeout_ms=100)
+    await queue.enqueue("t_acme", make_task("tk_1"))
+    (delivered,) = await queue.dequeue("t_acme", worker_id="w1")
+
+    started = asyncio.get_running_loop().time()
+    (redelivered,) = await queue.dequeue("t_acme", worker_id="w2")
+    waited = asyncio.get_running_loop().time() - started
+
+    assert redelivered._raw_id == delivered._raw_id
+    assert 0.05 <= waited < 0.5
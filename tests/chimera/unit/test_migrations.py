@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, text
+from sqlmodel import SQLModel
+
+import chimera.db.schema  # noqa: F401  (registers the tables on SQLModel.metadata)
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture
+def alembic_config(tmp_path: Path) -> Config:
+    config = Config(str(REPO_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(REPO_ROOT / "scripts/db/migrations"))
+    config.set_main_option("sqlalchemy.url", f"sqlite:///{tmp_path / 'migrations.db'}")
+    return config
+
+
+def test_migrations_match_models_and_downgrade_cleanly(alembic_config: Config) -> None:
+    url = alembic_config.get_main_option("sqlalchemy.url")
+    assert url is not None
+    engine = create_engine(url)
+
+    command.upgrade(alembic_config, "head")
+    with engine.connect() as connection:
+        assert compare_metadata(MigrationContext.configure(connection), SQLModel.metadata) == []
+
+    command.downgrade(alembic_config, "base")
+    with engine.connect() as connection:
+        tables = connection.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'"))
+        assert [name for (name,) in tables] == ["alembic_version"]
+    engine.dispose()
+
+
+@pytest.mark.parametrize(
+    ("query", "index"),
+    [
+        (
+            "SELECT id FROM review_cards WHERE status = 'OPEN' ORDER BY created_at LIMIT 10",
+            "ix_review_cards_open_created",
+        ),
+        (
+            "SELECT id FROM tasks WHERE session_id = :id AND status = 'RUNNING' "
+            "ORDER BY created_at DESC LIMIT 10",
+            "ix_tasks_session_status_created",
+        ),
+        (
+            "SELECT id FROM transactions WHERE budget_id = :id AND status = 'EXECUTED' "
+            "AND created_at >= '2026-01-01'",
+            "ix_transactions_budget_status_created",
+        ),
+    ],
+)
+def test_hot_queries_are_planned_on_their_indexes(
+    alembic_config: Config, query: str, index: str
+) -> None:
+    url = alembic_config.get_main_option("sqlalchemy.url")
+    assert url is not None
+    command.upgrade(alembic_config, "head")
+    engine = create_engine(url)
+
+    with engine.connect() as connection:
+        plan = connection.execute(text(f"EXPLAIN QUERY PLAN {query}"), {"id": "x"}).all()
+
+    assert any(index in row.detail for row in plan), plan
+    engine.dispose()
@@ -0,0 +1,91 @@
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlmodel import SQLModel
+
+from chimera.db.engine import Database, DatabaseConfig
+from chimera.db.partitions import PartitionManager, PartitionPolicy, plan_maintenance
+from chimera.db.repository import Repository
+from chimera.db.schema import Task, TaskResult
+from chimera.db.write_behind import TASK_RESULTS, insert_ignoring_conflicts
+
+NOW = datetime(2026, 11, 20, 15, 30, tzinfo=UTC)
+
+
+@pytest.fixture
+async def database(tmp_path: Path) -> AsyncGenerator[Database, None]:
+    database = Database.from_config(
+        DatabaseConfig(url=f"sqlite+aiosqlite:///{tmp_path / 'chimera.db'}")
+    )
+    async with database.engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+    yield database
+    await database.dispose()
+
+
+def test_plan_creates_upcoming_partitions_across_year_end() -> None:
+    policy = PartitionPolicy(table="tasks", premake=2)
+
+    actions = plan_maintenance(policy, {"tasks_p20261101"}, NOW)
+
+    assert [(a.kind, a.name) for a in actions] == [
+        ("create", "tasks_p20261201"),
+        ("create", "tasks_p20270101"),
+    ]
+    assert actions[0].statements() == (
+        "CREATE TABLE IF NOT EXISTS tasks_p20261201 PARTITION OF tasks FOR VALUES "
+        "FROM ('2026-12-01T00:00:00+00:00') TO ('2027-01-01T00:00:00+00:00')",
+    )
+    assert plan_maintenance(policy, {a.name for a in actions} | {"tasks_p20261101"}, NOW) == []
+
+
+def test_plan_expires_partitions_past_retention() -> None:
+    existing = {f"task_results_p202611{day:02d}" for day in range(1, 21)} | {"task_results_old"}
+    dropping = PartitionPolicy(table="task_results", interval="day", premake=1, retention_days=7)
+    archiving = dropping.model_copy(update={"archive_schema": "archive"})
+
+    expired = [a for a in plan_maintenance(dropping, existing, NOW) if a.kind == "drop"]
+    archived = [a for a in plan_maintenance(archiving, existing, NOW) if a.kind == "archive"]
+
+    # The cutoff is 2026-11-13 15:30; the 12th is the last partition wholly before it.
+    assert [a.name for a in expired][-1] == "task_results_p20261112"
+    assert len(expired) == 12
+    assert expired[0].statements() == ("DROP TABLE IF EXISTS task_results_p20261101",)
+    assert archived[0].statements()[1:] == (
+        "ALTER TABLE task_results DETACH PARTITION task_results_p20261101",
+        "ALTER TABLE task_results_p20261101 SET SCHEMA archive",
+    )
+
+
+@pytest.mark.asyncio
+async def test_repository_reads_are_bounded_to_the_lookback_window(database: Database) -> None:
+    repo = Repository(database, lookback=timedelta(days=30), clock=lambda: NOW)
+    recent = Task(type="post", created_at=NOW - timedelta(days=1))
+    old = Task(type="post", created_at=NOW - timedelta(days=90))
+    await repo.add_tasks([recent, old])
+    await repo.add_results(
+        [
+            TaskResult(task_id=recent.id, status="SUCCEEDED", created_at=NOW),
+            TaskResult(task_id=old.id, status="SUCCEEDED", created_at=NOW - timedelta(days=89)),
+        ]
+    )
+
+    loaded = await repo.get_tasks([recent.id, old.id], load=("results",))
+    everything = await repo.get_tasks([recent.id, old.id], since=NOW - timedelta(days=365))
+
+    assert [task.id for task in loaded] == [recent.id]
+    assert len(loaded[0].results) == 1
+    assert len(everything) == 2
+    assert list(await repo.results_for_tasks([recent.id, old.id])) == [recent.id]
+    assert await PartitionManager(database.engine).maintain() == []
+
+
+def test_result_upserts_target_the_partitioned_key_on_postgres() -> None:
+    statement = insert_ignoring_conflicts(TASK_RESULTS, "postgresql")
+
+    assert "ON CONFLICT (id, created_at) DO NOTHING" in str(
+        statement.compile(dialect=postgresql.dialect())
+    )
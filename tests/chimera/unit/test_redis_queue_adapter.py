@@ -6,6 +6,7 @@ import pytest
 
 from chimera.lib.redis_queue import RedisTaskQueue
 from chimera.models.task import Task
+from tests.chimera.unit.helpers import make_task
 
 
 @pytest.fixture
@@ -55,3 +56,47 @@ async def test_redis_queue_ack(redis_client: fakeredis.aioredis.FakeRedis) -> No
 
     # Ack the task
     await queue.ack("t_acme", tasks[0], "w1")
+
+
+@pytest.mark.asyncio
+async def test_redis_queue_batches_enqueue_dequeue_and_ack(
+    redis_client: fakeredis.aioredis.FakeRedis,
+) -> None:
+    queue = RedisTaskQueue(redis_client, block_ms=None)
+
+    ids = await queue.enqueue_many("t_acme", [make_task(f"tk_{i}") for i in range(250)])
+    first = await queue.dequeue("t_acme", batch_size=200, worker_id="w1")
+    second = await queue.dequeue("t_acme", batch_size=200, worker_id="w1")
+    await queue.ack_many("t_acme", [*first, *second], "w1")
+
+    assert len(ids) == 250
+    assert [task.task_id for task in first[:2]] == ["tk_0", "tk_1"]
+    assert len(second) == 50
+    assert await queue.dequeue_pending("t_acme", worker_id="w2", idle_time_ms=0) == []
+
+
+@pytest.mark.asyncio
+async def test_redis_queue_isolates_tenants(redis_client: fakeredis.aioredis.FakeRedis) -> None:
+    queue = RedisTaskQueue(redis_client, block_ms=None)
+
+    await queue.enqueue("t_acme", make_task("tk_acme"))
+    with pytest.raises(ValueError):
+        await queue.enqueue("t_other", make_task("tk_acme"))
+
+    assert await queue.dequeue("t_other", batch_size=10, worker_id="w1") == []
+    assert len(await queue.dequeue("t_acme", batch_size=10, worker_id="w1")) == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_queue_dead_letters_undecodable_entries(
+    redis_client: fakeredis.aioredis.FakeRedis,
+) -> None:
+    queue = RedisTaskQueue(redis_client, block_ms=None)
+    await queue.enqueue("t_acme", make_task("tk_ok"))
+    await redis_client.xadd(queue.stream_key("t_acme"), {"task": b"not json"})
+
+    tasks = await queue.dequeue("t_acme", batch_size=10, worker_id="w1")
+
+    assert [task.task_id for task in tasks] == ["tk_ok"]
+    assert await redis_client.xlen(queue.stream_key("t_acme") + ":dead") == 1
+    assert await queue.dequeue_pending("t_acme", worker_id="w2", idle_time_ms=0) == tasks
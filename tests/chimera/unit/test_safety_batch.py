@@ -0,0 +1,84 @@
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
+
+from chimera.lib.keyword_scanner import KeywordMatch, KeywordScanner, StringLeaves
+from chimera.models.result import Result, ResultStatus
+from chimera.models.review import ReviewReason
+from chimera.services.safety import SafetyService
+
+
+def _result(output: dict[str, Any]) -> Result:
+    return Result(
+        tenant_id="t_tenant1",
+        trace_id=str(uuid4()),
+        task_id=str(uuid4()),
+        status=ResultStatus.SUCCEEDED,
+        output=output,
+        completed_at=datetime.now(UTC),
+    )
+
+
+def test_check_results_stops_at_the_first_failing_check() -> None:
+    service = SafetyService(confidence_threshold=0.7, max_output_chars=40)
+    results = [
+        _result({"confidence": 0.9, "content": "weather is fine"}),
+        _result({"confidence": 0.5, "content": "my password"}),
+        _result({"content": "x" * 41, "note": "SSN"}),
+        _result({"confidence": 0.8, "posts": [{"body": "ok"}, {"body": "the SSN is"}]}),
+        _result({"content": "no score, still clean"}),
+    ]
+
+    verdicts = service.check_results(results)
+
+    assert [v.passed for v in verdicts] == [True, False, False, False, True]
+    assert [v.reason for v in verdicts] == [
+        None,
+        ReviewReason.LOW_CONFIDENCE,
+        ReviewReason.OUTPUT_TOO_LARGE,
+        ReviewReason.SENSITIVE_KEYWORD,
+        None,
+    ]
+    assert verdicts[3].match == KeywordMatch("SSN", ("posts", 1, "body"), 4, 7)
+    assert verdicts[3].details == "Found keyword 'SSN'"
+    assert service.check_result(results[0]) is True
+    assert service.check_result(results[1]) is False
+
+
+def test_check_results_counts_only_results_that_reach_each_check() -> None:
+    service = SafetyService(max_output_chars=10)
+    results = [
+        _result({"confidence": 0.1}),
+        _result({"content": "far too long for the limit"}),
+        _result({"content": "password"}),
+        _result({"content": "fine"}),
+    ]
+
+    service.check_results(results)
+    service.check_results([])
+    stats = service.stats()
+
+    assert list(stats) == ["confidence", "size", "keywords"]
+    assert [(s.checked, s.failed) for s in stats.values()] == [(4, 1), (3, 1), (2, 1)]
+    assert all(s.elapsed_ns >= 0 for s in stats.values())
+
+
+def test_first_matches_skips_to_the_next_payload_after_a_hit() -> None:
+    scanner = KeywordScanner(["password", "SSN"])
+    documents = [
+        StringLeaves.collect({"a": "password then SSN", "b": "SSN"}),
+        StringLeaves.collect({}),
+        StringLeaves.collect({"a": ["clean", "text"]}),
+        StringLeaves.collect({"a": "clean", "b": {"c": "an SSN"}}),
+    ]
+
+    firsts = scanner.first_matches(documents)
+
+    assert firsts == [
+        KeywordMatch("password", ("a",), 0, 8),
+        None,
+        None,
+        KeywordMatch("SSN", ("b", "c"), 3, 6),
+    ]
+    assert documents[0].total_chars == 20
+    assert KeywordScanner([]).first_matches(documents) == [None] * 4
@@ -0,0 +1,131 @@
+import sys
+from collections.abc import Iterator
+from importlib.metadata import EntryPoint
+from pathlib import Path
+
+import pytest
+
+from chimera.pipelines.skills_workflow import SkillsWorkflowPipeline
+from chimera.skills import registry as registry_module
+from chimera.skills.registry import SkillRegistry
+from chimera.skills.samples import register_sample_skills
+
+SKILL_MODULE = """
+from pydantic import BaseModel
+
+from chimera.skills.base import Skill
+
+
+class PingInput(BaseModel):
+    pass
+
+
+class PingSkill(Skill[PingInput, PingInput]):
+    name = "ping"
+    description = "Lazily imported test skill."
+    input_model = PingInput
+    output_model = PingInput
+
+    async def run(self, payload, context):
+        return payload
+"""
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture
+def skill_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    name = f"lazy_ping_{abs(hash(tmp_path))}"
+    (tmp_path / f"{name}.py").write_text(SKILL_MODULE, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    sys.modules.pop(name, None)
+
+
+def test_lazy_skill_is_imported_on_first_get(skill_module: str) -> None:
+    registry = SkillRegistry()
+    registry.register_lazy("ping", f"{skill_module}:PingSkill")
+
+    assert skill_module not in sys.modules
+    assert registry.list_names() == ["ping"]
+    assert registry.import_report() == []
+
+    skill_cls = registry.get("ping")
+
+    assert skill_cls.name == "ping"
+    assert skill_module in sys.modules
+    [timing] = registry.import_report()
+    assert timing.skill_name == "ping"
+    assert timing.seconds >= 0
+    assert registry.get("ping") is skill_cls
+
+
+def test_lazy_skill_name_mismatch_is_rejected(skill_module: str) -> None:
+    registry = SkillRegistry()
+    registry.register_lazy("pong", f"{skill_module}:PingSkill")
+
+    with pytest.raises(TypeError):
+        registry.get("pong")
+
+
+def test_duplicate_and_malformed_targets_are_rejected() -> None:
+    registry = SkillRegistry()
+    register_sample_skills(registry)
+
+    with pytest.raises(ValueError):
+        registry.register_lazy("echo", "chimera.skills.skills.echo:EchoSkill")
+    with pytest.raises(ValueError):
+        registry.register_lazy("other", "chimera.skills.skills.echo")
+
+
+def test_manifest_and_entry_points_populate_registry(
+    skill_module: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Spec: specs/002-skills-mcp-workflow/spec.md (AC-006)."""
+    discovered = [
+        EntryPoint(name="ping", value=f"{skill_module}:PingSkill", group="chimera.skills")
+    ]
+    monkeypatch.setattr(registry_module, "entry_points", lambda group: discovered)
+    registry = SkillRegistry()
+
+    manifest_names = registry.load_manifest(REPO_ROOT / "skills.json")
+    plugin_names = registry.load_entry_points()
+
+    assert manifest_names == ["echo", "normalize_handle", "mcp_tool"]
+    assert plugin_names == ["ping"]
+    assert skill_module not in sys.modules
+    report = registry.load_all()
+    assert {timing.skill_name for timing in report} == {
+        "echo",
+        "normalize_handle",
+        "mcp_tool",
+        "ping",
+    }
+
+
+def test_pipeline_registers_skills_from_the_manifest_and_entry_points(
+    skill_module: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    discovered = [
+        EntryPoint(name="ping", value=f"{skill_module}:PingSkill", group="chimera.skills")
+    ]
+    monkeypatch.setattr(registry_module, "entry_points", lambda group: discovered)
+    registry = SkillRegistry()
+
+    SkillsWorkflowPipeline(registry)
+
+    assert registry.list_names() == sorted(["echo", "normalize_handle", "mcp_tool", "ping"])
+    assert skill_module not in sys.modules
+
+
+def test_default_manifest_prefers_packaged_copy(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from chimera.skills import samples
+
+    (tmp_path / "skills.json").write_text("{}", encoding="utf-8")
+    monkeypatch.setattr(samples.resources, "files", lambda package: tmp_path)
+    assert samples._default_manifest() == tmp_path / "skills.json"
+
+    (tmp_path / "skills.json").unlink()
+    assert samples._default_manifest() == REPO_ROOT / "skills.json"
@@ -0,0 +1,146 @@
+from collections.abc import Sequence
+from types import TracebackType
+from typing import Any
+
+import pytest
+
+from chimera.models.mcp import ToolDefinition, ToolResult
+from chimera.ports.mcp import MCPClientPort
+from chimera.skills.models import SkillContext, SkillRunStatus
+from chimera.skills.registry import SkillRegistry
+from chimera.skills.samples import register_sample_skills
+from chimera.skills.skills import (
+    EchoInput,
+    EchoSkill,
+    McpToolInput,
+    McpToolSkill,
+    NormalizeHandleInput,
+    NormalizeHandleOutput,
+    NormalizeHandleSkill,
+)
+from chimera.skills.workflow import (
+    SkillWorkflowRunner,
+    WorkflowDefinition,
+    WorkflowExecutionMode,
+    WorkflowStep,
+)
+
+
+class BatchingClient(MCPClientPort):
+    """In-memory MCP client that records batched calls."""
+
+    def __init__(self) -> None:
+        self.batches: list[tuple[str, int]] = []
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        return None
+
+    async def list_tools(self) -> list[ToolDefinition]:
+        return []
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> ToolResult:
+        return ToolResult(content={"tool": name, **arguments})
+
+    async def call_tool_batch(
+        self, name: str, arguments: Sequence[dict[str, Any]]
+    ) -> list[ToolResult]:
+        self.batches.append((name, len(arguments)))
+        return [ToolResult(content={"tool": name, **args}) for args in arguments]
+
+
+class CountingNormalizeSkill(NormalizeHandleSkill):
+    name = "counting_normalize"
+    batch_sizes: list[int] = []
+
+    async def run_batch(
+        self, payloads: Sequence[NormalizeHandleInput], context: SkillContext
+    ) -> list[NormalizeHandleOutput]:
+        CountingNormalizeSkill.batch_sizes.append(len(payloads))
+        return await super().run_batch(payloads, context)
+
+
+@pytest.fixture
+def context() -> SkillContext:
+    return SkillContext(tenant_id="t_acme", trace_id="tr_1")
+
+
+@pytest.mark.asyncio
+async def test_default_run_batch_falls_back_to_run(context: SkillContext) -> None:
+    outputs = await EchoSkill().run_batch([EchoInput(message="a"), EchoInput(message="b")], context)
+
+    assert [output.message for output in outputs] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_normalize_handle_batch(context: SkillContext) -> None:
+    payloads = [NormalizeHandleInput(handle=handle) for handle in [" chimera ", "@ai", "x"]]
+
+    outputs = await NormalizeHandleSkill().run_batch(payloads, context)
+
+    assert [output.handle for output in outputs] == ["@chimera", "@ai", "@x"]
+
+
+@pytest.mark.asyncio
+async def test_mcp_tool_batch_coalesces_calls_per_tool(context: SkillContext) -> None:
+    client = BatchingClient()
+    context = context.model_copy(update={"mcp_client": client})
+    payloads = [
+        McpToolInput(tool_name="fetch_feed", arguments={"platform": "x"}),
+        McpToolInput(tool_name="recall_context", arguments={"query": "q"}),
+        McpToolInput(tool_name="fetch_feed", arguments={"platform": "moltbook"}),
+    ]
+
+    outputs = await McpToolSkill().run_batch(payloads, context)
+
+    assert sorted(client.batches) == [("fetch_feed", 2), ("recall_context", 1)]
+    assert [output.response["content"] for output in outputs] == [
+        {"tool": "fetch_feed", "platform": "x"},
+        {"tool": "recall_context", "query": "q"},
+        {"tool": "fetch_feed", "platform": "moltbook"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_mcp_tool_batch_requires_client(context: SkillContext) -> None:
+    """Spec: specs/002-skills-mcp-workflow/spec.md (AC-004)."""
+    with pytest.raises(RuntimeError):
+        await McpToolSkill().run_batch([McpToolInput(tool_name="fetch_feed")], context)
+
+
+@pytest.mark.asyncio
+async def test_parallel_runner_coalesces_sibling_batch_steps(context: SkillContext) -> None:
+    CountingNormalizeSkill.batch_sizes = []
+    registry = SkillRegistry()
+    register_sample_skills(registry)
+    registry.register(CountingNormalizeSkill)
+    definition = WorkflowDefinition(
+        workflow_id="batch",
+        steps=[
+            WorkflowStep(skill_name="echo", step_id="start", input={"message": "go"}),
+            *(
+                WorkflowStep(
+                    skill_name="counting_normalize",
+                    step_id=f"n{i}",
+                    input={"handle": f"h{i}"},
+                    depends_on=["start"],
+                )
+                for i in range(4)
+            ),
+            WorkflowStep(skill_name="echo", input={"message": "${steps.n3.handle}"}),
+        ],
+    )
+    runner = SkillWorkflowRunner(registry, mode=WorkflowExecutionMode.PARALLEL)
+
+    result = await runner.run(definition, context)
+
+    assert CountingNormalizeSkill.batch_sizes == [4]
+    assert [record.output for record in result.steps[1:5]] == [
+        {"handle": f"@h{i}"} for i in range(4)
+    ]
+    assert result.steps[-1].output == {"message": "@h3"}
+    assert all(record.status is SkillRunStatus.SUCCEEDED for record in result.steps)
@@ -0,0 +1,143 @@
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from chimera.skills.base import Skill
+from chimera.skills.bindings import BindingError, find_references, resolve_bindings
+from chimera.skills.models import SkillContext, SkillRunRecord
+from chimera.skills.registry import SkillRegistry
+from chimera.skills.samples import register_sample_skills
+from chimera.skills.skills import NormalizeHandleOutput
+from chimera.skills.workflow import (
+    SkillWorkflowRunner,
+    WorkflowDefinition,
+    WorkflowExecutionMode,
+    WorkflowStep,
+)
+
+
+class CaptureSkill(Skill[NormalizeHandleOutput, NormalizeHandleOutput]):
+    name = "capture"
+    description = "Record the payload object it receives."
+    input_model = NormalizeHandleOutput
+    output_model = NormalizeHandleOutput
+
+    received: list[BaseModel] = []
+
+    async def run(
+        self, payload: NormalizeHandleOutput, context: SkillContext
+    ) -> NormalizeHandleOutput:
+        _ = context
+        CaptureSkill.received.append(payload)
+        return payload
+
+
+@pytest.fixture
+def registry() -> SkillRegistry:
+    CaptureSkill.received = []
+    registry = SkillRegistry()
+    register_sample_skills(registry)
+    registry.register(CaptureSkill)
+    return registry
+
+
+@pytest.fixture
+def context() -> SkillContext:
+    return SkillContext(tenant_id="t_acme", trace_id="tr_1")
+
+
+def test_resolve_bindings_preserves_types_and_interpolates() -> None:
+    outputs = {"normalize": NormalizeHandleOutput(handle="@chimera")}
+
+    resolved = resolve_bindings(
+        {"whole": "${steps.normalize}", "text": "hi ${steps.normalize.handle}!"}, outputs
+    )
+
+    assert resolved == {"whole": outputs["normalize"], "text": "hi @chimera!"}
+    assert find_references({"a": ["${steps.x.y}"], "b": "${steps.z}"}) == {"x", "z"}
+
+
+def test_resolve_bindings_rejects_unknown_path() -> None:
+    outputs = {"normalize": NormalizeHandleOutput(handle="@chimera")}
+
+    with pytest.raises(BindingError):
+        resolve_bindings("${steps.normalize.missing}", outputs)
+
+
+@pytest.mark.parametrize("mode", list(WorkflowExecutionMode))
+@pytest.mark.asyncio
+async def test_step_output_feeds_next_step(
+    registry: SkillRegistry, context: SkillContext, mode: WorkflowExecutionMode
+) -> None:
+    """Spec: specs/002-skills-mcp-workflow/spec.md (AC-002)."""
+    definition = WorkflowDefinition(
+        workflow_id="chain",
+        steps=[
+            WorkflowStep(skill_name="echo", step_id="echo", input={"message": "chimera_ai"}),
+            WorkflowStep(
+                skill_name="normalize_handle",
+                step_id="normalize",
+                input={"handle": "${steps.echo.message}"},
+            ),
+            WorkflowStep(skill_name="capture", step_id="capture", input="${steps.normalize}"),
+        ],
+    )
+    runner = SkillWorkflowRunner(registry, mode=mode)
+
+    result = await runner.run(definition, context)
+
+    assert result.steps[-1].output == {"handle": "@chimera_ai"}
+    # The validated output model is handed over without a dump/validate cycle.
+    assert CaptureSkill.received == [result.output_of("normalize")]
+    assert CaptureSkill.received[0] is result.output_of("normalize")
+
+
+@pytest.mark.asyncio
+async def test_model_of_other_type_is_validated_from_attributes(
+    registry: SkillRegistry, context: SkillContext
+) -> None:
+    definition = WorkflowDefinition(
+        workflow_id="renormalize",
+        steps=[
+            WorkflowStep(skill_name="normalize_handle", step_id="first", input={"handle": "a"}),
+            WorkflowStep(skill_name="normalize_handle", step_id="second", input="${steps.first}"),
+        ],
+    )
+
+    result = await SkillWorkflowRunner(registry).run(definition, context)
+
+    assert result.output_of("second") == NormalizeHandleOutput(handle="@a")
+    assert result.steps[-1].step_id == "second"
+
+
+@pytest.mark.asyncio
+async def test_step_records_hold_validated_dict_output(
+    registry: SkillRegistry, context: SkillContext
+) -> None:
+    definition = WorkflowDefinition(
+        workflow_id="record",
+        steps=[WorkflowStep(skill_name="normalize_handle", step_id="n", input={"handle": "a"})],
+    )
+
+    result = await SkillWorkflowRunner(registry).run(definition, context)
+    record = result.steps[0]
+
+    assert record.output == {"handle": "@a"}
+    assert result.output_of("n") == NormalizeHandleOutput(handle="@a")
+    assert SkillRunRecord.model_validate(record.model_dump()) == record
+    with pytest.raises(ValidationError):
+        SkillRunRecord.model_validate({**record.model_dump(), "output": "garbage"})
+    with pytest.raises(ValidationError):
+        SkillRunRecord.model_validate(record.model_dump(exclude={"output"}))
+
+
+def test_definition_rejects_binding_to_unknown_step() -> None:
+    with pytest.raises(ValidationError):
+        WorkflowDefinition(
+            workflow_id="bad",
+            steps=[WorkflowStep(skill_name="echo", input={"message": "${steps.nope.message}"})],
+        )
+
+
+def test_step_rejects_non_binding_string_input() -> None:
+    with pytest.raises(ValidationError):
+        WorkflowStep(skill_name="echo", input="not a binding")
@@ -0,0 +1,102 @@
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from chimera.skills.base import Skill
+from chimera.skills.models import SkillContext, SkillRunStatus
+from chimera.skills.registry import SkillRegistry
+from chimera.skills.samples import build_sample_workflow, register_sample_skills
+from chimera.skills.workflow import SkillWorkflowRunner, WorkflowDefinition, WorkflowStep
+
+
+class CounterInput(BaseModel):
+    pass
+
+
+class CounterOutput(BaseModel):
+    runs: int
+
+
+class CounterSkill(Skill[CounterInput, CounterOutput]):
+    """Stateful skill: each instance counts its own runs."""
+
+    name = "counter"
+    description = "Count runs on this instance."
+    input_model = CounterInput
+    output_model = CounterOutput
+
+    def __init__(self) -> None:
+        self.runs = 0
+
+    async def run(self, payload: CounterInput, context: SkillContext) -> CounterOutput:
+        _ = payload, context
+        self.runs += 1
+        return CounterOutput(runs=self.runs)
+
+
+@pytest.fixture
+def runner() -> SkillWorkflowRunner:
+    registry = SkillRegistry()
+    register_sample_skills(registry)
+    registry.register(CounterSkill)
+    return SkillWorkflowRunner(registry)
+
+
+def test_compile_rejects_unknown_skill(runner: SkillWorkflowRunner) -> None:
+    definition = WorkflowDefinition(
+        workflow_id="typo", steps=[WorkflowStep(skill_name="normalise_handle")]
+    )
+
+    with pytest.raises(KeyError):
+        runner.compile(definition)
+
+
+def test_compile_validates_static_inputs(runner: SkillWorkflowRunner) -> None:
+    """Spec: specs/002-skills-mcp-workflow/spec.md (AC-003)."""
+    definition = WorkflowDefinition(
+        workflow_id="invalid", steps=[WorkflowStep(skill_name="echo", input={})]
+    )
+
+    with pytest.raises(ValidationError):
+        runner.compile(definition)
+
+
+def test_compile_shares_stateless_instances(runner: SkillWorkflowRunner) -> None:
+    definition = WorkflowDefinition(
+        workflow_id="shared",
+        steps=[
+            WorkflowStep(skill_name="echo", input={"message": "a"}),
+            WorkflowStep(skill_name="echo", input={"message": "b"}),
+            WorkflowStep(skill_name="counter"),
+        ],
+    )
+
+    plan = runner.compile(definition)
+
+    assert plan.steps[0].instance is not None
+    assert plan.steps[0].instance is plan.steps[1].instance
+    assert plan.steps[2].instance is None
+
+
+@pytest.mark.asyncio
+async def test_compiled_plan_is_reusable_across_runs(runner: SkillWorkflowRunner) -> None:
+    definition, context = build_sample_workflow("t_acme", "tr_1")
+    plan = runner.compile(definition)
+
+    first = await runner.run(plan, context)
+    second = await runner.run(plan, context)
+
+    assert first.steps[-1].output == second.steps[-1].output == {"handle": "@chimera_ai"}
+    assert all(record.status is SkillRunStatus.SUCCEEDED for record in second.steps)
+
+
+@pytest.mark.asyncio
+async def test_stateful_skill_gets_fresh_instance_per_run(runner: SkillWorkflowRunner) -> None:
+    plan = runner.compile(
+        WorkflowDefinition(workflow_id="count", steps=[WorkflowStep(skill_name="counter")])
+    )
+    context = SkillContext(tenant_id="t_acme", trace_id="tr_1")
+
+    await runner.run(plan, context)
+    result = await runner.run(plan, context)
+
+    assert result.steps[0].output == {"runs": 1}
@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from chimera.skills.base import Skill
+from chimera.skills.models import SkillContext, SkillRunStatus
+from chimera.skills.registry import SkillRegistry
+from chimera.skills.samples import register_sample_skills
+from chimera.skills.workflow import (
+    SkillWorkflowRunner,
+    WorkflowDefinition,
+    WorkflowExecutionMode,
+    WorkflowStep,
+)
+
+
+class SleepInput(BaseModel):
+    label: str
+
+
+class SleepOutput(BaseModel):
+    label: str
+
+
+class SleepSkill(Skill[SleepInput, SleepOutput]):
+    name = "sleep"
+    description = "Yield to the loop and record concurrency."
+    input_model = SleepInput
+    output_model = SleepOutput
+
+    in_flight = 0
+    peak = 0
+
+    async def run(self, payload: SleepInput, context: SkillContext) -> SleepOutput:
+        _ = context
+        SleepSkill.in_flight += 1
+        SleepSkill.peak = max(SleepSkill.peak, SleepSkill.in_flight)
+        await asyncio.sleep(0.01)
+        SleepSkill.in_flight -= 1
+        if payload.label == "boom":
+            raise RuntimeError("boom")
+        return SleepOutput(label=payload.label)
+
+
+@pytest.fixture
+def registry() -> SkillRegistry:
+    SleepSkill.in_flight = 0
+    SleepSkill.peak = 0
+    registry = SkillRegistry()
+    register_sample_skills(registry)
+    registry.register(SleepSkill)
+    return registry
+
+
+@pytest.fixture
+def context() -> SkillContext:
+    return SkillContext(tenant_id="t_acme", trace_id="tr_1")
+
+
+def _fan_out(width: int) -> WorkflowDefinition:
+    steps = [
+        WorkflowStep(skill_name="sleep", step_id=f"fetch_{i}", input={"label": str(i)})
+        for i in range(width)
+    ]
+    steps.append(
+        WorkflowStep(
+            skill_name="echo",
+            step_id="join",
+            input={"message": "done"},
+            depends_on=[step.step_id for step in steps if step.step_id],
+        )
+    )
+    return WorkflowDefinition(workflow_id="fan_out", steps=steps)
+
+
+@pytest.mark.asyncio
+async def test_parallel_runner_executes_independent_steps_concurrently(
+    registry: SkillRegistry, context: SkillContext
+) -> None:
+    """Spec: specs/002-skills-mcp-workflow/spec.md (AC-002)."""
+    runner = SkillWorkflowRunner(registry, mode=WorkflowExecutionMode.PARALLEL)
+
+    result = await runner.run(_fan_out(5), context)
+
+    assert SleepSkill.peak == 5
+    assert [record.step_id for record in result.steps] == [
+        "fetch_0",
+        "fetch_1",
+        "fetch_2",
+        "fetch_3",
+        "fetch_4",
+        "join",
+    ]
+    assert all(record.status is SkillRunStatus.SUCCEEDED for record in result.steps)
+
+
+@pytest.mark.asyncio
+async def test_parallel_runner_respects_concurrency_limit(
+    registry: SkillRegistry, context: SkillContext
+) -> None:
+    runner = SkillWorkflowRunner(registry, mode=WorkflowExecutionMode.PARALLEL, max_concurrency=2)
+
+    result = await runner.run(_fan_out(6), context)
+
+    assert SleepSkill.peak == 2
+    assert len(result.steps) == 7
+
+
+@pytest.mark.asyncio
+async def test_parallel_runner_skips_dependents_of_failed_step(
+    registry: SkillRegistry, context: SkillContext
+) -> None:
+    definition = WorkflowDefinition(
+        workflow_id="failing",
+        steps=[
+            WorkflowStep(skill_name="sleep", step_id="bad", input={"label": "boom"}),
+            WorkflowStep(
+                skill_name="echo", step_id="after", input={"message": "x"}, depends_on=["bad"]
+            ),
+        ],
+    )
+    runner = SkillWorkflowRunner(registry, mode=WorkflowExecutionMode.PARALLEL)
+
+    result = await runner.run(definition, context)
+
+    assert len(result.steps) == 1
+    assert result.steps[0].status is SkillRunStatus.FAILED
+    assert result.steps[0].error == "boom"
+
+
+@pytest.mark.asyncio
+async def test_sequential_runner_is_default(registry: SkillRegistry, context: SkillContext) -> None:
+    runner = SkillWorkflowRunner(registry)
+
+    result = await runner.run(_fan_out(3), context)
+
+    assert SleepSkill.peak == 1
+    assert result.steps[-1].output == {"message": "done"}
+
+
+def test_definition_rejects_dependency_on_later_step() -> None:
+    with pytest.raises(ValidationError):
+        WorkflowDefinition(
+            workflow_id="bad",
+            steps=[
+                WorkflowStep(skill_name="echo", step_id="a", depends_on=["b"]),
+                WorkflowStep(skill_name="echo", step_id="b"),
+            ],
+        )
+
+
+def test_runner_rejects_invalid_concurrency(registry: SkillRegistry) -> None:
+    with pytest.raises(ValueError):
+        SkillWorkflowRunner(registry, max_concurrency=0)
@@ -0,0 +1,90 @@
+import asyncio
+from collections import Counter
+
+import pytest
+from pydantic import BaseModel
+
+from chimera.pipelines.skills_workflow import SkillsWorkflowPipeline
+from chimera.skills.base import Skill
+from chimera.skills.models import SkillContext, SkillRunStatus
+from chimera.skills.registry import SkillRegistry
+from chimera.skills.workflow import WorkflowDefinition, WorkflowStep
+
+
+class TrackInput(BaseModel):
+    pass
+
+
+class TrackOutput(BaseModel):
+    tenant_id: str
+
+
+class TrackSkill(Skill[TrackInput, TrackOutput]):
+    name = "track"
+    description = "Record global and per-tenant concurrency."
+    input_model = TrackInput
+    output_model = TrackOutput
+    stateless = True
+
+    active: Counter[str] = Counter()
+    peak_total = 0
+    peak_tenant = 0
+
+    async def run(self, payload: TrackInput, context: SkillContext) -> TrackOutput:
+        _ = payload
+        cls = TrackSkill
+        cls.active[context.tenant_id] += 1
+        cls.peak_total = max(cls.peak_total, sum(cls.active.values()))
+        cls.peak_tenant = max(cls.peak_tenant, cls.active[context.tenant_id])
+        await asyncio.sleep(0.005)
+        cls.active[context.tenant_id] -= 1
+        return TrackOutput(tenant_id=context.tenant_id)
+
+
+@pytest.fixture
+def pipeline() -> SkillsWorkflowPipeline:
+    TrackSkill.active = Counter()
+    TrackSkill.peak_total = 0
+    TrackSkill.peak_tenant = 0
+    registry = SkillRegistry()
+    registry.register(TrackSkill)
+    return SkillsWorkflowPipeline(registry)
+
+
+DEFINITION = WorkflowDefinition(workflow_id="track", steps=[WorkflowStep(skill_name="track")])
+
+
+@pytest.mark.asyncio
+async def test_run_many_streams_every_result(pipeline: SkillsWorkflowPipeline) -> None:
+    contexts = [SkillContext(tenant_id=f"t_{i % 7}", trace_id=f"tr_{i}") for i in range(200)]
+
+    results = [item async for item in pipeline.run_many(DEFINITION, contexts)]
+
+    assert len(results) == 200
+    for context, result in results:
+        assert result.steps[0].status is SkillRunStatus.SUCCEEDED
+        assert result.steps[0].output == {"tenant_id": context.tenant_id}
+
+
+@pytest.mark.asyncio
+async def test_run_many_enforces_global_and_tenant_caps(pipeline: SkillsWorkflowPipeline) -> None:
+    # A skewed load: one hot tenant followed by many quiet ones.
+    contexts = [SkillContext(tenant_id="t_hot", trace_id=f"tr_h{i}") for i in range(50)]
+    contexts += [SkillContext(tenant_id=f"t_{i}", trace_id=f"tr_{i}") for i in range(20)]
+
+    count = 0
+    async for _ in pipeline.run_many(
+        DEFINITION, contexts, max_concurrency=10, per_tenant_concurrency=3
+    ):
+        count += 1
+
+    assert count == 70
+    assert TrackSkill.peak_tenant == 3
+    assert TrackSkill.peak_total == 10
+
+
+@pytest.mark.asyncio
+async def test_run_many_rejects_invalid_limits(pipeline: SkillsWorkflowPipeline) -> None:
+    with pytest.raises(ValueError):
+        async for _ in pipeline.run_many(DEFINITION, [], per_tenant_concurrency=0):
+            pass
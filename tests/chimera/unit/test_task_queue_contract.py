@@ -0,0 +1,55 @@
+from collections.abc import AsyncGenerator
+
+import fakeredis.aioredis
+import pytest
+
+from chimera.lib.memory_queue import InMemoryTaskQueue
+from chimera.lib.redis_queue import RedisTaskQueue
+from chimera.ports.queue import TaskQueuePort
+from tests.chimera.unit.helpers import make_task
+
+
+@pytest.fixture(params=["memory", "redis"])
+async def queue(request: pytest.FixtureRequest) -> AsyncGenerator[TaskQueuePort, None]:
+    if request.param == "memory":
+        yield InMemoryTaskQueue(block_ms=None)
+        return
+    client = fakeredis.aioredis.FakeRedis()
+    yield RedisTaskQueue(client, block_ms=None)
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_queue_delivers_each_task_once_in_order(queue: TaskQueuePort) -> None:
+    await queue.enqueue_many("t_acme", [make_task("tk_1"), make_task("tk_2"), make_task("tk_3")])
+
+    first = await queue.dequeue("t_acme", batch_size=2, worker_id="w1")
+    second = await queue.dequeue("t_acme", batch_size=2, worker_id="w2")
+
+    assert [task.task_id for task in first] == ["tk_1", "tk_2"]
+    assert [task.task_id for task in second] == ["tk_3"]
+    assert await queue.dequeue("t_acme", batch_size=2, worker_id="w1") == []
+
+
+@pytest.mark.asyncio
+async def test_queue_reclaims_only_unacked_tasks(queue: TaskQueuePort) -> None:
+    await queue.enqueue_many("t_acme", [make_task("tk_done"), make_task("tk_lost")])
+    done, lost = await queue.dequeue("t_acme", batch_size=2, worker_id="w1")
+    await queue.ack("t_acme", done, "w1")
+
+    reclaimed = await queue.dequeue_pending("t_acme", worker_id="w2", idle_time_ms=0)
+    await queue.ack("t_acme", reclaimed[0], "w2")
+
+    assert [task.task_id for task in reclaimed] == [lost.task_id]
+    assert await queue.dequeue_pending("t_acme", worker_id="w3", idle_time_ms=0) == []
+
+
+@pytest.mark.asyncio
+async def test_queue_keeps_tenants_isolated(queue: TaskQueuePort) -> None:
+    await queue.enqueue("t_acme", make_task("tk_acme"))
+    with pytest.raises(ValueError):
+        await queue.enqueue("t_other", make_task("tk_acme"))
+
+    assert await queue.dequeue("t_other", batch_size=5, worker_id="w1") == []
+    assert await queue.dequeue_pending("t_other", worker_id="w1", idle_time_ms=0) == []
+    assert len(await queue.dequeue("t_acme", batch_size=5, worker_id="w1")) == 1
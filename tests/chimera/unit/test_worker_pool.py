@@ -0,0 +1,137 @@
+import asyncio
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+import pytest
+
+from chimera.lib.memory_queue import InMemoryTaskQueue
+from chimera.models.result import Result, ResultStatus
+from chimera.models.task import Task
+from chimera.services.worker_pool import WorkerPool
+from tests.chimera.unit.helpers import make_task
+
+
+class GatedLLM:
+    def __init__(self) -> None:
+        self.gate = asyncio.Event()
+        self.running = 0
+        self.peak = 0
+        self.done = 0
+
+    async def generate_result(self, task: Task) -> Result:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            if task.task_id != "fast":
+                await self.gate.wait()
+        finally:
+            self.running -= 1
+        self.done += 1
+        return Result(
+            tenant_id=task.tenant_id,
+            trace_id=task.trace_id,
+            task_id=task.task_id,
+            status=ResultStatus.SUCCEEDED,
+            output={},
+            completed_at=datetime.now(UTC),
+        )
+
+
+class ListSink:
+    def __init__(self) -> None:
+        self.task_ids: list[str] = []
+
+    async def write(self, tenant_id: str, results: Sequence[Result]) -> None:
+        self.task_ids.extend(result.task_id for result in results)
+
+
+def _tasks(count: int, task_id: str | None = None) -> list[Task]:
+    return [make_task(task_id or f"tk_{i}") for i in range(count)]
+
+
+async def _settle() -> None:
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_in_flight_calls_are_bounded_and_backlog_stays_queued() -> None:
+    queue = InMemoryTaskQueue(block_ms=None)
+    llm = GatedLLM()
+    await queue.enqueue_many("t_acme", _tasks(50))
+
+    async with WorkerPool(
+        queue, llm, ["t_acme"], consumers=6, max_in_flight=8, batch_size=4, idle_sleep_s=0.001
+    ) as pool:
+        await _settle()
+        assert llm.running == 8
+        assert pool.saturated
+        assert queue.depth("t_acme") == 42
+        assert queue.pending_count("t_acme") == 8
+
+        llm.gate.set()
+        while llm.done < 50:
+            await asyncio.sleep(0.001)
+
+    assert llm.peak == 8
+    assert queue.pending_count("t_acme") == 0
+
+
+@pytest.mark.asyncio
+async def test_drain_acks_finished_tasks_and_leaves_stuck_ones_reclaimable() -> None:
+    queue = InMemoryTaskQueue(block_ms=None)
+    llm = GatedLLM()
+    sink = ListSink()
+    await queue.enqueue_many("t_acme", _tasks(1, "fast") + _tasks(2))
+    pool = WorkerPool(
+        queue,
+        llm,
+        ["t_acme"],
+        consumers=2,
+        max_in_flight=4,
+        idle_sleep_s=0.001,
+        drain_timeout_s=0.01,
+        result_sink=sink,
+    )
+
+    await pool.start()
+    await _settle()
+    abandoned = await pool.drain()
+
+    assert abandoned == 2
+    assert llm.done == 1
+    assert sink.task_ids == ["fast"]
+    reclaimed = await queue.dequeue_pending("t_acme", "w2", idle_time_ms=0)
+    assert sorted(task.task_id for task in reclaimed) == ["tk_0", "tk_1"]
+
+
+@pytest.mark.asyncio
+async def test_drain_gives_up_on_a_full_pool_of_hanging_calls() -> None:
+    queue = InMemoryTaskQueue(block_ms=None)
+    llm = GatedLLM()  # The gate is never opened, so every call hangs.
+    await queue.enqueue_many("t_acme", _tasks(10))
+    pool = WorkerPool(
+        queue,
+        llm,
+        ["t_acme"],
+        consumers=3,
+        max_in_flight=2,
+        idle_sleep_s=0.001,
+        drain_timeout_s=0.05,
+    )
+
+    await pool.start()
+    await _settle()
+    assert pool.saturated
+    abandoned = await asyncio.wait_for(pool.drain(), timeout=1)
+
+    assert abandoned == 2
+    assert llm.done == 0
+    assert queue.pending_count("t_acme") == 2
+
+
+def test_pool_rejects_invalid_sizes() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        WorkerPool(InMemoryTaskQueue(), GatedLLM(), ["t_acme"], max_in_flight=0)
+    with pytest.raises(ValueError, match="tenant"):
+        WorkerPool(InMemoryTaskQueue(), GatedLLM(), [])
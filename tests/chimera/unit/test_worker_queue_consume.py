@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock
 
@@ -8,6 +9,7 @@ from chimera.models.task import Task
 from chimera.ports.llm import LLMPort
 from chimera.ports.queue import TaskQueuePort
 from chimera.services.worker import Worker
+from tests.chimera.unit.helpers import make_task
 
 
 @pytest.mark.asyncio
@@ -42,4 +44,45 @@ async def test_worker_consumes_and_processes_task() -> None:
     assert results[0].output == {"answer": 42}
 
     # Verify ack was called
-    mock_queue.ack.assert_called_once_with("t_acme", task, "w1")
+    mock_queue.ack_many.assert_called_once_with("t_acme", [task], "w1")
+
+
+class RecordingSink:
+    def __init__(self, queue: AsyncMock) -> None:
+        self.queue = queue
+        self.batches: list[list[str]] = []
+
+    async def write(self, tenant_id: str, results: Sequence[Result]) -> None:
+        # Results must be handed off before anything is acknowledged.
+        self.queue.ack_many.assert_not_called()
+        self.batches.append([result.task_id for result in results])
+
+
+@pytest.mark.asyncio
+async def test_partial_failure_hands_off_and_acks_only_the_successes() -> None:
+    mock_queue = AsyncMock(spec=TaskQueuePort)
+    mock_llm = AsyncMock(spec=LLMPort)
+    sink = RecordingSink(mock_queue)
+    worker = Worker(queue=mock_queue, llm=mock_llm, worker_id="w1", result_sink=sink)
+    tasks = [make_task(task_id) for task_id in ("tk_1", "tk_2", "tk_3")]
+
+    async def generate_result(task: Task) -> Result:
+        if task.task_id == "tk_2":
+            raise RuntimeError("LLM Down")
+        return Result(
+            tenant_id="t_acme",
+            trace_id="tr_1",
+            task_id=task.task_id,
+            status=ResultStatus.SUCCEEDED,
+            output={},
+            completed_at=datetime.now(UTC),
+        )
+
+    mock_llm.generate_result.side_effect = generate_result
+
+    outcome = await worker.process_tasks("t_acme", tasks)
+
+    assert [result.task_id for result in outcome.results] == ["tk_1", "tk_3"]
+    assert [task.task_id for task, _ in outcome.failures] == ["tk_2"]
+    assert sink.batches == [["tk_1", "tk_3"]]
+    mock_queue.ack_many.assert_called_once_with("t_acme", [tasks[0], tasks[2]], "w1")
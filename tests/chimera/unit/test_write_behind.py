@@ -0,0 +1,166 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import fakeredis.aioredis
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+
+from chimera.db.schema import TaskResult
+from chimera.db.write_behind import (
+    TASK_RESULTS,
+    TASKS,
+    RedisWriteBuffer,
+    TaskStatusUpdate,
+    WriteBehindPersister,
+)
+
+
+@pytest.fixture
+async def engine(tmp_path: Path) -> AsyncGenerator[AsyncEngine, None]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'chimera.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+async def _insert_tasks(engine: AsyncEngine, count: int) -> list[UUID]:
+    ids = [uuid4() for _ in range(count)]
+    async with engine.begin() as connection:
+        await connection.execute(
+            TASKS.insert(),
+            [
+                {"id": task_id, "type": "test", "status": "QUEUED", "input_payload": {}}
+                for task_id in ids
+            ],
+        )
+    return ids
+
+
+async def _statuses(engine: AsyncEngine) -> dict[UUID, tuple[str, datetime | None]]:
+    async with engine.connect() as connection:
+        rows = await connection.execute(select(TASKS.c.id, TASKS.c.status, TASKS.c.started_at))
+    return {row.id: (row.status, row.started_at) for row in rows}
+
+
+@pytest.mark.asyncio
+async def test_flush_coalesces_updates_and_is_idempotent_for_results(engine: AsyncEngine) -> None:
+    (task_id,) = await _insert_tasks(engine, 1)
+    started = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    persister = WriteBehindPersister(engine, flush_interval_s=60)
+
+    await persister.record_status(TaskStatusUpdate(task_id, "RUNNING", started_at=started))
+    await persister.record_status(TaskStatusUpdate(task_id, "SUCCEEDED", attempt_count=1))
+    result = TaskResult(task_id=task_id, status="SUCCEEDED", output_payload={"answer": 42})
+    await persister.record_result(result)
+    await persister.record_result(result)
+
+    assert await persister.flush() == 3
+    status, started_at = (await _statuses(engine))[task_id]
+    assert status == "SUCCEEDED"
+    assert started_at is not None and started_at.replace(tzinfo=UTC) == started
+    async with engine.connect() as connection:
+        rows = (await connection.execute(select(TASK_RESULTS))).all()
+    assert len(rows) == 1
+    assert rows[0].output_payload == {"answer": 42}
+
+
+@pytest.mark.asyncio
+async def test_size_trigger_flushes_without_waiting_for_interval(engine: AsyncEngine) -> None:
+    ids = await _insert_tasks(engine, 3)
+
+    async with WriteBehindPersister(engine, flush_interval_s=60, max_batch=3) as persister:
+        for task_id in ids:
+            await persister.record_status(TaskStatusUpdate(task_id, "RUNNING"))
+        for _ in range(100):
+            if persister.flushed == 3:
+                break
+            await asyncio.sleep(0.01)
+
+    assert persister.flushed == 3
+    assert {status for status, _ in (await _statuses(engine)).values()} == {"RUNNING"}
+
+
+@pytest.mark.asyncio
+async def test_redis_buffer_replays_a_batch_left_by_a_failed_flush(
+    engine: AsyncEngine, tmp_path: Path
+) -> None:
+    (task_id,) = await _insert_tasks(engine, 1)
+    redis = fakeredis.aioredis.FakeRedis()
+    broken = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'x.db'}")
+    started = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+
+    crashed = WriteBehindPersister(broken, RedisWriteBuffer(redis))
+    await crashed.record_status(TaskStatusUpdate(task_id, "RUNNING", started_at=started))
+    await crashed.record_result(TaskResult(task_id=task_id, status="FAILED"))
+    with pytest.raises(OperationalError):
+        await crashed.flush()
+    await broken.dispose()
+
+    recovered = WriteBehindPersister(engine, RedisWriteBuffer(redis))
+    await recovered.record_status(TaskStatusUpdate(task_id, "FAILED"))
+    assert await recovered.flush() == 2
+    assert await recovered.flush() == 1
+
+    status, started_at = (await _statuses(engine))[task_id]
+    assert status == "FAILED"
+    assert started_at is not None
+    assert await redis.keys("*") == []
+    await redis.aclose()
+
+
+@pytest.mark.asyncio
+async def test_status_update_with_created_at_matches_the_full_key(engine: AsyncEngine) -> None:
+    keyed, other = await _insert_tasks(engine, 2)
+    async with engine.connect() as connection:
+        created_at = (
+            await connection.execute(select(TASKS.c.created_at).where(TASKS.c.id == keyed))
+        ).scalar_one()
+    redis = fakeredis.aioredis.FakeRedis()
+    persister = WriteBehindPersister(engine, RedisWriteBuffer(redis))
+
+    await persister.record_status(TaskStatusUpdate(keyed, "RUNNING", created_at=created_at))
+    await persister.record_status(TaskStatusUpdate(keyed, "SUCCEEDED"))
+    wrong_key = datetime(2020, 1, 1, tzinfo=UTC)
+    await persister.record_status(TaskStatusUpdate(other, "FAILED", created_at=wrong_key))
+    assert await persister.flush() == 2
+
+    statuses = await _statuses(engine)
+    assert (statuses[keyed][0], statuses[other][0]) == ("SUCCEEDED", "QUEUED")
+    await redis.aclose()
+
+
+@pytest.mark.asyncio
+async def test_redis_buffers_on_one_prefix_flush_one_at_a_time() -> None:
+    redis = fakeredis.aioredis.FakeRedis()
+    first = RedisWriteBuffer(redis, flush_lease_ms=50)
+    second = RedisWriteBuffer(redis, flush_lease_ms=50)
+    task_id = uuid4()
+
+    await first.add_status(TaskStatusUpdate(task_id, "RUNNING"))
+    taken = await first.take()
+    await second.add_status(TaskStatusUpdate(task_id, "SUCCEEDED"))
+    assert [update.status for update in taken.statuses.values()] == ["RUNNING"]
+    assert not await second.take()
+
+    # The first flusher stalls past its lease: the second replays its batch,
+    # and the stale commit must not delete what the second has taken since.
+    await asyncio.sleep(0.06)
+    replayed = await second.take()
+    assert replayed.statuses == taken.statuses
+    await second.commit(replayed)
+    newer = await second.take()
+    await first.commit(taken)
+
+    assert [update.status for update in newer.statuses.values()] == ["SUCCEEDED"]
+    assert (await second.take()).statuses == newer.statuses
+    await second.commit(newer)
+    assert not await first.take()
+    assert await redis.keys("*") == []
+    await redis.aclose()